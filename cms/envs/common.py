@@ -1197,6 +1197,9 @@ INSTALLED_APPS = [
     # Customized cms app
     'openedx.features.cms',
 
+    # Course card app, keeps course family index up to date on course publish, rerun and custom settings changes
+    'openedx.features.course_card',
+
     # Third party action planner xblock goals tracking application
     'action_planner.actionplan_manager',
 ]
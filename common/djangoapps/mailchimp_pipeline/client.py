@@ -21,9 +21,14 @@ class Connection(object):
     output = "json"
     version = '3.0'
 
-    def __init__(self, apikey=None, secure=False):
+    def __init__(self, apikey=None, secure=False, root=None):
         self._apikey = apikey
 
+        if root:
+            # e.g. a local stand-in for the mailchimp api
+            self.root = root
+            return
+
         proto = 'https' if secure else 'http'
         dc = apikey.split('-')[1]
 
@@ -77,7 +82,9 @@ class Connection(object):
 
     @classmethod
     def get_connection(cls):
-        connection = cls(apikey=settings.MAILCHIMP_API_KEY, secure=True)
+        connection = cls(
+            apikey=settings.MAILCHIMP_API_KEY, secure=True, root=getattr(settings, 'MAILCHIMP_API_ROOT', None)
+        )
         return connection
 
 
@@ -102,6 +109,43 @@ class ChimpClient(object):
         path = '/lists/{list_id}'.format(list_id=list_id)
         return self.conn.make_request(method="POST", path=path, body=data)
 
+    def get_member_operation(self, list_id, email, data):
+        """
+        Get a batch operation to add or update a member of the list, `operation_id` of the operation is the email
+
+        Arguments:
+            list_id (str): List id to add or update the member in
+            email (str): Email of the member
+            data (dict): Member data
+
+        Returns:
+            dict: operation to be sent with `create_batch_operations`
+        """
+        email_hash = self._get_email_hash(email.lower())
+        return {
+            'method': 'PUT',
+            'path': '/lists/{list_id}/members/{subscriber_hash}'.format(list_id=list_id, subscriber_hash=email_hash),
+            'operation_id': email,
+            'body': json.dumps(data),
+        }
+
+    def create_batch_operations(self, operations):
+        """
+        Send many operations in a single call, mailchimp processes them in background
+
+        Returns:
+            dict: batch details containing `id` of the batch
+        """
+        return self.conn.make_request(method="POST", path='/batches', body={'operations': operations})
+
+    def get_batch_operations(self, batch_id):
+        """
+        Returns:
+            dict: batch status, `errored_operations` count and `response_body_url` of results once finished
+        """
+        path = '/batches/{batch_id}'.format(batch_id=batch_id)
+        return self.conn.make_request(path=path)
+
     def add_update_member_to_list(self, list_id, email, data):
         email_hash = self._get_email_hash(email.lower())
         path = '/lists/{list_id}/members/{subscriber_hash}'.format(list_id=list_id, subscriber_hash=email_hash)
@@ -0,0 +1,15 @@
+"""
+Constants for mailchimp_pipeline app
+"""
+
+MAILCHIMP_BATCH_SIZE = 500
+MAILCHIMP_BATCH_OPERATIONS_SIZE = 1000
+
+ORG_UPDATE_DEBOUNCE_SECONDS = 30
+ORG_UPDATE_VERSION_KEY = 'mailchimp.org_update_version.{org_id}'
+ORG_UPDATE_VERSION_TIMEOUT = 24 * 60 * 60
+
+BATCH_STATUS_CHECK_DELAY = 60  # seconds
+BATCH_STATUS_MAX_CHECKS = 60
+BATCH_MAX_ATTEMPTS = 3
+BATCH_RESPONSE_BODY_TIMEOUT = 60  # seconds
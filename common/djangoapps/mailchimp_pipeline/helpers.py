@@ -1,14 +1,28 @@
 """
 Helpers to provide utility to the mailchimp_pipeline app
 """
+import json
+import tarfile
+from collections import defaultdict
 from datetime import datetime
+from io import BytesIO
 
 import pytz
+import requests
+from django.core.cache import cache
 from opaque_keys.edx.keys import CourseKey
 
 from custom_settings.models import CustomSettings
 from enrollment.api import get_enrollments
+from lms.djangoapps.certificates.models import CertificateStatuses, GeneratedCertificate
 from lms.djangoapps.onboarding.models import FocusArea, OrgSector
+from mailchimp_pipeline.constants import (
+    BATCH_RESPONSE_BODY_TIMEOUT,
+    ORG_UPDATE_VERSION_KEY,
+    ORG_UPDATE_VERSION_TIMEOUT
+)
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from student.models import CourseEnrollment
 
 
 def is_active_enrollment(course_end_date):
@@ -66,3 +80,190 @@ def get_org_data_for_mandrill(organization):
         focus_area = FocusArea.get_map().get(organization.focus_area, "")
 
     return org_label, org_type, focus_area
+
+
+def iterate_users_in_batches(queryset, batch_size):
+    """
+    Iterate over users of the queryset in batches using keyset pagination on user id, so that every batch costs the
+    same no matter how deep into the table it is
+
+    Arguments:
+        queryset (QuerySet): User queryset
+        batch_size (int): Number of users in each batch
+
+    Yields:
+        list: batch of User objects ordered by id
+    """
+    last_user_id = 0
+
+    while True:
+        users = list(queryset.filter(id__gt=last_user_id).order_by('id')[:batch_size])
+        if not users:
+            return
+
+        last_user_id = users[-1].id
+        yield users
+
+
+def get_users_enrollments_and_completions(user_ids):
+    """
+    Get active enrollments and completed courses of many users with a constant number of queries
+
+    Arguments:
+        user_ids (list): ids of the users
+
+    Returns:
+        dict: user id -> {'ENROLLS': str, 'ENROLL_IDS': str, 'COMPLETES': str}, same values as
+            `get_user_active_enrollements`, `get_enrollements_course_short_ids` and certificates api
+    """
+    enrollments = CourseEnrollment.objects.filter(
+        user_id__in=user_ids, is_active=True
+    ).order_by('created').values_list('user_id', 'course_id')
+
+    passed_certificates = GeneratedCertificate.eligible_certificates.filter(
+        user_id__in=user_ids, status__in=CertificateStatuses.PASSED_STATUSES
+    ).order_by('course_id').values_list('user_id', 'course_id')
+
+    enrolled_course_ids = {course_id for _, course_id in enrollments}
+    passed_course_ids = {course_id for _, course_id in passed_certificates}
+
+    course_overviews = {
+        course.id: course for course in CourseOverview.objects.filter(id__in=enrolled_course_ids | passed_course_ids)
+    }
+    course_short_ids = dict(
+        CustomSettings.objects.filter(id__in=enrolled_course_ids).values_list('id', 'course_short_id')
+    )
+
+    active_enrollments = defaultdict(list)
+    enrollment_short_ids = defaultdict(list)
+    completions = defaultdict(list)
+
+    for user_id, course_id in enrollments:
+        course = course_overviews.get(course_id)
+        # skip enrollments of deleted courses same as enrollment api
+        if not course:
+            continue
+
+        if is_active_enrollment(course.end):
+            active_enrollments[user_id].append(course.display_name_with_default)
+        if course_id in course_short_ids:
+            enrollment_short_ids[user_id].append(str(course_short_ids[course_id]))
+
+    for user_id, course_id in passed_certificates:
+        course = course_overviews.get(course_id)
+        if course:
+            completions[user_id].append(course.display_name)
+
+    return {
+        user_id: {
+            'ENROLLS': ", ".join(active_enrollments[user_id]),
+            'ENROLL_IDS': ",".join(enrollment_short_ids[user_id]),
+            'COMPLETES': ", ".join(completions[user_id]),
+        } for user_id in user_ids
+    }
+
+
+def get_users_merge_fields(users, focus_areas, org_sectors):
+    """
+    Get mailchimp members data for a batch of users
+
+    Arguments:
+        users (list): User objects, with profile and extended_profile organization selected
+        focus_areas (dict): FocusArea.get_map()
+        org_sectors (dict): OrgSector.objects.get_map()
+
+    Returns:
+        list: mailchimp members data, users without profile or extended profile are skipped
+    """
+    enrollments_and_completions = get_users_enrollments_and_completions([user.id for user in users])
+    members = []
+
+    for user in users:
+        try:
+            profile = user.profile
+            extended_profile = user.extended_profile
+        except Exception:  # pylint: disable=broad-except
+            continue
+
+        organization = extended_profile.organization
+        org_type = org_sectors.get(organization.org_type, '') if organization and organization.org_type else ""
+
+        merge_fields = {
+            "FULLNAME": user.get_full_name(),
+            "USERNAME": user.username,
+            "LANG": profile.language if profile.language else "",
+            "COUNTRY": profile.country.name.format() if profile.country else "",
+            "CITY": profile.city if profile.city else "",
+            "DATEREGIS": str(user.date_joined.strftime("%m/%d/%Y")),
+            "LSOURCE": "",
+            "ORG": organization.label if organization else "",
+            "ORGTYPE": org_type,
+            "WORKAREA": str(focus_areas.get(organization.focus_area, "")) if organization else "",
+        }
+        merge_fields.update(enrollments_and_completions[user.id])
+
+        members.append({
+            "email_address": user.email,
+            "merge_fields": merge_fields
+        })
+
+    return members
+
+
+def get_next_org_update_version(org_id):
+    """
+    Register a new change of the organization
+
+    Returns:
+        int: version of the change, only the latest version of an organization is sent to MailChimp
+    """
+    key = ORG_UPDATE_VERSION_KEY.format(org_id=org_id)
+    cache.add(key, 0, ORG_UPDATE_VERSION_TIMEOUT)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(key, 1, ORG_UPDATE_VERSION_TIMEOUT)
+        return 1
+
+
+def get_org_update_version(org_id):
+    """
+    Returns:
+        int: latest change version of the organization or None if it is not known
+    """
+    return cache.get(ORG_UPDATE_VERSION_KEY.format(org_id=org_id))
+
+
+def is_outdated_org_update(org_id, version):
+    """
+    Returns True if a newer change of the organization has been registered after `version`
+    """
+    latest_version = get_org_update_version(org_id)
+    return version is not None and latest_version is not None and version < latest_version
+
+
+def get_failed_operation_ids(response_body_url):
+    """
+    Get ids of the failed operations of a finished MailChimp batch
+
+    Arguments:
+        response_body_url (str): url of the gzipped tar archive of batch results
+
+    Returns:
+        list: `operation_id` of every operation whose status code is 400 or above
+    """
+    response = requests.get(response_body_url, timeout=BATCH_RESPONSE_BODY_TIMEOUT)
+    response.raise_for_status()
+
+    failed_operation_ids = []
+    with tarfile.open(fileobj=BytesIO(response.content), mode='r:gz') as results_archive:
+        for member in results_archive.getmembers():
+            if not member.isfile():
+                continue
+
+            for result in json.load(results_archive.extractfile(member)):
+                if result.get('status_code', 0) >= 400:
+                    failed_operation_ids.append(result.get('operation_id'))
+
+    return failed_operation_ids
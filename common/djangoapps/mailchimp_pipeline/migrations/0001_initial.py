@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.utils.timezone
+import jsonfield.fields
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MailchimpBatchOperation',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('created', model_utils.fields.AutoCreatedField(default=django.utils.timezone.now, verbose_name='created', editable=False)),
+                ('modified', model_utils.fields.AutoLastModifiedField(default=django.utils.timezone.now, verbose_name='modified', editable=False)),
+                ('batch_id', models.CharField(unique=True, max_length=64)),
+                ('list_id', models.CharField(max_length=64)),
+                ('organization_id', models.PositiveIntegerField(db_index=True, null=True, blank=True)),
+                ('organization_update_version', models.PositiveIntegerField(null=True, blank=True)),
+                ('member_data', jsonfield.fields.JSONField(default=dict)),
+                ('emails', jsonfield.fields.JSONField(default=list)),
+                ('failed_emails', jsonfield.fields.JSONField(default=list)),
+                ('status', models.CharField(default=b'pending', max_length=16, choices=[(b'pending', b'Pending'), (b'finished', b'Finished')])),
+                ('attempt', models.PositiveSmallIntegerField(default=1)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
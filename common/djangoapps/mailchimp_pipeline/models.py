@@ -0,0 +1,32 @@
+"""
+Models for mailchimp_pipeline app
+"""
+from django.db import models
+from jsonfield.fields import JSONField
+from model_utils.models import TimeStampedModel
+
+
+class MailchimpBatchOperation(TimeStampedModel):
+    """
+    Model to keep track of member updates sent through MailChimp batch operations endpoint, so that only the members
+    which failed are sent again.
+    """
+    PENDING = 'pending'
+    FINISHED = 'finished'
+    STATUS_CHOICES = (
+        (PENDING, 'Pending'),
+        (FINISHED, 'Finished'),
+    )
+
+    batch_id = models.CharField(max_length=64, unique=True)
+    list_id = models.CharField(max_length=64)
+    organization_id = models.PositiveIntegerField(null=True, blank=True, db_index=True)
+    organization_update_version = models.PositiveIntegerField(null=True, blank=True)
+    member_data = JSONField(default=dict)
+    emails = JSONField(default=list)
+    failed_emails = JSONField(default=list)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    attempt = models.PositiveSmallIntegerField(default=1)
+
+    def __unicode__(self):
+        return u'MailchimpBatchOperation: batch_id: {}, status: {}'.format(self.batch_id, self.status)
@@ -13,8 +13,10 @@ from common.lib.mandrill_client.client import MandrillClient
 from lms.djangoapps.certificates import api as certificate_api
 from lms.djangoapps.onboarding.models import EmailPreference, GranteeOptIn, Organization, UserExtendedProfile
 from mailchimp_pipeline.client import ChimpClient, MailChimpException
+from mailchimp_pipeline.constants import ORG_UPDATE_DEBOUNCE_SECONDS
 from mailchimp_pipeline.helpers import (
     get_enrollements_course_short_ids,
+    get_next_org_update_version,
     get_org_data_for_mandrill,
     get_user_active_enrollements
 )
@@ -134,8 +136,12 @@ def sync_grantee_optin_with_mailchimp(sender, instance, **kwargs):  # pylint: di
 def sync_organization_with_mailchimp(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
     if not created:
         org_label, org_type, work_area = get_org_data_for_mandrill(instance)
-        update_org_details_at_mailchimp.delay(
-            org_label, org_type, work_area, instance.id, settings.MAILCHIMP_LEARNERS_LIST_ID)
+        # wait for a while so that only the latest of the changes made close together is sent to mailchimp
+        update_org_details_at_mailchimp.apply_async(
+            args=(org_label, org_type, work_area, instance.id, settings.MAILCHIMP_LEARNERS_LIST_ID),
+            kwargs={'version': get_next_org_update_version(instance.id)},
+            countdown=ORG_UPDATE_DEBOUNCE_SECONDS
+        )
 
 
 def sync_metric_update_prompt_with_mail_chimp(update_prompt):
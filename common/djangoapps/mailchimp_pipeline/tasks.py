@@ -1,40 +1,60 @@
 """
 Tasks related to the mailchimp_pipeline app
 """
+import time
 from logging import getLogger
 
 from celery import task
 from django.contrib.auth.models import User
 from django.db import connection
 
-from lms.djangoapps.certificates import api as certificate_api
 from lms.djangoapps.onboarding.models import FocusArea, OrgSector, UserExtendedProfile
 from mailchimp_pipeline.client import ChimpClient, MailChimpException
-from mailchimp_pipeline.helpers import get_enrollements_course_short_ids, get_user_active_enrollements
-from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from mailchimp_pipeline.constants import (
+    BATCH_MAX_ATTEMPTS,
+    BATCH_STATUS_CHECK_DELAY,
+    BATCH_STATUS_MAX_CHECKS,
+    MAILCHIMP_BATCH_OPERATIONS_SIZE,
+    MAILCHIMP_BATCH_SIZE
+)
+from mailchimp_pipeline.helpers import (
+    get_failed_operation_ids,
+    get_users_merge_fields,
+    is_outdated_org_update,
+    iterate_users_in_batches
+)
+from mailchimp_pipeline.models import MailchimpBatchOperation
 
 log = getLogger(__name__)
 
 
 @task()
-def update_org_details_at_mailchimp(org_label, org_type, work_area, org_id, list_id):
+def update_org_details_at_mailchimp(org_label, org_type, work_area, org_id, list_id, version=None):
     """
     Update the details of the organization associated with the org_id
 
+    Members are sent in chunks through the MailChimp batch operations endpoint. If the organization has changed again
+    after this task was queued, nothing is sent because the task of the latest change sends it.
+
     Arguments:
         org_id (int): id of the target organization
         org_label (str): Label of the organization to update to
         org_type (str): Type of the organization to update to
         work_area (str): Work area of the organization to update to
         list_id (str): List id to add the update member to
+        version (int): Version of the organization change, from `get_next_org_update_version`
 
     Returns:
         None
     """
+    if is_outdated_org_update(org_id, version):
+        log.info("Skipping outdated details of organization %s for MailChimp", org_id)
+        return
+
     log.info("Task to send organization details to MailChimp")
     log.info(org_label)
 
-    extended_profiles = UserExtendedProfile.objects.filter(organization_id=org_id).values("user__email")
+    emails = list(UserExtendedProfile.objects.filter(organization_id=org_id).values_list("user__email", flat=True))
 
     user_json = {
         "merge_fields": {
@@ -44,90 +64,146 @@ def update_org_details_at_mailchimp(org_label, org_type, work_area, org_id, list
         }
     }
 
-    for extended_profile in extended_profiles:
-        try:
-            response = ChimpClient().add_update_member_to_list(list_id, extended_profile.get('user__email'), user_json)
-            log.info(response)
-        except MailChimpException as ex:
-            log.exception(ex)
+    for chunk_start in range(0, len(emails), MAILCHIMP_BATCH_OPERATIONS_SIZE):
+        send_members_batch_operation(
+            list_id, emails[chunk_start:chunk_start + MAILCHIMP_BATCH_OPERATIONS_SIZE], user_json,
+            organization_id=org_id, organization_update_version=version
+        )
+
+
+def send_members_batch_operation(list_id, emails, member_data, organization_id=None,
+                                 organization_update_version=None, attempt=1):
+    """
+    Add or update members of the list with same data in a single MailChimp batch operation, record the batch and
+    schedule a task to check its results
+
+    Returns:
+        MailchimpBatchOperation: recorded batch or None if batch could not be created
+    """
+    client = ChimpClient()
+    operations = [client.get_member_operation(list_id, email, member_data) for email in emails]
+
+    try:
+        response = client.create_batch_operations(operations)
+    except MailChimpException as ex:
+        log.exception(ex)
+        return None
+
+    if not response or not response.get('id'):
+        log.error("MailChimp batch could not be created for %s members, response: %s", len(emails), response)
+        return None
+
+    batch_operation = MailchimpBatchOperation.objects.create(
+        batch_id=response['id'],
+        list_id=list_id,
+        organization_id=organization_id,
+        organization_update_version=organization_update_version,
+        member_data=member_data,
+        emails=emails,
+        attempt=attempt,
+    )
+    log.info("MailChimp batch %s created for %s members", batch_operation.batch_id, len(emails))
+
+    check_mailchimp_batch_operation.apply_async(args=[batch_operation.batch_id], countdown=BATCH_STATUS_CHECK_DELAY)
+    return batch_operation
+
+
+@task(default_retry_delay=BATCH_STATUS_CHECK_DELAY, max_retries=BATCH_STATUS_MAX_CHECKS)
+def check_mailchimp_batch_operation(batch_id):
+    """
+    Check results of a MailChimp batch once it is finished and send the failed members again
+    """
+    batch_operation = MailchimpBatchOperation.objects.filter(
+        batch_id=batch_id, status=MailchimpBatchOperation.PENDING
+    ).first()
+
+    if not batch_operation:
+        return
+
+    response = ChimpClient().get_batch_operations(batch_id)
+
+    if not response or response.get('status') != MailchimpBatchOperation.FINISHED:
+        check_mailchimp_batch_operation.retry()
+
+    failed_emails = []
+    if response.get('errored_operations'):
+        failed_emails = get_failed_operation_ids(response['response_body_url'])
+
+    batch_operation.failed_emails = failed_emails
+    batch_operation.status = MailchimpBatchOperation.FINISHED
+    batch_operation.save()
+
+    if not failed_emails:
+        return
+
+    if batch_operation.attempt >= BATCH_MAX_ATTEMPTS:
+        log.error("MailChimp batch %s failed for %s members, giving up", batch_id, len(failed_emails))
+        return
+
+    if is_outdated_org_update(batch_operation.organization_id, batch_operation.organization_update_version):
+        return
+
+    send_members_batch_operation(
+        batch_operation.list_id, failed_emails, batch_operation.member_data,
+        organization_id=batch_operation.organization_id,
+        organization_update_version=batch_operation.organization_update_version,
+        attempt=batch_operation.attempt + 1
+    )
 
 
 @task()
-def update_enrollments_completions_at_mailchimp(list_id):
-    """Task to send user enrollments & course completions details to MailChimp"""
+def update_enrollments_completions_at_mailchimp(list_id, batch_size=MAILCHIMP_BATCH_SIZE):
+    """
+    Task to send user enrollments & course completions details to MailChimp
+
+    Users are streamed in keyset paginated batches, data of each batch is loaded with a constant number of queries and
+    sent to MailChimp in a single batch subscribe call.
+
+    Arguments:
+        list_id (str): MailChimp list id
+        batch_size (int): Number of users sent to MailChimp in one call, MailChimp accepts at most 500
+
+    Returns:
+        None
+    """
     log.info("starting enrollments & completions sync")
 
     cursor = connection.cursor()
     cursor.execute('SET TRANSACTION ISOLATION LEVEL READ COMMITTED')
 
-    batch_size = 100
-    total_user_count = User.objects.all().count()
-    page_count = total_user_count / batch_size
-    counter = 0
+    client = ChimpClient()
+    focus_areas = FocusArea.get_map()
+    org_sectors = OrgSector.objects.get_map()
+    users = User.objects.select_related('profile', 'extended_profile__organization')
 
-    while counter is not page_count + 1:
-        try:
-            page_start = counter * batch_size
-            page_end = page_start + batch_size
-
-            users = list(User.objects.all()[page_start:page_end])
-            log.info("Syncing batch from {} to {}".format(page_start, page_end))
-
-            focus_areas = FocusArea.get_map()
-            org_sectors = OrgSector.objects.get_map()
-
-            for user in users:
-                profile = user.profile
-                extended_profile = user.extended_profile
-
-                org_type = ""
-                if extended_profile.organization and extended_profile.organization.org_type:
-                    org_type = org_sectors.get(extended_profile.organization.org_type, '')
-
-                all_certs = []
-                try:
-                    all_certs = certificate_api.get_certificates_for_user(user.username)
-                except Exception as ex:  # pylint: disable=broad-except
-                    log.exception(str(ex.args))
-
-                completed_course_keys = [cert.get('course_key', '') for cert in all_certs
-                                         if certificate_api.is_passing_status(cert['status'])]
-                completed_courses = CourseOverview.objects.filter(id__in=completed_course_keys)
-
-                user_json = {
-                    "merge_fields": {
-                        "FULLNAME": user.get_full_name(),
-                        "USERNAME": user.username,
-                        "LANG": profile.language if profile.language else "",
-                        "COUNTRY": profile.country.name.format() if profile.country else "",
-                        "CITY": profile.city if profile.city else "",
-                        "DATEREGIS": str(user.date_joined.strftime("%m/%d/%Y")),
-                        "LSOURCE": "",
-                        "ENROLLS": get_user_active_enrollements(user.username),
-                        "ENROLL_IDS": get_enrollements_course_short_ids(user.username),
-                        "COMPLETES": ", ".join([course.display_name for course in completed_courses]),
-                        "ORG": extended_profile.organization.label if extended_profile.organization else "",
-                        "ORGTYPE": org_type,
-                        "WORKAREA": str(focus_areas.get(extended_profile.organization.focus_area, ""))
-                        if extended_profile.organization else "",
-                    }
-                }
-
-                try:
-                    response = ChimpClient().add_update_member_to_list(list_id, user.email, user_json)
-                    log.info(
-                        "Mailchimp-Sync Method: User with email address {} synced successfully".format(user.email)
-                    )
-                    log.info(response)
-                except MailChimpException as ex:
-                    log.info(
-                        "Mailchimp-Sync Method: "
-                        "There was error syncing user with email address {}".format(user.email)
-                    )
-                    log.exception(ex)
+    synced_count = failed_count = 0
+    started_at = time.time()
 
+    for batch in iterate_users_in_batches(users, batch_size):
+        try:
+            members = get_users_merge_fields(batch, focus_areas, org_sectors)
+            response = client.add_list_members_in_batch(list_id, {
+                "members": members,
+                "update_existing": True
+            }) or {}
         except Exception as ex:  # pylint: disable=broad-except
-            log.info("There was an error in batch from {} to {}".format(page_start, page_end))
+            failed_count += len(batch)
+            log.info("There was an error in batch from user id {} to {}".format(batch[0].id, batch[-1].id))
             log.exception(str(ex.args))
-
-        counter += 1
+            continue
+
+        batch_error_count = response.get('error_count', 0)
+        for error in response.get('errors', []):
+            log.info("Mailchimp-Sync Method: There was error syncing user with email address {}: {}".format(
+                error.get('email_address'), error.get('error')
+            ))
+
+        synced_count += len(members) - batch_error_count
+        failed_count += len(batch) - len(members) + batch_error_count
+        log.info("Mailchimp-Sync Method: synced users up to id {}, {:.2f} rows/sec".format(
+            batch[-1].id, (synced_count + failed_count) / max(time.time() - started_at, 0.001)
+        ))
+
+    log.info("Finished enrollments & completions sync, synced: {}, failed: {}, {:.2f} rows/sec".format(
+        synced_count, failed_count, (synced_count + failed_count) / max(time.time() - started_at, 0.001)
+    ))
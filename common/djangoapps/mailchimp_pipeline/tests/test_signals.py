@@ -10,7 +10,7 @@ from mock import ANY, patch
 from lms.djangoapps.onboarding.models import EmailPreference, GranteeOptIn
 from lms.djangoapps.onboarding.tests.factories import UserFactory
 from mailchimp_pipeline.client import Connection
-from mailchimp_pipeline.helpers import get_org_data_for_mandrill
+from mailchimp_pipeline.helpers import get_org_data_for_mandrill, get_org_update_version
 from mailchimp_pipeline.tests.helpers import (
     create_organization,
     create_organization_partner_object,
@@ -146,15 +146,17 @@ class MailchimpPipelineSignalTestClass(TestCase):
         self.mock_request.assert_called_with(
             "PUT", url=expected_url, headers=ANY, data=json.dumps(expected_data), auth=ANY, params=ANY)
 
-    @patch("mailchimp_pipeline.signals.handlers.update_org_details_at_mailchimp.delay", autospec=True)
-    def test_sync_organization_with_mailchimp(self, mocked_delay):
+    @patch("mailchimp_pipeline.signals.handlers.update_org_details_at_mailchimp.apply_async")
+    def test_sync_organization_with_mailchimp(self, mocked_apply_async):
         """
-        Test if Organization post-save signal is generated and the delay of the update_org_details_at_mailchimp
-        task is called with right parameters from its handler.
-        :param mocked_delay: Mocked task delay to check if task has been called.
+        Test if Organization post-save signal is generated and the update_org_details_at_mailchimp
+        task is scheduled with right parameters and latest change version from its handler.
+        :param mocked_apply_async: Mocked task apply_async to check if task has been scheduled.
         """
         organization = create_organization(self.user)
         org_label, org_type, work_area = get_org_data_for_mandrill(organization)
-        mocked_delay.assert_called_with(
-            org_label, org_type, work_area, organization.id, settings.MAILCHIMP_LEARNERS_LIST_ID
+        mocked_apply_async.assert_called_with(
+            args=(org_label, org_type, work_area, organization.id, settings.MAILCHIMP_LEARNERS_LIST_ID),
+            kwargs={'version': get_org_update_version(organization.id)},
+            countdown=ANY
         )
@@ -18,9 +18,11 @@ from lms.djangoapps.onboarding.tests.factories import UserFactory
 from mailchimp_pipeline.client import Connection, MailChimpException
 from mailchimp_pipeline.helpers import (
     get_enrollements_course_short_ids,
+    get_next_org_update_version,
     get_org_data_for_mandrill,
     get_user_active_enrollements
 )
+from mailchimp_pipeline.models import MailchimpBatchOperation
 from mailchimp_pipeline.signals.handlers import (
     send_user_course_completions_to_mailchimp,
     send_user_enrollments_to_mailchimp,
@@ -30,7 +32,11 @@ from mailchimp_pipeline.signals.handlers import (
     task_send_user_info_to_mailchimp,
     update_mailchimp
 )
-from mailchimp_pipeline.tasks import update_enrollments_completions_at_mailchimp, update_org_details_at_mailchimp
+from mailchimp_pipeline.tasks import (
+    check_mailchimp_batch_operation,
+    update_enrollments_completions_at_mailchimp,
+    update_org_details_at_mailchimp
+)
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from student.models import CourseEnrollment
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
@@ -230,18 +236,23 @@ class MailchimpPipelineTaskTestClass(ModuleStoreTestCase):
         self.mock_request.assert_called_with(
             "PUT", url=expected_url, headers=ANY, data=json.dumps(expected_data), auth=ANY, params=ANY)
 
-    def test_task_update_org_details_at_mailchimp(self):
+    @patch("mailchimp_pipeline.tasks.check_mailchimp_batch_operation.apply_async")
+    def test_task_update_org_details_at_mailchimp(self, mocked_check_batch):
         """
             Test if the update_org_details_at_mailchimp task is sending organization information
-            perfectly to the MailChimp expected URL
+            of all members to the MailChimp batch operations URL and records the batch
         """
+        self.mock_request.return_value.status_code = 200
+        self.mock_request.return_value.json.return_value = {'id': 'test_batch', 'status': 'pending'}
+
         organization = create_organization(self.user)
         org_label, org_type, work_area = get_org_data_for_mandrill(organization)
+        self.user.extended_profile.organization = organization
+        self.user.extended_profile.save()
         result = update_org_details_at_mailchimp.delay(
             org_label, org_type, work_area, organization.id, self.mailchimp_list_id
         )
         assert result.successful()
-        expected_url = generate_mailchimp_url(self.mail_chimp_root_url, self.user.email)
         expected_data = {
             "merge_fields": {
                 "ORG": org_label,
@@ -249,8 +260,68 @@ class MailchimpPipelineTaskTestClass(ModuleStoreTestCase):
                 "WORKAREA": work_area
             }
         }
+        expected_url = '{}/batches'.format(self.mail_chimp_root_url)
+        operations = json.loads(self.mock_request.call_args[1]['data'])['operations']
         self.mock_request.assert_called_with(
-            "PUT", url=expected_url, headers=ANY, data=json.dumps(expected_data), auth=ANY, params=ANY)
+            "POST", url=expected_url, headers=ANY, data=ANY, auth=ANY, params=ANY)
+        self.assertEqual(
+            operations,
+            [{
+                'method': 'PUT',
+                'path': generate_mailchimp_url('', self.user.email),
+                'operation_id': self.user.email,
+                'body': json.dumps(expected_data),
+            }]
+        )
+
+        batch_operation = MailchimpBatchOperation.objects.get(batch_id='test_batch')
+        self.assertEqual(batch_operation.emails, [self.user.email])
+        self.assertEqual(batch_operation.organization_id, organization.id)
+        mocked_check_batch.assert_called_with(args=['test_batch'], countdown=ANY)
+
+    @patch("mailchimp_pipeline.tasks.send_members_batch_operation")
+    def test_task_update_org_details_at_mailchimp_skips_outdated_change(self, mocked_send_batch):
+        """
+            Test if the update_org_details_at_mailchimp task sends nothing when the organization has
+            changed again after the task was queued
+        """
+        organization = create_organization(self.user)
+        org_label, org_type, work_area = get_org_data_for_mandrill(organization)
+        outdated_version = get_next_org_update_version(organization.id)
+        get_next_org_update_version(organization.id)
+
+        update_org_details_at_mailchimp.delay(
+            org_label, org_type, work_area, organization.id, self.mailchimp_list_id, version=outdated_version
+        )
+
+        mocked_send_batch.assert_not_called()
+
+    @patch("mailchimp_pipeline.tasks.get_failed_operation_ids")
+    @patch("mailchimp_pipeline.tasks.send_members_batch_operation")
+    def test_check_mailchimp_batch_operation_retries_failed_members(self, mocked_send_batch, mocked_failed_ids):
+        """
+            Test if only the failed members of a finished batch are sent again
+        """
+        member_data = {"merge_fields": {"ORG": "test_org"}}
+        MailchimpBatchOperation.objects.create(
+            batch_id='test_batch', list_id=self.mailchimp_list_id, member_data=member_data,
+            emails=['first@example.com', 'second@example.com']
+        )
+        self.mock_request.return_value.status_code = 200
+        self.mock_request.return_value.json.return_value = {
+            'id': 'test_batch', 'status': 'finished', 'errored_operations': 1, 'response_body_url': 'http://results'
+        }
+        mocked_failed_ids.return_value = ['second@example.com']
+
+        check_mailchimp_batch_operation('test_batch')
+
+        batch_operation = MailchimpBatchOperation.objects.get(batch_id='test_batch')
+        self.assertEqual(batch_operation.status, MailchimpBatchOperation.FINISHED)
+        self.assertEqual(batch_operation.failed_emails, ['second@example.com'])
+        mocked_send_batch.assert_called_once_with(
+            self.mailchimp_list_id, ['second@example.com'], member_data,
+            organization_id=None, organization_update_version=None, attempt=2
+        )
 
     def test_task_update_org_details_at_mailchimp_for_exception(self):
         """
@@ -293,8 +364,9 @@ class MailchimpPipelineTaskTestClass(ModuleStoreTestCase):
         result = update_enrollments_completions_at_mailchimp.delay(self.mailchimp_list_id)
         assert result.successful()
 
-        expected_url = generate_mailchimp_url(self.mail_chimp_root_url, self.user.email)
-        expected_data = {
+        expected_url = '{}/lists/{}'.format(self.mail_chimp_root_url, self.mailchimp_list_id)
+        expected_member = {
+            "email_address": self.user.email,
             "merge_fields": {
                 "FULLNAME": self.user.get_full_name(),
                 "USERNAME": self.user.username,
@@ -311,8 +383,35 @@ class MailchimpPipelineTaskTestClass(ModuleStoreTestCase):
                 "WORKAREA": str(FocusArea.get_map().get(extended_profile.organization.focus_area, ""))
             }
         }
-        self.mock_request.assert_any_call(
-            "PUT", url=expected_url, headers=ANY, data=json.dumps(expected_data), auth=ANY, params=ANY)
+
+        batch_calls = [
+            mocked_call for mocked_call in self.mock_request.call_args_list
+            if mocked_call[0][0] == "POST" and mocked_call[1]['url'] == expected_url
+        ]
+        self.assertEqual(len(batch_calls), 1)
+        request_body = json.loads(batch_calls[0][1]['data'])
+        self.assertTrue(request_body['update_existing'])
+        self.assertIn(expected_member, request_body['members'])
+
+    @factory.django.mute_signals(post_save)
+    @patch("mailchimp_pipeline.tasks.connection")
+    def test_update_enrollments_completions_at_mailchimp_in_batches(self, mocked_connection):  # pylint: disable=unused-argument
+        """
+            Test if the update_enrollments_completions_at_mailchimp task sends users in chunks of
+            batch size using the MailChimp batch subscribe endpoint
+            :param mocked_connection: Mocked database connection to handle cursor
+        """
+        for _ in range(4):
+            UserFactory()
+
+        update_enrollments_completions_at_mailchimp.delay(self.mailchimp_list_id, batch_size=2)
+
+        expected_url = '{}/lists/{}'.format(self.mail_chimp_root_url, self.mailchimp_list_id)
+        batch_sizes = [
+            len(json.loads(mocked_call[1]['data'])['members']) for mocked_call in self.mock_request.call_args_list
+            if mocked_call[0][0] == "POST" and mocked_call[1]['url'] == expected_url
+        ]
+        self.assertEqual(batch_sizes, [2, 2, 1])
 
     @patch("mailchimp_pipeline.tasks.connection")
     def test_update_enrollments_completions_at_mailchimp_for_mailchimp_exception(
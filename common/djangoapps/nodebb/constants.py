@@ -6,3 +6,20 @@ COMMUNITY_ID_SPLIT_INDEX = 0
 COMMUNITY_URL_SPLIT_CHAR = '/'
 CONVERSATIONALIST_ENTRY_INDEX = 0
 TEAM_PLAYER_ENTRY_INDEX = 0
+
+COURSE_POSSIBLE_SCORE_KEY = 'nodebb.course_possible_score.{course_id}.{version}'
+COURSE_POSSIBLE_SCORE_TIMEOUT = 24 * 60 * 60
+
+PROFILE_SYNC_DEBOUNCE_SECONDS = 10
+PROFILE_SYNC_PENDING_TIMEOUT = 60 * 60
+PROFILE_SYNC_DELTA_KEY = 'nodebb.profile_sync.delta.{username}.{sequence}'
+PROFILE_SYNC_SEQUENCE_KEY = 'nodebb.profile_sync.sequence.{username}'
+PROFILE_SYNC_FLUSHED_KEY = 'nodebb.profile_sync.flushed.{username}'
+PROFILE_SYNC_MAX_RETRIES = 5
+PROFILE_SYNC_FLUSH_KEY = 'nodebb.profile_sync.flush.{username}'
+PROFILE_SYNC_COUNTER_KEY = 'nodebb.profile_sync.counter.{name}'
+PROFILE_SYNC_QUEUED = 'queued'
+PROFILE_SYNC_MERGED = 'merged'
+PROFILE_SYNC_SENT = 'sent'
+PROFILE_SYNC_FAILED = 'failed'
+PROFILE_SYNC_COUNTERS = (PROFILE_SYNC_QUEUED, PROFILE_SYNC_MERGED, PROFILE_SYNC_SENT, PROFILE_SYNC_FAILED)
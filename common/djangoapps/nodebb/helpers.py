@@ -4,17 +4,38 @@ Helpers for Nodebb app
 import collections
 from logging import getLogger
 
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.urlresolvers import reverse
+from django.db.models import Sum
 
 from courseware.tabs import get_course_tab_list
+from lms.djangoapps.grades.config import should_persist_grades
 from lms.djangoapps.grades.course_grade_factory import CourseGradeFactory
+from lms.djangoapps.grades.models import PersistentSubsectionGrade
+from lms.djangoapps.grades.scores import possibly_scored, weighted_score
+from lms.djangoapps.grades.transformer import GradesTransformer
+from nodebb.constants import (
+    COURSE_POSSIBLE_SCORE_KEY,
+    COURSE_POSSIBLE_SCORE_TIMEOUT,
+    PROFILE_SYNC_MERGED,
+    PROFILE_SYNC_QUEUED
+)
 from nodebb.models import DiscussionCommunity, TeamGroupChat
+from nodebb.profile_sync import (
+    claim_profile_flush,
+    get_debounce_window,
+    increment_profile_sync_counter,
+    merge_pending_profile_data
+)
 from nodebb.tasks import (
     task_activate_user_on_nodebb,
     task_archive_community_on_nodebb,
+    task_flush_user_profile_on_nodebb,
     task_update_onboarding_surveys_status
 )
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
 
 log = getLogger(__name__)
@@ -44,7 +65,75 @@ def get_all_course_progress(student, course):
     """
         Return course overall progress percentage for a student
     """
+    return get_users_course_progress(course, [student]).get(student.id, 0)
+
+
+def get_users_course_progress(course, users):
+    """
+    Return course overall progress percentage of many students, earned score of all subsections they have attempted
+    over possible score of the whole course. Earned scores are read from persisted subsection grades with one query,
+    grades are only computed if persistent grades are not enabled for the course.
+
+    Arguments:
+        course (CourseDescriptor): course for which progress is required
+        users (list): students whose progress is required
+
+    Returns:
+        dict: user id -> progress percentage (int)
+    """
+    if not should_persist_grades(course.id):
+        return {user.id: _compute_course_progress(user, course) for user in users}
+
+    subsection_scores = PersistentSubsectionGrade.objects.filter(
+        course_id=course.id, user_id__in=[user.id for user in users]
+    ).values('user_id').annotate(earned=Sum('earned_all'))
+
+    progress = {user.id: 0 for user in users}
+    if not subsection_scores:
+        return progress
+
+    possible_score = get_course_possible_score(course.id)
+    for scores in subsection_scores:
+        progress[scores['user_id']] = _get_progress_percentage(scores['earned'], possible_score)
+
+    return progress
+
+
+def get_course_possible_score(course_key):
+    """
+    Return possible score of all scorable blocks of a course, cached until the course is published again
+    """
+    modified = CourseOverview.objects.filter(id=course_key).values_list('modified', flat=True).first()
+    version = '{:%Y%m%d%H%M%S%f}'.format(modified) if modified else None
+    key = COURSE_POSSIBLE_SCORE_KEY.format(course_id=course_key, version=version)
+
+    possible_score = cache.get(key)
+    if possible_score is None:
+        possible_score = _compute_course_possible_score(course_key)
+        cache.set(key, possible_score, COURSE_POSSIBLE_SCORE_TIMEOUT)
+
+    return possible_score
+
 
+def _compute_course_possible_score(course_key):
+    course_structure = get_course_in_cache(course_key)
+    possible_score = 0
+
+    for block_key in course_structure.post_order_traversal(filter_func=possibly_scored):
+        if not course_structure.get_xblock_field(block_key, 'has_score', False):
+            continue
+
+        max_score = course_structure.get_transformer_block_field(block_key, GradesTransformer, 'max_score')
+        if max_score is None:
+            continue
+
+        weight = course_structure.get_xblock_field(block_key, 'weight')
+        possible_score += weighted_score(max_score, max_score, weight)[1]
+
+    return possible_score
+
+
+def _compute_course_progress(student, course):
     course_grade = CourseGradeFactory().read(student, course)
     courseware_summary = course_grade.chapter_grades.values()
 
@@ -58,6 +147,10 @@ def get_all_course_progress(student, course):
             total_score += section.all_total.possible
             earned_score += section.all_total.earned
 
+    return _get_progress_percentage(earned_score, total_score)
+
+
+def _get_progress_percentage(earned_score, total_score):
     if total_score:
         average = earned_score / total_score
         percentage = average * 100
@@ -127,6 +220,29 @@ def update_nodebb_for_user_status(username):
     task_update_onboarding_surveys_status.delay(username=username)
 
 
+def queue_user_profile_update_on_nodebb(username, profile_data):
+    """
+    Queue profile changes of a user to be sent to NodeBB
+
+    Changes queued for the same user within the debounce window are merged and sent to NodeBB as a single
+    profile update, later values of a field override the earlier ones.
+
+    Arguments:
+        username (str): username of the user whose profile is changed
+        profile_data (dict): changed profile fields
+
+    Returns:
+        None
+    """
+    increment_profile_sync_counter(PROFILE_SYNC_QUEUED)
+
+    if merge_pending_profile_data(username, profile_data):
+        increment_profile_sync_counter(PROFILE_SYNC_MERGED)
+
+    if claim_profile_flush(username):
+        task_flush_user_profile_on_nodebb.apply_async(kwargs={'username': username}, countdown=get_debounce_window())
+
+
 def set_user_activation_status_on_nodebb(username, is_active):
     """
     Call nodebb client to update NodeBB for user's activation status
@@ -0,0 +1,161 @@
+"""
+Coalescing store for NodeBB profile updates.
+
+A single onboarding form saves UserProfile, UserExtendedProfile and Organization one after another and each save
+used to send its own profile update to NodeBB. Instead, signal handlers merge their deltas per username in the
+cache and only one flush task per username is scheduled within the debounce window. The flush merges the pending
+deltas and sends them to NodeBB as one call.
+
+Every delta is kept in its own cache entry, keyed on a sequence number of the user which is incremented atomically,
+so that concurrent writers never drop each other's fields. Deltas are removed only once NodeBB has accepted them,
+a failed flush is retried with any change made in the meantime.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from nodebb.constants import (
+    PROFILE_SYNC_COUNTER_KEY,
+    PROFILE_SYNC_COUNTERS,
+    PROFILE_SYNC_DEBOUNCE_SECONDS,
+    PROFILE_SYNC_DELTA_KEY,
+    PROFILE_SYNC_FLUSH_KEY,
+    PROFILE_SYNC_FLUSHED_KEY,
+    PROFILE_SYNC_PENDING_TIMEOUT,
+    PROFILE_SYNC_SEQUENCE_KEY
+)
+
+
+def get_debounce_window():
+    """
+    Seconds to wait for more profile changes of a user before sending them to NodeBB
+    """
+    return getattr(settings, 'NODEBB_PROFILE_SYNC_DEBOUNCE', PROFILE_SYNC_DEBOUNCE_SECONDS)
+
+
+def _increment_sequence(username):
+    """
+    Returns:
+        int: new sequence number of the deltas of the user
+    """
+    key = PROFILE_SYNC_SEQUENCE_KEY.format(username=username)
+    cache.add(key, 0, None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(key, 1, None)
+        return 1
+
+
+def _get_flushed_sequence(username, sequence):
+    """
+    Sequence number of the last delta of the user sent to NodeBB
+    """
+    flushed_sequence = cache.get(PROFILE_SYNC_FLUSHED_KEY.format(username=username), 0)
+    # sequence starts again if its key is evicted, all of its deltas are pending then
+    return flushed_sequence if flushed_sequence <= sequence else 0
+
+
+def _get_delta_keys(username, flushed_sequence, sequence):
+    return [
+        PROFILE_SYNC_DELTA_KEY.format(username=username, sequence=delta_sequence)
+        for delta_sequence in range(flushed_sequence + 1, sequence + 1)
+    ]
+
+
+def merge_pending_profile_data(username, profile_data):
+    """
+    Add `profile_data` to the pending deltas of the user
+
+    Arguments:
+        username (str): username of the user on NodeBB
+        profile_data (dict): changed profile fields
+
+    Returns:
+        bool: True if the data was merged with already pending deltas
+    """
+    sequence = _increment_sequence(username)
+    cache.set(
+        PROFILE_SYNC_DELTA_KEY.format(username=username, sequence=sequence), profile_data, PROFILE_SYNC_PENDING_TIMEOUT
+    )
+    return sequence - _get_flushed_sequence(username, sequence) > 1
+
+
+def get_pending_profile_data(username):
+    """
+    Merge pending deltas of the user, later deltas override fields of the earlier ones. Deltas are kept until
+    `acknowledge_profile_data` is called with the returned sequence.
+
+    Returns:
+        tuple: merged delta, None if nothing is pending, and sequence number of the last merged delta
+    """
+    sequence = cache.get(PROFILE_SYNC_SEQUENCE_KEY.format(username=username), 0)
+    flushed_sequence = _get_flushed_sequence(username, sequence)
+    delta_keys = _get_delta_keys(username, flushed_sequence, sequence)
+    deltas = cache.get_many(delta_keys)
+
+    pending_data = {}
+    merged_sequence = flushed_sequence
+    for delta_sequence, key in enumerate(delta_keys, flushed_sequence + 1):
+        if key in deltas:
+            pending_data.update(deltas[key])
+            merged_sequence = delta_sequence
+
+    # trailing deltas may still be written by their senders, which schedule another flush for them
+    return pending_data or None, merged_sequence
+
+
+def acknowledge_profile_data(username, sequence):
+    """
+    Remove deltas of the user up to `sequence`, once these are sent to NodeBB
+    """
+    flushed_sequence = _get_flushed_sequence(username, sequence)
+    cache.set(PROFILE_SYNC_FLUSHED_KEY.format(username=username), sequence, None)
+    cache.delete_many(_get_delta_keys(username, flushed_sequence, sequence))
+
+
+def claim_profile_flush(username):
+    """
+    Mark a flush as scheduled for the user
+
+    Returns:
+        bool: True if caller should schedule the flush, False if one is already scheduled
+    """
+    return cache.add(PROFILE_SYNC_FLUSH_KEY.format(username=username), True, PROFILE_SYNC_PENDING_TIMEOUT)
+
+
+def release_profile_flush(username):
+    """
+    Allow a new flush to be scheduled for the user, must be called before the pending deltas are read
+    """
+    cache.delete(PROFILE_SYNC_FLUSH_KEY.format(username=username))
+
+
+def increment_profile_sync_counter(name, delta=1):
+    """
+    Increment one of PROFILE_SYNC_COUNTERS
+    """
+    key = PROFILE_SYNC_COUNTER_KEY.format(name=name)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(key, delta, None)
+
+
+def get_profile_sync_counters():
+    """
+    Returns:
+        dict: count of queued, merged, sent and failed profile updates
+    """
+    keys = {PROFILE_SYNC_COUNTER_KEY.format(name=name): name for name in PROFILE_SYNC_COUNTERS}
+    values = cache.get_many(keys.keys())
+    return {name: values.get(key, 0) for key, name in keys.items()}
+
+
+def reset_profile_sync_counters():
+    """
+    Reset all profile sync counters to zero
+    """
+    cache.delete_many([PROFILE_SYNC_COUNTER_KEY.format(name=name) for name in PROFILE_SYNC_COUNTERS])
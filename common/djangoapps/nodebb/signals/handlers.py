@@ -10,7 +10,7 @@ from django.dispatch import receiver
 
 from common.lib.nodebb_client.client import NodeBBClient
 from lms.djangoapps.certificates.models import GeneratedCertificate
-from lms.djangoapps.onboarding.helpers import COUNTRIES
+from lms.djangoapps.onboarding.lookups import get_country_name
 from lms.djangoapps.onboarding.models import FocusArea, Organization, UserExtendedProfile
 from lms.djangoapps.teams.models import CourseTeam, CourseTeamMembership
 from mailchimp_pipeline.signals.handlers import (
@@ -18,15 +18,14 @@ from mailchimp_pipeline.signals.handlers import (
     send_user_enrollments_to_mailchimp,
     send_user_info_to_mailchimp
 )
-from nodebb.helpers import get_community_id
+from nodebb.helpers import get_community_id, queue_user_profile_update_on_nodebb
 from nodebb.models import DiscussionCommunity, TeamGroupChat
 from nodebb.tasks import (
     task_activate_user_on_nodebb,
     task_create_user_on_nodebb,
     task_delete_user_on_nodebb,
     task_join_group_on_nodebb,
-    task_un_join_group_on_nodebb,
-    task_update_user_profile_on_nodebb
+    task_un_join_group_on_nodebb
 )
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.signals.signals import COURSE_CERT_AWARDED
@@ -75,12 +74,11 @@ def sync_user_profile_info_with_nodebb(sender, instance, **kwargs):  # pylint: d
     user = instance.user
     data_to_sync = {
         "city_of_residence": instance.city,
-        "country_of_residence": COUNTRIES.get(instance.country.code, ''),
+        "country_of_residence": get_country_name(instance.country.code, ''),
         "birthday": "01/01/%s" % instance.year_of_birth,
         "language": instance.language,
     }
-    task_update_user_profile_on_nodebb.delay(
-        username=user.username, profile_data=data_to_sync)
+    queue_user_profile_update_on_nodebb(username=user.username, profile_data=data_to_sync)
 
 
 @receiver(post_save, sender=UserExtendedProfile)
@@ -102,7 +100,7 @@ def sync_extended_profile_info_with_nodebb(sender, instance, **kwargs):  # pylin
         return
 
     data_to_sync = {
-        "country_of_employment": COUNTRIES.get(instance.country_of_employment, ''),
+        "country_of_employment": get_country_name(instance.country_of_employment, ''),
         "city_of_employment": instance.city_of_employment,
         "interests": instance.get_user_selected_interests(),
         "self_prioritize_areas": instance.get_user_selected_functions()
@@ -113,8 +111,7 @@ def sync_extended_profile_info_with_nodebb(sender, instance, **kwargs):  # pylin
 
     # sanity to confirm that some data actually exists to sync, during registration
     if 'registration' not in request.path or any(data_to_sync.values()):
-        task_update_user_profile_on_nodebb.delay(
-            username=user.username, profile_data=data_to_sync)
+        queue_user_profile_update_on_nodebb(username=user.username, profile_data=data_to_sync)
 
 
 @receiver(post_save, sender=Organization)
@@ -138,8 +135,7 @@ def sync_organization_info_with_nodebb(sender, instance, created, **kwargs):  #
 
     user = request.user
 
-    task_update_user_profile_on_nodebb.delay(
-        username=user.username, profile_data=data_to_sync)
+    queue_user_profile_update_on_nodebb(username=user.username, profile_data=data_to_sync)
 
 
 @receiver(post_save, sender=User, dispatch_uid='update_user_profile_on_nodebb')
@@ -178,8 +174,7 @@ def update_user_profile_on_nodebb(sender, instance, created, **kwargs):
             'last_name': instance.last_name
         }
 
-        task_update_user_profile_on_nodebb.delay(
-            username=instance.username, profile_data=data_to_sync)
+        queue_user_profile_update_on_nodebb(username=instance.username, profile_data=data_to_sync)
 
 
 @receiver(post_delete, sender=User)
@@ -5,8 +5,16 @@ from celery.task import task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.contrib.auth.models import User
+from requests.exceptions import RequestException
 
-from common.lib.nodebb_client.client import NodeBBClient
+from common.lib.nodebb_client.client import NodeBBClient, get_pooled_nodebb_client
+from nodebb.constants import PROFILE_SYNC_FAILED, PROFILE_SYNC_MAX_RETRIES, PROFILE_SYNC_SENT
+from nodebb.profile_sync import (
+    acknowledge_profile_data,
+    get_pending_profile_data,
+    increment_profile_sync_counter,
+    release_profile_flush
+)
 
 LOGGER = get_task_logger(__name__)
 
@@ -63,6 +71,40 @@ def task_update_user_profile_on_nodebb(username, profile_data):
     handle_response(task_update_user_profile_on_nodebb, 'Update user profile', status_code, response, username)
 
 
+@task(default_retry_delay=RETRY_DELAY, max_retries=PROFILE_SYNC_MAX_RETRIES, routing_key=settings.HIGH_PRIORITY_QUEUE)
+def task_flush_user_profile_on_nodebb(username):
+    """
+    Celery task to send all pending profile changes of a user to NodeBB in a single call. Changes are kept pending
+    until NodeBB accepts them, a retry sends them along with any change made in the meantime. Changes still pending
+    once retries are exhausted are sent by the next flush of the user.
+    """
+    release_profile_flush(username)
+    profile_data, sequence = get_pending_profile_data(username)
+
+    if not profile_data:
+        # already flushed by another task
+        return
+
+    try:
+        status_code, response = get_pooled_nodebb_client().users.update_profile(
+            username=username, profile_data=profile_data
+        )
+    except RequestException as exc:
+        increment_profile_sync_counter(PROFILE_SYNC_FAILED)
+        LOGGER.warning('Retrying: Flush user profile task for user: %s, error: %s', username, exc)
+        raise task_flush_user_profile_on_nodebb.retry(exc=exc)
+
+    if not 200 <= status_code < 300:
+        increment_profile_sync_counter(PROFILE_SYNC_FAILED)
+        LOGGER.warning('Retrying: Flush user profile task for user: %s, status_code: %s, response: %s',
+                       username, status_code, response)
+        raise task_flush_user_profile_on_nodebb.retry()
+
+    acknowledge_profile_data(username, sequence)
+    increment_profile_sync_counter(PROFILE_SYNC_SENT)
+    handle_response(task_flush_user_profile_on_nodebb, 'Flush user profile', status_code, response, username)
+
+
 @task(default_retry_delay=RETRY_DELAY, max_retries=None, routing_key=settings.HIGH_PRIORITY_QUEUE)
 def task_sync_badge_info_with_nodebb(badge_info):
     """
@@ -2,18 +2,33 @@
 Tests for Nodebb app
 """
 import mock
+from celery.exceptions import Retry
 from django.test import TestCase
+from opaque_keys.edx.locator import BlockUsageLocator, CourseLocator
 from requests.exceptions import ConnectionError
 
+from capa.tests.response_xml_factory import MultipleChoiceResponseXMLFactory
 from common.lib.nodebb_client.client import NodeBBClient
+from lms.djangoapps.grades.models import BlockRecordList, PersistentSubsectionGrade
+from nodebb.helpers import (
+    get_course_possible_score,
+    get_users_course_progress,
+    queue_user_profile_update_on_nodebb
+)
+from nodebb.profile_sync import get_profile_sync_counters
 from nodebb.tasks import (
     task_activate_user_on_nodebb,
     task_create_user_on_nodebb,
     task_delete_user_on_nodebb,
+    task_flush_user_profile_on_nodebb,
     task_join_group_on_nodebb,
     task_update_onboarding_surveys_status,
     task_update_user_profile_on_nodebb
 )
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from student.tests.factories import UserFactory
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
 
 class NodeBBUserCreationTestCase(TestCase):
@@ -115,3 +130,139 @@ class NodeBBUserCreationTestCase(TestCase):
                 task_update_onboarding_surveys_status.delay(username=username)
 
                 method.assert_called_with(username=username)
+
+
+class NodeBBProfileSyncTestCase(CacheIsolationTestCase):
+    """
+    Test coalescing of profile updates sent to NodeBB
+    """
+    ENABLED_CACHES = ['default']
+
+    @mock.patch('nodebb.helpers.task_flush_user_profile_on_nodebb.apply_async')
+    def test_updates_of_same_user_are_merged(self, mocked_apply_async):
+        queue_user_profile_update_on_nodebb('testuser', {'city_of_residence': 'Lahore', 'language': 'English'})
+        queue_user_profile_update_on_nodebb('testuser', {'language': 'Urdu'})
+        queue_user_profile_update_on_nodebb('testuser', {'focus_area': 'Education'})
+
+        self.assertEqual(mocked_apply_async.call_count, 1)
+
+        with mock.patch('common.lib.nodebb_client.users.ForumUser.update_profile', return_value=(200, {})) as update:
+            task_flush_user_profile_on_nodebb(username='testuser')
+
+        update.assert_called_once_with(
+            username='testuser',
+            profile_data={'city_of_residence': 'Lahore', 'language': 'Urdu', 'focus_area': 'Education'}
+        )
+        self.assertEqual(get_profile_sync_counters(), {'queued': 3, 'merged': 2, 'sent': 1, 'failed': 0})
+
+    @mock.patch('nodebb.helpers.task_flush_user_profile_on_nodebb.apply_async')
+    def test_flush_schedules_again_for_new_updates(self, mocked_apply_async):
+        queue_user_profile_update_on_nodebb('testuser', {'language': 'English'})
+
+        with mock.patch('common.lib.nodebb_client.users.ForumUser.update_profile', return_value=(200, {})) as update:
+            task_flush_user_profile_on_nodebb(username='testuser')
+            # nothing is pending, flushing again must not call NodeBB
+            task_flush_user_profile_on_nodebb(username='testuser')
+
+        self.assertEqual(update.call_count, 1)
+
+        queue_user_profile_update_on_nodebb('testuser', {'language': 'Urdu'})
+        self.assertEqual(mocked_apply_async.call_count, 2)
+
+    @mock.patch('nodebb.tasks.task_flush_user_profile_on_nodebb.retry', return_value=Retry())
+    @mock.patch('nodebb.helpers.task_flush_user_profile_on_nodebb.apply_async')
+    def test_failed_flush_keeps_changes_and_retries(self, mocked_apply_async, mocked_retry):
+        """
+        Test changes are kept when NodeBB cannot be reached or rejects them, and are sent by the retry along with
+        changes made in the meantime
+        """
+        queue_user_profile_update_on_nodebb('testuser', {'city_of_residence': 'Lahore', 'language': 'English'})
+
+        for side_effect in [ConnectionError(), [(500, {})]]:
+            with mock.patch('common.lib.nodebb_client.users.ForumUser.update_profile', side_effect=side_effect):
+                with self.assertRaises(Retry):
+                    task_flush_user_profile_on_nodebb(username='testuser')
+
+        queue_user_profile_update_on_nodebb('testuser', {'language': 'Urdu'})
+
+        with mock.patch('common.lib.nodebb_client.users.ForumUser.update_profile', return_value=(200, {})) as update:
+            task_flush_user_profile_on_nodebb(username='testuser')
+            task_flush_user_profile_on_nodebb(username='testuser')
+
+        update.assert_called_once_with(
+            username='testuser', profile_data={'city_of_residence': 'Lahore', 'language': 'Urdu'}
+        )
+        self.assertEqual(mocked_retry.call_count, 2)
+        self.assertEqual(get_profile_sync_counters(), {'queued': 2, 'merged': 1, 'sent': 1, 'failed': 2})
+
+
+class NodeBBCourseProgressTestCase(TestCase):
+    """
+    Test course progress shown on community pages is read from persisted subsection grades
+    """
+
+    def setUp(self):
+        super(NodeBBCourseProgressTestCase, self).setUp()
+        self.course = mock.Mock(id=CourseLocator('edX', 'CS101', '2015_Q1'))
+        self.users = [UserFactory(), UserFactory(), UserFactory()]
+
+    def _create_subsection_grade(self, user, subsection, earned_all, possible_all):
+        PersistentSubsectionGrade.update_or_create_grade(
+            user_id=user.id,
+            usage_key=BlockUsageLocator(course_key=self.course.id, block_type='sequential', block_id=subsection),
+            course_version='deadbeef',
+            subtree_edited_timestamp=None,
+            earned_all=earned_all,
+            possible_all=possible_all,
+            earned_graded=earned_all,
+            possible_graded=possible_all,
+            visible_blocks=BlockRecordList([], self.course.id),
+            first_attempted=None,
+        )
+
+    @mock.patch('nodebb.helpers.get_course_possible_score', return_value=16.0)
+    @mock.patch('nodebb.helpers.should_persist_grades', return_value=True)
+    @mock.patch('nodebb.helpers.CourseGradeFactory')
+    def test_progress_of_many_users(self, mocked_grade_factory, mocked_should_persist_grades,
+                                    mocked_get_course_possible_score):
+        """
+        Test earned score of attempted subsections is divided by possible score of the whole course
+        """
+        self._create_subsection_grade(self.users[0], 'subsection_1', 3.0, 4.0)
+        self._create_subsection_grade(self.users[0], 'subsection_2', 0.0, 4.0)
+        self._create_subsection_grade(self.users[1], 'subsection_1', 4.0, 4.0)
+
+        progress = get_users_course_progress(self.course, self.users)
+
+        self.assertEqual(progress, {self.users[0].id: 18, self.users[1].id: 25, self.users[2].id: 0})
+        mocked_get_course_possible_score.assert_called_once_with(self.course.id)
+        self.assertFalse(mocked_grade_factory.called)
+
+
+class NodeBBCoursePossibleScoreTestCase(ModuleStoreTestCase):
+    """
+    Test possible score of a course, used as denominator of course progress
+    """
+
+    def setUp(self):
+        super(NodeBBCoursePossibleScoreTestCase, self).setUp()
+        self.course = CourseFactory.create()
+        problem_xml = MultipleChoiceResponseXMLFactory().build_xml(
+            question_text='The correct answer is Choice 1',
+            choices=[True, False],
+            choice_names=['choice_0', 'choice_1']
+        )
+        with self.store.bulk_operations(self.course.id):
+            chapter = ItemFactory.create(parent=self.course, category='chapter')
+            sequence = ItemFactory.create(parent=chapter, category='sequential')
+            ItemFactory.create(parent=sequence, category='problem', data=problem_xml)
+            ItemFactory.create(parent=sequence, category='problem', data=problem_xml, metadata={'weight': 4})
+            ItemFactory.create(parent=sequence, category='html')
+
+    def test_possible_score_of_whole_course_is_cached(self):
+        self.assertEqual(get_course_possible_score(self.course.id), 5.0)
+
+        with mock.patch('nodebb.helpers.get_course_in_cache') as mocked_get_course_in_cache:
+            self.assertEqual(get_course_possible_score(self.course.id), 5.0)
+
+        self.assertFalse(mocked_get_course_in_cache.called)
@@ -1,12 +1,30 @@
 """
 All helpers for philu_commands
 """
+import json
+import zlib
 from logging import getLogger
 
+from django.conf import settings
+from django.core.cache import cache
+from django.core.urlresolvers import reverse
+from opaque_keys.edx.keys import UsageKey
+
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from xmodule.modulestore.django import modulestore
 
 log = getLogger(__name__)
 
+ORA_ASSESSMENT_BLOCK = 'openassessment'
+COURSE_MODULES_INDEX_CACHE_KEY = 'philu_commands.course_modules_index.{course_id}.{version}'
+COURSE_MODULES_INDEX_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+COURSE_STRUCTURE_CACHE_KEY = 'philu_commands.course_structure.{course_id}.{version}'
+COURSE_STRUCTURE_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+COURSE_STRUCTURE_CACHE_COUNTER_KEY = 'philu_commands.course_structure.{name}'
+COURSE_STRUCTURE_CACHE_HIT = 'hit'
+COURSE_STRUCTURE_CACHE_MISS = 'miss'
+COURSE_STRUCTURE_CACHE_COUNTERS = (COURSE_STRUCTURE_CACHE_HIT, COURSE_STRUCTURE_CACHE_MISS)
+
 
 def generate_course_structure(course_key):
     """
@@ -55,20 +73,129 @@ def generate_course_structure(course_key):
         }
 
 
-def has_active_certificate(course):
+def get_course_structure(course_key):
+    """
+    Get course structure, same as `generate_course_structure`, from a cache shared by all processes.
+
+    Structure is cached as compressed json against the published version of the course, i.e. modified time of
+    its CourseOverview, so nightly commands build it once per version instead of loading the full descriptor tree
+    for every run. Structure of a course without CourseOverview is not cached.
+
+    Args:
+        course_key (CourseKey): Course for which structure is required
+
+    Returns:
+        dict: `structure` and `discussion_id_map` of the course
+    """
+    course_modified = CourseOverview.objects.filter(id=course_key).values_list('modified', flat=True).first()
+    if not course_modified:
+        return generate_course_structure(course_key)
+
+    cache_key = COURSE_STRUCTURE_CACHE_KEY.format(course_id=course_key, version=course_modified.isoformat())
+    cached_structure = cache.get(cache_key)
+
+    if cached_structure is not None:
+        increment_course_structure_cache_counter(COURSE_STRUCTURE_CACHE_HIT)
+        return json.loads(zlib.decompress(cached_structure))
+
+    increment_course_structure_cache_counter(COURSE_STRUCTURE_CACHE_MISS)
+    course_structure = generate_course_structure(course_key)
+    cache.set(cache_key, zlib.compress(json.dumps(course_structure)), COURSE_STRUCTURE_CACHE_TIMEOUT)
+    return course_structure
+
+
+def increment_course_structure_cache_counter(name):
+    """
+    Increment one of COURSE_STRUCTURE_CACHE_COUNTERS
+    """
+    key = COURSE_STRUCTURE_CACHE_COUNTER_KEY.format(name=name)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(key, 1, None)
+
+
+def get_course_structure_cache_metrics():
+    """
+    Returns:
+        dict: number of course structure cache hits and misses
+    """
+    keys = {COURSE_STRUCTURE_CACHE_COUNTER_KEY.format(name=name): name for name in COURSE_STRUCTURE_CACHE_COUNTERS}
+    values = cache.get_many(keys.keys())
+    return {name: values.get(key, 0) for key, name in keys.items()}
+
+
+def reset_course_structure_cache_metrics():
+    """
+    Reset course structure cache hits and misses to zero
+    """
+    cache.delete_many([COURSE_STRUCTURE_CACHE_COUNTER_KEY.format(name=name) for name in COURSE_STRUCTURE_CACHE_COUNTERS])
+
+
+def get_course_modules_index(course):
     """
-    Return true if course contains any active certificate
+    Get modules (chapters) of a course, in order, with the ORA blocks of their graded sub-sections.
+
+    The index is cached against the published version of the course, so it is built once per version instead of
+    walking the modulestore for every learner.
 
     Args:
-        course (Course): Course from module store
+        course (CourseOverview): Course for which index is required
 
     Returns:
-        boolean: True if course contains any active certificate, False otherwise
+        list: dict for every module with `usage_key`, `display_name`, `url` of its first sub-section and
+            `graded_sequentials`, a list containing list of ORA usage keys for every graded sub-section
     """
-    has_activated_certificate = False
-    certificates = course.certificates
+    cache_key = COURSE_MODULES_INDEX_CACHE_KEY.format(
+        course_id=course.id, version=course.modified.isoformat() if course.modified else ''
+    )
+    modules = cache.get(cache_key)
+
+    if modules is None:
+        modules = build_course_modules_index(course.id, get_course_structure(course.id)['structure'])
+        cache.set(cache_key, modules, COURSE_MODULES_INDEX_CACHE_TIMEOUT)
+
+    return modules
+
+
+def build_course_modules_index(course_id, course_structure):
+    """
+    Build modules index from course structure generated by `generate_course_structure`
+    """
+    blocks = course_structure['blocks']
+    modules = []
+
+    for chapter_key in blocks[course_structure['root']]['children']:
+        chapter = blocks[chapter_key]
+        graded_sequentials = []
+
+        for sequential_key in chapter['children']:
+            sequential = blocks[sequential_key]
+            if not sequential['graded']:
+                continue
+
+            graded_sequentials.append([
+                component_key
+                for vertical_key in sequential['children']
+                for component_key in blocks[vertical_key]['children']
+                if blocks[component_key]['block_type'] == ORA_ASSESSMENT_BLOCK
+            ])
+
+        url = ''
+        if chapter['children']:
+            url = settings.LMS_ROOT_URL + reverse('courseware_section', args=[
+                course_id.to_deprecated_string(),
+                UsageKey.from_string(chapter_key).block_id,
+                UsageKey.from_string(chapter['children'][0]).block_id,
+            ])
 
-    if certificates:
-        has_activated_certificate = any([certificate['is_active'] for certificate in certificates['certificates']])
+        modules.append({
+            'usage_key': chapter_key,
+            'display_name': chapter['display_name'],
+            'url': url,
+            'graded_sequentials': graded_sequentials,
+        })
 
-    return has_activated_certificate
+    return modules
@@ -9,13 +9,17 @@ from logging import getLogger
 
 from django.apps import apps
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 from opaque_keys.edx.keys import UsageKey
 from pytz import UTC
 
 from courseware.views.views import _get_cert_data
 from lms.djangoapps.certificates.api import generate_user_certificates
-from lms.djangoapps.certificates.models import CertificateStatuses
-from philu_commands.helpers import has_active_certificate
+from lms.djangoapps.certificates.models import CertificateStatuses, CertificateWhitelist
+from lms.djangoapps.grades.config import should_persist_grades
+from lms.djangoapps.grades.models import PersistentCourseGrade
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from philu_commands.helpers import get_course_structure
 from student.models import CourseEnrollment
 from xmodule.modulestore.django import modulestore
 
@@ -24,34 +28,92 @@ log = getLogger(__name__)
 CERT_GENERATION_RESPONSE_MESSAGE = 'Generating certificate for user with ' \
                                    'username: {} and user_id: {} with ' \
                                    'generation status: {}'
+ESTIMATED_MODULE_COMPLETION_DAYS = 7
+ENROLLMENTS_BATCH_SIZE = 500
+# Users with these certificate statuses can not request a certificate, see `courseware.views.views._certificate_message`
+CERTIFICATE_REQUESTED_STATUSES = CertificateStatuses.PASSED_STATUSES + (CertificateStatuses.unverified,)
 
 StudentModule = apps.get_model('courseware', 'StudentModule')
 GeneratedCertificate = apps.get_model('certificates', 'GeneratedCertificate')
 
 
 def is_course_valid_for_certificate_auto_generation(course):
+    """
+    Check if certificates of a running course can be generated
+
+    Args:
+        course (CourseOverview): Course overview
+
+    Returns:
+        bool: True if course has started, has not ended, may certify and has an active certificate
+    """
     return bool(
-        course.has_started() and not course.has_ended() and course.may_certify()) and has_active_certificate(course)
+        course.has_started() and not course.has_ended() and course.may_certify() and
+        course.has_any_active_web_certificate
+    )
+
+
+def get_open_courses():
+    """
+    Get overviews of currently running courses with an active certificate, without loading course descriptors
+    """
+    now = datetime.now(UTC)
+    courses = CourseOverview.objects.filter(
+        Q(end__isnull=True) | Q(end__gt=now), start__lte=now, has_any_active_web_certificate=True
+    )
+    return [course for course in courses if is_course_valid_for_certificate_auto_generation(course)]
+
+
+def get_certificate_candidate_enrollments(course_id):
+    """
+    Get active enrollments of the course of users who have passed the course, or are whitelisted, and have not
+    requested a certificate yet. Passing status is read from persisted course grades, all active enrollments are
+    candidates for courses whose grades are not persisted.
 
+    Returns:
+        QuerySet: enrollments ordered on user id
+    """
+    enrollments = CourseEnrollment.objects.filter(course_id=course_id, is_active=True).exclude(
+        user_id__in=GeneratedCertificate.objects.filter(
+            course_id=course_id, status__in=CERTIFICATE_REQUESTED_STATUSES
+        ).values('user_id')
+    )
+
+    if should_persist_grades(course_id):
+        enrollments = enrollments.filter(
+            Q(user_id__in=PersistentCourseGrade.objects.filter(
+                course_id=course_id, passed_timestamp__isnull=False
+            ).values('user_id')) |
+            Q(user_id__in=CertificateWhitelist.objects.filter(course_id=course_id, whitelist=True).values('user_id'))
+        )
+
+    return enrollments.select_related('user').order_by('user_id')
+
+
+def get_last_module_visitor_ids(last_module_key, user_ids):
+    """
+    Get users, out of the given ones, who have visited the last module of the course with one query
 
-def _is_eligible_for_certificate(user_course_enrollment, course_chapters, user):
+    Returns:
+        set: user ids
+    """
+    return set(StudentModule.objects.filter(
+        module_state_key=last_module_key, student_id__in=user_ids
+    ).values_list('student_id', flat=True).distinct())
+
+
+def _is_eligible_for_certificate(user_course_enrollment, total_modules, is_last_module_visited):
     """
     This is checking if the user enrollment if eligible for the certificate generation.
     :param user_course_enrollment:
-    :param course_chapters:
-    :param user:
+    :param total_modules: number of modules in course
+    :param is_last_module_visited: True if user has visited the last module of course
     :return:
         bool: True if the current enrollment is eligible for the certificate generation.
     """
-    COURSE_STRUCTURE_INDEX = 0
-    ESTIMATED_MODULE_COMPLETION_DAYS = 7
     today = datetime.now(UTC)
     delta_days = (today.date() - user_course_enrollment.created.date()).days
-    total_modules = len(course_chapters[COURSE_STRUCTURE_INDEX].children)
-    last_module_id = str(course_chapters[COURSE_STRUCTURE_INDEX].children[-1])
-    usage_key = UsageKey.from_string(last_module_id)
-    is_lastmodule_visitied = StudentModule.objects.filter(student=user, module_state_key=usage_key).exists()
-    return ((total_modules - 1) * ESTIMATED_MODULE_COMPLETION_DAYS) >= delta_days and not is_lastmodule_visitied
+    return ((total_modules - 1) * ESTIMATED_MODULE_COMPLETION_DAYS) >= delta_days and not is_last_module_visited
 
 
 class Command(BaseCommand):
@@ -66,32 +128,63 @@ class Command(BaseCommand):
     running courses that have "certificate_display_behavior" set as
     "early_no_info" or "early_with_info"
 
+    Only enrollments of users who have passed and have not requested a certificate are evaluated, in batches, so
+    a run takes time in proportion to the number of new certificates instead of the total enrollments.
+
     example:
         manage.py ... auto_generate_certificates_for_open_courses
     """
 
     def handle(self, *args, **options):
-        for course in modulestore().get_courses():
-            if not is_course_valid_for_certificate_auto_generation(course):
-                continue
-            log.info('course id : {course_id}'.format(course_id=course.id))
-            for user_course_enrollment in CourseEnrollment.objects.filter(course_id=course.id, is_active=True).all():
-                user = user_course_enrollment.user
-                cert_data = _get_cert_data(user, course, user_course_enrollment.mode)
-                if not cert_data or cert_data.cert_status != CertificateStatuses.requesting:
-                    cert_status = cert_data.cert_status if cert_data else 'not available'
-                    log.info('skipping because status is : {cert_status}'.format(cert_status=cert_status))
-                    continue
-                course_chapters = modulestore().get_items(
-                    course.id,
-                    qualifiers={'category': 'course'}
+        for course_overview in get_open_courses():
+            log.info('course id : {course_id}'.format(course_id=course_overview.id))
+            self.generate_course_certificates(course_overview.id)
+
+    def generate_course_certificates(self, course_id):
+        """
+        Generate certificates of eligible users of a course, in batches of enrollments
+        """
+        enrollments = get_certificate_candidate_enrollments(course_id)
+        modules = get_course_structure(course_id)['structure']
+        course_modules = modules['blocks'][modules['root']]['children']
+        last_module_key = UsageKey.from_string(course_modules[-1]) if course_modules else None
+        course = None
+        last_user_id = 0
+
+        while True:
+            batch = list(enrollments.filter(user_id__gt=last_user_id)[:ENROLLMENTS_BATCH_SIZE])
+            if not batch:
+                break
+
+            last_user_id = batch[-1].user_id
+            visitor_ids = get_last_module_visitor_ids(
+                last_module_key, [enrollment.user_id for enrollment in batch]
+            ) if last_module_key else set()
+
+            # descriptor is loaded only for courses which have candidates
+            course = course or modulestore().get_course(course_id)
+
+            for user_course_enrollment in batch:
+                self.generate_user_certificate(
+                    course, user_course_enrollment, len(course_modules), user_course_enrollment.user_id in visitor_ids
                 )
 
-                if _is_eligible_for_certificate(user_course_enrollment, course_chapters, user):
-                    log.info('skipping because course with id {course_id} is not eligible for certificate'.format(
-                        course_id=course.id
-                    ))
-                    continue
-
-                status = generate_user_certificates(user, course.id, course=course, send_email=True)
-                log.info(CERT_GENERATION_RESPONSE_MESSAGE.format(user.username, user.id, status))
+    def generate_user_certificate(self, course, user_course_enrollment, total_modules, is_last_module_visited):
+        """
+        Generate certificate of an enrolled user if user can request it and is eligible for it
+        """
+        user = user_course_enrollment.user
+        cert_data = _get_cert_data(user, course, user_course_enrollment.mode)
+        if not cert_data or cert_data.cert_status != CertificateStatuses.requesting:
+            cert_status = cert_data.cert_status if cert_data else 'not available'
+            log.info('skipping because status is : {cert_status}'.format(cert_status=cert_status))
+            return
+
+        if _is_eligible_for_certificate(user_course_enrollment, total_modules, is_last_module_visited):
+            log.info('skipping because course with id {course_id} is not eligible for certificate'.format(
+                course_id=course.id
+            ))
+            return
+
+        status = generate_user_certificates(user, course.id, course=course, send_email=True)
+        log.info(CERT_GENERATION_RESPONSE_MESSAGE.format(user.username, user.id, status))
@@ -6,7 +6,11 @@ from datetime import datetime
 from django.core.management.base import BaseCommand
 
 from lms.djangoapps.certificates.models import GeneratedCertificate
-from openedx.features.student_certificates.tasks import task_create_certificate_img_and_upload_to_s3
+from openedx.features.student_certificates.image_renderer import claim_certificate_image
+from openedx.features.student_certificates.tasks import (
+    task_create_certificate_img_and_upload_to_s3,
+    task_create_certificate_images_and_upload_to_s3
+)
 
 
 class Command(BaseCommand):
@@ -28,12 +32,17 @@ class Command(BaseCommand):
             nargs='?',
             help='Create images of all certificates generated after given date like (15/09/1995) - (day/month/year)',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Create images in batches of given size, each batch is rendered by one task with a pool of renderers',
+        )
 
     def handle(self, *args, **options):
         # pylint: disable=no-member
         opt_after = options['after']
         opt_uuid = options['uuid']
-        certificates = []
 
         if opt_after:
             after_date = datetime.strptime(opt_after, '%d/%m/%Y')
@@ -45,5 +54,18 @@ class Command(BaseCommand):
         else:
             certificates = GeneratedCertificate.objects.all()
 
-        for certificate in certificates:
-            task_create_certificate_img_and_upload_to_s3.delay(verify_uuid=certificate.verify_uuid)
+        batch_size = options['batch_size']
+        if not batch_size:
+            for certificate in certificates:
+                task_create_certificate_img_and_upload_to_s3.delay(verify_uuid=certificate.verify_uuid)
+            return
+
+        # images already queued, e.g. by certificate generation, are skipped
+        verify_uuids = [
+            verify_uuid for verify_uuid in certificates.values_list('verify_uuid', flat=True)
+            if claim_certificate_image(verify_uuid)
+        ]
+        for batch_start in range(0, len(verify_uuids), batch_size):
+            task_create_certificate_images_and_upload_to_s3.delay(
+                verify_uuids=verify_uuids[batch_start:batch_start + batch_size]
+            )
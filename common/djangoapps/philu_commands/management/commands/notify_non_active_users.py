@@ -1,7 +1,7 @@
 """
 A command to notify non active users
 """
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from logging import getLogger
 
 from django.core.management.base import BaseCommand
@@ -10,13 +10,15 @@ from pytz import utc
 from common.lib.mandrill_client.client import MandrillClient
 from courseware.models import StudentModule
 from lms.djangoapps.branding import get_visible_courses
-from openedx.core.djangoapps.timed_notification.core import get_course_first_chapter_link
+from openedx.core.djangoapps.timed_notification.core import get_course_first_chapter_link, send_bulk_email
 from openedx.features.course_card.helpers import get_course_open_date
 from student.models import CourseEnrollment
 
 log = getLogger(__name__)
 
 DAYS_TO_SEND_EMAIL = 7
+RECIPIENTS_BATCH_SIZE = 1000
+EMAIL_CAMPAIGN = '{template}:{course_id}:{run_date}'
 
 
 class Command(BaseCommand):
@@ -48,40 +50,56 @@ class Command(BaseCommand):
             log.info('Days passed since course started %s', delta_date.days)
 
             if delta_date.days == DAYS_TO_SEND_EMAIL:
+                notify_non_active_users(course, course_start_date, today)
 
-                log.info('Getting all enrollments for %s course', course.display_name)
-                all_enrollments = CourseEnrollment.objects.filter(course_id=course.id)
 
-                active_users = []
-                enrolled_users = []
-
-                for enrollment in all_enrollments:
-                    enrolled_users.append(enrollment.user)
-
-                modules = StudentModule.objects.filter(course_id=course.id)
-
-                for mod_entry in modules:
-                    # Verifying if mod_entry is between Course Open Date and 7 days after course open date
-                    if course_start_date < mod_entry.created.date() \
-                            <= (course_start_date + timedelta(days=DAYS_TO_SEND_EMAIL)):
-                        active_users.append(mod_entry.student)
-
-                # Getting unique users as Student module may contains multiple entries for same course of same user
-                unique_users = set([k for k in dict.fromkeys(active_users)])
-                # Getting list of those users who haven't entered in course.
-                non_actives = [user for user in enrolled_users if user not in unique_users]
-
-                for non_active_user in non_actives:
-                    first_name = non_active_user.first_name
-                    course_name = course.display_name
-                    course_url = get_course_first_chapter_link(course=course)
-
-                    template = MandrillClient.COURSE_ACTIVATION_REMINDER_TEMPLATE
-                    context = {
-                        'first_name': first_name,
-                        'course_name': course_name,
-                        'course_url': course_url
-                    }
+def notify_non_active_users(course, course_start_date, run_date):
+    """
+    Send activation reminder to users, enrolled in the course, who have not entered the course in 7 days after
+    course open date. Course link is computed once and emails are sent in batches of recipients.
+    """
+    template = MandrillClient.COURSE_ACTIVATION_REMINDER_TEMPLATE
+    context = {
+        'course_name': course.display_name,
+        'course_url': get_course_first_chapter_link(course=course)
+    }
+    campaign = EMAIL_CAMPAIGN.format(template=template, course_id=course.id, run_date=run_date)
+
+    for recipients in get_non_active_user_batches(course.id, course_start_date):
+        status_counts = send_bulk_email(campaign, template, [
+            {'email': email, 'merge_vars': {'first_name': first_name}} for email, first_name in recipients
+        ], context)
+        log.info(
+            'Emailing to %s non active users of %s completed, delivery status: %s',
+            len(recipients), course.id, dict(status_counts)
+        )
+
+
+def get_non_active_user_batches(course_id, course_start_date):
+    """
+    Lazily yields batches of users enrolled in the course with no StudentModule created between course open date and
+    7 days after it. Every batch is one anti-join query keyset paginated on user id.
 
-                    MandrillClient().send_mail(template, non_active_user.email, context)
-                    log.info("Emailing to %s Task Completed", non_active_user.email)
+    Yields:
+        list: (email, first_name) tuples
+    """
+    # Verifying if module is created after Course Open Date and on or before 7 days after course open date
+    window_start = utc.localize(datetime.combine(course_start_date + timedelta(days=1), time.min))
+    window_end = utc.localize(datetime.combine(course_start_date + timedelta(days=DAYS_TO_SEND_EMAIL + 1), time.min))
+
+    active_user_ids = StudentModule.objects.filter(
+        course_id=course_id, created__gte=window_start, created__lt=window_end
+    ).values('student_id')
+    non_active_enrollments = CourseEnrollment.objects.filter(course_id=course_id).exclude(user_id__in=active_user_ids)
+
+    last_user_id = 0
+    while True:
+        users = list(non_active_enrollments.filter(user_id__gt=last_user_id).order_by('user_id').values_list(
+            'user_id', 'user__email', 'user__first_name'
+        )[:RECIPIENTS_BATCH_SIZE])
+
+        if not users:
+            return
+
+        last_user_id = users[-1][0]
+        yield [(email, first_name) for _, email, first_name in users]
@@ -1,27 +1,35 @@
 """
 A command for sending reminder emails to students who have not completed graded modules
 """
+import zlib
 from datetime import datetime, timedelta
 from logging import getLogger
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count, Q
+from django.utils import timezone
 from submissions.models import Submission
 
 from common.lib.mandrill_client.client import MandrillClient
 from lms.djangoapps.onboarding.helpers import get_email_pref_on_demand_course, get_user_anonymous_id
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from openedx.core.djangoapps.timed_notification.core import send_bulk_email
+from openedx.core.djangoapps.timed_notification.models import EmailDeliveryLedger
 from openedx.features.ondemand_email_preferences.helpers import get_my_account_link
 from openedx.features.philu_courseware.helpers import get_nth_chapter_link
-from philu_commands.helpers import generate_course_structure
+from philu_commands.helpers import get_course_structure, get_course_structure_cache_metrics
+from philu_commands.models import CommandShard
 from student.models import CourseEnrollment
-from xmodule.modulestore.django import modulestore
 
 log = getLogger(__name__)
 
-today = datetime.now().date()
+SHARD_NAME = 'send_ondemand_reminder_emails'
 DAYS_FOR_EACH_MODULE = 7
 INACTIVITY_REMINDER_DAYS = 10
 ORA_ASSESSMENT_BLOCK = 'openassessment'
+EMAIL_CAMPAIGN = '{template}:{course_id}:{run_date}'
+# A running shard which has not been updated for this long is considered abandoned by its worker
+SHARD_STALE_TIMEOUT = timedelta(hours=2)
 
 
 class Command(BaseCommand):
@@ -33,96 +41,252 @@ class Command(BaseCommand):
     help = """
         Send reminder emails to those users who haven't completed the scheduled graded module for 10 days.
         This email will not be sent for those module which don't have at-least one graded sub-section.
+
+        Every course is a shard whose progress is kept in CommandShard for the day of the run. By default the
+        pending shards are dispatched as celery tasks. With --shard, this process sends emails of its own share of
+        the courses itself, so that the command can run in parallel under cron e.g.
+            manage.py ... send_ondemand_reminder_emails --workers 4 --shard 0
+            ...
+            manage.py ... send_ondemand_reminder_emails --workers 4 --shard 3
+
+        Running the command again on the same day only processes the shards which have not completed and never
+        emails a user twice for the same course.
     """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of parallel processes the courses are divided among, used with --shard',
+        )
+        parser.add_argument(
+            '--shard',
+            type=int,
+            default=None,
+            help='Index of the share of courses to process in this process, from 0 to workers - 1',
+        )
+
     def handle(self, *args, **options):
+        workers = options['workers']
+        shard_index = options['shard']
 
-        # Getting all self paced courses with end dates greater than today (Only active ones).
-        courses = CourseOverview.objects.filter(self_paced=True, end__gte=today)
+        if workers < 1:
+            raise CommandError('--workers must be at least 1')
 
-        for course in courses:
-            course_struct = generate_course_structure(course.id)['structure']
+        if shard_index is not None and not 0 <= shard_index < workers:
+            raise CommandError('--shard must be from 0 to {}'.format(workers - 1))
 
-            if not course_struct:
-                log.error('Course doesn\'t have a proper structure.')
-                continue
+        run_date = datetime.now().date()
+        shards = get_or_create_course_shards(run_date, workers, shard_index)
 
-            ora_blocks = get_all_ora_blocks(course_struct)
+        if shard_index is None:
+            # imported here because the task module imports this command
+            from philu_commands.tasks import task_send_ondemand_reminder_emails
 
-            # If course doesn't have any ORA blocks, continue.
-            if not ora_blocks:
-                continue
+            for shard in shards:
+                task_send_ondemand_reminder_emails.delay(shard.id)
+        else:
+            for shard in shards:
+                try:
+                    process_reminder_email_shard(shard)
+                except Exception:  # pylint: disable=broad-except
+                    log.exception('Reminder emails failed for course %s', shard.course_id)
 
-            course_blocks = course_struct['blocks']
+        status_counts = CommandShard.objects.filter(name=SHARD_NAME, run_date=run_date).values('status').annotate(
+            count=Count('id')
+        )
+        log.info(
+            'On-demand reminder email shards of %s: %s', run_date,
+            {status_count['status']: status_count['count'] for status_count in status_counts}
+        )
+        log.info('Course structure cache: %s', get_course_structure_cache_metrics())
 
-            graded_oras_count = get_graded_ora_count(ora_blocks)
-            last_module_oras = get_last_module_ora(course_blocks)
 
-            # Getting all enrollments of user in self paced course.
-            enrollments = CourseEnrollment.objects.filter(course_id=course.id, is_active=True)
+def get_course_shard_index(course_id, workers):
+    """
+    Stable index of the share of work a course belongs to, so every parallel process picks the same courses daily
+    """
+    return zlib.crc32(unicode(course_id)) % workers
 
-            for enrollment in enrollments:
-                user = enrollment.user
 
-                try:
-                    anonymous_user = get_user_anonymous_id(user, course.id)
-                except Exception as error:  # pylint: disable=broad-except
-                    log.info(error)
-                    continue
-
-                # If user hasn't enable email preferences for on demand course, no need to go further.
-                if not get_email_pref_on_demand_course(user, course.id):
-                    continue
-
-                course_chapters = modulestore().get_items(
-                    course.id,
-                    qualifiers={'category': 'course'}
-                )
-
-                course_deadline = get_suggested_course_deadline(enrollment.created.date(), course_chapters[0].children)
-
-                # Get all user submission in descending order by date
-                response_submissions = Submission.objects.filter(
-                    student_item__student_id=anonymous_user.anonymous_user_id,
-                    student_item__course_id=course.id.to_deprecated_string()).order_by('-created_at')
-
-                # Check if user has submitted last modules graded oras or not. If yes no need to send email OR
-                # If user's submission gets equal to graded oras count than don't need to continue.
-                if (last_module_oras and check_for_last_module_submission(last_module_oras, anonymous_user)) or \
-                        len(response_submissions) == graded_oras_count:
-                    log.info('Last module Graded ORAs submitted so no further check')
-                    continue
-
-                latest_submission = response_submissions.first()
-
-                if not response_submissions.exists():
-                    if has_inactivity_threshold_reached(enrollment.created.date(), today):
-                        send_reminder_email(user, course, course_deadline)
-                    continue
-
-                # Check for latest submission entry from submission table if the difference of created date and
-                # today is equals to "INACTIVITY_REMINDER_DAYS" days this means that email should be send to user
-                # but before that we need to check is it the first time user shows an inactivity for
-                # "INACTIVITY_REMINDER_DAYS" days or not if yes than send email else means that emails has already
-                #  been sent to user so no need to send it again.
-                if has_inactivity_threshold_reached(latest_submission.created_at.date(), today):
-                    log.info('Inactivity threshold reached so check for previous ORAs')
-                    last_response_time = latest_submission.created_at.date()
-
-                    # Boolean to keep track if user has shown an inactivity for "INACTIVITY_REMINDER_DAYS"
-                    is_threshold_reached_before = False
-
-                    # We have checked first entry separately so starting from second index.
-                    for response in response_submissions[1:]:
-                        if has_inactivity_threshold_reached(response.created_at.date(), last_response_time):
-                            log.info('User showed inactivity previously')
-                            is_threshold_reached_before = True
-                            break
-                        last_response_time = response.created_at.date()
-
-                    # If user haven't been inactive in past before today than send email.
-                    if not is_threshold_reached_before:
-                        send_reminder_email(user, course, course_deadline)
+def get_or_create_course_shards(run_date, workers=1, shard_index=None):
+    """
+    Get shards of the run which have not completed yet, creating them for the courses to be processed
+
+    Args:
+        run_date (date): Date of the run
+        workers (int): Number of shares the courses are divided among
+        shard_index (int): Share of courses to return, all courses if None
+
+    Returns:
+        list: pending, failed and stale running CommandShard of the courses
+    """
+    # Getting all self paced courses with end dates greater than today (Only active ones).
+    course_ids = CourseOverview.objects.filter(self_paced=True, end__gte=run_date).values_list('id', flat=True)
+    if shard_index is not None:
+        course_ids = [
+            course_id for course_id in course_ids if get_course_shard_index(course_id, workers) == shard_index
+        ]
+
+    shards = []
+    for course_id in course_ids:
+        shard, _ = CommandShard.objects.get_or_create(name=SHARD_NAME, run_date=run_date, course_id=course_id)
+        if is_shard_claimable(shard):
+            shards.append(shard)
+
+    return shards
+
+
+def get_claimable_shards_filter():
+    """
+    Shards which are pending, have failed, or are running but abandoned by their worker
+    """
+    return Q(status__in=[CommandShard.PENDING, CommandShard.FAILED]) | Q(
+        status=CommandShard.RUNNING, modified__lt=timezone.now() - SHARD_STALE_TIMEOUT
+    )
+
+
+def is_shard_claimable(shard):
+    """
+    In memory counterpart of `get_claimable_shards_filter`, used to list shards to dispatch
+    """
+    return shard.status in [CommandShard.PENDING, CommandShard.FAILED] or (
+        shard.status == CommandShard.RUNNING and shard.modified < timezone.now() - SHARD_STALE_TIMEOUT
+    )
+
+
+def claim_shard(shard):
+    """
+    Atomically mark a claimable shard as running, so that only one worker processes it
+
+    Returns:
+        bool: True if this worker has claimed the shard
+    """
+    claimed = CommandShard.objects.filter(get_claimable_shards_filter(), id=shard.id).update(
+        status=CommandShard.RUNNING, modified=timezone.now()
+    )
+    if claimed:
+        shard.refresh_from_db()
+    return bool(claimed)
+
+
+def process_reminder_email_shard(shard):
+    """
+    Send reminder emails of the course of a shard and record the progress of the shard. Shard is skipped if it is
+    completed or another worker is processing it.
+    """
+    if not claim_shard(shard):
+        log.info('Skipping reminder emails of course %s, shard is %s', shard.course_id, shard.status)
+        return
+
+    try:
+        course = CourseOverview.objects.get(id=shard.course_id)
+        shard.processed_count, shard.sent_count = send_course_reminder_emails(course, shard.run_date)
+    except Exception:
+        shard.status = CommandShard.FAILED
+        shard.save()
+        raise
+
+    shard.status = CommandShard.COMPLETED
+    shard.save()
+
+
+def send_course_reminder_emails(course, today):
+    """
+    Send reminder emails to users of a course who haven't completed the scheduled graded module
+
+    Users already emailed for the course on the same day are skipped, which makes processing a course again safe.
+
+    Returns:
+        tuple: number of enrollments processed and number of emails sent
+    """
+    course_struct = get_course_structure(course.id)['structure']
+
+    if not course_struct:
+        log.error('Course doesn\'t have a proper structure.')
+        return 0, 0
+
+    ora_blocks = get_all_ora_blocks(course_struct)
+
+    # If course doesn't have any ORA blocks, continue.
+    if not ora_blocks:
+        return 0, 0
+
+    course_blocks = course_struct['blocks']
+
+    graded_oras_count = get_graded_ora_count(ora_blocks)
+    last_module_oras = get_last_module_ora(course_blocks)
+
+    course_chapters = course_blocks[course_struct['root']]['children']
+
+    # Getting all enrollments of user in self paced course.
+    enrollments = CourseEnrollment.objects.filter(course_id=course.id, is_active=True).select_related('user')
+    recipients = []
+
+    for enrollment in enrollments:
+        user = enrollment.user
+
+        try:
+            anonymous_user = get_user_anonymous_id(user, course.id)
+        except Exception as error:  # pylint: disable=broad-except
+            log.info(error)
+            continue
+
+        # If user hasn't enable email preferences for on demand course, no need to go further.
+        if not get_email_pref_on_demand_course(user, course.id):
+            continue
+
+        course_deadline = get_suggested_course_deadline(enrollment.created.date(), course_chapters)
+
+        # Get all user submission in descending order by date
+        response_submissions = Submission.objects.filter(
+            student_item__student_id=anonymous_user.anonymous_user_id,
+            student_item__course_id=course.id.to_deprecated_string()).order_by('-created_at')
+
+        # Check if user has submitted last modules graded oras or not. If yes no need to send email OR
+        # If user's submission gets equal to graded oras count than don't need to continue.
+        if (last_module_oras and check_for_last_module_submission(last_module_oras, anonymous_user)) or \
+                len(response_submissions) == graded_oras_count:
+            log.info('Last module Graded ORAs submitted so no further check')
+            continue
+
+        latest_submission = response_submissions.first()
+
+        if not response_submissions.exists():
+            if has_inactivity_threshold_reached(enrollment.created.date(), today):
+                recipients.append(get_reminder_email_recipient(user, course_deadline))
+            continue
+
+        # Check for latest submission entry from submission table if the difference of created date and
+        # today is equals to "INACTIVITY_REMINDER_DAYS" days this means that email should be send to user
+        # but before that we need to check is it the first time user shows an inactivity for
+        # "INACTIVITY_REMINDER_DAYS" days or not if yes than send email else means that emails has already
+        #  been sent to user so no need to send it again.
+        if has_inactivity_threshold_reached(latest_submission.created_at.date(), today):
+            log.info('Inactivity threshold reached so check for previous ORAs')
+            last_response_time = latest_submission.created_at.date()
+
+            # Boolean to keep track if user has shown an inactivity for "INACTIVITY_REMINDER_DAYS"
+            is_threshold_reached_before = False
+
+            # We have checked first entry separately so starting from second index.
+            for response in response_submissions[1:]:
+                if has_inactivity_threshold_reached(response.created_at.date(), last_response_time):
+                    log.info('User showed inactivity previously')
+                    is_threshold_reached_before = True
+                    break
+                last_response_time = response.created_at.date()
+
+            # If user haven't been inactive in past before today than send email.
+            if not is_threshold_reached_before:
+                recipients.append(get_reminder_email_recipient(user, course_deadline))
+
+    sent_count = 0
+    if recipients:
+        sent_count = send_reminder_emails(course, recipients, today)
+
+    return len(enrollments), sent_count
 
 
 def has_inactivity_threshold_reached(first_date, second_date):
@@ -226,26 +390,42 @@ def check_for_last_module_submission(oras_list, anonymous_user):
     return True
 
 
-def send_reminder_email(user, course, course_deadline):
+def get_reminder_email_recipient(user, course_deadline):
     """
-        Send weekly emails for completed module
+    Recipient of the reminder email with the context which is specific to the user
+    """
+    return {
+        'email': user.email,
+        'merge_vars': {
+            'first_name': user.first_name,
+            'deadline_date': str(course_deadline),
+            'email_address': user.email,
+        }
+    }
+
+
+def send_reminder_emails(course, recipients, run_date):
+    """
+        Send reminder emails of a course, skipping users who have already been emailed for the course on run date
 
         Parameters:
-        user: user, whom we are sending emails.
         course: Course for which we want to send email.
-        course_deadline: Suggested deadline by which user must complete course.
+        recipients: list of recipients from `get_reminder_email_recipient`.
+        run_date: date of the run.
 
+        Returns:
+        int: number of emails sent
         """
     template = MandrillClient.ON_DEMAND_REMINDER_EMAIL_TEMPLATE
     next_chapter_url = get_nth_chapter_link(course, chapter_index=0)
     context = {
-        'first_name': user.first_name,
         'course_name': course.display_name,
-        'deadline_date': str(course_deadline),
         'course_url': next_chapter_url,
-        'email_address': user.email,
         'unsubscribe_link': get_my_account_link(course.id)
     }
+    campaign = EMAIL_CAMPAIGN.format(template=template, course_id=course.id, run_date=run_date)
+
+    status_counts = send_bulk_email(campaign, template, recipients, context)
+    log.info("Emailing course reminder for %s, delivery status: %s", course.id, dict(status_counts))
 
-    MandrillClient().send_mail(template, user.email, context)
-    log.info("Emailing to %s Task Completed for course reminder", user.email)
+    return sum(status_counts[status] for status in EmailDeliveryLedger.DELIVERED_STATUSES)
@@ -1,6 +1,7 @@
 """
 Command to send on-demand weekly emails.
 """
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
 from logging import getLogger
 
@@ -8,19 +9,17 @@ from django.core.management.base import BaseCommand
 from submissions.models import Submission
 
 from common.lib.mandrill_client.client import MandrillClient
-from lms.djangoapps.onboarding.helpers import get_email_pref_on_demand_course, get_user_anonymous_id
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.features.ondemand_email_preferences.helpers import get_my_account_link
-from openedx.features.philu_courseware.helpers import get_nth_chapter_link
-from philu_commands.helpers import generate_course_structure
-from student.models import CourseEnrollment
-from xmodule.modulestore.django import modulestore
+from openedx.features.ondemand_email_preferences.models import OnDemandEmailPreferences
+from philu_commands.helpers import get_course_modules_index, get_course_structure_cache_metrics
+from student.models import AnonymousUserId, CourseEnrollment
 
 log = getLogger(__name__)
 
 HOURS_TO_WAIT_FOR_EMAIL = 24
 today = datetime.now().date()
-ORA_ASSESSMENT_BLOCK = 'openassessment'
+ENROLLMENTS_BATCH_SIZE = 1000
 EMAIL_SUBJECT_LINE = 'Get started on the next module of {course_name}'
 ON_DEMAND_MODULE_TEXT_FOMATTER = "<li> {module_name} </li>"
 
@@ -35,134 +34,179 @@ class Command(BaseCommand):
     skipped some graded modules then skip module email will be send.
     """
 
-    def handle(self, *args, **options):  # pylint: disable=too-many-statements
+    def handle(self, *args, **options):
         # Getting all self paced courses.
         courses = CourseOverview.objects.filter(self_paced=True)
 
-        # TODO This command have too many nested blocks, which needs an update.
-        # pylint: disable=too-many-nested-blocks
         for course in courses:
-            course_struct = generate_course_structure(course.id)['structure']
+            # Modules, graded sub-sections and ORAs of the course, built once per course version
+            modules = get_course_modules_index(course)
 
-            if not course_struct:
+            # If course doesn't have any modules, continue.
+            if not modules:
                 log.error('Course doesn\'t have a proper structure.')
                 continue
 
-            course_blocks = course_struct['blocks']
-            # If course doesn't have any blocks, continue.
-            if not course_blocks:
-                continue
+            ora_blocks = {ora for module in modules for oras in module['graded_sequentials'] for ora in oras}
 
             # Getting all enrollments of user in self paced course.
-            enrollments = CourseEnrollment.objects.filter(course_id=course.id, is_active=True)
-
-            for enrollment in enrollments:
-                user = enrollment.user
-
-                try:
-                    anonymous_user = get_user_anonymous_id(user, course.id)
-                except Exception as error:  # pylint: disable=broad-except
-                    log.info(error)
-                    continue
-
-                # If user hasn't enable email preferences for on demand course, no need to go further.
-                if not get_email_pref_on_demand_course(user, course.id):
-                    continue
-
-                course_chapters = modulestore().get_items(
-                    course.id,
-                    qualifiers={'category': 'course'}
-                )
-
-                chapters_skipped = {}
-                all_chapters = course_chapters[0].children
-                last_chapter_index = (len(all_chapters) - 1)
-
-                # We introduced this variable to store submission date of ora in last module. So that we will
-                # check if it is 2 days older or more we don't need to send skip module email again.
-                last_module_ora_submission_date = ''
-
-                log.info("############## %s ##############", course.display_name)
-                for index_chapter, chapter in enumerate(all_chapters):
-
-                    # We introduced this boolean to check the count of graded sub-section in the module.
-                    # We only need to send email if graded sub-section count is greater than or equall to 1.
-                    graded_subsection = 0
-
-                    # Getting sub-section in chapter
-                    sequentials = modulestore().get_item(chapter)
-                    log.info("$$$$$$$$$$$$$$$ %s $$$$$$$$$$$$$$$", sequentials.display_name)
-                    for sequential in sequentials.children:
-                        if course_blocks[str(sequential)]['graded']:
-
-                            # We introduced this boolean to check if there is atleast
-                            # one ora submitted in last 24 hours.
-                            atleast_one_ora_submitted = False
-
-                            graded_subsection += 1
-
-                            # Getting verticals in sub-section
-                            verticals = modulestore().get_item(sequential)
-
-                            # Getting list of all ORAs in vertical of graded sub-section. We won't proceed if
-                            # there are no ORAs in this vertical. There may be multiple vertical in sub-section
-                            ora_list = get_ora_list(verticals)
-                            if ora_list:
-                                log.info("&&&&&&&&&&&&&&& %s &&&&&&&&&&&&&&&", verticals.display_name)
-                                for ora_block in ora_list:
-                                    response_submissions = Submission.objects.filter(
-                                        student_item__student_id=anonymous_user.anonymous_user_id,
-                                        student_item__item_id=ora_block
-                                    ).first()
-                                    if response_submissions:
-                                        if index_chapter == last_chapter_index:
-                                            last_module_ora_submission_date = response_submissions.created_at.date()
-                                        # Response submitted date must be within last
-                                        # 24 hours and we are checking that below
-                                        if today - timedelta(hours=HOURS_TO_WAIT_FOR_EMAIL) <= \
-                                                response_submissions.created_at.date() <= today:
-                                            atleast_one_ora_submitted = True
-                                            log.info('Response Created at: %s', response_submissions.created_at.date())
-                                    else:
-                                        log.error("ORA response not submitted")
-                                        chapters_skipped.update({index_chapter: sequentials.display_name})
-                                        break
-                                else:
-                                    # We don't want to send email for last module so check if user's current module
-                                    # is less than total number of modules, number of graded sub-section is
-                                    # greater than 0 and atleast one ora sub mitted in last 24 hours.
-                                    if index_chapter != last_chapter_index and \
-                                            graded_subsection > 0 and atleast_one_ora_submitted:
-                                        send_weekly_email(user, course, str(chapter), course_blocks, index_chapter + 1)
-
-                                    # We need to send skip email if user has completed last
-                                    # module but has skipped one or more prevedxious module.
-                                    elif index_chapter == last_chapter_index and bool(chapters_skipped):
-                                        days_last_module_submission = today - last_module_ora_submission_date
-
-                                        # We only need to send this email for once so we are checking if the
-                                        # last module ora assessment is done in last 24 hours or not.
-                                        if days_last_module_submission.days < 2:
-                                            send_module_skip_email(user, course, chapters_skipped)
-                                    continue
-                                break
-
-
-def send_weekly_email(user, course, chapter_block, all_course_blocks, next_chapter_index):
+            enrollments = CourseEnrollment.objects.filter(
+                course_id=course.id, is_active=True
+            ).select_related('user').order_by('id')
+
+            for batch_start in range(0, enrollments.count(), ENROLLMENTS_BATCH_SIZE):
+                users = [
+                    enrollment.user for enrollment in enrollments[batch_start:batch_start + ENROLLMENTS_BATCH_SIZE]
+                ]
+                self.process_users(course, modules, ora_blocks, users)
+
+        log.info('Course structure cache: %s', get_course_structure_cache_metrics())
+
+    def process_users(self, course, modules, ora_blocks, users):
+        """
+        Send weekly and skip module emails to a batch of users enrolled in the course
+        """
+        user_ids = [user.id for user in users]
+        anonymous_ids = get_users_anonymous_ids(course.id, user_ids)
+        disabled_user_ids = get_users_with_disabled_email_preference(course.id, user_ids)
+        submission_dates = get_ora_submission_dates(anonymous_ids.values(), ora_blocks)
+
+        for user in users:
+            anonymous_id = anonymous_ids.get(user.id)
+            if not anonymous_id:
+                log.info('Anonymous Id doesn\'t exists or is not unique for %s', user)
+                continue
+
+            # If user hasn't enable email preferences for on demand course, no need to go further.
+            if user.id in disabled_user_ids:
+                continue
+
+            send_user_module_emails(user, course, modules, anonymous_id, submission_dates)
+
+
+def get_users_anonymous_ids(course_id, user_ids):
+    """
+    Get anonymous ids of users in a course, users with no or multiple anonymous ids are left out
+
+    Returns:
+        dict: user id -> anonymous user id
+    """
+    anonymous_ids = AnonymousUserId.objects.filter(
+        course_id=course_id, user_id__in=user_ids
+    ).values_list('user_id', 'anonymous_user_id')
+
+    id_counts = Counter(user_id for user_id, _ in anonymous_ids)
+    return {user_id: anonymous_id for user_id, anonymous_id in anonymous_ids if id_counts[user_id] == 1}
+
+
+def get_users_with_disabled_email_preference(course_id, user_ids):
+    """
+    Get users who have disabled emails for on demand course, users with no preference get emails
+
+    Returns:
+        set: ids of users
+    """
+    return set(OnDemandEmailPreferences.objects.filter(
+        course_id=course_id, user_id__in=user_ids, is_enabled=False
+    ).values_list('user_id', flat=True))
+
+
+def get_ora_submission_dates(anonymous_ids, ora_blocks):
+    """
+    Get creation date of the latest submission of every user in every ORA block
+
+    Returns:
+        dict: (anonymous user id, ora usage key) -> submission created_at
+    """
+    if not anonymous_ids or not ora_blocks:
+        return {}
+
+    submissions = Submission.objects.filter(
+        student_item__student_id__in=anonymous_ids,
+        student_item__item_id__in=ora_blocks,
+    ).order_by('-submitted_at', '-id').values_list('student_item__student_id', 'student_item__item_id', 'created_at')
+
+    submission_dates = {}
+    for student_id, item_id, created_at in submissions:
+        submission_dates.setdefault((student_id, item_id), created_at)
+
+    return submission_dates
+
+
+def send_user_module_emails(user, course, modules, anonymous_id, submission_dates):
+    """
+    Send weekly email for every module whose graded ORAs are submitted in last 24 hours and skip module email if user
+    has completed the last module but skipped some previous modules
+    """
+    chapters_skipped = OrderedDict()
+    last_chapter_index = len(modules) - 1
+
+    # We introduced this variable to store submission date of ora in last module. So that we will
+    # check if it is 2 days older or more we don't need to send skip module email again.
+    last_module_ora_submission_date = ''
+
+    for index_chapter, module in enumerate(modules):
+
+        # We introduced this boolean to check the count of graded sub-section in the module.
+        # We only need to send email if graded sub-section count is greater than or equall to 1.
+        graded_subsection = 0
+
+        for ora_list in module['graded_sequentials']:
+
+            # We introduced this boolean to check if there is atleast
+            # one ora submitted in last 24 hours.
+            atleast_one_ora_submitted = False
+
+            graded_subsection += 1
+
+            # We won't proceed if there are no ORAs in this graded sub-section.
+            if not ora_list:
+                continue
+
+            for ora_block in ora_list:
+                submission_date = submission_dates.get((anonymous_id, ora_block))
+                if not submission_date:
+                    chapters_skipped.update({index_chapter: module['display_name']})
+                    break
+
+                if index_chapter == last_chapter_index:
+                    last_module_ora_submission_date = submission_date.date()
+                # Response submitted date must be within last
+                # 24 hours and we are checking that below
+                if today - timedelta(hours=HOURS_TO_WAIT_FOR_EMAIL) <= submission_date.date() <= today:
+                    atleast_one_ora_submitted = True
+            else:
+                # We don't want to send email for last module so check if user's current module
+                # is less than total number of modules, number of graded sub-section is
+                # greater than 0 and atleast one ora sub mitted in last 24 hours.
+                if index_chapter != last_chapter_index and graded_subsection > 0 and atleast_one_ora_submitted:
+                    send_weekly_email(user, course, module['display_name'], modules[index_chapter + 1]['url'])
+
+                # We need to send skip email if user has completed last
+                # module but has skipped one or more previous module.
+                elif index_chapter == last_chapter_index and bool(chapters_skipped):
+                    days_last_module_submission = today - last_module_ora_submission_date
+
+                    # We only need to send this email for once so we are checking if the
+                    # last module ora assessment is done in last 24 hours or not.
+                    if days_last_module_submission.days < 2:
+                        send_module_skip_email(user, course, chapters_skipped, modules)
+                continue
+            break
+
+
+def send_weekly_email(user, course, current_chapter_name, next_chapter_url):
     """
         Send weekly emails for completed module
 
         Parameters:
         user: user, whom we are sending emails.
         course: Course for which we want to send email.
-        chapter_block: XBlock info of Chapter block.
-        all_course_blocks: Complete list of blocks in a course.
-        next_chapter_index: next chapter index which url we will be sending to user.
+        current_chapter_name: name of the completed chapter.
+        next_chapter_url: url of the next chapter.
 
         """
-    current_chapter_name = all_course_blocks[chapter_block]['display_name']
     template = MandrillClient.ON_DEMAND_WEEKLY_MODULE_COMPLETE_TEMPLATE
-    next_chapter_url = get_nth_chapter_link(course, chapter_index=next_chapter_index)
     context = {
         'first_name': user.first_name,
         'course_name': course.display_name,
@@ -178,18 +222,19 @@ def send_weekly_email(user, course, chapter_block, all_course_blocks, next_chapt
     log.info("Emailing to %s Task Completed for module completion", user.email)
 
 
-def send_module_skip_email(user, course, chapters_skipped):
+def send_module_skip_email(user, course, chapters_skipped, modules):
     """
         Send skip module emails after completing final module
 
         Parameters:
         user: user, whom we are sending emails.
         course: Course for which we want to send email.
-        chapters_skipped: dict that are storing skipped chapter.
+        chapters_skipped: ordered dict that are storing skipped chapter.
+        modules: modules index of the course.
 
     """
     template = MandrillClient.ON_DEMAND_WEEKLY_MODULE_SKIP_TEMPLATE
-    skip_module_url = get_nth_chapter_link(course, chapter_index=chapters_skipped.keys()[0])
+    skip_module_url = modules[chapters_skipped.keys()[0]]['url']
     context = {
         'first_name': user.first_name,
         'course_name': course.display_name,
@@ -213,16 +258,3 @@ def get_module_list(chapter_names):
         )
         chapters_text = chapters_text + module_text
     return chapters_text
-
-
-def get_ora_list(verticals):
-    """
-    Get all ORAs in a list from given vertical
-    """
-    oras = []
-    for vertical in verticals.children:
-        vertical_blocks = modulestore().get_item(vertical)
-        for k, v in enumerate(vertical_blocks.children):
-            if v.block_type == ORA_ASSESSMENT_BLOCK:
-                oras.append(vertical_blocks.children[k])
-    return oras
@@ -11,6 +11,7 @@ from openedx.features.smart_referral.models import SmartReferral
 from openedx.features.smart_referral.tasks import task_send_referral_follow_up_emails
 
 CONTACT_EMAIL = 'contact_email'
+EMAIL = 'email'
 DAYS_TO_SEND_FOLLOW_UP_EMAIL = 3
 
 
@@ -26,25 +27,29 @@ class Command(BaseCommand):
     """
 
     def handle(self, *args, **options):
-        emails_list = []
         referral_threshold_date = timezone.now() - timedelta(days=DAYS_TO_SEND_FOLLOW_UP_EMAIL)
 
-        pending_referral_emails = SmartReferral.objects.filter(
-            created__lte=referral_threshold_date,
-            is_referral_step_complete=False
-        ).values_list(
-            CONTACT_EMAIL,
-            flat=True
-        ).distinct()
-
-        for referral_email in pending_referral_emails:
-            try:
-                User.objects.get(email=referral_email)
-                SmartReferral.objects.filter(contact_email=referral_email).update(
-                    is_referral_step_complete=True
-                )
-            except User.DoesNotExist:
-                emails_list.append(referral_email)
+        pending_referrals = SmartReferral.objects.filter(
+            is_referral_step_complete=False,
+            created__lte=referral_threshold_date
+        )
+        registered_emails = User.objects.values(EMAIL)
+
+        # Contacts who have registered on our platform don't need follow-up email
+        registered_referral_emails = list(
+            pending_referrals.filter(contact_email__in=registered_emails).values_list(CONTACT_EMAIL, flat=True)
+        )
+        if registered_referral_emails:
+            SmartReferral.objects.filter(contact_email__in=registered_referral_emails).update(
+                is_referral_step_complete=True
+            )
+
+        emails_list = list(
+            pending_referrals.exclude(contact_email__in=registered_emails).values_list(
+                CONTACT_EMAIL,
+                flat=True
+            ).order_by(CONTACT_EMAIL).distinct()
+        )
 
         if emails_list:
             task_send_referral_follow_up_emails(emails_list)
@@ -1,12 +1,16 @@
 """
 Django management command to create users at nodeBB corresponding to edx-platform users.
 """
+import time
+from concurrent.futures import ThreadPoolExecutor
 from logging import getLogger
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from requests.exceptions import RequestException
 
 from common.lib.nodebb_client.client import NodeBBClient
-from lms.djangoapps.onboarding.helpers import COUNTRIES
+from lms.djangoapps.onboarding.lookups import get_country_name
 from lms.djangoapps.onboarding.models import UserExtendedProfile
 from nodebb.tasks import (
     task_activate_user_on_nodebb,
@@ -14,9 +18,59 @@ from nodebb.tasks import (
     task_update_onboarding_surveys_status,
     task_update_user_profile_on_nodebb
 )
+from philu_commands.models import CommandCheckpoint, CommandFailedRecord
 
 log = getLogger(__name__)
 
+CHECKPOINT_NAME = 'sync_users_with_nodebb'
+DEFAULT_WORKERS = 8
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_EXPECTED_LATENCY = 0.2  # seconds per NodeBB request, used to estimate throughput in dry run
+RETRY_BACKOFF = 1  # seconds, doubled on every retry
+
+ACTION_CREATE = 'create'
+ACTION_UPDATE = 'update'
+ACTION_SKIP = 'skip'
+
+
+def get_edx_user_data(extended_profile):
+    """
+    Returns the data of user, we keep on NodeBB, from edx-platform
+    """
+    user = extended_profile.user
+    profile = user.profile
+
+    return {
+        'edx_user_id': unicode(user.id),
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'country_of_employment': extended_profile.country_of_employment,
+        'city_of_employment': extended_profile.city_of_employment,
+        'country_of_residence': get_country_name(profile.country.code),
+        'city_of_residence': profile.city,
+        'birthday': profile.year_of_birth,
+        'language': profile.language,
+        'interests': extended_profile.get_user_selected_interests(),
+        'self_prioritize_areas': extended_profile.get_user_selected_functions()
+    }
+
+
+def is_nodebb_data_outdated(edx_data, nodebb_data):
+    """
+    Returns True if user data on NodeBB is different from the data on edx-platform
+    """
+    # filter nodebb_data to ensure compatibility with edx_data
+    for key in nodebb_data:
+        if unicode(nodebb_data[key]) == u'None':
+            nodebb_data[key] = None
+    if not nodebb_data.get('self_prioritize_areas'):
+        nodebb_data['self_prioritize_areas'] = []
+
+    return not edx_data.viewitems() <= nodebb_data.viewitems()
+
 
 class Command(BaseCommand):
     """
@@ -28,10 +82,63 @@ class Command(BaseCommand):
 
     After creating the users, it also activates them if they are active in edx-platform.
     example:
-        manage.py ... create_nodebb_users
+        manage.py ... sync_users_with_nodebb
+
+    With --bulk, users are synced directly (not through celery) by a pool of workers sharing one connection pooled
+    client. Progress is checkpointed after every batch so an interrupted run resumes where it stopped. Users which
+    fail to sync are kept with the checkpoint and are retried at the end of the run and by every next run.
+    example:
+        manage.py ... sync_users_with_nodebb --bulk --workers 16
+        manage.py ... sync_users_with_nodebb --bulk --dry-run
+        manage.py ... sync_users_with_nodebb --bulk --restart
     """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Sync users directly with a pool of workers and checkpoint the progress',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help='Number of concurrent NodeBB requests in bulk mode',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help='Number of users loaded from database at a time in bulk mode',
+        )
+        parser.add_argument(
+            '--max-retries',
+            type=int,
+            default=DEFAULT_MAX_RETRIES,
+            help='Number of retries of a failed NodeBB request in bulk mode',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report the users to be synced and the expected throughput, in bulk mode',
+        )
+        parser.add_argument(
+            '--expected-latency',
+            type=float,
+            default=DEFAULT_EXPECTED_LATENCY,
+            help='Expected seconds per NodeBB request, used to estimate throughput in dry run',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore the checkpoint of the previous run and start from the first user, in bulk mode',
+        )
+
     def handle(self, *args, **options):
+        if options['bulk']:
+            self.bulk_sync(options)
+            return
+
         user_extended_profiles = UserExtendedProfile.objects.all()
         nodebb_client = NodeBBClient()
 
@@ -44,24 +151,7 @@ class Command(BaseCommand):
 
         for extended_profile in user_extended_profiles:
             user = extended_profile.user
-            profile = user.profile
-
-            edx_data = {
-                'edx_user_id': unicode(user.id),
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'country_of_employment': extended_profile.country_of_employment,
-                'city_of_employment': extended_profile.city_of_employment,
-                'country_of_residence': COUNTRIES.get(profile.country.code),
-                'city_of_residence': profile.city,
-                'birthday': profile.year_of_birth,
-                'language': profile.language,
-                'interests': extended_profile.get_user_selected_interests(),
-                'self_prioritize_areas': extended_profile.get_user_selected_functions()
-            }
-
+            edx_data = get_edx_user_data(extended_profile)
             nodebb_data = nodebb_users.get(user.username)
 
             if not nodebb_data:
@@ -73,12 +163,236 @@ class Command(BaseCommand):
                     task_update_onboarding_surveys_status.delay(username=user.username)
                 continue
 
-            # filter nodebb_data to ensure compatibility with edx_data
-            for key in nodebb_data:
-                if unicode(nodebb_data[key]) == u'None':
-                    nodebb_data[key] = None
-            if not nodebb_data.get('self_prioritize_areas'):
-                nodebb_data['self_prioritize_areas'] = []
-
-            if not edx_data.viewitems() <= nodebb_data.viewitems():
+            if is_nodebb_data_outdated(edx_data, nodebb_data):
                 task_update_user_profile_on_nodebb.delay(username=user.username, profile_data=edx_data)
+
+    def bulk_sync(self, options):
+        """
+        Sync users in batches, keyset paginated on user id, with a bounded pool of workers
+        """
+        workers = max(options['workers'], 1)
+        batch_size = max(options['batch_size'], 1)
+        dry_run = options['dry_run']
+        self.max_retries = options['max_retries']
+        self.nodebb_client = NodeBBClient(pooled=True, pool_size=workers)
+
+        status_code, nodebb_users = self.nodebb_client.users.all()
+        if status_code != 200:
+            log.error('Error: failed to connect to NodeBB. aborting command "{}"'.format('sync_users_with_nodebb'))
+            return
+
+        nodebb_users = {user['username']: user for user in nodebb_users}
+
+        checkpoint, _ = CommandCheckpoint.objects.get_or_create(name=CHECKPOINT_NAME)
+        restart = options['restart'] or checkpoint.is_completed
+        if restart and not dry_run:
+            checkpoint.reset()
+
+        last_user_id = 0 if restart else checkpoint.last_processed_id
+        action_counts = {ACTION_CREATE: 0, ACTION_UPDATE: 0, ACTION_SKIP: 0}
+        request_count = 0
+        started_at = time.time()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                batch = self._get_users_batch(last_user_id, batch_size)
+                if not batch:
+                    break
+
+                last_user_id = batch[-1].user_id
+                jobs = []
+
+                for extended_profile in batch:
+                    job = self._get_sync_job(extended_profile, nodebb_users)
+                    action_counts[job['action']] += 1
+                    if job['action'] != ACTION_SKIP:
+                        request_count += len(job['requests'])
+                        jobs.append(job)
+
+                if dry_run:
+                    continue
+
+                failed_jobs = self._run_sync_jobs(executor, jobs)
+
+                # failed users and progress are saved together, so that a resumed run never records a user twice
+                with transaction.atomic():
+                    CommandFailedRecord.objects.bulk_create([
+                        CommandFailedRecord(checkpoint=checkpoint, record_id=job['user_id']) for job in failed_jobs
+                    ])
+                    checkpoint.last_processed_id = last_user_id
+                    checkpoint.processed_count += len(batch)
+                    checkpoint.failed_count += len(failed_jobs)
+                    checkpoint.save()
+
+                elapsed_time = time.time() - started_at
+                log.info(
+                    'Synced users up to id %s with NodeBB, %s users processed, %.2f users/sec',
+                    last_user_id, checkpoint.processed_count, checkpoint.processed_count / max(elapsed_time, 0.001)
+                )
+
+            if not dry_run:
+                self._retry_failed_users(executor, checkpoint)
+
+        if dry_run:
+            self._report_dry_run(action_counts, request_count, workers, options['expected_latency'])
+            return
+
+        checkpoint.is_completed = True
+        checkpoint.save()
+        log.info(
+            'Finished syncing users with NodeBB, created: %s, updated: %s, unchanged: %s, failed: %s',
+            action_counts[ACTION_CREATE], action_counts[ACTION_UPDATE], action_counts[ACTION_SKIP],
+            checkpoint.failed_count
+        )
+
+    def _run_sync_jobs(self, executor, jobs):
+        """
+        Run sync jobs with the pool of workers
+
+        Returns:
+            list: jobs which failed
+        """
+        results = list(executor.map(self._run_sync_job, jobs))
+        failed_jobs = [job for job, is_synced in zip(jobs, results) if not is_synced]
+
+        for job in failed_jobs:
+            log.error('Error: failed to sync user (%s) with NodeBB', job['username'])
+
+        return failed_jobs
+
+    def _retry_failed_users(self, executor, checkpoint):
+        """
+        Retry users which have failed in this or previous runs, users which are synced now are not retried anymore.
+
+        NodeBB users are fetched again because a failed user may have been created on NodeBB before a later request
+        of its job failed, such a user is activated and updated instead of being created again.
+        """
+        failed_user_ids = list(checkpoint.failed_records.values_list('record_id', flat=True))
+        if not failed_user_ids:
+            return
+
+        status_code, nodebb_users = self.nodebb_client.users.all()
+        if status_code != 200:
+            log.error('Error: failed to fetch NodeBB users, %s failed users are retried by next run',
+                      len(failed_user_ids))
+            return
+
+        nodebb_users = {user['username']: user for user in nodebb_users}
+        jobs = [
+            self._get_sync_job(extended_profile, nodebb_users, is_retry=True)
+            for extended_profile in UserExtendedProfile.objects.filter(
+                user_id__in=failed_user_ids
+            ).select_related('user', 'user__profile')
+        ]
+        failed_jobs = self._run_sync_jobs(
+            executor, [job for job in jobs if job['action'] != ACTION_SKIP]
+        )
+
+        # users which are synced, already in sync or don't exist anymore are not retried by next run
+        with transaction.atomic():
+            checkpoint.failed_records.exclude(record_id__in=[job['user_id'] for job in failed_jobs]).delete()
+            checkpoint.failed_count = len(failed_jobs)
+            checkpoint.save()
+        log.info('Retried %s failed users, %s still failed', len(failed_user_ids), len(failed_jobs))
+
+    def _get_users_batch(self, last_user_id, batch_size):
+        """
+        Returns next batch of extended profiles after `last_user_id`, ordered on user id
+        """
+        return list(
+            UserExtendedProfile.objects.filter(user_id__gt=last_user_id)
+            .select_related('user', 'user__profile')
+            .order_by('user_id')[:batch_size]
+        )
+
+    def _get_sync_job(self, extended_profile, nodebb_users, is_retry=False):
+        """
+        Prepare the NodeBB requests for a user, all database access is done here so that workers only make requests.
+
+        On retry, a user which exists on NodeBB is also activated and its onboarding status is updated, as these
+        requests may have failed after the user was created.
+        """
+        user = extended_profile.user
+        edx_data = get_edx_user_data(extended_profile)
+        nodebb_data = nodebb_users.get(user.username)
+        job = {'user_id': user.id, 'username': user.username, 'requests': []}
+
+        if not nodebb_data:
+            job['action'] = ACTION_CREATE
+            job['requests'].append(('create', {'username': user.username, 'user_data': edx_data}))
+        elif is_nodebb_data_outdated(edx_data, nodebb_data):
+            job['action'] = ACTION_UPDATE
+            job['requests'].append(('update_profile', {'username': user.username, 'profile_data': edx_data}))
+        elif is_retry:
+            job['action'] = ACTION_UPDATE
+        else:
+            job['action'] = ACTION_SKIP
+
+        if job['action'] == ACTION_CREATE or is_retry:
+            if user.is_active:
+                job['requests'].append(('activate', {'username': user.username, 'active': user.is_active}))
+            if not bool(extended_profile.unattended_surveys(_type='list')):
+                job['requests'].append(('update_onboarding_surveys_status', {'username': user.username}))
+
+        return job
+
+    def _run_sync_job(self, job):
+        """
+        Send requests of a job to NodeBB in order, stops at the first request which fails
+
+        Returns:
+            bool: True if all requests succeeded
+        """
+        for method_name, kwargs in job['requests']:
+            if not self._send_with_retry(method_name, kwargs):
+                return False
+
+        return True
+
+    def _send_with_retry(self, method_name, kwargs):
+        """
+        Send a request to NodeBB, retry with exponential backoff on server and connection errors
+        """
+        delay = RETRY_BACKOFF
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                # copy kwargs because NodeBB client methods update the data dicts in place
+                status_code, response = getattr(self.nodebb_client.users, method_name)(
+                    **{key: dict(value) if isinstance(value, dict) else value for key, value in kwargs.items()}
+                )
+            except RequestException as error:
+                status_code, response = None, error
+
+            if status_code is not None and 200 <= status_code < 300:
+                return True
+
+            if status_code is not None and status_code < 500:
+                log.error('Error: NodeBB %s failed for %s due to %s', method_name, kwargs['username'], response)
+                return False
+
+            if attempt < self.max_retries:
+                time.sleep(delay)
+                delay *= 2
+
+        return False
+
+    def _report_dry_run(self, action_counts, request_count, workers, expected_latency):
+        """
+        Print the number of users to be synced and the expected throughput of the run
+        """
+        users_to_sync = action_counts[ACTION_CREATE] + action_counts[ACTION_UPDATE]
+        requests_per_second = workers / max(expected_latency, 0.001)
+        expected_seconds = request_count / requests_per_second
+
+        # pylint: disable=superfluous-parens
+        print('-' * 80)
+        print('Users to create: {}'.format(action_counts[ACTION_CREATE]))
+        print('Users to update: {}'.format(action_counts[ACTION_UPDATE]))
+        print('Users already synced: {}'.format(action_counts[ACTION_SKIP]))
+        print('NodeBB requests: {}'.format(request_count))
+        print('Expected throughput: {:.2f} requests/sec, {:.2f} users/sec with {} workers'.format(
+            requests_per_second, users_to_sync and requests_per_second * users_to_sync / request_count, workers
+        ))
+        print('Expected duration: {:.1f} seconds'.format(expected_seconds))
+        print('-' * 80)
@@ -0,0 +1,122 @@
+"""
+Local fake NodeBB http server to test and benchmark NodeBB syncing offline
+"""
+import json
+import threading
+import time
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from SocketServer import ThreadingMixIn
+from urlparse import parse_qs, urlparse
+
+
+class FakeNodeBBRequestHandler(BaseHTTPRequestHandler):
+    """
+    Records every request and responds as configured on the server
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self._respond()
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        self._respond()
+
+    def do_DELETE(self):  # pylint: disable=invalid-name
+        self._respond()
+
+    def _respond(self):
+        server = self.server
+        content_length = int(self.headers.getheader('content-length') or 0)
+        body = parse_qs(self.rfile.read(content_length)) if content_length else {}
+        path = urlparse(self.path).path
+
+        status_code, response_body = server.get_response(self.command, path, body)
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(response_body))
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """
+        Keep test output clean
+        """
+        pass
+
+
+class FakeNodeBBServer(ThreadingMixIn, HTTPServer):
+    """
+    Threaded http server listening on a random local port
+
+    Arguments:
+        users (list): users returned from `/api/v2/users/all`
+        latency (float): seconds to wait before every response
+        failures (dict): path -> number of times the path responds with 500 before it succeeds
+
+    example:
+        with FakeNodeBBServer() as server:
+            with override_settings(NODEBB_ENDPOINT=server.url):
+                ...
+            server.requests  # list of (method, path, body)
+    """
+    daemon_threads = True
+
+    def __init__(self, users=None, latency=0, failures=None):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), FakeNodeBBRequestHandler)
+        self.users = users or []
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.requests = []
+        self.max_concurrent_requests = 0
+        self._concurrent_requests = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://{}:{}'.format(*self.server_address)
+
+    def get_response(self, method, path, body):
+        """
+        Returns (status_code, response_body) for a request and records it
+        """
+        with self._lock:
+            self.requests.append((method, path, body))
+            if self.failures.get(path):
+                self.failures[path] -= 1
+                return 500, {'code': 'internal-server-error'}
+
+        if path == '/api/v2/users/all':
+            return 200, self.users
+
+        if path == '/api/v2/users/create':
+            # created users are returned by next fetch of all users
+            with self._lock:
+                self.users.append({'username': body['username'][0]})
+
+        return 200, {'code': 'ok'}
+
+    def process_request_thread(self, request, client_address):
+        with self._lock:
+            self._concurrent_requests += 1
+            self.max_concurrent_requests = max(self.max_concurrent_requests, self._concurrent_requests)
+        try:
+            ThreadingMixIn.process_request_thread(self, request, client_address)
+        finally:
+            with self._lock:
+                self._concurrent_requests -= 1
+
+    def requests_for(self, path):
+        return [request for request in self.requests if request[1] == path]
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
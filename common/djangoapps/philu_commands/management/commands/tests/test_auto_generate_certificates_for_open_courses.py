@@ -7,17 +7,24 @@ from datetime import datetime, timedelta
 
 import pytz
 from django.core.management import call_command
-from django.db.models import signals
-from factory.django import mute_signals
 from mock import Mock, patch
 
+from courseware.tests.factories import StudentModuleFactory
+from lms.djangoapps.certificates.models import CertificateStatuses
+from lms.djangoapps.certificates.tests.factories import GeneratedCertificateFactory
+from lms.djangoapps.grades.models import PersistentCourseGrade
 from lms.djangoapps.onboarding.tests.factories import UserFactory
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from philu_commands.management.commands.auto_generate_certificates_for_open_courses import (
+    get_certificate_candidate_enrollments,
+    get_open_courses,
     is_course_valid_for_certificate_auto_generation
 )
 from student.tests.factories import CourseEnrollmentFactory
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
-from xmodule.modulestore.tests.factories import CourseFactory
+from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
+
+COMMAND_MODULE = 'philu_commands.management.commands.auto_generate_certificates_for_open_courses'
 
 
 class TestAutoGenerateCertificateForOpenCourse(ModuleStoreTestCase):
@@ -25,118 +32,102 @@ class TestAutoGenerateCertificateForOpenCourse(ModuleStoreTestCase):
     Tests for `auto_generate_certificates_for_open_courses.py` command.
     """
 
-    @mute_signals(signals.pre_save, signals.post_save)
     def setUp(self):
         """
-        This function is responsible for creating courses for every test and mocking the function for tests.
+        Create a running course, with two modules and an active certificate, for every test
         """
         super(TestAutoGenerateCertificateForOpenCourse, self).setUp()
-        self.course_1 = CourseFactory.create(display_name='test course 1', run='Testing_course_1')
-        self.course_1.end = datetime.now(pytz.UTC) - timedelta(hours=2)
-        self.user = UserFactory(username='test', email='test@example.com', password='123')
-
-    @patch(
-        'philu_commands.management.commands.auto_generate_certificates_for_open_courses._is_eligible_for_certificate',
-        return_value=False
-    )
-    @patch(
-        'philu_commands.management.commands.auto_generate_certificates_for_open_courses'
-        '.is_course_valid_for_certificate_auto_generation',
-        return_value=True
-    )
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.modulestore')
-    @patch(
-        'philu_commands.management.commands.auto_generate_certificates_for_open_courses.CourseEnrollment.objects.filter'
-    )
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses._get_cert_data')
-    @patch(
-        'philu_commands.management.commands.auto_generate_certificates_for_open_courses.generate_user_certificates',
-        return_value='generating'
-    )
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.log.info')
-    def test_successfully_generate_certificate(
-        self,
-        mock_log_info,
-        mock_generate_user_certificates,
-        mock_get_cert_data,
-        mock_course_enrollments,
-        mock_modulestore,
-        _mock_is_course_valid,
-        _mock_is_eligible_for_certificate
-    ):
-        """
-        Test 'Successfully generate certificate'
-        """
-        mock_response = Mock(name='mock module store', **{'get_courses.return_value': [self.course_1]})
-        mock_modulestore.return_value = mock_response
-        mock_objects = CourseEnrollmentFactory.create(
-            user=self.user, course_id=self.course_1.id, mode='honor')
-        mock_course_enrollments.return_value = Mock(**{'all.return_value': [mock_objects], 'get_items': {}})
-        mock_get_cert_data.return_value = Mock(**{'cert_status': 'requesting'})
-
-        def assert_certificates_generated(info):
-            """
-            assert certification generation
-            """
-            certificate_success_message = 'Generating certificate for user with ' \
-                                          'username: {} and user_id: {} with ' \
-                                          'generation status: {}'
-            course_id_message = 'course id : {course_id}'
-            format_certificate_success_message = certificate_success_message.format(self.user.username, self.user.id,
-                                                                                    mock_generate_user_certificates())
-            format_course_id_message = course_id_message.format(course_id=self.course_1.id)
-            assert info in (format_certificate_success_message, format_course_id_message)
-
-        mock_log_info.side_effect = assert_certificates_generated
-        call_command('auto_generate_certificates_for_open_courses')
-        mock_log_info.assert_called(2)
+        now = datetime.now(pytz.UTC)
+        self.course = CourseFactory.create(
+            display_name='test course 1', run='Testing_course_1', start=now - timedelta(days=10),
+            end=now + timedelta(days=10), certificates_display_behavior='early_with_info'
+        )
+        ItemFactory.create(parent_location=self.course.location, category='chapter')
+        self.last_module = ItemFactory.create(parent_location=self.course.location, category='chapter')
 
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.modulestore')
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.log.info')
-    def test_no_open_course_available(self, mock_log_info, mock_modulestore):
-        """
-        Test 'If no open course is available'
-        """
-        mock_response = Mock(**{'get_courses.return_value': []})
-        mock_modulestore.return_value = mock_response
-        call_command('auto_generate_certificates_for_open_courses')
-        assert not mock_log_info.called
+        self.course_overview = CourseOverview.get_from_id(self.course.id)
+        self.course_overview.has_any_active_web_certificate = True
+        self.course_overview.save()
 
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.modulestore')
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.log.info')
-    def test_course_not_valid_for_certificate_auto_generation(self, mock_log_info, mock_modulestore):
+    def _create_enrollment(self, passed=True, certificate_status=None):
         """
-        Test 'If course is not valid'
+        Enroll a new user in course, with a passing grade and a certificate if required
         """
-        mock_response = Mock(**{'get_courses.return_value': [self.course_1]})
-        mock_modulestore.return_value = mock_response
+        user = UserFactory()
+        enrollment = CourseEnrollmentFactory.create(user=user, course_id=self.course.id, mode='honor')
+
+        if passed:
+            PersistentCourseGrade.objects.create(
+                user_id=user.id, course_id=self.course.id, percent_grade=0.9, letter_grade='Pass',
+                grading_policy_hash='', course_version='', passed_timestamp=datetime.now(pytz.UTC)
+            )
+        if certificate_status:
+            GeneratedCertificateFactory(user=user, course_id=self.course.id, status=certificate_status)
+
+        return enrollment
+
+    def test_open_courses_are_selected_from_course_overviews(self):
+        self.assertEqual([course.id for course in get_open_courses()], [self.course.id])
+
+        self.course_overview.has_any_active_web_certificate = False
+        self.course_overview.save()
+
+        self.assertEqual(get_open_courses(), [])
+
+    @patch('{}.should_persist_grades'.format(COMMAND_MODULE), return_value=True)
+    def test_only_passed_users_without_certificate_are_candidates(self, _mock_should_persist_grades):
+        candidate = self._create_enrollment()
+        self._create_enrollment(certificate_status=CertificateStatuses.downloadable)
+        self._create_enrollment(passed=False)
+        not_passing_candidate = self._create_enrollment(certificate_status=CertificateStatuses.notpassing)
+
+        self.assertEqual(
+            [enrollment.id for enrollment in get_certificate_candidate_enrollments(self.course.id)],
+            [candidate.id, not_passing_candidate.id]
+        )
+
+    @patch('{}.should_persist_grades'.format(COMMAND_MODULE), return_value=True)
+    @patch('{}._get_cert_data'.format(COMMAND_MODULE), return_value=Mock(cert_status='requesting'))
+    @patch('{}.generate_user_certificates'.format(COMMAND_MODULE), return_value='generating')
+    @patch('{}.get_open_courses'.format(COMMAND_MODULE))
+    def test_certificates_generated_for_eligible_candidates(
+        self, mock_get_open_courses, mock_generate_user_certificates, mock_get_cert_data, _mock_should_persist_grades
+    ):
+        mock_get_open_courses.return_value = [self.course_overview]
+        last_module_visitor = self._create_enrollment()
+        StudentModuleFactory.create(
+            student=last_module_visitor.user, course_id=self.course.id, module_state_key=self.last_module.location
+        )
+        self._create_enrollment()
+        self._create_enrollment(passed=False)
+
         call_command('auto_generate_certificates_for_open_courses')
-        assert not mock_log_info.called
 
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.modulestore')
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.log.info')
-    @patch('philu_commands.management.commands.auto_generate_certificates_for_open_courses.'
-           'is_course_valid_for_certificate_auto_generation')
-    def test_course_valid_cert_data_not_exists(self, mock_is_course_valid, mock_log_info, mock_modulestore):
+        # users who have not passed are not evaluated at all
+        self.assertEqual(mock_get_cert_data.call_count, 2)
+        # recently enrolled user, who has not visited the last module yet, is skipped
+        mock_generate_user_certificates.assert_called_once_with(
+            last_module_visitor.user, self.course.id, course=mock_generate_user_certificates.call_args[1]['course'],
+            send_email=True
+        )
+
+    @patch('{}.get_open_courses'.format(COMMAND_MODULE), return_value=[])
+    @patch('{}.log.info'.format(COMMAND_MODULE))
+    def test_no_open_course_available(self, mock_log_info, _mock_get_open_courses):
         """
-        Test 'If course is valid but certification data does not exist'
+        Test 'If no open course is available'
         """
-        mock_response = Mock(**{'get_courses.return_value': [self.course_1]})
-        mock_modulestore.return_value = mock_response
-        mock_is_course_valid.return_value = True
         call_command('auto_generate_certificates_for_open_courses')
-        assert mock_log_info.called
+        assert not mock_log_info.called
 
-    @patch(
-        'philu_commands.management.commands.auto_generate_certificates_for_open_courses.has_active_certificate',
-        return_value=True
-    )
-    def test_is_course_valid_for_certificate_auto_generation(self, mock_has_active_certificate):
+    def test_is_course_valid_for_certificate_auto_generation(self):
         """
         Test 'check if course is in active state'
         """
-        self.course_1.has_started = Mock(return_value=True)
-        self.course_1.has_ended = Mock(return_value=False)
-        self.course_1.may_certify = Mock(return_value=True)
-        mock_has_active_certificate.return_value = True
-        assert is_course_valid_for_certificate_auto_generation(self.course_1)
+        course_overview = Mock(has_any_active_web_certificate=True, **{
+            'has_started.return_value': True, 'has_ended.return_value': False, 'may_certify.return_value': True
+        })
+        assert is_course_valid_for_certificate_auto_generation(course_overview)
+
+        course_overview.has_any_active_web_certificate = False
+        assert not is_course_valid_for_certificate_auto_generation(course_overview)
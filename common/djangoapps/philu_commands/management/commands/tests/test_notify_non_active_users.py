@@ -38,12 +38,10 @@ class TestNotifyNonActiveUsers(ModuleStoreTestCase):
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_visible_courses')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_open_date')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_first_chapter_link')
-    @mock.patch('philu_commands.management.commands.notify_non_active_users.MandrillClient.send_mail')
-    @mock.patch('philu_commands.management.commands.notify_non_active_users.log.info')
+    @mock.patch('philu_commands.management.commands.notify_non_active_users.send_bulk_email')
     def test_notify_non_active_users_with_one_user_to_notify(
         self,
-        mock_log_success_message,
-        mock_send_mail,
+        mock_send_bulk_email,
         mock_get_course_first_chapter_link,
         mock_get_course_open_date,
         mock_get_visible_courses
@@ -57,23 +55,32 @@ class TestNotifyNonActiveUsers(ModuleStoreTestCase):
         call_command('notify_non_active_users')
 
         expected_context = {
-            'first_name': self.user_without_course_access.first_name,
             'course_name': self.course.display_name,
             'course_url': course_first_chapter_link
         }
-
-        mock_send_mail.assert_called_once_with(MandrillClient.COURSE_ACTIVATION_REMINDER_TEMPLATE,
-                                               self.user_without_course_access.email, expected_context)
-        mock_log_success_message.assert_called_with("Emailing to %s Task Completed",
-                                                    self.user_without_course_access.email)
+        expected_recipients = [{
+            'email': self.user_without_course_access.email,
+            'merge_vars': {'first_name': self.user_without_course_access.first_name}
+        }]
+        expected_campaign = '{template}:{course_id}:{run_date}'.format(
+            template=MandrillClient.COURSE_ACTIVATION_REMINDER_TEMPLATE,
+            course_id=self.course.id,
+            run_date=datetime.now(utc).date()
+        )
+
+        mock_send_bulk_email.assert_called_once_with(
+            expected_campaign, MandrillClient.COURSE_ACTIVATION_REMINDER_TEMPLATE, expected_recipients,
+            expected_context
+        )
+        mock_get_course_first_chapter_link.assert_called_once_with(course=self.course)
 
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_visible_courses')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_open_date')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_first_chapter_link')
-    @mock.patch('philu_commands.management.commands.notify_non_active_users.MandrillClient.send_mail')
+    @mock.patch('philu_commands.management.commands.notify_non_active_users.send_bulk_email')
     def test_notify_non_active_users_with_multiple_users_to_notify(
         self,
-        mock_send_mail,
+        mock_send_bulk_email,
         mock_get_course_first_chapter_link,
         mock_get_course_open_date,
         mock_get_visible_courses
@@ -87,16 +94,18 @@ class TestNotifyNonActiveUsers(ModuleStoreTestCase):
         self._create_user_and_enroll_in_provided_course(self.course.id)
 
         call_command('notify_non_active_users')
-        self.assertEqual(mock_send_mail.call_count, 2)
+        self.assertEqual(mock_send_bulk_email.call_count, 1)
+        self.assertEqual(len(mock_send_bulk_email.call_args[0][2]), 2)
+        self.assertEqual(mock_get_course_first_chapter_link.call_count, 1)
 
     @mute_signals(signals.pre_save, signals.post_save)
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_visible_courses')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_open_date')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_first_chapter_link')
-    @mock.patch('philu_commands.management.commands.notify_non_active_users.MandrillClient.send_mail')
+    @mock.patch('philu_commands.management.commands.notify_non_active_users.send_bulk_email')
     def test_notify_non_active_users_with_no_users_to_notify(
         self,
-        mock_send_mail,
+        mock_send_bulk_email,
         mock_get_course_first_chapter_link,
         mock_get_course_open_date,
         mock_get_visible_courses
@@ -113,15 +122,15 @@ class TestNotifyNonActiveUsers(ModuleStoreTestCase):
         StudentModuleFactory.create(student=second_user_without_course_access, course_id=self.course.id)
 
         call_command('notify_non_active_users')
-        assert not mock_send_mail.called
+        assert not mock_send_bulk_email.called
 
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_visible_courses')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_open_date')
     @mock.patch('philu_commands.management.commands.notify_non_active_users.get_course_first_chapter_link')
-    @mock.patch('philu_commands.management.commands.notify_non_active_users.MandrillClient.send_mail')
+    @mock.patch('philu_commands.management.commands.notify_non_active_users.send_bulk_email')
     def test_notify_non_active_users_with_invalid_dates(
         self,
-        mock_send_mail,
+        mock_send_bulk_email,
         mock_get_course_first_chapter_link,
         mock_get_course_open_date,
         mock_get_visible_courses
@@ -137,14 +146,14 @@ class TestNotifyNonActiveUsers(ModuleStoreTestCase):
 
         call_command('notify_non_active_users')
         assert not mock_get_course_first_chapter_link.called
-        assert not mock_send_mail.called
+        assert not mock_send_bulk_email.called
 
         ten_days_before_today = datetime.now(utc) - timedelta(days=10)
         mock_get_course_open_date.return_value = ten_days_before_today
 
         call_command('notify_non_active_users')
         assert not mock_get_course_first_chapter_link.called
-        assert not mock_send_mail.called
+        assert not mock_send_bulk_email.called
 
     def _initialize_mock_parameters(self, course_open_date, all_courses, course_first_chapter_link):
         """
@@ -0,0 +1,124 @@
+"""
+Tests for 'send_ondemand_reminder_emails' command
+"""
+from datetime import datetime, timedelta
+
+import mock
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+from pytz import utc
+
+from openedx.core.djangoapps.content.course_overviews.tests.factories import CourseOverviewFactory
+from philu_commands.management.commands.send_ondemand_reminder_emails import (
+    SHARD_NAME,
+    SHARD_STALE_TIMEOUT,
+    get_course_shard_index,
+    process_reminder_email_shard
+)
+from philu_commands.models import CommandShard
+
+COMMAND_MODULE = 'philu_commands.management.commands.send_ondemand_reminder_emails'
+
+
+class TestSendOnDemandReminderEmails(TestCase):
+    """
+    Tests for sharding of 'send_ondemand_reminder_emails' command
+    """
+
+    def setUp(self):
+        super(TestSendOnDemandReminderEmails, self).setUp()
+        end = datetime.now(utc) + timedelta(days=30)
+        self.courses = [
+            CourseOverviewFactory.create(self_paced=True, end=end, org='org{}'.format(index)) for index in range(4)
+        ]
+        CourseOverviewFactory.create(self_paced=False, end=end, org='instructor_paced')
+
+    @mock.patch('philu_commands.tasks.task_send_ondemand_reminder_emails.delay')
+    def test_shards_dispatched_as_tasks(self, mock_delay):
+        """
+        Test a shard is created and dispatched for every active self paced course
+        """
+        call_command('send_ondemand_reminder_emails')
+
+        shards = CommandShard.objects.filter(name=SHARD_NAME)
+        self.assertEqual(
+            set(shards.values_list('course_id', flat=True)), {course.id for course in self.courses}
+        )
+        self.assertItemsEqual([call[0][0] for call in mock_delay.call_args_list], [shard.id for shard in shards])
+
+    @mock.patch('{}.send_course_reminder_emails'.format(COMMAND_MODULE), return_value=(10, 2))
+    def test_shard_processes_own_courses_once(self, mock_send_course_reminder_emails):
+        """
+        Test a shard only processes its share of courses and a rerun skips completed courses
+        """
+        shard_courses = [course.id for course in self.courses if get_course_shard_index(course.id, 2) == 1]
+
+        call_command('send_ondemand_reminder_emails', '--workers', '2', '--shard', '1')
+        call_command('send_ondemand_reminder_emails', '--workers', '2', '--shard', '1')
+
+        self.assertItemsEqual(
+            [call[0][0].id for call in mock_send_course_reminder_emails.call_args_list], shard_courses
+        )
+        shards = CommandShard.objects.filter(name=SHARD_NAME)
+        self.assertItemsEqual([shard.course_id for shard in shards], shard_courses)
+        for shard in shards:
+            self.assertEqual(shard.status, CommandShard.COMPLETED)
+            self.assertEqual((shard.processed_count, shard.sent_count), (10, 2))
+
+    @mock.patch('{}.send_course_reminder_emails'.format(COMMAND_MODULE), side_effect=Exception)
+    def test_failed_shard_is_retried(self, mock_send_course_reminder_emails):
+        """
+        Test a failed shard is marked as failed and processed again in the next run
+        """
+        call_command('send_ondemand_reminder_emails', '--shard', '0')
+        self.assertEqual(
+            set(CommandShard.objects.values_list('status', flat=True)), {CommandShard.FAILED}
+        )
+
+        mock_send_course_reminder_emails.side_effect = None
+        mock_send_course_reminder_emails.return_value = (1, 1)
+        call_command('send_ondemand_reminder_emails', '--shard', '0')
+        self.assertEqual(
+            set(CommandShard.objects.values_list('status', flat=True)), {CommandShard.COMPLETED}
+        )
+        self.assertEqual(mock_send_course_reminder_emails.call_count, 2 * len(self.courses))
+
+    @mock.patch('{}.send_course_reminder_emails'.format(COMMAND_MODULE), return_value=(1, 1))
+    def test_running_shard_is_skipped_unless_stale(self, mock_send_course_reminder_emails):
+        """
+        Test a shard which another worker is running is not processed again, unless that worker has abandoned it
+        """
+        for course in self.courses:
+            CommandShard.objects.create(
+                name=SHARD_NAME, run_date=datetime.now().date(), course_id=course.id, status=CommandShard.RUNNING
+            )
+        stale_course = self.courses[0]
+        CommandShard.objects.filter(course_id=stale_course.id).update(
+            modified=datetime.now(utc) - SHARD_STALE_TIMEOUT - timedelta(minutes=1)
+        )
+
+        call_command('send_ondemand_reminder_emails', '--shard', '0')
+
+        self.assertEqual([call[0][0].id for call in mock_send_course_reminder_emails.call_args_list], [stale_course.id])
+        self.assertEqual(CommandShard.objects.get(course_id=stale_course.id).status, CommandShard.COMPLETED)
+
+    @mock.patch('{}.send_course_reminder_emails'.format(COMMAND_MODULE), return_value=(1, 1))
+    def test_shard_claimed_by_other_worker_is_skipped(self, mock_send_course_reminder_emails):
+        """
+        Test a shard which is claimed after it was listed is not processed by a second worker
+        """
+        shard = CommandShard.objects.create(
+            name=SHARD_NAME, run_date=datetime.now().date(), course_id=self.courses[0].id
+        )
+        CommandShard.objects.filter(id=shard.id).update(status=CommandShard.RUNNING)
+
+        process_reminder_email_shard(shard)
+
+        self.assertFalse(mock_send_course_reminder_emails.called)
+
+    def test_invalid_shard(self):
+        """
+        Test shard index must be less than number of workers
+        """
+        with self.assertRaises(CommandError):
+            call_command('send_ondemand_reminder_emails', '--workers', '2', '--shard', '2')
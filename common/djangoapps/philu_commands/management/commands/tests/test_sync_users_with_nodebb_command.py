@@ -6,13 +6,16 @@ from __future__ import unicode_literals
 from django.core.management import call_command
 from django.db.models.signals import post_save
 from django.test import TestCase
+from django.test.utils import override_settings
 from factory.django import mute_signals
 from mock import call, patch
 from pynodebb.settings import settings as nodebb_settings
 
-from lms.djangoapps.onboarding.helpers import COUNTRIES
+from lms.djangoapps.onboarding.lookups import get_country_name
 from lms.djangoapps.onboarding.models import UserExtendedProfile
 from lms.djangoapps.onboarding.tests.factories import UserFactory
+from philu_commands.management.commands.tests.fake_nodebb_server import FakeNodeBBServer
+from philu_commands.models import CommandCheckpoint
 
 HTTP_SUCCESS = 200
 HTTP_NOT_FOUND = 404
@@ -152,7 +155,7 @@ class NodeBBSync(TestCase):
             'last_name': user.last_name,
             'country_of_employment': extended_profile.country_of_employment,
             'city_of_employment': extended_profile.city_of_employment,
-            'country_of_residence': COUNTRIES.get(profile.country.code),
+            'country_of_residence': get_country_name(profile.country.code),
             'city_of_residence': profile.city,
             'birthday': profile.year_of_birth,
             'language': profile.language,
@@ -161,3 +164,90 @@ class NodeBBSync(TestCase):
         }
 
         return edx_user_data
+
+
+@patch('philu_commands.management.commands.sync_users_with_nodebb.RETRY_BACKOFF', 0)
+class NodeBBBulkSync(TestCase):
+    """
+    Tests for `sync_users_with_nodebb --bulk` against a local fake NodeBB server.
+    """
+
+    @mute_signals(post_save)
+    def setUp(self):
+        super(NodeBBBulkSync, self).setUp()
+        self.users = [UserFactory() for _ in range(6)]
+
+    def _call_bulk_sync(self, server, *args):
+        with override_settings(NODEBB_ENDPOINT=server.url):
+            call_command('sync_users_with_nodebb', '--bulk', *args)
+
+    def test_bulk_sync_creates_users_concurrently(self):
+        with FakeNodeBBServer(latency=0.05) as server:
+            self._call_bulk_sync(server, '--workers', '4', '--batch-size', '2')
+
+        created_usernames = {body['username'][0] for _, _, body in server.requests_for('/api/v2/users/create')}
+        self.assertEqual(created_usernames, {user.username for user in self.users})
+        self.assertGreater(server.max_concurrent_requests, 1)
+
+        checkpoint = CommandCheckpoint.objects.get(name='sync_users_with_nodebb')
+        self.assertTrue(checkpoint.is_completed)
+        self.assertEqual(checkpoint.processed_count, len(self.users))
+        self.assertEqual(checkpoint.last_processed_id, self.users[-1].id)
+
+    def test_bulk_sync_retries_server_errors(self):
+        with FakeNodeBBServer(failures={'/api/v2/users/create': 2}) as server:
+            self._call_bulk_sync(server, '--workers', '1', '--max-retries', '2')
+
+        self.assertEqual(len(server.requests_for('/api/v2/users/create')), len(self.users) + 2)
+        self.assertEqual(CommandCheckpoint.objects.get(name='sync_users_with_nodebb').failed_count, 0)
+
+    def test_bulk_sync_resumes_from_checkpoint(self):
+        CommandCheckpoint.objects.create(name='sync_users_with_nodebb', last_processed_id=self.users[2].id)
+
+        with FakeNodeBBServer() as server:
+            self._call_bulk_sync(server)
+
+        created_usernames = {body['username'][0] for _, _, body in server.requests_for('/api/v2/users/create')}
+        self.assertEqual(created_usernames, {user.username for user in self.users[3:]})
+
+    def test_bulk_sync_retries_failed_users_at_end_of_run(self):
+        with FakeNodeBBServer(failures={'/api/v2/users/create': 1}) as server:
+            self._call_bulk_sync(server, '--workers', '1', '--max-retries', '0')
+
+        created_usernames = {body['username'][0] for _, _, body in server.requests_for('/api/v2/users/create')}
+        self.assertEqual(created_usernames, {user.username for user in self.users})
+
+        checkpoint = CommandCheckpoint.objects.get(name='sync_users_with_nodebb')
+        self.assertEqual(checkpoint.failed_count, 0)
+        self.assertFalse(checkpoint.failed_records.exists())
+
+    def test_bulk_sync_retries_partially_created_users_without_creating_again(self):
+        with FakeNodeBBServer(failures={'/api/v2/users/activate': 1}) as server:
+            self._call_bulk_sync(server, '--workers', '1', '--max-retries', '0')
+
+        self.assertEqual(len(server.requests_for('/api/v2/users/create')), len(self.users))
+        self.assertEqual(len(server.requests_for('/api/v2/users/activate')), len(self.users) + 1)
+
+        checkpoint = CommandCheckpoint.objects.get(name='sync_users_with_nodebb')
+        self.assertEqual(checkpoint.failed_count, 0)
+        self.assertFalse(checkpoint.failed_records.exists())
+
+    def test_bulk_sync_resume_retries_failed_users_of_previous_run(self):
+        checkpoint = CommandCheckpoint.objects.create(
+            name='sync_users_with_nodebb', last_processed_id=self.users[-1].id, failed_count=1
+        )
+        checkpoint.failed_records.create(record_id=self.users[0].id)
+
+        with FakeNodeBBServer(failures={'/api/v2/users/create': 1}) as server:
+            self._call_bulk_sync(server, '--max-retries', '0')
+
+        self.assertEqual(len(server.requests_for('/api/v2/users/create')), 1)
+        self.assertEqual(list(checkpoint.failed_records.values_list('record_id', flat=True)), [self.users[0].id])
+        self.assertEqual(CommandCheckpoint.objects.get(id=checkpoint.id).failed_count, 1)
+
+    def test_bulk_sync_dry_run(self):
+        with FakeNodeBBServer() as server:
+            self._call_bulk_sync(server, '--dry-run')
+
+        self.assertEqual([path for _, path, _ in server.requests], ['/api/v2/users/all'])
+        self.assertFalse(CommandCheckpoint.objects.get(name='sync_users_with_nodebb').is_completed)
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('philu_commands', '0002_auto_20171024_0658'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommandCheckpoint',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('name', models.CharField(unique=True, max_length=255)),
+                ('last_processed_id', models.PositiveIntegerField(default=0)),
+                ('processed_count', models.PositiveIntegerField(default=0)),
+                ('failed_count', models.PositiveIntegerField(default=0)),
+                ('is_completed', models.BooleanField(default=False)),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import openedx.core.djangoapps.xmodule_django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('philu_commands', '0003_commandcheckpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommandShard',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('name', models.CharField(max_length=255)),
+                ('run_date', models.DateField()),
+                ('course_id', openedx.core.djangoapps.xmodule_django.models.CourseKeyField(max_length=255)),
+                ('status', models.CharField(default='pending', max_length=16, choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')])),
+                ('processed_count', models.PositiveIntegerField(default=0)),
+                ('sent_count', models.PositiveIntegerField(default=0)),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='commandshard',
+            unique_together=set([('name', 'run_date', 'course_id')]),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('philu_commands', '0004_commandshard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommandFailedRecord',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('record_id', models.PositiveIntegerField()),
+                ('checkpoint', models.ForeignKey(related_name='failed_records', to='philu_commands.CommandCheckpoint', on_delete=django.db.models.deletion.CASCADE)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='commandfailedrecord',
+            unique_together=set([('checkpoint', 'record_id')]),
+        ),
+    ]
@@ -3,6 +3,8 @@ Models for philu_commands app
 """
 from django.db import models
 
+from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
+
 
 class CreationFailedUsers(models.Model):
     """
@@ -14,3 +16,82 @@ class CreationFailedUsers(models.Model):
 
     def __unicode__(self):
         return 'CreationFailedUsers: {email}'.format(email=self.email)
+
+
+class CommandCheckpoint(models.Model):
+    """
+    Model to keep progress of long running management commands so that an interrupted run can resume from the last
+    processed record instead of starting over.
+    """
+    name = models.CharField(max_length=255, unique=True)
+    last_processed_id = models.PositiveIntegerField(default=0)
+    processed_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    is_completed = models.BooleanField(default=False)
+    modified = models.DateTimeField(auto_now=True)
+
+    def reset(self):
+        """
+        Restart progress from the first record
+        """
+        self.last_processed_id = 0
+        self.processed_count = 0
+        self.failed_count = 0
+        self.is_completed = False
+        self.save()
+        self.failed_records.all().delete()
+
+    def __unicode__(self):
+        return 'CommandCheckpoint: {name}, last_processed_id: {last_id}'.format(
+            name=self.name, last_id=self.last_processed_id
+        )
+
+
+class CommandFailedRecord(models.Model):
+    """
+    Model to keep records which a checkpointed management command failed to process, so that they are retried even
+    though the checkpoint has moved past them.
+    """
+    checkpoint = models.ForeignKey(CommandCheckpoint, related_name='failed_records', on_delete=models.CASCADE)
+    record_id = models.PositiveIntegerField()
+
+    class Meta(object):
+        unique_together = ('checkpoint', 'record_id')
+
+    def __unicode__(self):
+        return 'CommandFailedRecord: {name}, record_id: {record_id}'.format(
+            name=self.checkpoint.name, record_id=self.record_id
+        )
+
+
+class CommandShard(models.Model):
+    """
+    Model to keep progress of a management command which is split into one shard per course for every run, so that
+    a rerun of the same day only processes the shards which have not completed yet.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (COMPLETED, 'Completed'),
+        (FAILED, 'Failed'),
+    )
+
+    name = models.CharField(max_length=255)
+    run_date = models.DateField()
+    course_id = CourseKeyField(max_length=255)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    processed_count = models.PositiveIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    modified = models.DateTimeField(auto_now=True)
+
+    class Meta(object):
+        unique_together = ('name', 'run_date', 'course_id')
+
+    def __unicode__(self):
+        return 'CommandShard: {name}, {run_date}, {course_id}: {status}'.format(
+            name=self.name, run_date=self.run_date, course_id=self.course_id, status=self.status
+        )
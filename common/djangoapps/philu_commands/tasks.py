@@ -0,0 +1,28 @@
+"""
+Tasks of philu_commands
+"""
+from celery.task import task
+from celery.utils.log import get_task_logger
+
+from philu_commands.management.commands.send_ondemand_reminder_emails import process_reminder_email_shard
+from philu_commands.models import CommandShard
+
+log = get_task_logger(__name__)
+
+SHARD_RETRY_DELAY = 5 * 60  # seconds
+SHARD_MAX_RETRIES = 3
+
+
+@task(default_retry_delay=SHARD_RETRY_DELAY, max_retries=SHARD_MAX_RETRIES)
+def task_send_ondemand_reminder_emails(shard_id):
+    """
+    Send on-demand reminder emails of the course of a shard, retried on failure. Users already emailed in a previous
+    attempt are not emailed again.
+    """
+    shard = CommandShard.objects.get(id=shard_id)
+
+    try:
+        process_reminder_email_shard(shard)
+    except Exception as error:  # pylint: disable=broad-except
+        log.exception('Reminder emails failed for course %s', shard.course_id)
+        task_send_ondemand_reminder_emails.retry(exc=error)
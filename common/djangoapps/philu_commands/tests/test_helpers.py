@@ -6,11 +6,18 @@ from __future__ import unicode_literals
 from datetime import datetime, timedelta
 
 import pytz
+from django.core.cache import cache
 from django.db.models import signals
 from factory.django import mute_signals
 from mock import Mock, patch
 
-from philu_commands.helpers import generate_course_structure, has_active_certificate
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from philu_commands.helpers import (
+    build_course_modules_index,
+    generate_course_structure,
+    get_course_structure,
+    get_course_structure_cache_metrics
+)
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 from xmodule.modulestore.tests.factories import CourseFactory, ItemFactory
 
@@ -95,23 +102,67 @@ class TestHelpers(ModuleStoreTestCase):
         }
         assert course_structure_data_2 == expected_course_object
 
-    def test_has_active_certificate(self):
+    @patch('philu_commands.helpers.generate_course_structure')
+    def test_get_course_structure_cached_per_course_version(self, mock_generate_course_structure):
         """
-        Test 'has active certificates'
+        Test course structure is generated once per published version of course and cache hits and misses are counted
         """
-        has_certificate_1 = has_active_certificate(self.course)
-        self.assertEqual(has_certificate_1, False)
-        certificates = [
-            {
-                'id': i,
-                'name': 'Test Certificate ' + str(i),
-                'description': 'Test Description ' + str(i),
-                'course_title': 'course_title_Test ' + str(i),
-                'org_logo_path': '/t4x/orgX/testX/asset/org-logo-{}.png ' + str(i),
-                'version': i,
-                'is_active': True if i == 1 else False
-            } for i in xrange(2)
-        ]
-        self.course.certificates = {'certificates': certificates}
-        has_certificate_2 = has_active_certificate(self.course)
-        self.assertEqual(has_certificate_2, True)
+        cache.clear()
+        self.addCleanup(cache.clear)
+        mock_generate_course_structure.return_value = {'structure': {'root': 'root', 'blocks': {}}}
+        course_overview = CourseOverview.get_from_id(self.course.id)
+
+        self.assertEqual(get_course_structure(self.course.id), mock_generate_course_structure.return_value)
+        self.assertEqual(get_course_structure(self.course.id), mock_generate_course_structure.return_value)
+        self.assertEqual(mock_generate_course_structure.call_count, 1)
+        self.assertEqual(get_course_structure_cache_metrics(), {'hit': 1, 'miss': 1})
+
+        # course is published again
+        course_overview.save()
+
+        get_course_structure(self.course.id)
+        self.assertEqual(mock_generate_course_structure.call_count, 2)
+        self.assertEqual(get_course_structure_cache_metrics(), {'hit': 1, 'miss': 2})
+
+    @patch('philu_commands.helpers.reverse', return_value='/courseware/chapter/sequential/')
+    def test_build_course_modules_index(self, mock_reverse):
+        """
+        Test modules index contains ORAs of graded sub-sections only and url of first sub-section of every module
+        """
+        course_structure = {
+            'root': 'i4x://test_org/mth/course/Testing_course_1',
+            'blocks': {
+                'i4x://test_org/mth/course/Testing_course_1': {
+                    'children': ['i4x://test_org/mth/chapter/one', 'i4x://test_org/mth/chapter/two']
+                },
+                'i4x://test_org/mth/chapter/one': {
+                    'display_name': 'Module 1',
+                    'children': ['i4x://test_org/mth/sequential/graded', 'i4x://test_org/mth/sequential/ungraded']
+                },
+                'i4x://test_org/mth/chapter/two': {'display_name': 'Module 2', 'children': []},
+                'i4x://test_org/mth/sequential/graded': {
+                    'graded': True, 'children': ['i4x://test_org/mth/vertical/graded']
+                },
+                'i4x://test_org/mth/sequential/ungraded': {
+                    'graded': False, 'children': ['i4x://test_org/mth/vertical/ungraded']
+                },
+                'i4x://test_org/mth/vertical/graded': {
+                    'children': ['i4x://test_org/mth/openassessment/ora', 'i4x://test_org/mth/html/text']
+                },
+                'i4x://test_org/mth/vertical/ungraded': {'children': ['i4x://test_org/mth/openassessment/practice']},
+                'i4x://test_org/mth/openassessment/ora': {'block_type': 'openassessment'},
+                'i4x://test_org/mth/openassessment/practice': {'block_type': 'openassessment'},
+                'i4x://test_org/mth/html/text': {'block_type': 'html'},
+            }
+        }
+
+        modules = build_course_modules_index(self.course.id, course_structure)
+
+        self.assertEqual([module['display_name'] for module in modules], ['Module 1', 'Module 2'])
+        self.assertEqual(modules[0]['graded_sequentials'], [['i4x://test_org/mth/openassessment/ora']])
+        self.assertTrue(modules[0]['url'].endswith('/courseware/chapter/sequential/'))
+        self.assertEqual(modules[1]['graded_sequentials'], [])
+        self.assertEqual(modules[1]['url'], '')
+        mock_reverse.assert_called_once_with('courseware_section', args=[
+            self.course.id.to_deprecated_string(), 'one', 'graded'
+        ])
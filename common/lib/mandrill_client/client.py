@@ -3,12 +3,17 @@ Client for Sending email via mandrill
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import mandrill
+import requests
 from django.conf import settings
 
 log = logging.getLogger(__name__)
 
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CONCURRENT_CHUNKS = 4
+
 
 class MandrillClient(object):
     """
@@ -109,3 +114,81 @@ class MandrillClient(object):
             log.error('A mandrill error occurred: {eClass} - {error}'.format(eClass=e.__class__, error=e))
             raise
         return result
+
+    def send_bulk_mail(self, template_name, recipients, context, subject=None, chunk_size=BULK_CHUNK_SIZE,
+                       max_concurrent_chunks=BULK_MAX_CONCURRENT_CHUNKS):
+        """
+        calls the mandrill API once per chunk of recipients, every recipient gets a separate copy of the email
+
+        arguments:
+        template_name: the slug/identifier of the mandrill email template
+        recipients: list of dicts with `email` and optional `merge_vars` dict e.g. {'full_name': 'John Doe'} which
+            overrides the context for that recipient only
+        context: the data which is passed to the template for all recipients. must be a dict
+        Subject: A subject  title for email
+        chunk_size: max number of recipients in one API call
+        max_concurrent_chunks: max number of API calls in flight at a time
+
+        returns:
+        list of dicts with `email`, `status` and `reject_reason` of every recipient. status is `error` for all
+        recipients of a chunk whose API call failed
+        """
+        chunks = [recipients[start:start + chunk_size] for start in range(0, len(recipients), chunk_size)]
+        global_merge_vars = [{'name': key, 'content': context[key]} for key in context]
+
+        if len(chunks) <= 1 or max_concurrent_chunks <= 1:
+            chunk_results = [
+                self._send_bulk_mail_chunk(self.mandrill_client, template_name, chunk, global_merge_vars, subject)
+                for chunk in chunks
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=max_concurrent_chunks) as executor:
+                # a separate connection for every chunk, mandrill sessions are not shared among threads
+                chunk_results = list(executor.map(
+                    lambda chunk: self._send_bulk_mail_chunk(
+                        mandrill.Mandrill(settings.MANDRILL_API_KEY), template_name, chunk, global_merge_vars, subject
+                    ),
+                    chunks
+                ))
+
+        return [result for results in chunk_results for result in results]
+
+    def _send_bulk_mail_chunk(self, mandrill_client, template_name, recipients, global_merge_vars, subject):
+        """
+        Send one message to a chunk of recipients with per recipient merge vars
+        """
+        message = {
+            'from_email': settings.NOTIFICATION_FROM_EMAIL,
+            'to': [{'email': recipient['email']} for recipient in recipients],
+            'global_merge_vars': global_merge_vars,
+            'merge_vars': [
+                {
+                    'rcpt': recipient['email'],
+                    'vars': [{'name': key, 'content': value} for key, value in recipient.get('merge_vars', {}).items()]
+                }
+                for recipient in recipients if recipient.get('merge_vars')
+            ],
+            'preserve_recipients': False,
+        }
+
+        if subject:
+            message.update({'subject': subject})
+
+        try:
+            results = mandrill_client.messages.send_template(
+                template_name=template_name,
+                template_content=[],
+                message=message,
+            )
+        except (mandrill.Error, requests.exceptions.RequestException) as e:
+            # connection errors and timeouts fail only this chunk, so that results of other chunks are still returned
+            log.error('A mandrill error occurred for a chunk of {count} recipients: {eClass} - {error}'.format(
+                count=len(recipients), eClass=e.__class__, error=e
+            ))
+            return [{'email': recipient['email'], 'status': 'error', 'reject_reason': str(e)}
+                    for recipient in recipients]
+
+        log.info('A mandrill info: sent {template} to a chunk of {count} recipients'.format(
+            template=template_name, count=len(recipients)
+        ))
+        return results
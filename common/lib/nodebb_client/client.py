@@ -12,23 +12,30 @@ from pynodebb.http_client import HttpClient
 from common.lib.nodebb_client.badges import ForumBadge
 from common.lib.nodebb_client.categories import ForumCategory
 from common.lib.nodebb_client.groups import ForumGroup
+from common.lib.nodebb_client.http_client import DEFAULT_POOL_SIZE, PooledHttpClient
 from common.lib.nodebb_client.users import ForumUser
 
+_pooled_client = None
+
 
 class NodeBBClient(Client):
-    def __init__(self, admin_uid=None):
+    def __init__(self, admin_uid=None, pooled=False, pool_size=DEFAULT_POOL_SIZE):
         """Instantiates the NodeBB API Client.
         Args:
             admin_uid (Optional[str]): When using a master token, requests require
                 some form of context (which user made a request) and that context is
                 based on a `_uid` field. Defaults to `HttpClient.DEFAULT_ADMIN_UID`.
+            pooled (Optional[bool]): Send requests over a keep-alive connection pool
+                instead of opening a new connection for every request.
+            pool_size (Optional[int]): Max number of pooled connections, used only
+                if `pooled` is True.
         """
         super(NodeBBClient, self).__init__()
         self.configure(api_endpoint=settings.NODEBB_ENDPOINT,
                        master_token=settings.NODEBB_MASTER_TOKEN,
                        admin_uid=admin_uid)
 
-        self.http_client = HttpClient()
+        self.http_client = PooledHttpClient(pool_size=pool_size) if pooled else HttpClient()
 
         self.users = ForumUser(self.http_client)
         self.topics = Topic(self.http_client)
@@ -36,3 +43,15 @@ class NodeBBClient(Client):
         self.groups = ForumGroup(self.http_client)
         self.categories = ForumCategory(self.http_client)
         self.badges = ForumBadge(self.http_client)
+
+
+def get_pooled_nodebb_client():
+    """
+    Returns a process wide NodeBBClient whose requests share one keep-alive connection pool
+    """
+    global _pooled_client  # pylint: disable=global-statement
+
+    if _pooled_client is None:
+        _pooled_client = NodeBBClient(pooled=True)
+
+    return _pooled_client
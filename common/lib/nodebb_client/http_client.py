@@ -0,0 +1,52 @@
+"""
+Connection pooled http client for pynodebb
+"""
+from __future__ import unicode_literals
+
+from urlparse import urljoin
+
+import requests
+from pynodebb.http_client import HttpClient
+from pynodebb.settings import settings as nodebb_settings
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 30  # seconds
+
+
+class PooledHttpClient(HttpClient):
+    """
+    HttpClient which sends all requests over a single keep-alive `requests.Session`.
+
+    The default pynodebb HttpClient opens a new connection for every request, this one reuses connections from a
+    pool so that a worker syncing many users with NodeBB does not pay the TCP/TLS handshake on each call.
+    """
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+        super(PooledHttpClient, self).__init__()
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Authorization': 'Bearer {}'.format(nodebb_settings['master_token'])})
+
+    def _request(self, method, path, **kwargs):
+        """
+        Perform the request over the pooled session
+
+        Returns:
+            tuple: (status_code, response_body) same as pynodebb HttpClient
+        """
+        url = urljoin(nodebb_settings['api_endpoint'], path)
+
+        if method.upper() == 'GET':
+            response = self.session.request(method, url, params=kwargs, timeout=self.timeout)
+        else:
+            kwargs.setdefault('_uid', nodebb_settings['admin_uid'])
+            response = self.session.request(method, url, data=kwargs, timeout=self.timeout)
+
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, response.text
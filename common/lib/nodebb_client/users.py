@@ -67,3 +67,10 @@ class ForumUser(User):
         Returns and array of all users present on NodeBB
         """
         return self.client.post('/api/v2/users/all')
+
+    def data(self, username):
+        """
+        Returns community profile data of a user e.g. reputation and postcount
+        """
+        payload = {'username': username, '_uid': 1}
+        return self.client.post('/api/v2/users/data', **payload)
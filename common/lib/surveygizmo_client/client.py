@@ -1,6 +1,9 @@
 """
 Client to communicate with Survey Gizmo
 """
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
 from surveygizmo import SurveyGizmo
 
@@ -35,24 +38,35 @@ class SurveyGizmoClient(SurveyGizmo):
 
         return surveys.list(survey_id)
 
-    def get_filtered_survey_responses(self, survey_filters=None):
+    def iter_survey_response_pages(self, survey_id, survey_filters=None, results_per_page=500, workers=1):
         """
-        Filters survey based on the provided survey filters.
+        Lazily yields responses of every page of a survey.
+
+        First page is fetched to know the number of pages, the rest are fetched `workers` pages at a time by
+        concurrent requests, so at most `workers` pages are held in memory. Every thread uses its own client because
+        the Survey Gizmo resources keep the page and filters of a request on the client.
         """
-        survey_responses_data = []
-        surveys = self.get_surveys()
+        first_page = self.get_survey_responses(
+            survey_id, survey_filters=survey_filters, results_per_page=results_per_page
+        )
+        yield first_page['data']
+
+        pages = range(int(first_page['page']) + 1, int(first_page['total_pages']) + 1)
+        if not pages:
+            return
 
-        for survey in surveys['data']:
-            survey_responses = self.get_survey_responses(survey['id'], survey_filters=survey_filters)
-            if survey_responses['data']:
-                survey_responses_data += survey_responses['data']
+        workers = max(workers, 1)
+        thread_data = threading.local()
 
-            # Pagination
-            total_pages = survey_responses['total_pages']
+        def get_page_responses(page_no):
+            if not hasattr(thread_data, 'client'):
+                thread_data.client = SurveyGizmoClient()
 
-            for page in range(int(survey_responses['page']) + 1, int(total_pages) + 1):
-                page_responses = self.get_survey_responses(survey['id'], survey_filters=survey_filters, page_no=page)
-                if page_responses['data']:
-                    survey_responses_data += page_responses['data']
+            return thread_data.client.get_survey_responses(
+                survey_id, survey_filters=survey_filters, page_no=page_no, results_per_page=results_per_page
+            )['data']
 
-        return survey_responses_data
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for window_start in range(0, len(pages), workers):
+                for page_responses in executor.map(get_page_responses, pages[window_start:window_start + workers]):
+                    yield page_responses
@@ -1,7 +1,16 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from oef.models import OrganizationOefScore, OrganizationOefUpdatePrompt
+from oef.helpers import invalidate_survey_definition
+from oef.models import (
+    Instruction,
+    OefSurvey,
+    Option,
+    OptionLevel,
+    OrganizationOefScore,
+    OrganizationOefUpdatePrompt,
+    TopicQuestion
+)
 from lms.djangoapps.onboarding.helpers import convert_date_to_utcdatetime, its_been_year
 
 
@@ -37,3 +46,20 @@ def update_oef_prompts(instance, **kwargs):
             year=year
         )
         prompt.save()
+
+
+@receiver(post_save, sender=OefSurvey)
+@receiver(post_delete, sender=OefSurvey)
+@receiver(post_save, sender=TopicQuestion)
+@receiver(post_delete, sender=TopicQuestion)
+@receiver(post_save, sender=Option)
+@receiver(post_delete, sender=Option)
+@receiver(post_save, sender=OptionLevel)
+@receiver(post_delete, sender=OptionLevel)
+@receiver(post_save, sender=Instruction)
+@receiver(post_delete, sender=Instruction)
+def invalidate_survey_definition_on_change(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Compile survey definition again once survey, its topics, options, levels or instructions are changed in admin
+    """
+    invalidate_survey_definition()
@@ -1,9 +1,111 @@
 import datetime
+from collections import namedtuple
+
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch, Q
 
-from oef.models import OefSurvey, TopicQuestion, OptionLevel, OrganizationOefScore, Instruction
+from oef.models import OefSurvey, TopicQuestion, Option, OptionLevel, OrganizationOefScore, Instruction
 from oef.messages import NON_APPLICABLE_OEF, PENDING_DRAFT
 
+OEF_SURVEY_VERSION_KEY = 'oef.survey.version'
+
+SurveyDefinition = namedtuple(
+    'SurveyDefinition', ['version', 'id', 'title', 'description', 'topics', 'levels', 'instructions']
+)
+SurveyTopic = namedtuple('SurveyTopic', ['id', 'title', 'description', 'index', 'score_name', 'options'])
+SurveyOption = namedtuple('SurveyOption', ['id', 'text', 'short_text', 'level'])
+SurveyOptionLevel = namedtuple('SurveyOptionLevel', ['id', 'label', 'value', 'caption'])
+SurveyInstruction = namedtuple('SurveyInstruction', ['id', 'question_index', 'question', 'answer'])
+
+_survey_definition = None
+
+
+def get_survey_definition():
+    """
+    Get the enabled OEF survey along with its topics, options, option levels and instructions. Survey is compiled
+    once per version into an immutable structure kept in process memory, so reading it costs no query until the
+    survey is changed in admin.
+
+    Returns:
+        SurveyDefinition: latest enabled survey
+
+    Raises:
+        OefSurvey.DoesNotExist: if no survey is enabled
+    """
+    global _survey_definition  # pylint: disable=global-statement
+
+    version = get_survey_definition_version()
+    if _survey_definition is None or _survey_definition.version != version:
+        _survey_definition = compile_survey_definition(version)
+
+    return _survey_definition
+
+
+def compile_survey_definition(version):
+    """
+    Load the enabled survey with a constant number of queries, regardless of number of topics and options
+    """
+    survey = OefSurvey.objects.filter(is_enabled=True).latest('created')
+    topics = TopicQuestion.objects.filter(survey_id=survey.id).order_by('order_number').prefetch_related(
+        Prefetch('options', queryset=Option.objects.select_related('level').order_by('level__value'))
+    )
+    levels = {level.id: _get_survey_option_level(level) for level in OptionLevel.objects.all()}
+
+    return SurveyDefinition(
+        version=version,
+        id=survey.id,
+        title=survey.title,
+        description=survey.description,
+        topics=tuple(
+            SurveyTopic(
+                id=topic.id,
+                title=topic.title,
+                description=topic.description,
+                index=index + 1,
+                score_name=topic.score_name,
+                options=tuple(
+                    SurveyOption(
+                        id=option.id, text=option.text, short_text=option.short_text, level=levels[option.level_id]
+                    ) for option in topic.options.all()
+                )
+            ) for index, topic in enumerate(topics)
+        ),
+        levels=tuple(sorted(levels.values(), key=lambda level: level.value)),
+        instructions=tuple(
+            SurveyInstruction(
+                id=instruction.id,
+                question_index=instruction.question_index,
+                question=instruction.question,
+                answer=instruction.answer
+            ) for instruction in Instruction.objects.filter(is_enabled=True).order_by('question_index')
+        )
+    )
+
+
+def _get_survey_option_level(level):
+    return SurveyOptionLevel(id=level.id, label=level.label, value=level.value, caption=level.caption)
+
+
+def get_survey_definition_version():
+    """
+    Get version of survey definition, shared by all processes through cache
+    """
+    cache.add(OEF_SURVEY_VERSION_KEY, 1, None)
+    return cache.get(OEF_SURVEY_VERSION_KEY, 1)
+
+
+def invalidate_survey_definition():
+    """
+    Move survey definition to next version, so that every process compiles the survey again on its next access
+    """
+    cache.add(OEF_SURVEY_VERSION_KEY, 1, None)
+    try:
+        cache.incr(OEF_SURVEY_VERSION_KEY)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(OEF_SURVEY_VERSION_KEY, 1, None)
+
 
 def get_user_survey_status(user, create_new_survey=True):
     """
@@ -24,7 +126,7 @@ def get_user_survey_status(user, create_new_survey=True):
 
     if not uos:
         if create_new_survey:
-            survey = OefSurvey.objects.filter(is_enabled=True).latest('created')
+            survey = get_survey_definition()
 
         return {
             'error': error,
@@ -35,14 +137,14 @@ def get_user_survey_status(user, create_new_survey=True):
     if not uos.finish_date:
         error = PENDING_DRAFT
         is_eligible = False
-        survey = OefSurvey.objects.filter(is_enabled=True).latest('created')
+        survey = get_survey_definition()
     else:
         limit = settings.OEF_RENEWAL_DAYS
         if (datetime.date.today() - uos.modified.date()).days < limit:
             is_eligible = False
             error = NON_APPLICABLE_OEF
         elif create_new_survey:
-            survey = OefSurvey.objects.filter(is_enabled=True).latest('created')
+            survey = get_survey_definition()
 
     return {
         'error': error,
@@ -72,30 +174,42 @@ def get_user_survey(user, latest_survey):
     return uos
 
 
-def get_survey_topics(uos, survey_id):
-    topics = TopicQuestion.objects.filter(survey_id=survey_id).order_by("order_number")
+def get_survey_topics(uos, survey):
+    """
+    Get topics of the survey definition along with answers of a user survey
+    """
     parsed_topics = []
-    for index, topic in enumerate(topics):
-        options = topic.options.order_by('level__value')
-        answer = getattr(uos, topic.score_name)
+    for topic in survey.topics:
         parsed_topics.append({
             'title': topic.title,
             'description': topic.description,
-            'index': index + 1,
+            'index': topic.index,
             'id': topic.id,
             'score_name': topic.score_name,
-            'options': options,
-            'answer': answer
+            'options': topic.options,
+            'answer': getattr(uos, topic.score_name)
         })
     return parsed_topics
 
 
-def get_option_levels():
-    return OptionLevel.objects.order_by('value')
-
+def get_oef_score_history(user, organization):
+    """
+    Get surveys of the user and finished surveys of the organization, with one query
 
-def get_oef_instructions():
-    return Instruction.objects.filter(is_enabled=True).order_by('question_index')
+    Returns:
+        list: dicts with dates and status of surveys
+    """
+    scores = OrganizationOefScore.objects.filter(
+        Q(user_id=user.id) | Q(org=organization, finish_date__isnull=False)
+    ).order_by('start_date', 'id').values('id', 'start_date', 'finish_date', 'modified')
+
+    return [{
+        'id': score['id'],
+        'started_on': score['start_date'].strftime('%m/%d/%Y'),
+        'completed_on': score['finish_date'].strftime('%m/%d/%Y') if score['finish_date'] else '',
+        'modified': score['modified'].strftime('%m/%d/%Y'),
+        'status': 'Draft' if not score['finish_date'] else 'Finished'
+    } for score in scores]
 
 
 def get_option(option_value):
@@ -1,3 +1,82 @@
-from django.test import TestCase
+"""
+Tests for OEF survey definition and score history
+"""
+from datetime import date
 
-# Create your tests here.
+from lms.djangoapps.onboarding.tests.factories import OrganizationFactory, UserFactory
+from oef import helpers
+from oef.models import Instruction, OefSurvey, Option, OptionLevel, OrganizationOefScore, TopicQuestion
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+
+
+class SurveyDefinitionTestCase(CacheIsolationTestCase):
+    """
+    Tests for compiled and versioned survey definition in `oef.helpers`
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(SurveyDefinitionTestCase, self).setUp()
+        helpers._survey_definition = None  # pylint: disable=protected-access
+
+        self.survey = OefSurvey.objects.create(title='OEF', description='Assessment', is_enabled=True)
+        high_level = OptionLevel.objects.create(label='High', value=2)
+        low_level = OptionLevel.objects.create(label='Low', value=1)
+        for order_number, score_name in enumerate(['leadership_score', 'strategy_score']):
+            topic = TopicQuestion.objects.create(
+                survey=self.survey, title=score_name, score_name=score_name, description='', order_number=order_number
+            )
+            Option.objects.create(topic=topic, level=high_level, text='high', short_text='high')
+            Option.objects.create(topic=topic, level=low_level, text='low', short_text='low')
+        Instruction.objects.create(question_index=1, question='Why?', answer='Because')
+
+    def test_survey_is_compiled_once_per_version(self):
+        with self.assertNumQueries(5):
+            survey = helpers.get_survey_definition()
+
+        self.assertEqual(survey.id, self.survey.id)
+        self.assertEqual([topic.score_name for topic in survey.topics], ['leadership_score', 'strategy_score'])
+        self.assertEqual([option.level.label for option in survey.topics[0].options], ['Low', 'High'])
+        self.assertEqual([level.value for level in survey.levels], [1, 2])
+        self.assertEqual([instruction.question for instruction in survey.instructions], ['Why?'])
+
+        with self.assertNumQueries(0):
+            self.assertIs(helpers.get_survey_definition(), survey)
+
+    def test_survey_is_compiled_again_once_changed(self):
+        survey = helpers.get_survey_definition()
+
+        Option.objects.filter(text='high').first().delete()
+
+        self.assertIsNot(helpers.get_survey_definition(), survey)
+        self.assertEqual(len(helpers.get_survey_definition().topics[0].options), 1)
+
+    def test_survey_topics_with_answers(self):
+        uos = OrganizationOefScore(leadership_score=2)
+        topics = helpers.get_survey_topics(uos, helpers.get_survey_definition())
+
+        self.assertEqual([(topic['index'], topic['answer']) for topic in topics], [(1, 2), (2, None)])
+
+
+class OefScoreHistoryTestCase(CacheIsolationTestCase):
+    """
+    Tests for `oef.helpers.get_oef_score_history`
+    """
+
+    def test_user_and_finished_organization_scores_with_one_query(self):
+        user = UserFactory()
+        other_user = UserFactory()
+        organization = OrganizationFactory()
+        draft = OrganizationOefScore.objects.create(user=user, org=organization, start_date=date(2020, 1, 1))
+        finished = OrganizationOefScore.objects.create(
+            user=other_user, org=organization, start_date=date(2020, 1, 2), finish_date=date(2020, 1, 3)
+        )
+        OrganizationOefScore.objects.create(user=other_user, org=organization, start_date=date(2020, 1, 4))
+
+        with self.assertNumQueries(1):
+            history = helpers.get_oef_score_history(user, organization)
+
+        self.assertEqual([(score['id'], score['status']) for score in history], [
+            (draft.id, 'Draft'), (finished.id, 'Finished')
+        ])
+        self.assertEqual(history[1]['completed_on'], '01/03/2020')
@@ -18,12 +18,6 @@ def oef_dashboard(request):
 
     """
     user_extended_profile = request.user.extended_profile
-    user_surveys = list(OrganizationOefScore.objects.filter(user_id=request.user.id))
-    organization_surveys = list(OrganizationOefScore.objects.filter(
-        org=user_extended_profile.organization).exclude(finish_date__isnull=True))
-    user_surveys = set(user_surveys + organization_surveys)
-
-    surveys = []
     user_survey_status = get_user_survey_status(request.user, create_new_survey=False)
 
     is_first_user = user_extended_profile.is_first_signup_in_org if user_extended_profile.organization else False
@@ -36,16 +30,10 @@ def oef_dashboard(request):
         'first_learner_submitted_oef': is_first_user and user_extended_profile.has_submitted_oef()
     }
 
-    for survey in user_surveys:
-        surveys.append({
-            'id': survey.id,
-            'started_on': survey.start_date.strftime('%m/%d/%Y'),
-            'completed_on': survey.finish_date.strftime('%m/%d/%Y') if survey.finish_date else '',
-            'modified': survey.modified.strftime('%m/%d/%Y'),
-            'status': 'Draft' if not survey.finish_date else 'Finished'
-        })
-
-    context.update({'surveys': surveys, 'error': user_survey_status['error']})
+    context.update({
+        'surveys': get_oef_score_history(request.user, user_extended_profile.organization),
+        'error': user_survey_status['error']
+    })
 
     return render(request, 'oef/oef-org.html', context)
 
@@ -69,15 +57,14 @@ def get_survey_by_id(request, user_survey_id):
     """
     organization = request.user.extended_profile.organization
     uos = OrganizationOefScore.objects.get(id=int(user_survey_id), org=organization)
-    survey = OefSurvey.objects.filter(is_enabled=True).latest('created')
-    topics = get_survey_topics(uos, survey.id)
-    levels = get_option_levels()
+    survey = get_survey_definition()
+    topics = get_survey_topics(uos, survey)
     return render(request, 'oef/oef_survey.html', {"survey_id": survey.id,
                                                    "is_completed": bool(uos.finish_date),
                                                    "description": survey.description,
                                                    "topics": topics,
-                                                   "instructions": get_oef_instructions(),
-                                                   "levels": levels,
+                                                   "instructions": survey.instructions,
+                                                   "levels": survey.levels,
                                                    'organization': organization.label,
                                                    'date': uos.modified.strftime('%m/%d/%Y')
                                                    })
@@ -97,16 +84,15 @@ def fetch_survey(request):
             finish_date__isnull=True).last()
         return redirect('/oef/%s' % last_finished_survey.id)
 
-    uos = get_user_survey(request.user, survey_info['survey'])
-    survey = OefSurvey.objects.filter(is_enabled=True).latest('created')
-    topics = get_survey_topics(uos, survey.id)
-    levels = get_option_levels()
+    survey = survey_info['survey']
+    uos = get_user_survey(request.user, survey)
+    topics = get_survey_topics(uos, survey)
     return render(request, 'oef/oef_survey.html', {"survey_id": survey.id,
                                                    "description": survey.description,
                                                    "topics": topics,
-                                                   "levels": levels,
+                                                   "levels": survey.levels,
                                                    'is_completed': False,
-                                                   "instructions": get_oef_instructions(),
+                                                   "instructions": survey.instructions,
                                                    'organization': request.user.extended_profile.organization.label,
                                                    'date': uos.start_date.strftime('%m/%d/%Y')
                                                    })
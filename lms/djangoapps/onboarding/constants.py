@@ -10,3 +10,8 @@ TAKE_ME_THERE_VAL = 'Take Me There'
 NOT_INTERESTED_KEY = 'NT'
 NOT_INTERESTED_VAL = "No Thanks, I'm Not Interested"
 ORG_SEARCH_TERM_LENGTH = 2
+
+ORG_SEARCH_INDEX_VERSION_KEY = 'onboarding.org_search_index.version'
+ORG_SEARCH_INDEX_CHANGE_KEY = 'onboarding.org_search_index.change.{version}'
+ORG_SEARCH_INDEX_TIMEOUT = 60 * 60  # seconds, index is rebuilt at least this often
+ORG_SEARCH_INDEX_MAX_REPLAY = 500  # changes, an index further behind is rebuilt instead
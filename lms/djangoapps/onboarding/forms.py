@@ -12,7 +12,7 @@ from django.utils.translation import ugettext_lazy, ugettext_noop
 from opaque_keys.edx.keys import CourseKey
 
 from lms.djangoapps.onboarding.email_utils import send_admin_activation_email
-from lms.djangoapps.onboarding.helpers import COUNTRIES, LANGUAGES, get_country_iso
+from lms.djangoapps.onboarding.lookups import get_countries, get_country_iso, is_language, normalize_language
 from lms.djangoapps.onboarding.models import (
     Currency,
     EducationLevel,
@@ -227,7 +227,7 @@ class UserInfoModelForm(BaseOnboardingModelForm):
         return gender
 
     def clean_country(self):
-        all_countries = COUNTRIES.values()
+        all_countries = get_countries().values()
         country = self.cleaned_data['country']
 
         if country in all_countries:
@@ -238,8 +238,8 @@ class UserInfoModelForm(BaseOnboardingModelForm):
     def clean_language(self):
         submitted_language = self.cleaned_data['language']
 
-        if submitted_language in LANGUAGES:
-            return submitted_language
+        if is_language(submitted_language):
+            return normalize_language(submitted_language)
 
         raise forms.ValidationError(ugettext_noop('Please select language.'))
 
@@ -633,7 +633,7 @@ class OrganizationInfoForm(BaseOnboardingModelForm):
         }
 
     def clean_country(self):
-        all_countries = COUNTRIES.values()
+        all_countries = get_countries().values()
         country = self.cleaned_data['country']
 
         if country in all_countries:
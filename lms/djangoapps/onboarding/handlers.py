@@ -22,6 +22,10 @@ from lms.djangoapps.onboarding.models import (
     OrganizationMetricUpdatePrompt,
     UserExtendedProfile
 )
+from lms.djangoapps.onboarding.org_search import (
+    remove_organization_from_search_index,
+    update_organization_in_search_index
+)
 from mailchimp_pipeline.signals.handlers import sync_metric_update_prompt_with_mail_chimp
 from oef.models import OrganizationOefUpdatePrompt
 from util.model_utils import USER_FIELD_CHANGED, get_changed_fields_dict
@@ -60,6 +64,16 @@ def update_responsible_user_to_admin(sender, instance, update_fields, **kwargs):
             pass
 
 
+@receiver(post_save, sender=Organization)
+def update_organization_search_index(sender, instance, **kwargs):
+    update_organization_in_search_index(instance)
+
+
+@receiver(post_delete, sender=Organization)
+def remove_organization_search_index(sender, instance, **kwargs):
+    remove_organization_from_search_index(instance.id)
+
+
 @receiver(post_save, sender=OrganizationMetric)
 def update_metric_prompts(instance, created, update_fields, **kwargs):
     this_metric_prompts = OrganizationMetricUpdatePrompt.objects.filter(org_id=instance.org_id)
@@ -1,5 +1,6 @@
 import re
 import pytz
+from collections import OrderedDict
 from logging import getLogger
 
 from dateutil.relativedelta import relativedelta
@@ -9,7800 +10,25 @@ from difflib import SequenceMatcher
 from django.conf import settings
 from django.core import serializers
 
-from common.lib.mandrill_client.client import MandrillClient
-from mailchimp_pipeline.signals.handlers import update_user_email_in_mailchimp
-from nodebb.tasks import task_update_user_profile_on_nodebb
 from oef.models import OrganizationOefUpdatePrompt
 from lms.djangoapps.onboarding.constants import ORG_SEARCH_TERM_LENGTH
+from lms.djangoapps.onboarding.lookups import get_country_name
 from lms.djangoapps.onboarding.models import (
     Organization, OrganizationMetricUpdatePrompt, PartnerNetwork, OrganizationAdminHashKeys
 )
+from lms.djangoapps.onboarding.org_search import get_match_label, get_organization_search_index
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
 
 
 utc = pytz.UTC
 log = getLogger(__name__)
 
-COUNTRIES = {
-    'AD': 'Andorra',
-    'AE': 'United Arab Emirates',
-    'AF': 'Afghanistan',
-    'AX': 'Aland Islands',
-    'AG': 'Antigua and Barbuda',
-    'AI': 'Anguilla',
-    'AL': 'Albania',
-    'AM': 'Armenia',
-    'AO': 'Angola',
-    'AQ': 'Antarctica',
-    'AR': 'Argentina',
-    'AS': 'American Samoa',
-    'AT': 'Austria',
-    'AU': 'Australia',
-    'AW': 'Aruba',
-    'AZ': 'Azerbaijan',
-    'BA': 'Bosnia and Herzegovina',
-    'BB': 'Barbados',
-    'BD': 'Bangladesh',
-    'BE': 'Belgium',
-    'BF': 'Burkina Faso',
-    'BG': 'Bulgaria',
-    'BH': 'Bahrain',
-    'BI': 'Burundi',
-    'BJ': 'Benin',
-    'BM': 'Bermuda',
-    'BN': 'Brunei',
-    'BO': 'Bolivia',
-    'BQ': 'Caribbean Netherlands',
-    'BR': 'Brazil',
-    'BS': 'Bahamas',
-    'BT': 'Bhutan',
-    'BV': 'Bouvet Island',
-    'BW': 'Botswana',
-    'BY': 'Belarus',
-    'BZ': 'Belize',
-    'CA': 'Canada',
-    'CC': 'Cocos (Keeling) Islands',
-    'CD': 'Congo, Republic of the',
-    'CF': 'Central African Republic',
-    'CG': 'Congo, Democratic Republic of the',
-    'CH': 'Switzerland',
-    'CI': "Cote d'Ivoire",
-    'CK': "Cook Islands",
-    'CL': 'Chile',
-    'CM': 'Cameroon',
-    'CN': 'China',
-    'CO': 'Colombia',
-    'CR': 'Costa Rica',
-    'CUW': 'Curacao',
-    'CV': 'Cape Verde',
-    'CX': 'Christmas Island',
-    'CY': 'Cyprus',
-    'CZ': 'Czechia',
-    'DE': 'Germany',
-    'DJ': 'Djibouti',
-    'DK': 'Denmark',
-    'DM': 'Dominica',
-    'DO': 'Dominican Republic',
-    'DZ': 'Algeria',
-    'EC': 'Ecuador',
-    'EE': 'Estonia',
-    'EG': 'Egypt',
-    'EH': 'Western Sahara',
-    'ER': 'Eritrea',
-    'ES': 'Spain',
-    'ET': 'Ethiopia',
-    'FI': 'Finland',
-    'FJ': 'Fiji',
-    'FK': 'Falkland Islands',
-    'FM': 'Micronesia',
-    'FO': 'Faroe Islands',
-    'FR': 'France',
-    'GA': 'Gabon',
-    'GB': 'United Kingdom',
-    'GD': 'Grenada',
-    'GE': 'Georgia',
-    'GF': 'French Guiana',
-    'GG': 'Guernsey',
-    'GH': 'Ghana',
-    'GI': 'Gibraltar',
-    'GL': 'Greenland',
-    'GM': 'Gambia, The',
-    'GN': 'Guinea',
-    'GP': 'Guadeloupe',
-    'GQ': 'Equatorial Guinea',
-    'GR': 'Greece',
-    'GS': 'South Georgia and the South Sandwich Islands',
-    'GT': 'Guatemala',
-    'GU': 'Guam',
-    'GW': 'Guinea-Bissau',
-    'GY': 'Guyana',
-    'HK': 'Hong Kong',
-    'HM': 'Heard and McDonald Islands',
-    'HN': 'Honduras',
-    'HR': 'Croatia',
-    'HT': 'Haiti',
-    'HU': 'Hungary',
-    'ID': 'Indonesia',
-    'IE': 'Ireland',
-    'IL': 'Israel',
-    'IM': 'Isle of Man',
-    'IN': 'India',
-    'IO': 'British Indian Ocean Territory',
-    'IQ': 'Iraq',
-    'IS': 'Iceland',
-    'IT': 'Italy',
-    'JE': 'Jersey',
-    'JM': 'Jamaica',
-    'JO': 'Jordan',
-    'JP': 'Japan',
-    'KE': 'Kenya',
-    'KG': 'Kyrgyzstan',
-    'KH': 'Cambodia',
-    'KI': 'Kiribati',
-    'KM': 'Comoros',
-    'KN': 'Saint Kitts and Nevis',
-    'KR': 'South Korea',
-    'KW': 'Kuwait',
-    'KY': 'Cayman Islands',
-    'KZ': 'Kazakhstan',
-    'LA': "Laos",
-    'LB': 'Lebanon',
-    'LBY': 'Libya',
-    'LC': 'Saint Lucia',
-    'LI': 'Liechtenstein',
-    'LK': 'Sri Lanka',
-    'LR': 'Liberia',
-    'LS': 'Lesotho',
-    'LT': 'Lithuania',
-    'LU': 'Luxembourg',
-    'LV': 'Latvia',
-    'MA': 'Morocco',
-    'MC': 'Monaco',
-    'MD': 'Moldova',
-    'ME': 'Montenegro',
-    'MF': 'Saint-Martin (France)',
-    'MG': 'Madagascar',
-    'MH': 'Marshall Islands',
-    'MK': 'Macedonia',
-    'ML': 'Mali',
-    'MM': 'Myanmar',
-    'MN': 'Mongolia',
-    'MO': 'Macau',
-    'MP': 'Northern Mariana Islands',
-    'MQ': 'Martinique',
-    'MR': 'Mauritania',
-    'MS': 'Montserrat',
-    'MT': 'Malta',
-    'MU': 'Mauritius',
-    'MV': 'Maldives',
-    'MW': 'Malawi',
-    'MX': 'Mexico',
-    'MY': 'Malaysia',
-    'MZ': 'Mozambique',
-    'NA': 'Namibia',
-    'NC': 'New Caledonia',
-    'NE': 'Niger',
-    'NF': 'Norfolk Island',
-    'NG': 'Nigeria',
-    'NI': 'Nicaragua',
-    'NL': 'Netherlands',
-    'NO': 'Norway',
-    'NP': 'Nepal',
-    'NR': 'Nauru',
-    'NU': 'Niue',
-    'NZ': 'New Zealand',
-    'OM': 'Oman',
-    'PA': 'Panama',
-    'PE': 'Peru',
-    'PF': 'French Polynesia',
-    'PG': 'Papua New Guinea',
-    'PH': 'Philippines',
-    'PK': 'Pakistan',
-    'PL': 'Poland',
-    'PM': 'St. Pierre and Miquelon',
-    'PN': 'Pitcairn',
-    'PR': 'Puerto Rico',
-    'PS': 'Palestinian Territories',
-    'PT': 'Portugal',
-    'PW': 'Palau',
-    'PY': 'Paraguay',
-    'QA': 'Qatar',
-    'RE': 'Reunion',
-    'RO': 'Romania',
-    'RS': 'Serbia',
-    'RU': 'Russia',
-    'RW': 'Rwanda',
-    'BL': 'Saint Barthelemy',
-    'SA': 'Saudi Arabia',
-    'SB': 'Solomon Islands',
-    'SC': 'Seychelles',
-    'SD': 'Sudan',
-    'SE': 'Sweden',
-    'SG': 'Singapore',
-    'SH': 'Saint Helena',
-    'SI': 'Slovenia',
-    'SJ': 'Svalbard and Jan Mayen Islands',
-    'SK': 'Slovakia',
-    'SL': 'Sierra Leone',
-    'SXM': 'Sint Maarten',
-    'SM': 'San Marino',
-    'SN': 'Senegal',
-    'SO': 'Somalia',
-    'SR': 'Suriname',
-    'SS': 'South Sudan',
-    'ST': 'Sao Tome and Principe',
-    'SV': 'El Salvador',
-    'SY': 'Syria',
-    'SZ': 'Swaziland',
-    'TC': 'Turks and Caicos Islands',
-    'TD': 'Chad',
-    'TF': 'French Southern Territories',
-    'TG': 'Togo',
-    'TH': 'Thailand',
-    'TJ': 'Tajikistan',
-    'TK': 'Tokelau',
-    'TL': 'Timor-Leste',
-    'TM': 'Turkmenistan',
-    'TN': 'Tunisia',
-    'TO': 'Tonga',
-    'TR': 'Turkey',
-    'TT': 'Trinidad and Tobago',
-    'TV': 'Tuvalu',
-    'TW': 'Taiwan',
-    'TZ': 'Tanzania',
-    'UA': 'Ukraine',
-    'UG': 'Uganda',
-    'UM': 'United States Minor Outlying Islands',
-    'US': 'United States',
-    'UY': 'Uruguay',
-    'UZ': 'Uzbekistan',
-    'VA': 'Holy See (Vatican City State)',
-    'VC': 'Saint Vincent and the Grenadines',
-    'VE': 'Venezuela',
-    'VG': 'Virgin Islands (British)',
-    'VI': 'Virgin Islands (U.S.)',
-    'VN': 'Vietnam',
-    'VU': 'Vanuatu',
-    'WF': 'Wallis and Futuna Islands',
-    'WS': 'Samoa',
-    'XK': 'Kosovo',
-    'YE': 'Yemen',
-    'YT': 'Mayotte',
-    'ZA': 'South Africa',
-    'ZM': 'Zambia',
-    'ZW': 'Zimbabwe'
-}
-
-LANGUAGES = [
-    "A-Pucikwar",
-    "Akaselem",
-    "Angait\u00e9",
-    "Arpitan",
-    "Aari",
-    "Akateko",
-    "Angal",
-    "Arrarnta, Western",
-    "Aas\u00e1x",
-    "Akawaio",
-    "Angal Enen",
-    "Arrernte, Eastern",
-    "Abadi",
-    "Ake",
-    "Angal Heneng",
-    "Arta",
-    "Abaga",
-    "Akebu",
-    "Angika",
-    "Aru\u00e1",
-    "Abai Sungai",
-    "Akei",
-    "Angkamuthi",
-    "Aruamu",
-    "Abanyom",
-    "Akeu",
-    "Angloromani",
-    "Aruek",
-    "Abau",
-    "Akha",
-    "Angolar",
-    "Aruop",
-    "Abaza",
-    "Akhvakh",
-    "Angor",
-    "Arutani",
-    "Ab\u00e9",
-    "Akolet",
-    "Angoram",
-    "As",
-    "Abenaki, Eastern",
-    "Akoose",
-    "Anguthimri",
-    "Asaro\u2019o",
-    "Abenaki, Western",
-    "Akoye",
-    "||Ani",
-    "Asas",
-    "Abidji",
-    "Akpa",
-    "Anii",
-    "Ash\u00e1ninka",
-    "Abinomn",
-    "Akpes",
-    "Animere",
-    "Ashe",
-    "Abkhaz",
-    "Akukem",
-    "Anindilyakwa",
-    "Ash\u00e9ninka, Pajonal",
-    "Abom",
-    "Akuku",
-    "Anjam",
-    "Ash\u00e9ninka, Peren\u00e9",
-    "Abon",
-    "Akum",
-    "Ankave",
-    "Ash\u00e9ninka, Pichis",
-    "Abron",
-    "Akuntsu",
-    "Anmatyerre",
-    "Ash\u00e9ninka, South Ucayali",
-    "Abu",
-    "Akurio",
-    "Anong",
-    "Ash\u00e9ninka, Ucayali-Yur\u00faa",
-    "Abua",
-    "Akwa",
-    "Anor",
-    "Ashkun",
-    "Abui",
-    "Al-Sayyid Bedouin Sign Language",
-    "Anserma",
-    "Ashtiani",
-    "Abun",
-    "Alaba-K\u2019abeena",
-    "Ansus",
-    "Asilulu",
-    "Abure",
-    "Alabama",
-    "Antakarinya",
-    "Askopan",
-    "Abureni",
-    "Alago",
-    "Antigua and Barbuda Creole English",
-    "Asmat, Casuarina Coast",
-    "Aceh",
-    "Alagwa",
-    "Anuak",
-    "Asmat, Central",
-    "Achagua",
-    "Alak",
-    "Anufo",
-    "Asmat, North",
-    "Achang",
-    "Alamblak",
-    "Anuki",
-    "Asmat, Yaosakor",
-    "Ache",
-    "Alangan",
-    "Anus",
-    "Asoa",
-    "Ach\u00e9",
-    "Alawa",
-    "Anuta",
-    "Assamese",
-    "Acheron",
-    "Albanian",
-    "Anyin",
-    "Assangori",
-    "Achi",
-    "Albanian Sign Language",
-    "Anyin Morofo",
-    "Assiniboine",
-    "Acholi",
-    "Albanian, Arb\u00ebresh\u00eb",
-    "Aoheng",
-    "Assyrian Neo-Aramaic",
-    "Achterhoeks",
-    "Albanian, Arvanitika",
-    "Aore",
-    "Asturian",
-    "Achuar-Shiwiar",
-    "Albanian, Gheg",
-    "A\u2019ou",
-    "Asu",
-    "Achumawi",
-    "Albanian, Tosk",
-    "Ap Ma",
-    "Asu",
-    "Acipa, Eastern",
-    "Ale",
-    "Apache, Jicarilla",
-    "Asumboa",
-    "Acro\u00e1",
-    "Alege",
-    "Apache, Kiowa",
-    "Asuri",
-    "Adabe",
-    "Alekano",
-    "Apache, Lipan",
-    "Asurini of Xing\u00fa",
-    "Adamorobe Sign Language",
-    "Aleut",
-    "Apache, Mescalero-Chiricahua",
-    "Asurini, Tocantins",
-    "Adang",
-    "Aleut, Mednyj",
-    "Apache, Western",
-    "Ata",
-    "Adangbe",
-    "Algerian Sign Language",
-    "Apala\u00ed",
-    "Atampaya",
-    "Adara",
-    "Algonquin",
-    "Apali",
-    "Atayal",
-    "Adasen",
-    "Ali",
-    "Apatani",
-    "Athpariya",
-    "Adele",
-    "Alladian",
-    "Apiak\u00e1",
-    "Ati",
-    "Adhola",
-    "Allar",
-    "Apinay\u00e9",
-    "Atikamekw",
-    "Adi",
-    "Alngith",
-    "Apma",
-    "Atohwaim",
-    "Adi, Galo",
-    "Alor",
-    "Apurin\u00e3",
-    "Atong",
-    "Adioukrou",
-    "Alta, Northern",
-    "Aputai",
-    "Atong",
-    "Adithinngithigh",
-    "Alta, Southern",
-    "Arabana",
-    "Arabic, Maghrebi",
-    "Arabic, Egyptian",
-    "Arabic, Levantine",
-    "Arabic, Iraqi",
-    "Arabic, Gulf",
-    "Arabic, Yemeni",
-    "Arabic, Hejazi",
-    "Arabic, other",
-    "Atorada",
-    "Adnyamathanha",
-    "Altai, Northern",
-    "Arabela",
-    "Atsam",
-    "Adonara",
-    "Altai, Southern",
-    "Atsugewi",
-    "Aduge",
-    "Alugu",
-    "Atta, Faire",
-    "Adyghe",
-    "Alumu-Tesu",
-    "Atta, Pamplona",
-    "Adzera",
-    "Alune",
-    "Atta, Pudtol",
-    "Aeka",
-    "Aluo",
-    "Atti\u00e9",
-    "Aekyom",
-    "Alur",
-    "Au",
-    "Aer",
-    "Alutor",
-    "\u2019Auhelawa",
-    "Afade",
-    "Alviri-Vidari",
-    "Aukan",
-    "Afar",
-    "Alyawarr",
-    "Aulua",
-    "Afghan Sign Language",
-    "Ama",
-    "Aur\u00e1",
-    "Afitti",
-    "Ama",
-    "Aushi",
-    "Afrikaans",
-    "Amahai",
-    "Aushiri",
-    "Afro-Seminole Creole",
-    "Amahuaca",
-    "Auslan",
-    "Agarabi",
-    "Amaimon",
-    "Austral",
-    "Agariya",
-    "Amal",
-    "Australian Aborigines Sign Language",
-    "Agatu",
-    "Amami-Oshima, Northern",
-    "Austrian Sign Language",
-    "Agavotaguerra",
-    "Amami-Oshima, Southern",
-    "Auwe",
-    "Aghem",
-    "Amanab",
-    "Auye",
-    "Aghu",
-    "Amanay\u00e9",
-    "Av\u00e1-Canoeiro",
-    "Aghu-Tharnggala",
-    "Amara",
-    "Avar",
-    "Aghul",
-    "Amarakaeri",
-    "Avatime",
-    "Agi",
-    "Amarasi",
-    "Avau",
-    "Agob",
-    "Amba",
-    "Avava",
-    "Agoi",
-    "Amba",
-    "Avestan",
-    "Agta, Alabat Island",
-    "Ambae, East",
-    "Avikam",
-    "Agta, Casiguran Dumagat",
-    "Ambae, West",
-    "Avokaya",
-    "Agta, Central Cagayan",
-    "Ambai",
-    "Awa",
-    "Agta, Dicamay",
-    "Ambakich",
-    "Awa",
-    "Agta, Dupaninan",
-    "Ambel",
-    "Awa-Cuaiquer",
-    "Agta, Isarog",
-    "Ambelau",
-    "Awabakal",
-    "Agta, Mt. Iraya",
-    "Ambele",
-    "Awad Bing",
-    "Agta, Mt. Iriga",
-    "Amblong",
-    "Awadhi",
-    "Agta, Pahanan",
-    "Ambo",
-    "Awaj\u00fan",
-    "Agta, Umiray Dumaget",
-    "Ambrak",
-    "Awak",
-    "Agta, Villa Viciosa",
-    "Ambrym, North",
-    "Awakateko",
-    "Aguano",
-    "Ambrym, Southeast",
-    "Awar",
-    "Aguna",
-    "Ambul",
-    "Aragonese",
-    "Awara",
-    "Agutaynen",
-    "Ambulas",
-    "Araki",
-    "Awbono",
-    "Agwagwune",
-    "Amdang",
-    "Arakwal",
-    "Aweer",
-    "\u00c0h\u00e0n",
-    "Amele",
-    "Aralle-Tabulahan",
-    "Awera",
-    "Ahanta",
-    "American Sign Language",
-    "Arammba",
-    "Awet\u00ed",
-    "Aheu",
-    "Amharic",
-    "Aranadan",
-    "Awing",
-    "Ahirani",
-    "Ami",
-    "Aranda, Lower Southern",
-    "Awishira",
-    "Ahom",
-    "Amio-Gelimi",
-    "Arandai",
-    "Awiyaana",
-    "Ahtena",
-    "Amis",
-    "Araona",
-    "Awjilah",
-    "Ahwai",
-    "Amis, Nataoran",
-    "Arapaho",
-    "Awngi",
-    "Ai-Cham",
-    "Amo",
-    "Arapaso",
-    "Awngthim",
-    "Aighon",
-    "Amol",
-    "Arapesh, Abu\u2019",
-    "Awtuw",
-    "Aikan\u00e3",
-    "Ampanang",
-    "Arapesh, Bumbita",
-    "Awu",
-    "Aiklep",
-    "Amri Karbi",
-    "Ar\u00e1ra, Mato Grosso",
-    "Awun",
-    "Aimaq",
-    "Amto",
-    "Ar\u00e1ra, Par\u00e1",
-    "Awutu",
-    "Aimele",
-    "Amundava",
-    "Ararandew\u00e1ra",
-    "Awyi",
-    "Aimol",
-    "Amurdak",
-    "Arawak",
-    "Awyu, Asue",
-    "Ainbai",
-    "Amuzgo, Guerrero",
-    "Arawet\u00e9",
-    "Awyu, Central",
-    "Ainu",
-    "Amuzgo, Ipalapa",
-    "Arawum",
-    "Awyu, Edera",
-    "Ainu",
-    "Amuzgo, San Pedro Amuzgos",
-    "Arbore",
-    "Awyu, Jair",
-    "Aiome",
-    "Anaang",
-    "Archi",
-    "Awyu, North",
-    "Airoran",
-    "Anakalangu",
-    "Are",
-    "Awyu, South",
-    "Aisi",
-    "Anal",
-    "\u2019Are\u2019are",
-    "Axamb",
-    "Aiton",
-    "Anam",
-    "Areba",
-    "Axi",
-    "\u00c4iwoo",
-    "Anamb\u00e9",
-    "Arem",
-    "Ayabadhu",
-    "Aizi, Aproumu",
-    "Anamgura",
-    "Argentine Sign Language",
-    "Ayere",
-    "Aizi, Mobumrin",
-    "Anasi",
-    "Argobba",
-    "Ayerrerenge",
-    "Aizi, Tiagbamrin",
-    "\u00c1nc\u00e1",
-    "Arguni",
-    "Ayi",
-    "Aja",
-    "Andaandi",
-    "Arh\u00e2",
-    "Ayizi",
-    "Aja",
-    "Andai",
-    "Arh\u00f6",
-    "Aymara",
-    "Ajawa",
-    "Andajin",
-    "Arhuaco",
-    "Aymara, Central",
-    "Aji\u00eb",
-    "Andaman Creole Hindi",
-    "Ari",
-    "Aymara, Southern",
-    "Ajiya",
-    "Andaqui",
-    "Aribwatsa",
-    "Ayoreo",
-    "Ajumbu",
-    "Andarum",
-    "Aribwaung",
-    "Ayta, Abellen",
-    "Ajy\u00edninka Apurucayali",
-    "Andegerebinha",
-    "Arigidi",
-    "Ayta, Ambala",
-    "Ak",
-    "Andh",
-    "Arikap\u00fa",
-    "Ayta, Mag-antsi",
-    "Aka",
-    "Andi",
-    "Arikara",
-    "Ayta, Mag-Indi",
-    "Aka-Bea",
-    "Andio",
-    "Arikem",
-    "Ayta, Magbukun",
-    "Aka-Bo",
-    "Andoa",
-    "Aringa",
-    "Ayta, Sorsogon",
-    "Aka-Cari",
-    "Andoque",
-    "Arma",
-    "Ayta, Tayabas",
-    "Aka-Jeru",
-    "Andra-Hus",
-    "Armenian",
-    "Ayu",
-    "Aka-Kede",
-    "Aneityum",
-    "Armenian Sign Language",
-    "Azerbaijani",
-    "Aka-Kol",
-    "Anem",
-    "Aromanian",
-    "Azerbaijani, North",
-    "Aka-Kora",
-    "Aneme Wake",
-    "Arop-Lokep",
-    "Azerbaijani, South",
-    "Akan",
-    "Anfillo",
-    "Arop-Sissano",
-    "Azha",
-    "Akar-Bale",
-    "Angaataha",
-    "Arosi",
-    "Azhe",
-    "",
-    "Baan",
-    "Baram",
-    "Bhojpuri",
-    "Bonkiman",
-    "Baangi",
-    "Barama",
-    "Bhujel",
-    "Bontok",
-    "Baatonum",
-    "Barambu",
-    "Bhunjia",
-    "Bontok, Central",
-    "Baba",
-    "Baramu",
-    "Biafada",
-    "Bontok, Eastern",
-    "Babango",
-    "Barapasi",
-    "Biage",
-    "Bontok, Northern",
-    "Babanki",
-    "Baras",
-    "Biak",
-    "Bontok, Southern",
-    "Babar, North",
-    "Barasana-Eduria",
-    "Biali",
-    "Bontok, Southwestern",
-    "Babar, Southeast",
-    "Barbacoas",
-    "Biangai",
-    "Boon",
-    "Babatana",
-    "Barbaram",
-    "Biao",
-    "Boor",
-    "Babine",
-    "Barbare\u00f1o",
-    "Biao Mon",
-    "Bora",
-    "Babuza",
-    "Bardi",
-    "Biao-Jiao Mien",
-    "Borna",
-    "Bacama",
-    "Bar\u00e9",
-    "Bibbulman",
-    "Boro",
-    "Bada",
-    "Barein",
-    "Bidayuh, Bau",
-    "Borong",
-    "Badaga",
-    "Bareli, Palya",
-    "Bidayuh, Biatah",
-    "Bor\u00f4ro",
-    "Bade",
-    "Bareli, Pauri",
-    "Bidayuh, Bukar-Sadong",
-    "Boruca",
-    "Badeshi",
-    "Bareli, Rathwi",
-    "Bidayuh, Tringgus-Sembaan",
-    "Boselewa",
-    "Badimaya",
-    "Bargam",
-    "Bidiyo",
-    "Bosmun",
-    "Badjiri",
-    "Bar\u00ed",
-    "Bidyara",
-    "Bosnian",
-    "Badui",
-    "Bari",
-    "Bidyogo",
-    "Bote",
-    "Badyara",
-    "Bariai",
-    "Biem",
-    "Botlikh",
-    "Baeggu",
-    "Bariji",
-    "Bierebo",
-    "Bouyei",
-    "Baelelea",
-    "Barikanchi",
-    "Bieria",
-    "Bozaba",
-    "Baetora",
-    "Barikewa",
-    "Biete",
-    "Bozo, Jenaama",
-    "Bafanji",
-    "Barngarla",
-    "Biga",
-    "Bozo, Kelengaxo",
-    "Bafaw-Balong",
-    "Barok",
-    "Bigambal",
-    "Bozo, Tiemac\u00e8w\u00e8",
-    "Bafia",
-    "Barombi",
-    "Bih",
-    "Bozo, Tieyaxo",
-    "Bafut",
-    "Barrow Point",
-    "Bijori",
-    "Bragat",
-    "Baga Kaloum",
-    "Baruga",
-    "Bikaru",
-    "Brahui",
-    "Baga Koga",
-    "Barwe",
-    "Bikol",
-    "Braj Bhasha",
-    "Baga Manduri",
-    "Barzani Jewish Neo-Aramaic",
-    "Bikol, Buhi\u2019non",
-    "Brazilian Sign Language",
-    "Baga Pokur",
-    "Basa",
-    "Bikol, Central",
-    "Brem",
-    "Baga Sitemu",
-    "Basa-Gumna",
-    "Bikol, Libon",
-    "Breri",
-    "Baga Soban\u00e9",
-    "Basa-Gurmana",
-    "Bikol, Miraya",
-    "Breton",
-    "Bagheli",
-    "Basaa",
-    "Bikol, Northern Catanduanes",
-    "Bribri",
-    "Bagirmi",
-    "Basap",
-    "Bikol, Rinconada",
-    "British Sign Language",
-    "Bago-Kusuntu",
-    "Basay",
-    "Bikol, Southern Catanduanes",
-    "Brokkat",
-    "Bagri",
-    "Bashkardi",
-    "Bikol, West Albay",
-    "Brokpake",
-    "Bagupi",
-    "Bashkort",
-    "Bikya",
-    "Brokskat",
-    "Bagusa",
-    "Basketo",
-    "Bila",
-    "Broome Pearling Lugger Pidgin",
-    "Bagvalal",
-    "Basque",
-    "Bilakura",
-    "Bru, Eastern",
-    "Baham",
-    "Bassa",
-    "Bilaspuri",
-    "Bru, Western",
-    "Bahamas Creole English",
-    "Bassa-Kontagora",
-    "Bilba",
-    "Brunei",
-    "Bahau",
-    "Bassossi",
-    "Bilbil",
-    "Bu",
-    "Bahinemo",
-    "Bata",
-    "Bilen",
-    "Bua",
-    "Bahing",
-    "Batak",
-    "Bille",
-    "Buamu",
-    "Bahnar",
-    "Batak Alas-Kluet",
-    "Bilua",
-    "Buang, Mangga",
-    "Bahonsuai",
-    "Batak Angkola",
-    "Bima",
-    "Buang, Mapos",
-    "Bai",
-    "Batak Dairi",
-    "Bimin",
-    "Bube",
-    "Bai, Central",
-    "Batak Karo",
-    "Bimoba",
-    "Bubi",
-    "Bai, Lama",
-    "Batak Mandailing",
-    "Bina",
-    "Bubia",
-    "Bai, Panyi",
-    "Batak Simalungun",
-    "Bina",
-    "Budibud",
-    "Bai, Southern",
-    "Batak Toba",
-    "Binahari",
-    "Budong-Budong",
-    "Baibai",
-    "Batanga",
-    "Binandere",
-    "Budu",
-    "Baikeno",
-    "Batek",
-    "Bindal",
-    "Budukh",
-    "Baima",
-    "Bateri",
-    "Bine",
-    "Buduma",
-    "Baimak",
-    "Bathari",
-    "Binji",
-    "Budza",
-    "Bainouk-Gunyaamolo",
-    "Bati",
-    "Bintauna",
-    "Bugan",
-    "Bainouk-Gunyu\u00f1o",
-    "Bati",
-    "Bintulu",
-    "Bugawac",
-    "Bainouk-Samik",
-    "Bats",
-    "Binukid",
-    "Bughotu",
-    "Baiso",
-    "Batu",
-    "Binukidnon, Northern",
-    "Bugis",
-    "Bajan",
-    "Batui",
-    "Binukidnon, Southern",
-    "Buglere",
-    "Bajau, Indonesian",
-    "Batuley",
-    "Binumarien",
-    "Bugun",
-    "Bajau, West Coast",
-    "Batyala",
-    "Bipi",
-    "Buhid",
-    "Bajelani",
-    "Bau",
-    "Birao",
-    "Buhutu",
-    "Baka",
-    "Bauchi",
-    "Birgit",
-    "Bukat",
-    "Baka",
-    "Baure",
-    "Birhor",
-    "Bukharic",
-    "Bakair\u00ed",
-    "Bauria",
-    "Biri",
-    "Bukitan",
-    "Bakaka",
-    "Bauwaki",
-    "Birifor, Malba",
-    "Bukiyip",
-    "Bakati\u2019",
-    "Bauzi",
-    "Birifor, Southern",
-    "Buksa",
-    "Bakati\u2019, Rara",
-    "Bavarian",
-    "Biritai",
-    "Bukwen",
-    "Bakati\u2019, Sara",
-    "Bayali",
-    "Birked",
-    "Bulgarian",
-    "Bakhti\u00e2ri",
-    "Baybayanon",
-    "Birri",
-    "Bulgarian Sign Language",
-    "Baki",
-    "Baygo",
-    "Birrpayi",
-    "Bulgebi",
-    "Bakoko",
-    "Bayono",
-    "Birwa",
-    "Buli",
-    "Bakole",
-    "Bayot",
-    "Bisa",
-    "Buli",
-    "Bakpinka",
-    "Bayungu",
-    "Bisaya, Brunei",
-    "Bullom So",
-    "Bakumpai",
-    "Bazigar",
-    "Bisaya, Sabah",
-    "Bulu",
-    "Bakw\u00e9",
-    "Beami",
-    "Biseni",
-    "Bulu",
-    "Balaesang",
-    "Beaver",
-    "Bishnupriya",
-    "Bulungan",
-    "Balangao",
-    "Beba",
-    "Bishuo",
-    "Bum",
-    "Balanta-Ganja",
-    "Bebele",
-    "Bisis",
-    "Bumaji",
-    "Balanta-Kentohe",
-    "Bebeli",
-    "Bislama",
-    "Bumang",
-    "Balantak",
-    "Bebil",
-    "Bisorio",
-    "Bumthangkha",
-    "Balau",
-    "Bedawiyet",
-    "Bisu",
-    "Bun",
-    "Baldemu",
-    "Bedjond",
-    "Bit",
-    "Buna",
-    "Bali",
-    "Bedoanas",
-    "Bitare",
-    "Bunaba",
-    "Bali",
-    "Beeke",
-    "Bitur",
-    "Bunak",
-    "Bali",
-    "Beele",
-    "Biwat",
-    "Bunama",
-    "Balkan Gagauz Turkish",
-    "Beembe",
-    "Biyo",
-    "Bundeli",
-    "Balo",
-    "Beezen",
-    "Biyom",
-    "Bung",
-    "Balochi, Eastern",
-    "Befang",
-    "Blaan, Koronadal",
-    "Bungain",
-    "Balochi, Southern",
-    "Behoa",
-    "Blaan, Sarangani",
-    "Bunganditj",
-    "Balochi, Western",
-    "Bekwarra",
-    "Blablanga",
-    "Bungku",
-    "Baloi",
-    "Bekwel",
-    "Blackfoot",
-    "Bungu",
-    "Balti",
-    "Belait",
-    "Blafe",
-    "Bunu, Bu-Nao",
-    "Baluan-Pam",
-    "Belanda Bor",
-    "Blagar",
-    "Bunu, Jiongnai",
-    "Baluchi",
-    "Belanda Viri",
-    "Blang",
-    "Bunu, Wunai",
-    "Bamako Sign Language",
-    "Belarusian",
-    "Bo",
-    "Bunu, Younuo",
-    "Bamali",
-    "Belhariya",
-    "Bo",
-    "Bunun",
-    "Bamanankan",
-    "Beli",
-    "Bo-Rukul",
-    "Buol",
-    "Bambalang",
-    "Beli",
-    "Bo-Ung",
-    "Bura-Pabir",
-    "Bambam",
-    "Belize Kriol English",
-    "Boano",
-    "Burak",
-    "Bambili-Bambui",
-    "Bella Coola",
-    "Boano",
-    "Buraka",
-    "Bamenyam",
-    "Bellari",
-    "Bobo Madar\u00e9, Southern",
-    "Burarra",
-    "Bamu",
-    "Bemba",
-    "Bobongko",
-    "Burate",
-    "Bamukumbit",
-    "Bembe",
-    "Bobot",
-    "Burduna",
-    "Bamun",
-    "Bena",
-    "Bodo",
-    "Bure",
-    "Bamunka",
-    "Bena",
-    "Bodo Parja",
-    "Buriat",
-    "Bamwe",
-    "Benabena",
-    "Bofi",
-    "Buriat, China",
-    "Ban Khor Sign Language",
-    "Bench",
-    "Boga",
-    "Buriat, Mongolia",
-    "Bana",
-    "Bende",
-    "Bogaya",
-    "Buriat, Russia",
-    "Banam Bay",
-    "Bendi",
-    "Boghom",
-    "Burji",
-    "Banaro",
-    "Beneraf",
-    "Bogkalot",
-    "Burmese",
-    "Banda",
-    "Beng",
-    "Boguru",
-    "Burmeso",
-    "Banda, Mid-Southern",
-    "Benga",
-    "Bohtan Neo-Aramaic",
-    "Buru",
-    "Banda, South Central",
-    "Bengali",
-    "Boikin",
-    "Buru",
-    "Banda, Togbo-Vara",
-    "Benggoi",
-    "Bokha",
-    "Burui",
-    "Banda, West Central",
-    "Bentong",
-    "Boko",
-    "Burumakok",
-    "Banda-Bambari",
-    "Benyadu\u2019",
-    "Boko",
-    "Burun",
-    "Banda-Banda",
-    "Bepour",
-    "Bokobaru",
-    "Burunge",
-    "Banda-Mbr\u00e8s",
-    "Bera",
-    "Bokyi",
-    "Burushaski",
-    "Banda-Nd\u00e9l\u00e9",
-    "Berakou",
-    "Bola",
-    "Burusu",
-    "Banda-Yangere",
-    "Berawan, Central",
-    "Bolango",
-    "Buruwai",
-    "Bandi",
-    "Berawan, East",
-    "Bole",
-    "Busa",
-    "Bandial",
-    "Berawan, West",
-    "Bolgo",
-    "Busam",
-    "Bandjalang",
-    "Berbice Creole Dutch",
-    "Bolia",
-    "Busami",
-    "Bangala",
-    "Berik",
-    "Bolinao",
-    "Bushi",
-    "Bangandu",
-    "Berinomo",
-    "Bolivian Sign Language",
-    "Bushoong",
-    "Bangba",
-    "Berom",
-    "Boloki",
-    "Buso",
-    "Banggai",
-    "Berta",
-    "Bolon",
-    "Busoa",
-    "Bangi",
-    "Berti",
-    "Bolondo",
-    "Bussa",
-    "Bangime",
-    "Besme",
-    "Bolyu",
-    "Busuu",
-    "Bangka",
-    "Betaf",
-    "Bom-Kim",
-    "Butmas-Tur",
-    "Bangolan",
-    "Betawi",
-    "Boma",
-    "Butuanon",
-    "Bangubangu",
-    "Bete",
-    "Bomboli",
-    "Buwal",
-    "Bangwinji",
-    "B\u00e9t\u00e9, Daloa",
-    "Bomboma",
-    "Buyang, Baha",
-    "Baniva",
-    "B\u00e9t\u00e9, Gagnoa",
-    "Bomitaba",
-    "Buyang, E\u2019ma",
-    "Baniwa",
-    "B\u00e9t\u00e9, Guiberoua",
-    "Bomu",
-    "Buyang, Langnian",
-    "Banjar",
-    "Bete-Bendi",
-    "Bomwali",
-    "Buyu",
-    "Bankagooma",
-    "Beti",
-    "Bon Gula",
-    "Bwa",
-    "Bankal",
-    "Bezhta",
-    "Bonan",
-    "Bwaidoka",
-    "Bankon",
-    "Bhadrawahi",
-    "Bondei",
-    "Bwamu, Cwi",
-    "Bannoni",
-    "Bhalay",
-    "Bondo",
-    "Bwamu, L\u00e1\u00e1 L\u00e1\u00e1",
-    "Bantawa",
-    "Bharia",
-    "Bonerate",
-    "Bwanabwana",
-    "Bantayanon",
-    "Bhatri",
-    "Bonggi",
-    "Bwatoo",
-    "Bantik",
-    "Bhattiyali",
-    "Bonggo",
-    "Bwela",
-    "Bantoanon",
-    "Bhaya",
-    "Bongili",
-    "Bwile",
-    "Baoul\u00e9",
-    "Bhele",
-    "Bongo",
-    "Bwisi",
-    "Barababaraba",
-    "Bhilali",
-    "Bongu",
-    "Byangsi",
-    "Barai",
-    "Bhili",
-    "Bonjo",
-    "Byep",
-    "Barakai",
-    "Bhogoto",
-    "Bonkeng",
-    "",
-    "Caac",
-    "Chara",
-    "Chin, Uppu",
-    "Chuukese",
-    "Cab\u00e9car",
-    "Chatino, Eastern Highland",
-    "Chin, Zotung",
-    "Chuvash",
-    "Cabiyar\u00ed",
-    "Chatino, Nopala",
-    "Chin, Zyphe",
-    "Chuwabu",
-    "Cacaopera",
-    "Chatino, Tataltepec",
-    "Chinali",
-    "Cia-Cia",
-    "Cacua",
-    "Chatino, Western Highland",
-    "Chinantec, Chiltepec",
-    "Cicipu",
-    "Caddo",
-    "Chatino, Zacatepec",
-    "Chinantec, Comaltepec",
-    "Cimbrian",
-    "Cafundo Creole",
-    "Chatino, Zenzontepec",
-    "Chinantec, Lalana",
-    "Cineni",
-    "Cahuarano",
-    "Chaudangsi",
-    "Chinantec, Lealao",
-    "Cinta Larga",
-    "Cahuilla",
-    "Chaura",
-    "Chinantec, Ojitl\u00e1n",
-    "Cishingini",
-    "Cahungwarya",
-    "Chavacano",
-    "Chinantec, Ozumac\u00edn",
-    "Citak",
-    "Caka",
-    "Chechen",
-    "Chinantec, Palantla",
-    "Citak, Tamnim",
-    "Cakfem-Mushere",
-    "Chehalis, Lower",
-    "Chinantec, Quiotepec",
-    "Ciwogai",
-    "Callawalla",
-    "Chehalis, Upper",
-    "Chinantec, Sochiapam",
-    "Clallam",
-    "Cal\u00f3",
-    "Cheke Holo",
-    "Chinantec, Tepetotutla",
-    "C\u2019Lela",
-    "Caluyanun",
-    "Chenapian",
-    "Chinantec, Tepinapa",
-    "Cochimi",
-    "Campalagian",
-    "Chenchu",
-    "Chinantec, Tlacoatzintepec",
-    "Cocopa",
-    "Cams\u00e1",
-    "Chenoua",
-    "Chinantec, Usila",
-    "Coeur d\u2019Alene",
-    "Camtho",
-    "Chepang",
-    "Chinantec, Valle Nacional",
-    "Cof\u00e1n",
-    "Canela",
-    "Chepya",
-    "Cokwe",
-    "Canichana",
-    "Cheq Wong",
-    "Col",
-    "Cao Lan",
-    "Cherepon",
-    "Colombian Sign Language",
-    "Cao Miao",
-    "Cherokee",
-    "Colorado",
-    "Capanahua",
-    "Chesu",
-    "Columbia-Wenatchi",
-    "Capiznon",
-    "Chetco",
-    "Comanche",
-    "Cappadocian Greek",
-    "Chetti, Wayanad",
-    "Como Karim",
-    "Caquinte",
-    "Cheyenne",
-    "Comorian, Maore",
-    "Cara",
-    "Chhattisgarhi",
-    "Comorian, Mwali",
-    "Carabayo",
-    "Chhintang",
-    "Comorian, Ndzwani",
-    "Caramanta",
-    "Chhulung",
-    "Comorian, Ngazidja",
-    "Carapana",
-    "Chiangmai Sign Language",
-    "Comox",
-    "Carib",
-    "Chiapanec",
-    "Con",
-    "Carijona",
-    "Chichewa",
-    "Cook Islands Maori",
-    "Carolinian",
-    "Chichimeco-Jonaz",
-    "C\u00f4\u00f4ng",
-    "Carrier",
-    "Chichonyi-Chidzihana-Chikauma",
-    "Coos",
-    "Carrier, Southern",
-    "Chickasaw",
-    "Chini",
-    "Coptic",
-    "Catalan",
-    "Chicomuceltec",
-    "Chinook",
-    "Coquille",
-    "Catalan Sign Language",
-    "Chidigo",
-    "Chinook Wawa",
-    "Cora, El Nayar",
-    "Catawba",
-    "Chiduruma",
-    "Chipaya",
-    "Cora, Santa Teresa",
-    "Cauca",
-    "Chiga",
-    "Chippewa",
-    "Cori",
-    "Cavine\u00f1a",
-    "Chilcotin",
-    "Chiquitano",
-    "Cornish",
-    "Cayubaba",
-    "Chilean Sign Language",
-    "Chiru",
-    "Corsican",
-    "Cayuga",
-    "Chilisso",
-    "Chitimacha",
-    "Costa Rican Sign Language",
-    "Cebuano",
-    "Chimariko",
-    "Chittagonian",
-    "Cowlitz",
-    "Cemuh\u00ee",
-    "Chimila",
-    "Chocangacakha",
-    "Cree",
-    "Cen",
-    "Chin, Anu-Hkongso",
-    "Chocholtec",
-    "Cree, Moose",
-    "Cent\u00fa\u00fam",
-    "Chin, Asho",
-    "Choctaw",
-    "Cree, Northern East",
-    "Cerma",
-    "Chin, Bawm",
-    "Chodri",
-    "Cree, Plains",
-    "Chachi",
-    "Chin, Bualkhaw",
-    "Chol",
-    "Cree, Southern East",
-    "Ch\u00e1cobo",
-    "Chin, Daai",
-    "Chol\u00f3n",
-    "Cree, Swampy",
-    "Chadian Sign Language",
-    "Chin, Eastern Khumi",
-    "Chong",
-    "Cree, Woods",
-    "Chadong",
-    "Chin, Falam",
-    "Choni",
-    "Crimean Tatar",
-    "Chagatai",
-    "Chin, Hakha",
-    "Chontal, Highland Oaxaca",
-    "Crioulo, Upper Guinea",
-    "Chaima",
-    "Chin, Kaang",
-    "Chontal, Lowland Oaxaca",
-    "Croatia Sign Language",
-    "Chak",
-    "Chin, Khumi",
-    "Chontal, Tabasco",
-    "Croatian",
-    "Chakali",
-    "Chin, Laitu",
-    "Chopi",
-    "Crow",
-    "Chakma",
-    "Chin, Lautu",
-    "Chorote, Iyojwa\u2019ja",
-    "Cruze\u00f1o",
-    "Chala",
-    "Chin, Mara",
-    "Chinese, Mandarin",
-    "Chinese, Yue",
-    "Chinese, Wu",
-    "Chinese, Min",
-    "Chinese, Xiang",
-    "Chinese, Gan",
-    "Chinese, Hakka",
-    "Chinese, Other",
-    "Chorote, Iyo\u2019wujwa",
-    "Cua",
-    "Chaldean Neo-Aramaic",
-    "Chin, Matu",
-    "Ch\u2019orti\u2019",
-    "Cuba Sign Language",
-    "Chalikha",
-    "Chin, M\u00fc\u00fcn",
-    "Chrau",
-    "Cubeo",
-    "Cham, Eastern",
-    "Chin, Ngawn",
-    "Chru",
-    "Cuiba",
-    "Cham, Western",
-    "Chin, Paite",
-    "Chuave",
-    "Cuicatec, Tepeuxila",
-    "Chamacoco",
-    "Chin, Rawngtu",
-    "Chug",
-    "Cuicatec, Teutila",
-    "Chamalal",
-    "Chin, Rungtu",
-    "Chuj",
-    "Cumanagoto",
-    "Chamari",
-    "Chin, Senthang",
-    "Chukchi",
-    "Cun",
-    "Chambeali",
-    "Chin, Siyin",
-    "Chukwa",
-    "Cupe\u00f1o",
-    "Chambri",
-    "Chin, Songlai",
-    "Chulym",
-    "Curripaco",
-    "Chamicuro",
-    "Chin, Sumtu",
-    "Chumburung",
-    "Cutchi-Swahili",
-    "Chamling",
-    "Chin, Tawr",
-    "Chung",
-    "Cuvok",
-    "Chamorro",
-    "Chin, Tedim",
-    "Chungmboko",
-    "Cuyonon",
-    "Changriwa",
-    "Chin, Thado",
-    "Churahi",
-    "Czech",
-    "Changthang",
-    "Chin, Thaiphum",
-    "Chut",
-    "Czech Sign Language",
-    "Chantyal",
-    "",
-    "Daakaka",
-    "Dayi",
-    "Ding",
-    "Dong",
-    "Daantanai\u2019",
-    "Dazaga",
-    "Dinka",
-    "Dong, Northern",
-    "Daasanach",
-    "Deccan",
-    "Dinka, Northeastern",
-    "Dong, Southern",
-    "Daats\u02bc\u00edin",
-    "Dedua",
-    "Dinka, Northwestern",
-    "Dongo",
-    "Daba",
-    "Defaka",
-    "Dinka, South Central",
-    "Dongotono",
-    "Dabarre",
-    "Deg",
-    "Dinka, Southeastern",
-    "Dongxiang",
-    "Dabe",
-    "Degaru",
-    "Dinka, Southwestern",
-    "Doondo",
-    "Dadi Dadi",
-    "Degema",
-    "Dirari",
-    "Dorig",
-    "Dadibi",
-    "Degenan",
-    "Dirasha",
-    "Dori\u2019o",
-    "Dadiya",
-    "Degexit\u2019an",
-    "Diri",
-    "Doromu-Koki",
-    "Daga",
-    "Dehwari",
-    "Diriku",
-    "Dororo",
-    "Dagaare, Southern",
-    "Dek",
-    "Dirim",
-    "Dorze",
-    "Dagaari Dioula",
-    "Dela-Oenale",
-    "Disa",
-    "Doso",
-    "Dagara, Northern",
-    "Delaware",
-    "Ditammari",
-    "Dotyali",
-    "Dagba",
-    "Delaware, Pidgin",
-    "Ditidaht",
-    "Doutai",
-    "Dagbani",
-    "Delo",
-    "Diuwe",
-    "Doyayo",
-    "Dagik",
-    "Dem",
-    "Dixon Reef",
-    "Drehu",
-    "Dagoman",
-    "Dema",
-    "Dizin",
-    "Drents",
-    "Dahalik",
-    "Demisa",
-    "Djabwurrung",
-    "Drubea",
-    "Dahalo",
-    "Dendi",
-    "Djadjawurrung",
-    "Drung",
-    "Daho-Doo",
-    "Dendi",
-    "Djambarrpuyngu",
-    "Duala",
-    "Dai",
-    "Dene",
-    "Djamindjung",
-    "Duano",
-    "Dair",
-    "Dengese",
-    "Djangun",
-    "Duau",
-    "Daju, Dar Daju",
-    "Dengka",
-    "Djauan",
-    "Dubli",
-    "Daju, Dar Fur",
-    "Den\u00ed",
-    "Djawi",
-    "Dugun",
-    "Daju, Dar Sila",
-    "Deno",
-    "Djeebbana",
-    "Duguri",
-    "Dakka",
-    "Denya",
-    "Djinang",
-    "Dugwor",
-    "Dakota",
-    "Deori",
-    "Djinba",
-    "Duhwa",
-    "Dakpakha",
-    "Dera",
-    "Djingili",
-    "Duke",
-    "Dalabon",
-    "Dera",
-    "Djiwarli",
-    "Dulbu",
-    "Dama",
-    "Desano",
-    "Dobel",
-    "Duli-Gey",
-    "Damakawa",
-    "Desiya",
-    "Dobu",
-    "Duma",
-    "Damal",
-    "Dewoin",
-    "Doe",
-    "Dumagat, Remontado",
-    "Damar, East",
-    "Dezfuli",
-    "Doga",
-    "Dumi",
-    "Damar, West",
-    "Dghwede",
-    "Doghoro",
-    "Dumpas",
-    "Dambi",
-    "Dhaiso",
-    "Dogon, Ampari",
-    "Dumun",
-    "Dameli",
-    "Dhalandji",
-    "Dogon, Ana Tinga",
-    "Duna",
-    "Dampelas",
-    "Dhangu-Djangu",
-    "Dogon, Bankan Tey",
-    "Dungan",
-    "Dan",
-    "Dhanki",
-    "Dogon, Ben Tey",
-    "Dungmali",
-    "Danaru",
-    "Dhao",
-    "Dogon, Bondum Dom",
-    "Dungra Bhil",
-    "Danau",
-    "Dhargari",
-    "Dogon, Bunoge",
-    "Dungu",
-    "Dangal\u00e9at",
-    "Dharuk",
-    "Dogon, Dogul Dom",
-    "Duoluo",
-    "Dangme",
-    "Dharumbal",
-    "Dogon, Donno So",
-    "Dura",
-    "Dani, Lower Grand Valley",
-    "Dhatki",
-    "Dogon, Jamsay",
-    "Duri",
-    "Dani, Mid Grand Valley",
-    "Dhimal",
-    "Dogon, Mombo",
-    "Duriankere",
-    "Dani, Upper Grand Valley",
-    "Dhimba",
-    "Dogon, Nanga Dama",
-    "Duruwa",
-    "Dani, Western",
-    "Dhodia",
-    "Dogon, Tebul Ure",
-    "Dusner",
-    "Danish",
-    "Dholuo",
-    "Dogon, Tene Kan",
-    "Dusun Deyah",
-    "Danish Sign Language",
-    "Dhundari",
-    "Dogon, Tiranige Diga",
-    "Dusun Malang",
-    "Dano",
-    "Dhungaloo",
-    "Dogon, Tommo So",
-    "Dusun Witu",
-    "Danu",
-    "Dhurga",
-    "Dogon, Tomo Kan",
-    "Dutch",
-    "Danuwar",
-    "Dhuwal",
-    "Dogon, Toro So",
-    "Duungooma",
-    "Dao",
-    "Dhuwaya",
-    "Dogon, Toro Tegu",
-    "Duupa",
-    "Daonda",
-    "Dia",
-    "Dogon, Yanda Dom",
-    "Duvle",
-    "Darai",
-    "Dibiyaso",
-    "Dogos\u00e9",
-    "Duwai",
-    "Dargwa",
-    "Dibo",
-    "Dogoso",
-    "Duwet",
-    "Dari",
-    "Dibole",
-    "Dogri",
-    "Duya",
-    "Dari, Zoroastrian",
-    "Dida, Lakota",
-    "Dogri",
-    "Dwang",
-    "Darkinyung",
-    "Dida, Yocobou\u00e9",
-    "Dogrib",
-    "Dyaabugay",
-    "Darlong",
-    "Didinga",
-    "Doka",
-    "Dyaberdyaber",
-    "Darmiya",
-    "Dido",
-    "Doko-Uyanga",
-    "Dyan",
-    "Dass",
-    "Diebroud",
-    "Dolgan",
-    "Dyangadi",
-    "Datooga",
-    "Dieri",
-    "Dolpo",
-    "Dyirbal",
-    "Daungwurrung",
-    "Digaro-Mishmi",
-    "Dom",
-    "Dyugun",
-    "Daur",
-    "Dii",
-    "Domaaki",
-    "Dza",
-    "Davawenyo",
-    "Dikaka",
-    "Domari",
-    "Dzalakha",
-    "D\u00e2w",
-    "Dilling",
-    "Dombe",
-    "Dzando",
-    "Dawawa",
-    "Dima",
-    "Dominican Sign Language",
-    "Dzao Min",
-    "Dawera-Daweloor",
-    "Dimasa",
-    "Dompo",
-    "Dzhidi",
-    "Dawida",
-    "Dimbong",
-    "Domu",
-    "Dzodinka",
-    "Dawro",
-    "Dime",
-    "Domung",
-    "Dzongkha",
-    "Day",
-    "Dineor",
-    "Dondo",
-    "Dz\u00f9\u00f9ngoo",
-    "",
-    "E",
-    "Ekegusii",
-    "Enawen\u00e9-Naw\u00e9",
-    "Erzya",
-    "Eastern Franconian",
-    "Eki",
-    "Ende",
-    "Esan",
-    "Ebira",
-    "Ekit",
-    "Enets, Forest",
-    "Ese",
-    "Ebri\u00e9",
-    "Ekpeye",
-    "Enets, Tundra",
-    "Ese Ejja",
-    "Ebughu",
-    "El Hugeirat",
-    "Enga",
-    "Eshtehardi",
-    "Ecuadorian Sign Language",
-    "El Molo",
-    "Engdewu",
-    "Esimbi",
-    "Ede Cabe",
-    "Eleme",
-    "Engenni",
-    "Eskayan",
-    "Ede Ica",
-    "Elepi",
-    "Enggano",
-    "Esperanto",
-    "Ede Idaca",
-    "Elip",
-    "English",
-    "Esselen",
-    "Ede Ije",
-    "Elkei",
-    "Enlhet",
-    "Estonian",
-    "Ede Nago, Kura",
-    "Eloyi",
-    "Enrekang",
-    "Estonian Sign Language",
-    "Edo",
-    "Elseng",
-    "Enu",
-    "Estonian, Standard",
-    "Edolo",
-    "Elu",
-    "Enwan",
-    "Etebi",
-    "Edopi",
-    "Emae",
-    "Enwan",
-    "Ethiopian Sign Language",
-    "Efai",
-    "Emai-Iuleha-Ora",
-    "Enxet",
-    "Etkywan",
-    "Efate, North",
-    "Eman",
-    "Enya",
-    "Eton",
-    "Efate, South",
-    "Embaloh",
-    "Epena",
-    "Eton",
-    "Efe",
-    "Ember\u00e1, Northern",
-    "Epie",
-    "Etulo",
-    "Efik",
-    "Ember\u00e1-Baud\u00f3",
-    "Equatorial Guinean Pidgin",
-    "Evant",
-    "Efutop",
-    "Ember\u00e1-Cat\u00edo",
-    "Eravallan",
-    "Even",
-    "Ega",
-    "Ember\u00e1-Cham\u00ed",
-    "Erave",
-    "Evenki",
-    "Eggon",
-    "Ember\u00e1-Tad\u00f3",
-    "Ere",
-    "Eviya",
-    "Egyptian Sign Language",
-    "Emem",
-    "Eritai",
-    "Ewage-Notu",
-    "Ehueun",
-    "Emerillon",
-    "Erokwanas",
-    "\u00c9w\u00e9",
-    "Eitiep",
-    "Emilian",
-    "Erre",
-    "Ewondo",
-    "Ejagham",
-    "Emplawas",
-    "Erromintxela",
-    "Extremaduran",
-    "Ekajuk",
-    "En",
-    "Ersu",
-    "Eyak",
-    "Ekari",
-    "E\u2019\u00f1apa Woromaipu",
-    "Eruwa",
-    "Ezaa",
-    "",
-    "Fa d\u2019Ambu",
-    "Fataleka",
-    "Flemish Sign Language",
-    "Fulah",
-    "Fagani",
-    "Fataluku",
-    "Flinders Island",
-    "Fulfulde, Adamawa",
-    "Fagauvea",
-    "Fayu",
-    "Foau",
-    "Fulfulde, Bagirmi",
-    "Faiwol",
-    "Fedan",
-    "Foi",
-    "Fulfulde, Borgu",
-    "Fala",
-    "Fe\u2019fe\u2019",
-    "Foia Foia",
-    "Fulfulde, Central-Eastern Niger",
-    "Fali",
-    "Fembe",
-    "Folopa",
-    "Fulfulde, Maasina",
-    "Fali of Baissa",
-    "Feroge",
-    "Foma",
-    "Fulfulde, Nigerian",
-    "Fali, North",
-    "Fijian",
-    "Fon",
-    "Fulfulde, Western Niger",
-    "Fali, South",
-    "Fijian, Western",
-    "Fongoro",
-    "Fuliiru",
-    "Fam",
-    "Filipino",
-    "Foodo",
-    "Fum",
-    "Fanamaket",
-    "Filipino Sign Language",
-    "Forak",
-    "Fungwa",
-    "Fanbak",
-    "Finland-Swedish Sign Language",
-    "Fordata",
-    "Fur",
-    "Fang",
-    "Finnish",
-    "Fore",
-    "Furu",
-    "Fang",
-    "Finnish Sign Language",
-    "Fortsenal",
-    "Futuna, East",
-    "Fania",
-    "Finnish, Kven",
-    "French",
-    "Futuna-Aniwa",
-    "Farefare",
-    "Finnish, Tornedalen",
-    "French Belgian Sign Language",
-    "Fuyug",
-    "Faroese",
-    "Finongan",
-    "French Sign Language",
-    "Fw\u00e2i",
-    "Fars, Northwestern",
-    "Fipa",
-    "French, Cajun",
-    "Fwe",
-    "Fars, Southwestern",
-    "Firan",
-    "Frisian",
-    "Fyam",
-    "Fas",
-    "Fiwaga",
-    "Frisian, Northern",
-    "Fyer",
-    "Fasu",
-    "Flaaitaal",
-    "Friulian",
-    "",
-    "Ga",
-    "Gbaya, Southwest",
-    "Gitxsan",
-    "Guarequena",
-    "Gaa",
-    "Gbaya-Bossangoa",
-    "Giyug",
-    "Guatemalan Sign Language",
-    "Gaam",
-    "Gbaya-Bozoum",
-    "Giziga, North",
-    "Guat\u00f3",
-    "Ga\u2019anda",
-    "Gbaya-Mbodomo",
-    "Giziga, South",
-    "Guayabero",
-    "Gabi-Gabi",
-    "Gbayi",
-    "Gizrra",
-    "Gudang",
-    "Gabri",
-    "Gbe, Ayizo",
-    "Glaro-Twabo",
-    "Gudanji",
-    "Gadaba, Bodo",
-    "Gbe, Ci",
-    "Glavda",
-    "Gude",
-    "Gadaba, Mudhili",
-    "Gbe, Defi",
-    "Glio-Oubi",
-    "Gudu",
-    "Gadaba, Pottangi Ollar",
-    "Gbe, Eastern Xwla",
-    "Gnau",
-    "Guduf-Gava",
-    "Ga\u2019dang",
-    "Gbe, Gbesi",
-    "Goaria",
-    "Gu\u00e9bie",
-    "Gadang",
-    "Gbe, Kotafon",
-    "Gobasi",
-    "Gugadj",
-    "Gaddang",
-    "Gbe, Maxi",
-    "Gobu",
-    "Gugu Badhun",
-    "Gaddi",
-    "Gbe, Saxwe",
-    "Godi\u00e9",
-    "Gugu Warra",
-    "Gade",
-    "Gbe, Tofin",
-    "Godwari",
-    "Gugubera",
-    "Gadjerawang",
-    "Gbe, Waci",
-    "Goemai",
-    "Guguyimidjir",
-    "Gadsup",
-    "Gbe, Weme",
-    "Gofa",
-    "Guhu-Samane",
-    "Gagadu",
-    "Gbe, Western Xwla",
-    "Gogo",
-    "Guianese Creole French",
-    "Gagauz",
-    "Gbe, Xwela",
-    "Gogodala",
-    "Guinean Sign Language",
-    "Gahri",
-    "Gbii",
-    "Gokana",
-    "Guiqiong",
-    "Gaikundi",
-    "Gbiri-Niragu",
-    "Gola",
-    "Gujarati",
-    "Gail",
-    "Ge",
-    "Golin",
-    "Gujari",
-    "Gaina",
-    "Gebe",
-    "Golpa",
-    "Gula",
-    "Gal",
-    "Gedaged",
-    "Gondi",
-    "Gula",
-    "Galambu",
-    "Gedeo",
-    "Gondi, Adilabad",
-    "Gula Iro",
-    "Galela",
-    "Geez",
-    "Gondi, Aheri",
-    "Gula\u2019alaa",
-    "Galeya",
-    "Geji",
-    "Gondi, Northern",
-    "Gulay",
-    "Galice",
-    "Gela",
-    "Gone Dau",
-    "Gule",
-    "Galician",
-    "Gelao, Green",
-    "Gongduk",
-    "Guliguli",
-    "Galolen",
-    "Gelao, Red",
-    "Gonja",
-    "Gumalu",
-    "Gambera",
-    "Geme",
-    "Goodenough, West",
-    "Gumatj",
-    "Gamilaraay",
-    "Gen",
-    "Gooniyandi",
-    "Gumawana",
-    "Gamit",
-    "Gende",
-    "Gor",
-    "Gumuz",
-    "Gamkonora",
-    "Gengle",
-    "Gorakor",
-    "Gun",
-    "Gamo",
-    "Georgian",
-    "Gorap",
-    "Gundi",
-    "Gamo-Ningi",
-    "Gepo",
-    "Goreng",
-    "Gunditjmara",
-    "||Gana",
-    "Gera",
-    "Gorontalo",
-    "Gundungurra",
-    "Gana",
-    "German Sign Language",
-    "Gorovu",
-    "Gungabula",
-    "Ganang",
-    "German, Colonia Tovar",
-    "Gorowa",
-    "Gungu",
-    "Ganda",
-    "German, Pennsylvania",
-    "Goundo",
-    "Guntai",
-    "Gane",
-    "German, Standard",
-    "Gourmanch\u00e9ma",
-    "Gunwinggu",
-    "Ganggalida",
-    "German, Swiss",
-    "Gowlan",
-    "Gunya",
-    "Ganglau",
-    "Geruma",
-    "Gowli",
-    "Gupa-Abawa",
-    "Gangte",
-    "Geser-Gorom",
-    "Gowro",
-    "Gupapuyngu",
-    "Gangulu",
-    "Ghadam\u00e8s",
-    "Gozarkhani",
-    "Guragone",
-    "Gants",
-    "Ghale, Northern",
-    "Grangali",
-    "Guramalum",
-    "Ganza",
-    "Ghale, Southern",
-    "Great Andamanese, Mixed",
-    "Gurani",
-    "Ganzi",
-    "Ghanaian Pidgin English",
-    "Grebo",
-    "Gurdjar",
-    "Gao",
-    "Ghanaian Sign Language",
-    "Grebo, Barclayville",
-    "Gureng Gureng",
-    "Gapapaiwa",
-    "Ghandruk Sign Language",
-    "Grebo, Central",
-    "Gurgula",
-    "Garasia, Adiwasi",
-    "Ghanongga",
-    "Grebo, Gboloo",
-    "Guriaso",
-    "Garasia, Rajput",
-    "Ghari",
-    "Grebo, Northern",
-    "Gurindji Kriol",
-    "Garhwali",
-    "Ghayavi",
-    "Grebo, Southern",
-    "Gurinji",
-    "Garifuna",
-    "Ghera",
-    "Greek",
-    "Gurmana",
-    "Garig-Ilgar",
-    "Ghodoberi",
-    "Greek Sign Language",
-    "Guro",
-    "Garingbal",
-    "Ghom\u00e1l\u00e1\u2019",
-    "Greek, Ancient",
-    "Gurung",
-    "Garlali",
-    "Ghomara",
-    "Greenlandic",
-    "Guruntum-Mbaaru",
-    "Garo",
-    "Ghotuo",
-    "Grenadian Creole English",
-    "Gusilay",
-    "Garre",
-    "Ghulfan",
-    "Gresi",
-    "Guwa",
-    "Garrwa",
-    "Giangan",
-    "Groma",
-    "Guwamu",
-    "Garus",
-    "Gibanawa",
-    "Gronings",
-    "Guya",
-    "Gata\u2019",
-    "Gichuka",
-    "Gros Ventre",
-    "Guyanese Creole English",
-    "Gavak",
-    "Gidar",
-    "Gua",
-    "Guyani",
-    "Gavar",
-    "Giiwo",
-    "Guadeloupean Creole French",
-    "Gvoko",
-    "Gavi\u00e3o do Jiparan\u00e1",
-    "Gikuyu",
-    "Guahibo",
-    "Gwa",
-    "Gavi\u00e3o, Par\u00e1",
-    "Gikyode",
-    "Guaj\u00e1",
-    "Gwahatike",
-    "Gawar-Bati",
-    "Gilaki",
-    "Guajaj\u00e1ra",
-    "Gwak",
-    "Gayil",
-    "Gilima",
-    "Guambiano",
-    "Gwamhi-Wuri",
-    "Gayo",
-    "Gilyak",
-    "Guana",
-    "Gwandara",
-    "Gazi",
-    "Gimi",
-    "Guana",
-    "Gweda",
-    "Gbagyi",
-    "Gimi",
-    "Guanano",
-    "Gweno",
-    "Gban",
-    "Gimme",
-    "Guarani",
-    "Gwere",
-    "Gbanu",
-    "Gimnime",
-    "Guaran\u00ed, Ava",
-    "|Gwi",
-    "Gbanziri",
-    "Ginuman",
-    "Guaran\u00ed, Eastern Bolivian",
-    "Gwich\u2019in",
-    "Gbari",
-    "Ginyanga",
-    "Guaran\u00ed, Mby\u00e1",
-    "Gyele",
-    "Gbaya",
-    "Girawa",
-    "Guaran\u00ed, Paraguayan",
-    "Gyem",
-    "Gbaya",
-    "Githabul",
-    "Guaran\u00ed, Western Bolivian",
-    "Gyong",
-    "Gbaya, Northwest",
-    "Gitua",
-    "Guarayu",
-    "",
-    "Ha",
-    "Haryanvi",
-    "Hinduri",
-    "Hrangkhol",
-    "Habun",
-    "Harzani",
-    "Hindustani, Sarnami",
-    "Hre",
-    "Hadiyya",
-    "Hasha",
-    "Hinukh",
-    "Hruso",
-    "Hadza",
-    "Hassaniyya",
-    "Hitu",
-    "Hu",
-    "Haeke",
-    "Hatam",
-    "Hiw",
-    "\u2021Hua",
-    "Hahon",
-    "Hausa",
-    "Hixkary\u00e1na",
-    "Huachipaeri",
-    "Haida",
-    "Hausa Sign Language",
-    "Hlai",
-    "Huarij\u00edo",
-    "Haida, Northern",
-    "Havasupai-Walapai-Yavapai",
-    "Hlersu",
-    "Huastec",
-    "Haida, Southern",
-    "Haveke",
-    "Hmar",
-    "Huaulu",
-    "Haigwai",
-    "Havu",
-    "Hmong",
-    "Huave, San Dionisio del Mar",
-    "Hai||om",
-    "Hawai\u2019i Pidgin",
-    "Hmong Daw",
-    "Huave, San Francisco del Mar",
-    "Haiphong Sign Language",
-    "Hawaii Sign Language",
-    "Hmong D\u00f4",
-    "Huave, San Mateo del Mar",
-    "Haisla",
-    "Hawaiian",
-    "Hmong Don",
-    "Huave, Santa Mar\u00eda del Mar",
-    "Haitian Creole",
-    "Hawu",
-    "Hmong Njua",
-    "Huichol",
-    "Haitian Vodoun Culture Language",
-    "Haya",
-    "Hmwaveke",
-    "Huilliche",
-    "Haji",
-    "Hazaragi",
-    "Ho",
-    "Huitoto, Minica",
-    "Hajong",
-    "Hdi",
-    "Ho Chi Minh City Sign Language",
-    "Huitoto, Murui",
-    "Hak\u00f6",
-    "Hebrew",
-    "Ho-Chunk",
-    "Hukumina",
-    "Halang",
-    "Hebrew, Ancient",
-    "Hoava",
-    "Hula",
-    "Halang Doan",
-    "Hehe",
-    "Hoby\u00f3t",
-    "Hulaul\u00e1",
-    "Halbi",
-    "Heiban",
-    "Hoia Hoia",
-    "Huli",
-    "Halia",
-    "Heiltsuk",
-    "Holikachuk",
-    "Hulung",
-    "Halkomelem",
-    "Helong",
-    "Holiya",
-    "Humene",
-    "Hamap",
-    "Hema",
-    "Holma",
-    "Humla",
-    "Hamba",
-    "Hemba",
-    "Holoholo",
-    "Hun-Saare",
-    "Hamer-Banna",
-    "Herd\u00e9",
-    "Holu",
-    "Hunde",
-    "Hamtai",
-    "Herero",
-    "Homa",
-    "Hung",
-    "Han",
-    "Hermit",
-    "Honduras Sign Language",
-    "Hungana",
-    "Hanga",
-    "H\u00e9rtevin",
-    "H\u00f5ne",
-    "Hungarian",
-    "Hanga Hundi",
-    "Hewa",
-    "Hong Kong Sign Language",
-    "Hungarian Sign Language",
-    "Hangaza",
-    "Heyo",
-    "Honi",
-    "Hunjara-Kaina Ke",
-    "Hani",
-    "Hibito",
-    "Hopi",
-    "Hunsrik",
-    "Hano",
-    "Hidatsa",
-    "Horo",
-    "Hunzib",
-    "Hanoi Sign Language",
-    "Higaonon",
-    "Horom",
-    "Hupa",
-    "Hanunoo",
-    "Hijuk",
-    "Horpa",
-    "Hupd\u00eb",
-    "Harari",
-    "Hiligaynon",
-    "Hote",
-    "Hupla",
-    "Haroi",
-    "Himarim\u00e3",
-    "Hoti",
-    "Hutterisch",
-    "Haroti",
-    "Hindi",
-    "Hovongan",
-    "Hwana",
-    "Harsusi",
-    "Hindi, Fiji",
-    "Hoyahoya",
-    "Hya",
-    "Haruai",
-    "Hindko, Northern",
-    "Hozo",
-    "Hyam",
-    "Haruku",
-    "Hindko, Southern",
-    "Hpon",
-    "Hyolmo",
-    "",
-    "I-wak",
-    "Iha",
-    "Ingrian",
-    "Isnag",
-    "Iaai",
-    "Iha Based Pidgin",
-    "Ingush",
-    "Isoko",
-    "Iamalele",
-    "Ihievbe",
-    "Inku",
-    "Israeli Sign Language",
-    "Iapama",
-    "Ija-Zuba",
-    "Inoke-Yate",
-    "Istriot",
-    "Iat\u00ea",
-    "Ijo, Southeast",
-    "Inonhan",
-    "Isu",
-    "Iatmul",
-    "Ik",
-    "Inor",
-    "Isu",
-    "Iau",
-    "Ika",
-    "International Sign",
-    "Italian",
-    "Ibaloi",
-    "Ikaranggal",
-    "Intha",
-    "Italian Sign Language",
-    "Iban",
-    "Ikizu",
-    "Inuinnaqtun",
-    "Itawit",
-    "Ibanag",
-    "Iko",
-    "Inuit Sign Language",
-    "Itelmen",
-    "Ibani",
-    "Ikobi",
-    "Inuktitut",
-    "Iten",
-    "Ibatan",
-    "Ikoma-Nata-Isenye",
-    "Inuktitut, Eastern Canadian",
-    "Itene",
-    "Ibibio",
-    "Ikpeng",
-    "Inupiaq",
-    "Iteri",
-    "Ibino",
-    "Ikpeshi",
-    "Inupiatun, North Alaskan",
-    "Itik",
-    "Ibu",
-    "Ikposo",
-    "Inupiatun, Northwest Alaska",
-    "Itneg, Banao",
-    "Ibuoro",
-    "Iku-Gora-Ankwa",
-    "Iowa-Oto",
-    "Itneg, Binongan",
-    "Icelandic",
-    "Ikulu",
-    "Ipiko",
-    "Itneg, Inlaod",
-    "Icelandic Sign Language",
-    "Ikwere",
-    "Ipili",
-    "Itneg, Maeng",
-    "Iceve-Maci",
-    "Ikwo",
-    "Ipulo",
-    "Itneg, Masadiit",
-    "Ida\u2019an",
-    "Ila",
-    "Iquitu",
-    "Itneg, Moyadan",
-    "Idat\u00e9",
-    "Ile Ape",
-    "Ir",
-    "Ito",
-    "Idere",
-    "Ili Turki",
-    "Ir\u00e1ntxe",
-    "Itonama",
-    "Idesa",
-    "Ili\u2019uun",
-    "Iranun",
-    "Itu Mbon Uzo",
-    "Idi",
-    "Ilocano",
-    "Iranun",
-    "Itza\u2019",
-    "Idoma",
-    "Ilue",
-    "Iraqw",
-    "Iu Mien",
-    "Idu-Mishmi",
-    "Imbongu",
-    "Irarutu",
-    "Ivatan",
-    "Iduna",
-    "Imonda",
-    "Iraya",
-    "Ivbie North-Okpela-Arhe",
-    "If\u00e8",
-    "Imroing",
-    "Irigwe",
-    "Iwaidja",
-    "Ifo",
-    "Inabaknon",
-    "Irish",
-    "Iwal",
-    "Ifugao, Amganad",
-    "Inakeanon",
-    "Irish Sign Language",
-    "Iwam",
-    "Ifugao, Batad",
-    "Inapang",
-    "Irula",
-    "Iwam, Sepik",
-    "Ifugao, Mayoyao",
-    "I\u00f1apari",
-    "Isabi",
-    "Ixcatec",
-    "Ifugao, Tuwali",
-    "Indian Sign Language",
-    "Isaka",
-    "Ixil",
-    "Igala",
-    "Indo-Portuguese",
-    "Isanzu",
-    "Iyayu",
-    "Igana",
-    "Indonesian",
-    "Isconahua",
-    "Iyive",
-    "Igbo",
-    "Indonesian Sign Language",
-    "Isebe",
-    "Iyo",
-    "Igede",
-    "Indonesian, Peranakan",
-    "Isekiri",
-    "Izere",
-    "Ignaciano",
-    "Indri",
-    "Ishkashimi",
-    "Izii",
-    "Igo",
-    "Inese\u00f1o",
-    "Isinay",
-    "Izon",
-    "Iguta",
-    "Inga",
-    "Isirawa",
-    "Izora",
-    "Igwe",
-    "Inga, Jungle",
-    "Islander Creole English",
-    "",
-    "Jabut\u00ed",
-    "Jarawa",
-    "Jibu",
-    "Jordanian Sign Language",
-    "Jad",
-    "Jaru",
-    "Jiiddu",
-    "Jorto",
-    "Jadgali",
-    "Jaunsari",
-    "Jilbe",
-    "Jowulu",
-    "Jah Hut",
-    "Javanese",
-    "Jilim",
-    "Ju",
-    "Jahanka",
-    "Javanese, New Caledonian",
-    "Jimi",
-    "Juang",
-    "Jaitmatang",
-    "Javanese, Suriname",
-    "Jimi",
-    "Jakalteko",
-    "Javindo",
-    "Jina",
-    "Judeo-Berber",
-    "Jakun",
-    "Jawe",
-    "Jingpho",
-    "Judeo-Georgian",
-    "Jalkunan",
-    "Jaya",
-    "Jinuo, Buyuan",
-    "Judeo-Italian",
-    "Jamaican Creole English",
-    "Jebero",
-    "Jinuo, Youle",
-    "Judeo-Tat",
-    "Jamaican Sign Language",
-    "Jeh",
-    "Jirel",
-    "Ju|\u2019hoansi",
-    "Jamamad\u00ed",
-    "Jehai",
-    "Jiru",
-    "Jukun Takum",
-    "Jandai",
-    "Jejueo",
-    "Jita",
-    "Jula",
-    "Jandavra",
-    "Jemez",
-    "Jju",
-    "J\u00fama",
-    "Jangkang",
-    "Jere",
-    "Joba",
-    "Jumjum",
-    "Jangshung",
-    "Jeri Kuo",
-    "Jofotek-Bromnya",
-    "Jumla Sign Language",
-    "Janji",
-    "J\u00e8rriais",
-    "Jogi",
-    "Jumli",
-    "Japanese",
-    "Jerung",
-    "Jola-Felupe",
-    "Jur Modo",
-    "Japanese Sign Language",
-    "Jewish Babylonian Aramaic",
-    "Jola-Fonyi",
-    "Juray",
-    "Japreria",
-    "Jhankot Sign Language",
-    "Jola-Kasa",
-    "Jur\u00fana",
-    "Jaqaru",
-    "Jiamao",
-    "Jonkor Bourmataguil",
-    "Juwal",
-    "Jara",
-    "Jiarong",
-    "Jor\u00e1",
-    "Jwira-Pepesa",
-    "Jarai",
-    "Jiba",
-    "",
-    "Kaamba",
-    "Karata",
-    "Kibaku",
-    "Koyukon",
-    "Kaan",
-    "Karawa",
-    "Kibala",
-    "Kpagua",
-    "Kaansa",
-    "Karbi",
-    "Kibet",
-    "Kpala",
-    "Kaapor",
-    "Kare",
-    "Kibiri",
-    "Kpan",
-    "Kaapor Sign Language",
-    "Kare",
-    "K\u2019iche\u2019",
-    "Kpasham",
-    "Kaba D\u00e9m\u00e9, Sara",
-    "Karekare",
-    "Kickapoo",
-    "Kpati",
-    "Kaba Naa, Sara",
-    "Karelian",
-    "Kiembu",
-    "Kpatili",
-    "Kabalai",
-    "Karen, Bwe",
-    "Kigiryama",
-    "Kpeego",
-    "Kabardian",
-    "Karen, Geba",
-    "Kikai",
-    "Kpelle",
-    "Kabatei",
-    "Karen, Geko",
-    "Kilivila",
-    "Kpelle, Guinea",
-    "Kabba",
-    "Karen, Mobwa",
-    "Kiliwa",
-    "Kpelle, Liberia",
-    "Kabiy\u00e8",
-    "Karen, Paku",
-    "Kilmeri",
-    "Kpessi",
-    "Kabola",
-    "Karen, Phrae Pwo",
-    "Kim",
-    "Kplang",
-    "Kaburi",
-    "Karen, Pwo Eastern",
-    "Kim Mun",
-    "Krache",
-    "Kabutra",
-    "Karen, Pwo Northern",
-    "Kimaghima",
-    "Krahn, Eastern",
-    "Kabuverdianu",
-    "Karen, Pwo Western",
-    "Kimaragang",
-    "Krahn, Western",
-    "Kabwa",
-    "Karen, S\u2019gaw",
-    "Kimbu",
-    "Krah\u00f4",
-    "Kabwari",
-    "Karenggapa",
-    "Kimbundu",
-    "Kraol",
-    "Kabyle",
-    "Karey",
-    "Kim\u00ee\u00eeru",
-    "Krenak",
-    "Kacchi",
-    "Kari",
-    "Kimki",
-    "Kreye",
-    "Kachama-Ganjule",
-    "Karingani",
-    "Kimr\u00e9",
-    "Kriang",
-    "Kachari",
-    "Karipuna",
-    "Kinabalian",
-    "Krikati-Timbira",
-    "Kacipo-Balesi",
-    "Karip\u00fana",
-    "Kinabatangan, Upper",
-    "Krimchak",
-    "Kaco\u2019",
-    "Karipuna Creole French",
-    "Kinalakna",
-    "Krio",
-    "Kadai",
-    "Karir\u00ed-Xoc\u00f3",
-    "Kinaray-a",
-    "Kriol",
-    "Kadar",
-    "Kariti\u00e2na",
-    "Kinga",
-    "Krobu",
-    "Kadaru",
-    "Kariya",
-    "Kinnauri",
-    "Krongo",
-    "Kadazan Dusun",
-    "Kariyarra",
-    "Kinnauri, Bhoti",
-    "Krumen, Plapo",
-    "Kadazan, Klias River",
-    "Karkar-Yuri",
-    "Kinnauri, Chitkuli",
-    "Krumen, Pye",
-    "Kadazan, Labuk-Kinabatangan",
-    "Karko",
-    "Kinnauri, Pahari",
-    "Krumen, Tepo",
-    "Kadiw\u00e9u",
-    "Karnai",
-    "Kintaq",
-    "Krung",
-    "Kadu",
-    "Karnic, Eastern",
-    "Kinuku",
-    "Kryts",
-    "Kaduo",
-    "Karo",
-    "Kinyarwanda",
-    "Kua",
-    "Kaera",
-    "Karo",
-    "Kioko",
-    "Kua-nsi",
-    "Kafa",
-    "Karok",
-    "Kiong",
-    "Kuamasi",
-    "Kafoa",
-    "Karon",
-    "Kiorr",
-    "Kuan",
-    "Kagayanen",
-    "Karon Dori",
-    "Kiowa",
-    "Kuanhua",
-    "Kagoro",
-    "Karore",
-    "Kipfokomo",
-    "Kuanua",
-    "Kagulu",
-    "Karranga",
-    "Kipsigis",
-    "Kuay",
-    "Kahe",
-    "Karuwali",
-    "Kiput",
-    "Kube",
-    "Kahua",
-    "Kasanga",
-    "Kir-Balar",
-    "Kubi",
-    "Kaibobo",
-    "Kasem",
-    "Kire",
-    "Kubo",
-    "Kaidipang",
-    "Kashaya",
-    "Kiribati",
-    "Kubu",
-    "Kaiep",
-    "Kashinawa",
-    "Kirike",
-    "Kuce",
-    "Kaikadi",
-    "Kashkay",
-    "Kirikiri",
-    "Kucong",
-    "Kaike",
-    "Kashmiri",
-    "Kirya-Konzel",
-    "Kudiya",
-    "Kaiku",
-    "Kashubian",
-    "Kis",
-    "Kudmali",
-    "Kaili, Da\u2019a",
-    "Kasiguranin",
-    "Kisan",
-    "Kudu-Camo",
-    "Kaili, Ledo",
-    "Kaska",
-    "Kisankasa",
-    "Kugama",
-    "Kaili, Unde",
-    "Kasua",
-    "Kisar",
-    "Kugbo",
-    "Kaimb\u00e9",
-    "Kata Kolok",
-    "Kisi",
-    "Kuhane",
-    "Kaimbulawa",
-    "Katabaga",
-    "Kisi, Southern",
-    "Kui",
-    "Kaingang",
-    "Katang, Northern",
-    "Kissi, Northern",
-    "Kui",
-    "Kaing\u00e1ng, S\u00e3o Paulo",
-    "Katang, Southern",
-    "Kistane",
-    "Kuijau",
-    "Kairak",
-    "Katawixi",
-    "Kitharaka",
-    "Kuik\u00faro-Kalap\u00e1lo",
-    "Kairiru",
-    "Katcha-Kadugli-Miri",
-    "Kitja",
-    "Kujarge",
-    "Kairui-Midiki",
-    "K\u00e2te",
-    "Kitsai",
-    "Kuk",
-    "Kais",
-    "Kathu",
-    "Kituba",
-    "Kukama-Kukamiria",
-    "Kaivi",
-    "Kati",
-    "Kituba",
-    "Kukatja",
-    "Kaiw\u00e1",
-    "Katkari",
-    "Kiunum",
-    "Kuke",
-    "Kaiy",
-    "Katla",
-    "Kiwai, Northeast",
-    "Kukele",
-    "Kajakse",
-    "Kato",
-    "Kiwai, Southern",
-    "Kukna",
-    "Kajali",
-    "Katso",
-    "Kiwilwana",
-    "Kuku-Mangk",
-    "Kajaman",
-    "Katu, Eastern",
-    "Kla-Dan",
-    "Kuku-Mu\u2019inh",
-    "Kakabai",
-    "Katu, Western",
-    "Klamath-Modoc",
-    "Kuku-Muminh",
-    "Kakabe",
-    "Katua",
-    "Klao",
-    "Kuku-Ugbanh",
-    "Kakanda",
-    "Katuk\u00edna",
-    "Klon",
-    "Kuku-Uwanh",
-    "Kakataibo-Kashibo",
-    "Katuk\u00edna, Panoan",
-    "Ko",
-    "Kuku-Yalanji",
-    "Kaki Ae",
-    "Kaulong",
-    "Koalib",
-    "Kula",
-    "Kako",
-    "Kaur",
-    "Koasati",
-    "Kulango, Bondoukou",
-    "Kakwa",
-    "Kaure",
-    "Koba",
-    "Kulango, Bouna",
-    "Kala",
-    "Kaurna",
-    "Kobiana",
-    "Kulere",
-    "Kala Lagaw Ya",
-    "Kauwera",
-    "Kobol",
-    "Kulfa",
-    "Kalaamaya",
-    "Kavalan",
-    "Kobon",
-    "Kulina",
-    "Kalabari",
-    "Kavet",
-    "Koch",
-    "Kulina Pano",
-    "Kalabra",
-    "Kawacha",
-    "Koda",
-    "Kulisusu",
-    "Kalagan",
-    "Kawaiisu",
-    "Kodaku",
-    "Kulon-Pazeh",
-    "Kalagan, Kagan",
-    "Kawe",
-    "Kodava",
-    "Kulung",
-    "Kalam",
-    "Kawyaw",
-    "Kodeoha",
-    "Kulung",
-    "Kalami",
-    "Kaxarar\u00ed",
-    "Kodi",
-    "Kumal",
-    "Kalams\u00e9",
-    "Kaxui\u00e2na",
-    "Kodia",
-    "Kumalu",
-    "Kalanadi",
-    "Kayab\u00ed",
-    "Koenoem",
-    "Kumam",
-    "Kalanga",
-    "Kayagar",
-    "Kofa",
-    "Kuman",
-    "Kalanguya",
-    "Kayah, Eastern",
-    "Kofei",
-    "Kumaoni",
-    "Kalao",
-    "Kayah, Western",
-    "Kofyar",
-    "Kumarbhag Paharia",
-    "Kalapuya",
-    "Kayan",
-    "Kogi",
-    "Kumba",
-    "Kalarko",
-    "Kayan",
-    "Kohin",
-    "Kumbainggar",
-    "Kalasha",
-    "Kayan Mahakam",
-    "Kohistani, Indus",
-    "Kumbaran",
-    "Kalenjin",
-    "Kayan, Baram",
-    "Koho",
-    "Kumbewaha",
-    "Kalinga, Butbut",
-    "Kayan, Busang",
-    "Kohumono",
-    "Kumiai",
-    "Kalinga, Limos",
-    "Kayan, Kayan River",
-    "Koi",
-    "Kumukio",
-    "Kalinga, Lubuagan",
-    "Kayan, Mendalam",
-    "Koiali, Mountain",
-    "Kumyk",
-    "Kalinga, Mabaka Valley",
-    "Kayan, Rejang",
-    "Koiari, Grass",
-    "Kumzari",
-    "Kalinga, Majukayang",
-    "Kayan, Wahau",
-    "Koireng",
-    "Kuna, Border",
-    "Kalinga, Southern",
-    "Kayap\u00f3",
-    "Koitabu",
-    "Kuna, San Blas",
-    "Kalinga, Tanudan",
-    "Kayardild",
-    "Koiwat",
-    "Kunama",
-    "Kalispel-Pend d\u2019Oreille",
-    "Kayaw",
-    "Kok Borok",
-    "Kunbarlang",
-    "Kalkoti",
-    "Kayeli",
-    "Kok-Nar",
-    "Kunda",
-    "Kalkutung",
-    "Kayong",
-    "Kokata",
-    "Kundal Shahi",
-    "Kallahan, Keley-i",
-    "Kaytetye",
-    "Koke",
-    "Kunduvadi",
-    "Kalmyk-Oirat",
-    "Kayupulau",
-    "Koko Babangk",
-    "Kung",
-    "Kalou",
-    "Kazakh",
-    "Kokoda",
-    "Kung-Ekoka",
-    "Kaluli",
-    "Kazukuru",
-    "Kokola",
-    "Kungarakany",
-    "Kalumpang",
-    "Keak",
-    "Kokota",
-    "Kungardutyi",
-    "Kam",
-    "Keapara",
-    "Kol",
-    "Kunggari",
-    "Kamakan",
-    "Kedang",
-    "Kol",
-    "Kungkari",
-    "Kamang",
-    "Kehu",
-    "Kol",
-    "Kuni",
-    "Kamano",
-    "Kei",
-    "Kola",
-    "Kuni-Boazi",
-    "Kamantan",
-    "Keiga",
-    "Kolami, Northwestern",
-    "Kunigami",
-    "Kamar",
-    "Keijar",
-    "Kolami, Southeastern",
-    "Kunimaipa",
-    "Kamara",
-    "Kein",
-    "Kolbila",
-    "Kunja",
-    "Kamarian",
-    "Keiyo",
-    "Koli, Kachi",
-    "Kunjen",
-    "Kamaru",
-    "Kela",
-    "Koli, Parkari",
-    "Kunyi",
-    "Kamas",
-    "Kelabit",
-    "Koli, Wadiyara",
-    "Kunza",
-    "Kamasa",
-    "Kele",
-    "Koluwawa",
-    "Kuo",
-    "Kamasau",
-    "Kele",
-    "Kom",
-    "Kuot",
-    "Kamayo",
-    "K\u00e9l\u00e9",
-    "Kom",
-    "Kupa",
-    "Kamayur\u00e1",
-    "Keliko",
-    "Koma",
-    "Kupia",
-    "Kamba",
-    "Kelo",
-    "Komba",
-    "Kupsapiiny",
-    "Kambaata",
-    "Kemak",
-    "Kombai",
-    "Kur",
-    "Kambaira",
-    "Kembayan",
-    "Kombe",
-    "Kurama",
-    "Kambera",
-    "Kemberano",
-    "Kombio",
-    "Kuranko",
-    "Kamberau",
-    "Kembra",
-    "Komering",
-    "Kurdish",
-    "Kambiw\u00e1",
-    "Kemedzung",
-    "Komi",
-    "Kurdish, Central",
-    "Kami",
-    "Kemiehua",
-    "Komi-Permyak",
-    "Kurdish, Northern",
-    "Kami",
-    "Kemtuik",
-    "Komi-Zyrian",
-    "Kurdish, Southern",
-    "Kamo",
-    "Kenati",
-    "Kominimung",
-    "Kuri",
-    "Kamoro",
-    "Kendayan",
-    "Komo",
-    "Kuria",
-    "Kamu",
-    "Kendeje",
-    "Komo",
-    "Kurichiya",
-    "Kamuku",
-    "Kendem",
-    "Komodo",
-    "Kurmukar",
-    "Kamula",
-    "Kenga",
-    "Kompane",
-    "Kurnai",
-    "Kamviri",
-    "Keninjal",
-    "Komyandaret",
-    "Kurrama",
-    "Kamwe",
-    "Kensiu",
-    "Kon Keu",
-    "Kursav",
-    "Kanakanabu",
-    "Kenswei Nsei",
-    "Konab\u00e9r\u00e9",
-    "Kurti",
-    "Kanamar\u00ed",
-    "Kenyah, Mainstream",
-    "Konai",
-    "Kurtokha",
-    "Kanan",
-    "Kenyah, Wahau",
-    "Konchri Sain",
-    "Kuru\u00e1ya",
-    "Kanashi",
-    "Kenyan Sign Language",
-    "Konda",
-    "Kurudu",
-    "Kanasi",
-    "Kenyang",
-    "Konda-Dora",
-    "Kurumba, Alu",
-    "Kanauji",
-    "Kenye",
-    "Koneraw",
-    "Kurumba, Attapady",
-    "Kandas",
-    "Ke\u2019o",
-    "Kongo",
-    "Kurumba, Betta",
-    "Kandawo",
-    "Keoru-Ahia",
-    "Kongo, San Salvador",
-    "Kurumba, Jennu",
-    "Kande",
-    "Kepkiriw\u00e1t",
-    "Konjo, Coastal",
-    "Kurumba, Kannada",
-    "Kandozi-Chapra",
-    "Kepo\u2019",
-    "Konjo, Highland",
-    "Kurumba, Mullu",
-    "Kanembu",
-    "Kera",
-    "Konkani",
-    "Kurux",
-    "Kang",
-    "Kerak",
-    "Konkani",
-    "Kurux, Nepali",
-    "Kanga",
-    "Kereho",
-    "Konkani, Goan",
-    "Kusaal",
-    "Kangean",
-    "Kerek",
-    "Konkomba",
-    "Kusaghe",
-    "Kanggape",
-    "Keres, Eastern",
-    "Konni",
-    "Kushi",
-    "Kangjia",
-    "Keres, Western",
-    "Kono",
-    "Kuskokwim, Upper",
-    "Kango",
-    "Kerewe",
-    "Kono",
-    "Kusu",
-    "Kango",
-    "Kerewo",
-    "Kono",
-    "Kusunda",
-    "Kangri",
-    "Kerinci",
-    "Konomala",
-    "Kutenai",
-    "Kaniet",
-    "Kesawai",
-    "Konongo",
-    "Kutep",
-    "Kanikkaran",
-    "Ket",
-    "Konso",
-    "Kuthant",
-    "Kaningi",
-    "Ketangalan",
-    "Konzo",
-    "Kutong",
-    "Kaningra",
-    "Kete",
-    "Koongo",
-    "Kutto",
-    "Kaninuwa",
-    "Ketengban",
-    "Koonzime",
-    "Kutu",
-    "Kanite",
-    "Ketum",
-    "Koorete",
-    "Kuturmi",
-    "Kanjari",
-    "Kewa, East",
-    "Kopar",
-    "Kuuk-Yak",
-    "Kanju",
-    "Kewa, West",
-    "Kopkaka",
-    "Kuuku-Ya\u2019u",
-    "Kankanaey",
-    "Kewat",
-    "Korafe-Yegha",
-    "Kuvale",
-    "Kankanay, Northern",
-    "Keyagana",
-    "Koraga, Korra",
-    "Kuvi",
-    "Kannada",
-    "Kgalagadi",
-    "Koraga, Mudu",
-    "Kuwaa",
-    "Kano\u00e9",
-    "Khakas",
-    "Korak",
-    "Kuwaataay",
-    "Kansa",
-    "Khalaj",
-    "Korana",
-    "Kwa\u2019",
-    "Kantosi",
-    "Khalaj, Turkic",
-    "Korandje",
-    "Kwa",
-    "Kanu",
-    "Khaling",
-    "Korean",
-    "Kwaami",
-    "Kanufi",
-    "Kham, Eastern Parbate",
-    "Korean Sign Language",
-    "Kwadi",
-    "Kanum, B\u00e4di",
-    "Kham, Gamale",
-    "Koreguaje",
-    "Kw\u2019adza",
-    "Kanum, Ngk\u00e2lmpw",
-    "Kham, Sheshi",
-    "Koresh-e Rostam",
-    "Kwaio",
-    "Kanum, Sm\u00e4rky",
-    "Kham, Western Parbate",
-    "Korku",
-    "Kwaja",
-    "Kanum, Sota",
-    "Khamba",
-    "Korlai Creole Portuguese",
-    "Kwakiutl",
-    "Kanuri",
-    "Khamti",
-    "Koro",
-    "Kwakum",
-    "Kanuri, Bilma",
-    "Khamyang",
-    "Koro",
-    "Kwama",
-    "Kanuri, Central",
-    "Khana",
-    "Koro",
-    "Kwambi",
-    "Kanuri, Manga",
-    "Khandesi",
-    "Koro",
-    "Kwamera",
-    "Kanuri, Tumari",
-    "Kh\u00e1ng",
-    "Koro Wachi",
-    "Kwami",
-    "Kanyok",
-    "Khanty",
-    "Koromf\u00e9",
-    "Kwandu",
-    "Kao",
-    "Khao",
-    "Koromira",
-    "Kwang",
-    "Kaonde",
-    "Kharia",
-    "Koroni",
-    "Kwanga",
-    "Kap",
-    "Kharia Thar",
-    "Korop",
-    "Kwangali",
-    "Kapauri",
-    "Khasi",
-    "Korop\u00f3",
-    "Kwanja",
-    "Kapin",
-    "Khe",
-    "Koroshi",
-    "Kwara\u2019ae",
-    "Kapinaw\u00e1",
-    "Khehek",
-    "Korowai",
-    "Kwasio",
-    "Kapingamarangi",
-    "Khengkha",
-    "Korubo",
-    "Kwaya",
-    "Kapriman",
-    "Khetrani",
-    "Korupun-Sela",
-    "Kwaza",
-    "Kaptiau",
-    "Khinalugh",
-    "Korwa",
-    "Kwegu",
-    "Kapya",
-    "Khirwar",
-    "Koryak",
-    "Kwer",
-    "Kaqchikel",
-    "Khisa",
-    "Kosare",
-    "Kwerba",
-    "Kaqchikel-K\u2019iche\u2019 Mixed Language",
-    "Khlor",
-    "Kosena",
-    "Kwerba Mamberamo",
-    "Kara",
-    "Khlula",
-    "Koshin",
-    "Kwere",
-    "Kara",
-    "Khmer",
-    "Kosraean",
-    "Kwerisa",
-    "Kara",
-    "Khmer, Northern",
-    "Kota",
-    "Kwese",
-    "Karaboro, Eastern",
-    "Khmu",
-    "Kota",
-    "Kwesten",
-    "Karaboro, Western",
-    "Khoekhoe",
-    "Kota Marudu Talantang",
-    "Kwini",
-    "Karachay-Balkar",
-    "Kho\u2019ini",
-    "Koti",
-    "Kwinsu",
-    "Karadjeri",
-    "Kholok",
-    "Kouya",
-    "Kwinti",
-    "Karagas",
-    "Khorasani Turkish",
-    "Kovai",
-    "Kwoma",
-    "Karaim",
-    "Khowar",
-    "Kove",
-    "Kwomtari",
-    "Karaj\u00e1",
-    "Khua",
-    "Kowaki",
-    "Kyak",
-    "Karakalpak",
-    "Khuen",
-    "Kowiai",
-    "Kyaka",
-    "Karami",
-    "Kh\u00fcn",
-    "Koy Sanjaq Surat",
-    "Kyanga",
-    "Karang",
-    "Khunsari",
-    "Koya",
-    "Kyenele",
-    "Karanga",
-    "Khvarshi",
-    "Koyaga",
-    "Kyerung",
-    "Karao",
-    "Khwedam",
-    "Koyo",
-    "Kyrgyz",
-    "Karas",
-    "",
-    "Laal",
-    "Laopang",
-    "Lewo",
-    "Loma",
-    "Laalaa",
-    "Laos Sign Language",
-    "Lewo Eleng",
-    "Loma",
-    "Laari",
-    "Laragia",
-    "Lewotobi",
-    "Lomaiviti",
-    "Laba",
-    "Lardil",
-    "Leyigha",
-    "Lomavren",
-    "Label",
-    "Larevat",
-    "Lezgi",
-    "Lombard",
-    "La\u2019bi",
-    "Lari",
-    "Lhao Vo",
-    "Lombi",
-    "Labir",
-    "Larike-Wakasihu",
-    "Lhokpu",
-    "Lombo",
-    "Labu",
-    "Laro",
-    "Lhomi",
-    "Lomwe",
-    "Lacandon",
-    "Larteh",
-    "Lhowa",
-    "Lomwe, Malawi",
-    "Lachi",
-    "Laru",
-    "Liabuku",
-    "Long Wat",
-    "Lachi, White",
-    "Lasalimu",
-    "Liana-Seti",
-    "Longgu",
-    "Lacid",
-    "Lasgerdi",
-    "Liberian English",
-    "Longto",
-    "Ladakhi",
-    "Lasi",
-    "Libido",
-    "Longuda",
-    "Ladin",
-    "Latgalian",
-    "Libinza",
-    "Loniu",
-    "Ladino",
-    "Latin",
-    "Libyan Sign Language",
-    "Lonwolwol",
-    "Ladji Ladji",
-    "Latu",
-    "Ligbi",
-    "Lonzo",
-    "Laeko-Libuat",
-    "Latund\u00ea",
-    "Ligenza",
-    "Loo",
-    "Lafofa",
-    "Latvian",
-    "Ligurian",
-    "Lopa",
-    "Laghu",
-    "Latvian Sign Language",
-    "Lihir",
-    "Lopi",
-    "Laghuu",
-    "Latvian, Standard",
-    "Lijili",
-    "Lopit",
-    "Lagwan",
-    "Lau",
-    "Lik",
-    "Lorang",
-    "Laha",
-    "Laua",
-    "Lika",
-    "Lorediakarkar",
-    "Laha",
-    "Lauan",
-    "Liki",
-    "Lote",
-    "Lahanan",
-    "Lauje",
-    "Likila",
-    "Lotud",
-    "Lahnda",
-    "Laura",
-    "Likuba",
-    "Lou",
-    "Lahta",
-    "Lavatbura-Lamusong",
-    "Likum",
-    "Louisiana Creole",
-    "Lahu",
-    "Lave",
-    "Likwala",
-    "Loun",
-    "Lahu Shi",
-    "Laven",
-    "Lilau",
-    "Lovono",
-    "Laimbue",
-    "Lavrung",
-    "Lillooet",
-    "L\u00f6y\u00f6p",
-    "Laiyolo",
-    "Lavukaleve",
-    "Limassa",
-    "Lozi",
-    "Lak",
-    "Lawa, Eastern",
-    "Limba, East",
-    "L\u00fc",
-    "Laka",
-    "Lawa, Western",
-    "Limba, West-Central",
-    "Luang",
-    "Laka",
-    "Lawangan",
-    "Limbu",
-    "Luba-Kasai",
-    "Lakalei",
-    "Lawu",
-    "Limbum",
-    "Luba-Katanga",
-    "Lakha",
-    "Lawunuia",
-    "Limburgish",
-    "Lubila",
-    "Laki",
-    "Layakha",
-    "Limi",
-    "Lubu",
-    "Lakkia",
-    "Laz",
-    "Limilngan",
-    "Lubukusu",
-    "Lakon",
-    "Leco",
-    "Lingala",
-    "Lucazi",
-    "Lakond\u00ea",
-    "Leelau",
-    "Lingao",
-    "Lucumi",
-    "Lakota",
-    "Lefa",
-    "Lingua Franca",
-    "Ludian",
-    "Lala",
-    "Lega-Mwenga",
-    "Li\u2019o",
-    "Lufu",
-    "Lala-Bisa",
-    "Lega-Shabunda",
-    "Lipo",
-    "Lugbara",
-    "Lala-Roba",
-    "Legbo",
-    "Lisabata-Nuniali",
-    "Luguru",
-    "Lalia",
-    "Legenyem",
-    "Lisela",
-    "Luhu",
-    "Lalo, Central",
-    "Lehali",
-    "Lish",
-    "Lui",
-    "Lalo, Dongshanba",
-    "Leipon",
-    "Lish\u00e1n Did\u00e1n",
-    "Luidakho-Luisukha-Lutirichi",
-    "Lalu, Eastern",
-    "Lelak",
-    "Lishana Deni",
-    "Luimbi",
-    "Lalu, Western",
-    "Lele",
-    "Lishanid Noshan",
-    "Luise\u00f1o",
-    "Lama",
-    "Lele",
-    "Lisu",
-    "Lukabaras",
-    "Lamaholot",
-    "Lele",
-    "Lithuanian",
-    "Lukpa",
-    "Lamalera",
-    "Lele",
-    "Lithuanian Sign Language",
-    "Lulogooli",
-    "Lamang",
-    "Lelemi",
-    "Litzlitz",
-    "Lumbee",
-    "Lamatuka",
-    "Lelepa",
-    "Liv",
-    "Lumbu",
-    "Lamba",
-    "Lembata, South",
-    "Livvi-Karelian",
-    "Lumun",
-    "Lambadi",
-    "Lembata, West",
-    "Lo-Toga",
-    "Lun Bawang",
-    "Lamboya",
-    "Lembena",
-    "Loarki",
-    "Luna",
-    "Lambya",
-    "Lemerig",
-    "Lobala",
-    "Lunanakha",
-    "Lame",
-    "Lemio",
-    "Lobi",
-    "Lunda",
-    "Lamenu",
-    "Lemolang",
-    "Lobu, Lanas",
-    "Lungalunga",
-    "Lamja-Dengsa-Tola",
-    "Lemoro",
-    "Lobu, Tampias",
-    "Lungga",
-    "Lamkang",
-    "Lenakel",
-    "Lodhi",
-    "Luo",
-    "Lamnso\u2019",
-    "Lenca",
-    "Logba",
-    "Luri",
-    "Lamogai",
-    "Lendu",
-    "Logo",
-    "Luri, Northern",
-    "Lampung Api",
-    "Lengilu",
-    "Logol",
-    "Luri, Southern",
-    "Lampung Nyo",
-    "Lengo",
-    "Logorik",
-    "Lusengo",
-    "Lamu",
-    "Lengola",
-    "Lohar, Gade",
-    "Lushootseed",
-    "Lamu-Lamu",
-    "Leningitij",
-    "Lohar, Lahul",
-    "Lusi",
-    "Landoma",
-    "Lenje",
-    "Lohorung",
-    "Lutachoni",
-    "Langam",
-    "Lenkau",
-    "Lokaa",
-    "Lutos",
-    "Langbashe",
-    "Lenyima",
-    "Loko",
-    "Luvale",
-    "Lang\u2019e",
-    "Lepcha",
-    "Lokoya",
-    "Luwati",
-    "Langi",
-    "Lepki",
-    "Lola",
-    "Luwo",
-    "Lango",
-    "Lere",
-    "Lolak",
-    "Luxembourgish",
-    "Lango",
-    "Lese",
-    "Lole",
-    "Luyana",
-    "Lanima",
-    "Letemboi",
-    "Lolo",
-    "Lwalu",
-    "Lanoh",
-    "Leti",
-    "Loloda",
-    "Ly\u00e9l\u00e9",
-    "Lao",
-    "Leti",
-    "Lolopo",
-    "Lyngngam",
-    "Laomian",
-    "Levuka",
-    "Lolopo, Southern",
-    "Lyons Sign Language",
-    "",
-    "Ma",
-    "Manem",
-    "Mbre",
-    "Mlap",
-    "Ma",
-    "Mang",
-    "Mbudum",
-    "Mlomp",
-    "Ma Manda",
-    "Mangala",
-    "Mbugu",
-    "Mmaala",
-    "Maa",
-    "Mangarayi",
-    "Mbugwe",
-    "Mmen",
-    "Maaka",
-    "Mangareva",
-    "Mbuko",
-    "Mnong, Central",
-    "Ma\u2019anyan",
-    "Mangas",
-    "Mbukushu",
-    "Mnong, Eastern",
-    "Maasai",
-    "Mangayat",
-    "Mbula",
-    "Mnong, Southern",
-    "Maay",
-    "Mangbetu",
-    "Mbula-Bwazza",
-    "Mo",
-    "Maba",
-    "Mangbutu",
-    "Mbule",
-    "Moba",
-    "Maba",
-    "Mangerr",
-    "Mbulungish",
-    "M\u00f3cheno",
-    "Mabaale",
-    "Manggarai",
-    "Mbum",
-    "Mochi",
-    "Mabaan",
-    "Mango",
-    "Mbunda",
-    "Mocho",
-    "Mabire",
-    "Mangole",
-    "Mbunga",
-    "Mocov\u00ed",
-    "Macaguaje",
-    "Mangseng",
-    "Mburku",
-    "Mo\u2019da",
-    "Macagu\u00e1n",
-    "Mangue",
-    "Mbwela",
-    "Modang",
-    "Macanese",
-    "Manide",
-    "Medebur",
-    "Modole",
-    "Macedonian",
-    "Manikion",
-    "Media Lengua",
-    "Moere",
-    "Machame",
-    "Maninka, Konyanka",
-    "Mediak",
-    "Mofu, North",
-    "Machinere",
-    "Maninka, Sankaran",
-    "Medumba",
-    "Mofu-Gudur",
-    "Machinga",
-    "Maninkakan, Eastern",
-    "Me\u2019en",
-    "Mogholi",
-    "Maco",
-    "Maninkakan, Kita",
-    "Mefele",
-    "Mogofin",
-    "Macuna",
-    "Maninkakan, Western",
-    "Megam",
-    "Mogum",
-    "Macushi",
-    "Manipa",
-    "Mehek",
-    "Mohave",
-    "Mada",
-    "Mankanya",
-    "Mehin\u00e1ku",
-    "Mohawk",
-    "Mada",
-    "Mann",
-    "Mehri",
-    "Mohegan-Pequot",
-    "Madagascar Sign Language",
-    "Manna-Dora",
-    "Meitei",
-    "Moi",
-    "Madak",
-    "Mannan",
-    "Mekeo",
-    "Moi",
-    "Maden",
-    "Manobo, Agusan",
-    "Mekmek",
-    "Moikodi",
-    "Madhi Madhi",
-    "Manobo, Ata",
-    "Mekwei",
-    "Moingi",
-    "Madi",
-    "Manobo, Cotabato",
-    "Melanau, Central",
-    "Moji",
-    "Ma\u2019di",
-    "Manobo, Dibabawon",
-    "Melanau, Daro-Matu",
-    "Mok",
-    "Ma\u2019di, Southern",
-    "Manobo, Ilianen",
-    "Melanau, Kanowit-Tanjong",
-    "Moken",
-    "Madngele",
-    "Manobo, Kinamiging",
-    "Melanau, Sibu",
-    "Mokerang",
-    "Madura",
-    "Manobo, Matigsalug",
-    "Mele-Fila",
-    "Mokilese",
-    "Mae",
-    "Manobo, Obo",
-    "Melo",
-    "Moklen",
-    "Maewo, Central",
-    "Manobo, Rajah Kabunsuwan",
-    "Melpa",
-    "Mokole",
-    "Mafa",
-    "Manobo, Sarangani",
-    "Memoni",
-    "Mokpwe",
-    "Mafea",
-    "Manobo, Western Bukidnon",
-    "Mendankwe-Nkwen",
-    "Moksela",
-    "Magahi",
-    "Manombai",
-    "Mende",
-    "Moksha",
-    "Magar, Eastern",
-    "Mansaka",
-    "Mende",
-    "Molale",
-    "Magar, Western",
-    "Mansi",
-    "Mengaka",
-    "Molbog",
-    "M\u00e1ghd\u00ec",
-    "Mansoanka",
-    "Mengen",
-    "Moldova Sign Language",
-    "Magiyi",
-    "Manta",
-    "Mengisa",
-    "Molengue",
-    "Magoma",
-    "Mantsi",
-    "M\u00e9nik",
-    "Molima",
-    "Magori",
-    "Manx",
-    "Menka",
-    "Molo",
-    "Maguindanaon",
-    "Manya",
-    "Menominee",
-    "Molof",
-    "Mah Meri",
-    "Manyawa",
-    "Mentawai",
-    "Moloko",
-    "Mahali",
-    "Manyika",
-    "Menya",
-    "Mom Jango",
-    "Mahongwe",
-    "Maonan",
-    "Meoswar",
-    "Moma",
-    "Mahou",
-    "Maori",
-    "Me\u2019phaa, Acatepec",
-    "Momare",
-    "Mai Brat",
-    "Mape",
-    "Me\u2019phaa, Azoy\u00fa",
-    "Mombum",
-    "Maia",
-    "Mapena",
-    "Me\u2019phaa, Malinaltepec",
-    "Momina",
-    "Maiadomu",
-    "Mapia",
-    "Me\u2019phaa, Tlacoapa",
-    "Momuna",
-    "Maiani",
-    "Mapidian",
-    "Mer",
-    "Mon",
-    "Maidu, Northeast",
-    "Mapoyo",
-    "Meramera",
-    "Mond\u00e9",
-    "Maidu, Northwest",
-    "Mapudungun",
-    "Merei",
-    "Mondropolon",
-    "Maidu, Valley",
-    "Mapun",
-    "Merey",
-    "Mongo-Nkundu",
-    "Maii",
-    "Maquiritari",
-    "Meriam",
-    "Mongol",
-    "Maijuna",
-    "Mara",
-    "Merwari",
-    "Mongolian",
-    "Mailu",
-    "Maraghei",
-    "Mesaka",
-    "Mongolian Sign Language",
-    "Maindo",
-    "Maragus",
-    "Mesem",
-    "Mongolian, Halh",
-    "Mairasi",
-    "Maramba",
-    "Meskwaki",
-    "Mongolian, Peripheral",
-    "Maisin",
-    "Maranao",
-    "Mesme",
-    "Mongondow",
-    "Maithili",
-    "Marangis",
-    "Mesmes",
-    "Moni",
-    "Maiwa",
-    "Maranunggu",
-    "Mesqan",
-    "Mono",
-    "Maiwa",
-    "Mararit",
-    "Meta\u2019",
-    "Mono",
-    "Maiwala",
-    "Marathi",
-    "Mewahang, Eastern",
-    "Mono",
-    "Majang",
-    "Marau",
-    "Mewahang, Western",
-    "Mono",
-    "Majera",
-    "Marba",
-    "Mewari",
-    "Monom",
-    "Majhi",
-    "Marenje",
-    "Mewati",
-    "Monpa, Kalaktang",
-    "Majhwar",
-    "Marfa",
-    "Mexican Sign Language",
-    "Monpa, Tawang",
-    "Mak",
-    "Margany",
-    "Meyah",
-    "Montagnais",
-    "Mak",
-    "Marghi Central",
-    "Mfinu",
-    "Montol",
-    "Maka",
-    "Marghi South",
-    "Mfumte",
-    "Monumbo",
-    "Makaa",
-    "Margu",
-    "Mgbolizhia",
-    "Monzombo",
-    "Makah",
-    "Mari",
-    "Miami",
-    "Moo",
-    "Makalero",
-    "Mari",
-    "Mian",
-    "M\u00f2or\u00e9",
-    "Makasae",
-    "Mari",
-    "Miani",
-    "Mor",
-    "Makasar",
-    "Mari, Hill",
-    "Miao, Central Huishui",
-    "Mor",
-    "Makayam",
-    "Mari, Meadow",
-    "Miao, Central Mashan",
-    "Moraid",
-    "Makhuwa",
-    "Maria",
-    "Miao, Chuanqiandian Cluster",
-    "Morawa",
-    "Makhuwa-Marrevone",
-    "Maria",
-    "Miao, Eastern Huishui",
-    "Morerebi",
-    "Makhuwa-Meetto",
-    "Maria, Dandami",
-    "Miao, Eastern Qiandong",
-    "Moresada",
-    "Makhuwa-Moniga",
-    "Maricopa",
-    "Miao, Eastern Xiangxi",
-    "Mori Atas",
-    "Makhuwa-Saka",
-    "Maridan",
-    "Miao, Horned",
-    "Mori Bawah",
-    "Makhuwa-Shirima",
-    "Maridjabin",
-    "Miao, Large Flowery",
-    "Morigi",
-    "Makian, East",
-    "Marik",
-    "Miao, Luopohe",
-    "Morisyen",
-    "Makian, West",
-    "Marimanindji",
-    "Miao, Northern Guiyang",
-    "Moro",
-    "Maklew",
-    "Marind",
-    "Miao, Northern Huishui",
-    "Moroccan Sign Language",
-    "Makolkol",
-    "Marind, Bian",
-    "Miao, Northern Mashan",
-    "Morokodo",
-    "Makonde",
-    "Maring",
-    "Miao, Northern Qiandong",
-    "Morom",
-    "M\u00e1ku",
-    "Maringarr",
-    "Miao, Small Flowery",
-    "Moronene",
-    "Makur\u00e1p",
-    "Marino",
-    "Miao, Southern Guiyang",
-    "Morop",
-    "Makuva",
-    "Mariri",
-    "Miao, Southern Mashan",
-    "Morori",
-    "Makwe",
-    "Marithiel",
-    "Miao, Southern Qiandong",
-    "Morouas",
-    "Mal",
-    "Maritime Sign Language",
-    "Miao, Southwestern Guiyang",
-    "Mortlockese",
-    "Mal Paharia",
-    "Maritsau\u00e1",
-    "Miao, Southwestern Huishui",
-    "Moru",
-    "Mala",
-    "Mariyedi",
-    "Miao, Western Mashan",
-    "Mosimo",
-    "Mala",
-    "Marka",
-    "Miao, Western Xiangxi",
-    "Mosiro",
-    "Mala Malasar",
-    "Markweeta",
-    "Michif",
-    "Moskona",
-    "Malaccan Creole Malay",
-    "Marma",
-    "Midob",
-    "Mota",
-    "Malaccan Creole Portuguese",
-    "Marovo",
-    "Migaama",
-    "Motu",
-    "Malagasy",
-    "Marquesan, North",
-    "Migabac",
-    "Motu, Hiri",
-    "Malagasy, Antankarana",
-    "Marquesan, South",
-    "Migum",
-    "Mouk-Aria",
-    "Malagasy, Bara",
-    "Marriammu",
-    "Miji",
-    "Mouwase",
-    "Malagasy, Masikoro",
-    "Marshallese",
-    "Miju-Mishmi",
-    "Movima",
-    "Malagasy, Northern Betsimisaraka",
-    "Marti Ke",
-    "Mikasuki",
-    "Mozambican Sign Language",
-    "Malagasy, Plateau",
-    "Martu Wangka",
-    "Mi\u2019kmaq",
-    "Mpade",
-    "Malagasy, Sakalava",
-    "Martuyhunira",
-    "Mili",
-    "Mpalitjanh",
-    "Malagasy, Southern Betsimisaraka",
-    "Mar\u00fabo",
-    "Miltu",
-    "Mpi",
-    "Malagasy, Tandroy-Mahafaly",
-    "Marwari",
-    "Mina",
-    "Mpiemo",
-    "Malagasy, Tanosy",
-    "Marwari",
-    "Mina",
-    "Mpoto",
-    "Malagasy, Tesaka",
-    "Marwari",
-    "Minang",
-    "Mpotovoro",
-    "Malagasy, Tsimihety",
-    "Masaaba",
-    "Minangkabau",
-    "Mpumpong",
-    "Malalamai",
-    "Masalit",
-    "Minanibai",
-    "Mpuono",
-    "Malango",
-    "Masana",
-    "Minaveha",
-    "Mpur",
-    "Malankuravan",
-    "Masbatenyo",
-    "Minderico",
-    "Mro-Khimi",
-    "Malapandaram",
-    "Masela, Central",
-    "Mindiri",
-    "Mru",
-    "Malaryan",
-    "Masela, East",
-    "Mingang Doso",
-    "Mser",
-    "Malas",
-    "Masela, West",
-    "Mingrelian",
-    "Muak Sa-aak",
-    "Malasar",
-    "Mashco Piro",
-    "Miniafia Oyan",
-    "Mualang",
-    "Malavedan",
-    "Mashi",
-    "Minidien",
-    "Mubami",
-    "Malay",
-    "Mashi",
-    "Minigir",
-    "Mubi",
-    "Malay",
-    "Masimasi",
-    "Minjungbal",
-    "Muda",
-    "Malay, Ambonese",
-    "Masiwang",
-    "Minokok",
-    "Mudburra",
-    "Malay, Baba",
-    "Maskelynes",
-    "Minriq",
-    "Muduga",
-    "Malay, Bacanese",
-    "Maslam",
-    "Mintil",
-    "Mufian",
-    "Malay, Balinese",
-    "Masmaje",
-    "Miqie",
-    "Mugali",
-    "Malay, Banda",
-    "Massalat",
-    "Mirandese",
-    "Mugom",
-    "Malay, Berau",
-    "Massep",
-    "Mirgan",
-    "Muinane",
-    "Malay, Bukit",
-    "Matagalpa",
-    "Miriti",
-    "Muji, Northern",
-    "Malay, Central",
-    "Matal",
-    "Miriwoong Sign Language",
-    "Muji, Qila",
-    "Malay, Cocos Islands",
-    "Matbat",
-    "Miriwung",
-    "Muji, Southern",
-    "Malay, Jambi",
-    "Matengo",
-    "Miship",
-    "Mukha-Dora",
-    "Malay, Kedah",
-    "Matepi",
-    "Misima-Panaeati",
-    "Mukulu",
-    "Malay, Kota Bangun Kutai",
-    "Matipuhy",
-    "Mising",
-    "Mulaha",
-    "Malay, Kupang",
-    "Mat\u00eds",
-    "M\u00edskito",
-    "Mulam",
-    "Malay, Larantuka",
-    "Matlatzinca, Atzingo",
-    "Mittu",
-    "Mulao",
-    "Malay, Makassar",
-    "Matlatzinca, San Francisco",
-    "Mituku",
-    "Mulgi",
-    "Malay, Manado",
-    "Mato",
-    "Miu",
-    "Mullukmulluk",
-    "Malay, North Moluccan",
-    "Mats\u00e9s",
-    "Miwa",
-    "Muluridyi",
-    "Malay, Papuan",
-    "Matsigenka",
-    "Miwok, Central Sierra",
-    "Mum",
-    "Malay, Pattani",
-    "Mattokki",
-    "Miwok, Coast",
-    "Mumuye",
-    "Malay, Sabah",
-    "Mattole",
-    "Miwok, Lake",
-    "Muna",
-    "Malay, Standard",
-    "Matukar",
-    "Miwok, Northern Sierra",
-    "Munda",
-    "Malay, Tenggarong Kutai",
-    "Matumbi",
-    "Miwok, Plains",
-    "Mundabli",
-    "Malayalam",
-    "Maung",
-    "Miwok, Southern Sierra",
-    "Mundang",
-    "Malayic Dayak",
-    "Mauritian Sign Language",
-    "Mixe, Coatl\u00e1n",
-    "Mundani",
-    "Malaynon",
-    "Mauwake",
-    "Mixe, Isthmus",
-    "Mundari",
-    "Malayo",
-    "Mawa",
-    "Mixe, Juquila",
-    "Mundat",
-    "Malaysian Sign Language",
-    "Mawa",
-    "Mixe, Mazatl\u00e1n",
-    "M\u00fcnd\u00fc",
-    "Maldivian",
-    "Mawak",
-    "Mixe, North Central",
-    "Munduruk\u00fa",
-    "Male",
-    "Mawan",
-    "Mixe, Quetzaltepec",
-    "Mungaka",
-    "Male",
-    "Mawayana",
-    "Mixe, Tlahuitoltepec",
-    "Mungbam",
-    "Malecite-Passamaquoddy",
-    "Mawchi",
-    "Mixe, Totontepec",
-    "Munggui",
-    "Mal\u00e9ku Ja\u00edka",
-    "Mawes",
-    "Mixtec, Alacatlatzala",
-    "Mungkip",
-    "Maleng",
-    "Maxakal\u00ed",
-    "Mixtec, Alcozauca",
-    "Muniche",
-    "Maleu-Kilenge",
-    "Ma\u2019ya",
-    "Mixtec, Amoltepec",
-    "Munit",
-    "Malgana",
-    "Maya, Mop\u00e1n",
-    "Mixtec, Apasco-Apoala",
-    "Munji",
-    "Malgbe",
-    "Maya, Yucatec",
-    "Mixtec, Atatlahuca",
-    "Munsee",
-    "Mali",
-    "Mayaguduna",
-    "Mixtec, Ayutla",
-    "Muong",
-    "Malila",
-    "Mayangna",
-    "Mixtec, Cacaloxtepec",
-    "Mur Pano",
-    "Malimba",
-    "Mayawali",
-    "Mixtec, Chayuco",
-    "Muratayak",
-    "Malimpung",
-    "Mayeka",
-    "Mixtec, Chazumba",
-    "Muria, Eastern",
-    "Malo",
-    "Mayi-Kulan",
-    "Mixtec, Chigmecatitl\u00e1n",
-    "Muria, Far Western",
-    "Malol",
-    "Mayi-Thakurti",
-    "Mixtec, Coatzospan",
-    "Muria, Western",
-    "Maltese",
-    "Mayi-Yapi",
-    "Mixtec, Cuyamecalco",
-    "Murik",
-    "Maltese Sign Language",
-    "Mayo",
-    "Mixtec, Diuxi-Tilantongo",
-    "Murik",
-    "Malua Bay",
-    "Mayogo",
-    "Mixtec, Huitepec",
-    "Murkim",
-    "Malvi",
-    "Mazagway",
-    "Mixtec, Itundujia",
-    "Murle",
-    "Malyangapa",
-    "Mazahua, Central",
-    "Mixtec, Ixtayutla",
-    "Murrinh-Patha",
-    "Mam",
-    "Mazahua, Michoac\u00e1n",
-    "Mixtec, Jamiltepec",
-    "Mursi",
-    "Mama",
-    "Mazandarani",
-    "Mixtec, Juxtlahuaca",
-    "Murupi",
-    "Mamaa",
-    "Mazatec, Ayautla",
-    "Mixtec, Magdalena Pe\u00f1asco",
-    "Murut, Bookan",
-    "Mamaind\u00e9",
-    "Mazatec, Chiquihuitl\u00e1n",
-    "Mixtec, Metlat\u00f3noc",
-    "Murut, Kalabakan",
-    "Mamanwa",
-    "Mazatec, Huautla",
-    "Mixtec, Mitlatongo",
-    "Murut, Keningau",
-    "Mamasa",
-    "Mazatec, Ixcatl\u00e1n",
-    "Mixtec, Mixtepec",
-    "Murut, Paluan",
-    "Mambae",
-    "Mazatec, Jalapa de D\u00edaz",
-    "Mixtec, Northern Tlaxiaco",
-    "Murut, Selungai",
-    "Mambai",
-    "Mazatec, Mazatl\u00e1n",
-    "Mixtec, Northwest Oaxaca",
-    "Murut, Sembakung",
-    "Mambila, Cameroon",
-    "Mazatec, San Jer\u00f3nimo Tec\u00f3atl",
-    "Mixtec, Ocotepec",
-    "Murut, Serudung",
-    "Mambila, Nigeria",
-    "Mazatec, Soyaltepec",
-    "Mixtec, Pe\u00f1oles",
-    "Murut, Tahol",
-    "Mamboru",
-    "M\u00e0w\u00e9s Aas\u02bc\u00e8",
-    "Mixtec, Pinotepa Nacional",
-    "Murut, Timugon",
-    "Mambwe-Lungu",
-    "Mba",
-    "Mixtec, San Juan Colorado",
-    "Muruwari",
-    "Mampruli",
-    "Mbala",
-    "Mixtec, San Juan Teita",
-    "Musar",
-    "Mamuju",
-    "Mbalanhu",
-    "Mixtec, San Miguel el Grande",
-    "Musasa",
-    "Mamusi",
-    "Mbandja",
-    "Mixtec, San Miguel Piedras",
-    "Musey",
-    "Mamvu",
-    "Mbangala",
-    "Mixtec, Santa Luc\u00eda Monteverde",
-    "Musgu",
-    "Man Met",
-    "Mbangi",
-    "Mixtec, Santa Mar\u00eda Zacatepec",
-    "Mushungulu",
-    "Manam",
-    "Mbangwe",
-    "Mixtec, Silacayoapan",
-    "Musi",
-    "Manambu",
-    "Mbara",
-    "Mixtec, Sindihui",
-    "Muskogee",
-    "Manangkari",
-    "Mbara",
-    "Mixtec, Sinicahua",
-    "Muskum",
-    "Manat",
-    "Mbariman-Gudhinma",
-    "Mixtec, Southeastern Nochixtl\u00e1n",
-    "Musom",
-    "Manchu",
-    "Mbat",
-    "Mixtec, Southern Puebla",
-    "Mussau-Emira",
-    "Mand",
-    "Mbati",
-    "Mixtec, Southwestern Tlaxiaco",
-    "Muthuvan",
-    "Manda",
-    "Mbato",
-    "Mixtec, Soyaltepec",
-    "Mutu",
-    "Manda",
-    "Mbay",
-    "Mixtec, Tacahua",
-    "Muya",
-    "Manda",
-    "Mbe",
-    "Mixtec, Tamazola",
-    "Muyang",
-    "Mandahuaca",
-    "Mbelime",
-    "Mixtec, Tezoatl\u00e1n",
-    "Muyu, North",
-    "Mandaic",
-    "Mbembe, Cross River",
-    "Mixtec, Tida\u00e1",
-    "Muyu, South",
-    "Mandaic, Classical",
-    "Mbembe, Tigon",
-    "Mixtec, Tijaltepec",
-    "Muyuw",
-    "Mandan",
-    "Mbere",
-    "Mixtec, Tlazoyaltepec",
-    "Muzi",
-    "Mandandanyi",
-    "Mbesa",
-    "Mixtec, Tututepec",
-    "Mvanip",
-    "Mandar",
-    "Mbo",
-    "Mixtec, Western Juxtlahuaca",
-    "Mvuba",
-    "Mandara",
-    "Mbo",
-    "Mixtec, Yolox\u00f3chitl",
-    "Mwaghavul",
-    "Mandari",
-    "Mbo\u2019",
-    "Mixtec, Yosond\u00faa",
-    "Mwan",
-    "Mandaya",
-    "Mboi",
-    "Mixtec, Yucua\u00f1e",
-    "Mwani",
-    "Mandeali",
-    "Mboko",
-    "Mixtec, Yutanduchi",
-    "Mwatebu",
-    "Mander",
-    "Mbole",
-    "Miya",
-    "Mwera",
-    "Mandingo",
-    "Mbonga",
-    "Miyako",
-    "Mwera",
-    "Mandinka",
-    "Mbongno",
-    "Miyobe",
-    "Mwerlap",
-    "Mandja",
-    "Mbore",
-    "Mizo",
-    "Mwimbi-Muthambi",
-    "Mandjak",
-    "Mbosi",
-    "Mlabri",
-    "Mwotlap",
-    "Mandobo Atas",
-    "Mbowe",
-    "Mlahs\u00f6",
-    "Myene",
-    "Mandobo Bawah",
-    "",
-    "Na",
-    "Namla",
-    "Ng\u2019akarimojong",
-    "Nkem-Nkum",
-    "N\u00e1-Meo",
-    "Namo",
-    "Ngala",
-    "N\u2019ko",
-    "Naaba",
-    "Namonuito",
-    "Ngalakan",
-    "Nkongho",
-    "Na\u2019ahai",
-    "Namosi-Naitasiri-Serua",
-    "Ngalum",
-    "Nkonya",
-    "Naami",
-    "Namuyi",
-    "Ngam",
-    "Nkoroo",
-    "Naasioi",
-    "Nanai",
-    "Ngamambo",
-    "Nkoya",
-    "Naba",
-    "Nancere",
-    "Ngambay",
-    "Nkukoli",
-    "Nabak",
-    "Nande",
-    "Ngamini",
-    "Nkumbi",
-    "Nabi",
-    "\u00d1andeva",
-    "Ngamo",
-    "Nkutu",
-    "Nachering",
-    "Nandi",
-    "Nganakarti",
-    "Nnam",
-    "Nad\u00ebb",
-    "Nankina",
-    "Nganasan",
-    "Nobiin",
-    "Nafaanra",
-    "Nanti",
-    "Ngandi",
-    "Nobonob",
-    "Nafi",
-    "Nanticoke",
-    "Ngando",
-    "Nogai",
-    "Nafri",
-    "Nanubae",
-    "Ngando",
-    "Noip\u00e4",
-    "Nafusi",
-    "Napoletano-Calabrese",
-    "Ngandyera",
-    "Noiri",
-    "Naga Pidgin",
-    "Napu",
-    "Ngangam",
-    "Nokuku",
-    "Naga, Akyaung Ari",
-    "Nar Phu",
-    "Ngan\u2019gityemerri",
-    "Nomaande",
-    "Naga, Angami",
-    "Nara",
-    "Ngantangarra",
-    "Nomane",
-    "Naga, Ao",
-    "Narak",
-    "Nganyaywana",
-    "Nomatsigenga",
-    "Naga, Chang",
-    "Narango",
-    "Ngardi",
-    "Nomlaki",
-    "Naga, Chen-Kayu",
-    "Narau",
-    "Ngarigu",
-    "Nomu",
-    "Naga, Chokri",
-    "Nari Nari",
-    "Ngarinman",
-    "Nonuya",
-    "Naga, Chothe",
-    "Narim",
-    "Ngarinyin",
-    "Nooksack",
-    "Naga, Inpui",
-    "Naro",
-    "Ngarla",
-    "Noon",
-    "Naga, Jejara",
-    "Narom",
-    "Ngarluma",
-    "Noone",
-    "Naga, Kharam",
-    "Narragansett",
-    "Ngas",
-    "Nora",
-    "Naga, Khezha",
-    "Narrinyeri",
-    "Ngasa",
-    "Northwestern !Kung",
-    "Naga, Khiamniungan",
-    "Narua",
-    "Ngatik Men\u2019s Creole",
-    "Norwegian",
-    "Naga, Khoibu",
-    "Narungga",
-    "Ngawun",
-    "Norwegian Sign Language",
-    "Naga, Kokak",
-    "Nasal",
-    "Ngayawung",
-    "Norwegian, Traveller",
-    "Naga, Konyak",
-    "Nasarian",
-    "Ngbaka",
-    "Notre",
-    "Naga, Lainong",
-    "Naskapi",
-    "Ngbaka Ma\u2019bo",
-    "Notsi",
-    "Naga, Lao",
-    "Nasu, Wumeng",
-    "Ngbaka Manza",
-    "Nottoway",
-    "Naga, Liangmai",
-    "Nasu, Wusa",
-    "Ngbandi, Northern",
-    "Noy",
-    "Naga, Long Phuri",
-    "Natanzi",
-    "Ngbandi, Southern",
-    "Nsenga",
-    "Naga, Lotha",
-    "Natchez",
-    "Ngbee",
-    "Nshi",
-    "Naga, Makuri",
-    "Nateni",
-    "Ngbinda",
-    "Ntcham",
-    "Naga, Mao",
-    "Nathembo",
-    "Ngbundu",
-    "Ntomba",
-    "Naga, Maram",
-    "Natioro",
-    "Ngelima",
-    "N|u",
-    "Naga, Maring",
-    "Nat\u00fcgu",
-    "Ngemba",
-    "Nuaulu, North",
-    "Naga, Monsang",
-    "Nauete",
-    "Ngendelengo",
-    "Nuaulu, South",
-    "Naga, Moyon",
-    "Nauna",
-    "Ngete",
-    "Nubaca",
-    "Naga, Mzieme",
-    "Nauo",
-    "Nggem",
-    "Nubi",
-    "Naga, Nocte",
-    "Nauruan",
-    "Nggwahyi",
-    "Nubri",
-    "Naga, Northern Rengma",
-    "Navajo",
-    "Ngie",
-    "Nuer",
-    "Naga, Paungnyuan",
-    "Navut",
-    "Ngiemboon",
-    "Nugunu",
-    "Naga, Phom",
-    "Nawaru",
-    "Ngile",
-    "Nugunu",
-    "Naga, Pochuri",
-    "Nawdm",
-    "Ngindo",
-    "Nuk",
-    "Naga, Ponyo-Gongwang",
-    "Nawuri",
-    "Ngiti",
-    "Nukak Mak\u00fa",
-    "Naga, Poumei",
-    "Naxi",
-    "Ngizim",
-    "Nukeria",
-    "Naga, Puimei",
-    "Nayi",
-    "Ngom",
-    "Nukna",
-    "Naga, Rongmei",
-    "Nayini",
-    "Ngomba",
-    "Nukuini",
-    "Naga, Sangtam",
-    "Ncane",
-    "Ngombale",
-    "Nukumanu",
-    "Naga, Southern Rengma",
-    "Nchumbulu",
-    "Ngombe",
-    "Nukunul",
-    "Naga, Sumi",
-    "Ndai",
-    "Ngombe",
-    "Nukuoro",
-    "Naga, Tangkhul",
-    "Ndaka",
-    "Ngongo",
-    "Numana-Nunku-Gbantu-Numbu",
-    "Naga, Tangkhul",
-    "Ndaktup",
-    "Ngoni",
-    "Numanggang",
-    "Naga, Tangshang",
-    "Ndali",
-    "Ngoreme",
-    "Numbami",
-    "Naga, Tarao",
-    "Ndam",
-    "Ngoshie",
-    "Nume",
-    "Naga, Thangal",
-    "Ndamba",
-    "Ngul",
-    "Num\u00e8\u00e8",
-    "Naga, Tutsa",
-    "Ndambomo",
-    "Ngulu",
-    "Nung",
-    "Naga, Wancho",
-    "Nda\u2019nda\u2019",
-    "Nguluwan",
-    "Nungali",
-    "Naga, Yimchungru",
-    "Ndasa",
-    "Ngunawal",
-    "Nunggubuyu",
-    "Naga, Zeme",
-    "Ndau",
-    "Ngundi",
-    "Nungu",
-    "Nagarchal",
-    "Nde-Gbite",
-    "Ngundu",
-    "Nuni, Northern",
-    "Nage",
-    "Nde-Nsele-Nta",
-    "Ngungwel",
-    "Nuni, Southern",
-    "Nago, Northern",
-    "Ndebele",
-    "Ngu\u00f4n",
-    "Nuosu",
-    "Nago, Southern",
-    "Ndebele",
-    "Ngurmbur",
-    "Nupbikha",
-    "Nagumi",
-    "Ndemli",
-    "Ngwaba",
-    "Nupe-Nupe-Tako",
-    "Nahali",
-    "Ndendeule",
-    "Ngwe",
-    "Nusa Laut",
-    "Nahari",
-    "Ndengereko",
-    "Ngwo",
-    "Nusu",
-    "Nahavaq",
-    "Nding",
-    "Nhanda",
-    "Nuu-chah-nulth",
-    "Nahuat",
-    "Ndo",
-    "Nhengatu",
-    "Nya Huba",
-    "Nahuatl, Central",
-    "Ndobo",
-    "Nhirrpi",
-    "Nyabwa",
-    "Nahuatl, Central Huasteca",
-    "Ndoe",
-    "Nhuwala",
-    "Nyaheun",
-    "Nahuatl, Central Puebla",
-    "Ndogo",
-    "Nias",
-    "Nyahkur",
-    "Nahuatl, Coatepec",
-    "Ndolo",
-    "Nicaragua Creole English",
-    "Nyakyusa-Ngonde",
-    "Nahuatl, Eastern Durango",
-    "Ndom",
-    "Nicaraguan Sign Language",
-    "Nyala",
-    "Nahuatl, Eastern Huasteca",
-    "Ndombe",
-    "Nicobarese, Car",
-    "Nyali",
-    "Nahuatl, Guerrero",
-    "Ndonde Hamba",
-    "Nicobarese, Central",
-    "Nyam",
-    "Nahuatl, Highland Puebla",
-    "Ndonga",
-    "Nicobarese, Southern",
-    "Nyamal",
-    "Nahuatl, Huaxcaleca",
-    "Ndoola",
-    "Niellim",
-    "Nyambo",
-    "Nahuatl, Isthmus-Cosoleacaque",
-    "Ndra\u2019ngith",
-    "Nigerian Sign Language",
-    "Nyamusa-Molo",
-    "Nahuatl, Isthmus-Mecayapan",
-    "Nduga",
-    "Nihali",
-    "Nyamwanga",
-    "Nahuatl, Isthmus-Pajapan",
-    "Ndumu",
-    "Nii",
-    "Nyamwezi",
-    "Nahuatl, Michoac\u00e1n",
-    "Ndunda",
-    "Niksek",
-    "Nyaneka",
-    "Nahuatl, Morelos",
-    "Ndunga",
-    "Nikyob-Nindem",
-    "Nyanga",
-    "Nahuatl, Northern Oaxaca",
-    "Ndut",
-    "Nila",
-    "Nyanga-li",
-    "Nahuatl, Northern Puebla",
-    "Ndyuka-Trio Pidgin",
-    "Nilamba",
-    "Nyangatom",
-    "Nahuatl, Ometepec",
-    "Nedebang",
-    "Nimadi",
-    "Nyangbo",
-    "Nahuatl, Orizaba",
-    "Nefamese",
-    "Nimanbur",
-    "Nyangga",
-    "Nahuatl, Santa Mar\u00eda la Alta",
-    "Negerhollands",
-    "Nimbari",
-    "Nyang\u2019i",
-    "Nahuatl, Sierra Negra",
-    "Negeri Sembilan Malay",
-    "Nimboran",
-    "Nyangumarta",
-    "Nahuatl, Southeastern Puebla",
-    "Negidal",
-    "Nimi",
-    "Nyankore",
-    "Nahuatl, Tabasco",
-    "Nehan",
-    "Nimo",
-    "Nyankpa",
-    "Nahuatl, Temascaltepec",
-    "Nek",
-    "Ninam",
-    "Nyaturu",
-    "Nahuatl, Tetelcingo",
-    "Nekgini",
-    "Ninde",
-    "Nyaw",
-    "Nahuatl, Tlamacazapa",
-    "Neko",
-    "Nindi",
-    "Nyawaygi",
-    "Nahuatl, Western Durango",
-    "Neku",
-    "Ningera",
-    "Nyel\u00e2yu",
-    "Nahuatl, Western Huasteca",
-    "N\u00eal\u00eamwa-Nixumwak",
-    "Ninggerum",
-    "Nyemba",
-    "Nahuatl, Zacatl\u00e1n-Ahuacatl\u00e1n-Tepetzintla",
-    "Nema",
-    "Ningil",
-    "Nyengo",
-    "Nai",
-    "Neme",
-    "Ningye",
-    "Nyenkha",
-    "Naka\u2019ela",
-    "Nemi",
-    "Ninzo",
-    "Nyeshangte",
-    "Nakai",
-    "Nen",
-    "Nipsan",
-    "Nyeu",
-    "Nakame",
-    "Nend",
-    "Nisa",
-    "Nyigina",
-    "Nakanai",
-    "Nenets",
-    "Nisenan",
-    "Nyiha, Malawi",
-    "Nakara",
-    "Nengone",
-    "Nisga\u2019a",
-    "Nyiha, Tanzania",
-    "Nake",
-    "Nepalese Sign Language",
-    "Nisi",
-    "Nyika",
-    "Naki",
-    "Nepali",
-    "Nisu, Eastern",
-    "Nyika, Tanzania",
-    "Nakwi",
-    "Nepali",
-    "Nisu, Northern",
-    "Nyindrou",
-    "Nalca",
-    "Nete",
-    "Nisu, Northwestern",
-    "Nyindu",
-    "Nali",
-    "Neve\u2019ei",
-    "Nisu, Southern",
-    "Nyishi",
-    "Nalik",
-    "Neverver",
-    "Nisu, Southwestern",
-    "Nyiyaparli",
-    "Nal\u00f6go",
-    "New Zealand Sign Language",
-    "Niuafo\u2019ou",
-    "Nyokon",
-    "Nalu",
-    "Newar",
-    "Niue",
-    "Nyole",
-    "Naluo",
-    "Neyo",
-    "Nivacl\u00e9",
-    "Nyong",
-    "Nama",
-    "Nez Perce",
-    "Niwer Mil",
-    "Nyoro",
-    "Namakura",
-    "Ngaanyatjarra",
-    "Njalgulgule",
-    "Nyulnyul",
-    "Namat",
-    "Ng\u00e4bere",
-    "Njebi",
-    "Nyunga",
-    "Nambiku\u00e1ra, Southern",
-    "Ngad\u2019a",
-    "Njen",
-    "Nyungwe",
-    "Nambo",
-    "Ngad\u2019a, Eastern",
-    "Njerep",
-    "Nzakambay",
-    "Nambya",
-    "Ngadjunmaya",
-    "Njyem",
-    "Nzakara",
-    "Namia",
-    "Ngadjuri",
-    "Nkami",
-    "Nzanyi",
-    "Namiae",
-    "Ngaing",
-    "Nkangala",
-    "Nzema",
-    "Namibian Sign Language",
-    "Ngaju",
-    "Nkari",
-    "",
-    "Obanliku",
-    "Okobo",
-    "One, Southern",
-    "Oromo, West Central",
-    "Obispe\u00f1o",
-    "Okodia",
-    "Oneida",
-    "Oroqen",
-    "Oblo",
-    "Okolod",
-    "Ong",
-    "Orowe",
-    "Obokuitai",
-    "Okpamheri",
-    "\u00d6\u00f1ge",
-    "Oruma",
-    "Obolo",
-    "Okpe",
-    "Ongota",
-    "Orya",
-    "Obulom",
-    "Okpe",
-    "Onin",
-    "Osage",
-    "Ocaina",
-    "Oksapmin",
-    "Onin Based Pidgin",
-    "Osatu",
-    "Occitan",
-    "Oku",
-    "Oniyan",
-    "Oshiwambo",
-    "O\u2019chi\u2019chi\u2019",
-    "Olekha",
-    "Onjob",
-    "Osing",
-    "Od",
-    "Olkol",
-    "Ono",
-    "Ososo",
-    "Odia",
-    "Olo",
-    "Onobasulu",
-    "Ossetic",
-    "Odiai",
-    "Oloma",
-    "Onondaga",
-    "Ot Danum",
-    "Odoodee",
-    "Olrat",
-    "Ontenu",
-    "Otank",
-    "O\u2019du",
-    "Olu\u2019bo",
-    "Ontong Java",
-    "Oti",
-    "Odual",
-    "Olukhayo",
-    "Oorlams",
-    "Otomi, Eastern Highland",
-    "Odut",
-    "Olulumo-Ikom",
-    "Opao",
-    "Otom\u00ed, Estado de M\u00e9xico",
-    "Ofay\u00e9",
-    "Oluluyia",
-    "Opata",
-    "Otomi, Ixtenco",
-    "Ogbah",
-    "Olumarachi",
-    "Orang Kanaq",
-    "Otomi, Mezquital",
-    "Ogbia",
-    "Olumarama",
-    "Orang Seletar",
-    "Otomi, Quer\u00e9taro",
-    "Ogbogolo",
-    "Olunyole",
-    "Oring",
-    "Otomi, Temoaya",
-    "Ogbronuagum",
-    "Olushisa",
-    "Oriya",
-    "Otomi, Tenango",
-    "Ogea",
-    "Olutsotso",
-    "Oriya, Adivasi",
-    "Otomi, Texcatepec",
-    "Ohlone, Northern",
-    "Oluwanga",
-    "Orma",
-    "Otomi, Tilapa",
-    "Ohlone, Southern",
-    "Omagua",
-    "Ormu",
-    "Otoro",
-    "Oirata",
-    "Omaha-Ponca",
-    "Ormuri",
-    "Ottawa",
-    "Ojibwa",
-    "Ombamba",
-    "Oro",
-    "Otuho",
-    "Ojibwa, Central",
-    "Ombo",
-    "Oro Win",
-    "Otuke",
-    "Ojibwa, Eastern",
-    "Omi",
-    "Oroch",
-    "Ouma",
-    "Ojibwa, Northwestern",
-    "\u00d6mie",
-    "Oroha",
-    "Oune",
-    "Ojibwa, Severn",
-    "Omotik",
-    "Orok",
-    "\u00d6vdalian",
-    "Ojibwa, Western",
-    "Omurano",
-    "Orokaiva",
-    "Owa",
-    "Okanagan",
-    "Ona",
-    "Oroko",
-    "Owenia",
-    "Oki-No-Erabu",
-    "One, Inebu",
-    "Orokolo",
-    "Owiniga",
-    "Okiek",
-    "One, Kabore",
-    "Oromo",
-    "Oy",
-    "Okinawan, Central",
-    "One, Kwamtim",
-    "Oromo, Borana-Arsi-Guji",
-    "Oya\u2019oya",
-    "Oko-Eni-Osayen",
-    "One, Molmo",
-    "Oromo, Eastern",
-    "Oyda",
-    "Oko-Juwoi",
-    "One, Northern",
-    "",
-    "Pa Di",
-    "Pa\u2019o",
-    "Phake",
-    "Pomo, Northeastern",
-    "Pa-Hng",
-    "Papapana",
-    "Phala",
-    "Pomo, Northern",
-    "Pa\u2019a",
-    "Papar",
-    "Phana\u2019",
-    "Pomo, Southeastern",
-    "P\u00e1\u00e1fang",
-    "Papasena",
-    "Phangduwali",
-    "Pomo, Southern",
-    "Paakantyi",
-    "Papel",
-    "Phende",
-    "Ponam",
-    "Paama",
-    "Papi",
-    "Phimbi",
-    "Ponosakan",
-    "Paasaal",
-    "Papiamentu",
-    "Phola",
-    "Pontic",
-    "Pacahuara",
-    "Papitalai",
-    "Phola, Alo",
-    "Popoloca, Coyotepec",
-    "Pacoh",
-    "Papora-Hoanya",
-    "Pholo",
-    "Popoloca, Mezontla",
-    "Padoe",
-    "Papua New Guinean Sign Language",
-    "Phong-Kniang",
-    "Popoloca, San Felipe Otlaltepec",
-    "P\u00e1ez",
-    "Papuma",
-    "Phowa, Ani",
-    "Popoloca, San Juan Atzingo",
-    "Pagi",
-    "Parachi",
-    "Phowa, Hlepho",
-    "Popoloca, San Lu\u00eds Temalacayuca",
-    "Pagibete",
-    "Paraguayan Sign Language",
-    "Phowa, Labo",
-    "Popoloca, San Marcos Tlacoyalco",
-    "Pagu",
-    "Parakan\u00e3",
-    "Phu Thai",
-    "Popoloca, Santa In\u00e9s Ahuatempan",
-    "Pahari, Kullu",
-    "Paranan",
-    "Phuan",
-    "Popoluca, Highland",
-    "Pahari, Mahasu",
-    "Paranaw\u00e1t",
-    "Phudagi",
-    "Popoluca, Oluta",
-    "Pahari-Potwari",
-    "Paraujano",
-    "Phuie",
-    "Popoluca, Sayula",
-    "Pahi",
-    "Parawen",
-    "Phula",
-    "Popoluca, Texistepec",
-    "Pahlavani",
-    "Pardhan",
-    "Phuma",
-    "Poqomam",
-    "Pai Tavytera",
-    "Pardhi",
-    "Phunoi",
-    "Poqomchi\u2019",
-    "Paic\u00ee",
-    "Pare",
-    "Phuong",
-    "Porohanon",
-    "Paipai",
-    "Parec\u00eds",
-    "Phupa",
-    "Port Sandwich",
-    "Paiute, Northern",
-    "Parenga",
-    "Phupha",
-    "Port Vato",
-    "Paiwan",
-    "P\u00e4ri",
-    "Phuza",
-    "Portuguese",
-    "Pak-Tong",
-    "Parkwa",
-    "Piamatsina",
-    "Portuguese Sign Language",
-    "Paka\u00e1snovos",
-    "Parsi",
-    "Piame",
-    "Potawatomi",
-    "Pakanha",
-    "Parsi-Dari",
-    "Piapoco",
-    "Potigu\u00e1ra",
-    "Pakistan Sign Language",
-    "Parya",
-    "Piaroa",
-    "Pouye",
-    "Paku",
-    "Pashai, Northeast",
-    "Picard",
-    "Powari",
-    "Pal",
-    "Pashai, Northwest",
-    "Pidgin Bantu",
-    "Powhatan",
-    "Palatinate Franconian",
-    "Pashai, Southeast",
-    "Pidgin, Cameroon",
-    "Poyan\u00e1wa",
-    "Palauan",
-    "Pashai, Southwest",
-    "Pidgin, Nigerian",
-    "Prai",
-    "Palaung, Ruching",
-    "Pashto, Central",
-    "Pidgin, Timor",
-    "Prasuni",
-    "Palaung, Rumai",
-    "Pashto, Northern",
-    "Piedmontese",
-    "Principense",
-    "Palaung, Shwe",
-    "Pashto, Southern",
-    "Pijao",
-    "Providencia Sign Language",
-    "Palawano, Brooke\u2019s Point",
-    "Pasi",
-    "Pije",
-    "Prussian",
-    "Palawano, Central",
-    "Patamona",
-    "Pijin",
-    "Psikye",
-    "Palawano, Southwest",
-    "Patani",
-    "Pilag\u00e1",
-    "Puare",
-    "Paleni",
-    "Patax\u00f3 H\u00e3-Ha-H\u00e3e",
-    "Pima Bajo",
-    "Puelche",
-    "Palenquero",
-    "Patep",
-    "Pimbwe",
-    "Puerto Rican Sign Language",
-    "Pali",
-    "Pathiya",
-    "Pinai-Hagahai",
-    "Puinave",
-    "Palik\u00far",
-    "Patpatar",
-    "Pingelapese",
-    "Pukapuka",
-    "Paliyan",
-    "Pattani",
-    "Pini",
-    "Pulaar",
-    "Pallanganmiddang",
-    "Pattapu",
-    "Pinigura",
-    "Pulabu",
-    "Paloor",
-    "Patwin",
-    "Pinjarup",
-    "Pular",
-    "Palpa",
-    "Paulohi",
-    "Pinji",
-    "Puluwatese",
-    "Palu\u2019e",
-    "Paumar\u00ed",
-    "Pintiini",
-    "Puma",
-    "Palula",
-    "Paunaka",
-    "Pintupi-Luritja",
-    "Pum\u00e9",
-    "Pam",
-    "Pauserna",
-    "Pinyin",
-    "Pumi, Northern",
-    "Pambia",
-    "Pawaia",
-    "Pirah\u00e3",
-    "Pumi, Southern",
-    "Pame, Central",
-    "Pawnee",
-    "Piratapuyo",
-    "Punan Aput",
-    "Pame, Northern",
-    "Pe",
-    "Pirlatapa",
-    "Punan Batu",
-    "Pame, Southern",
-    "Pear",
-    "Pirriya",
-    "Punan Merah",
-    "Pamona",
-    "Pech",
-    "Pisabo",
-    "Punan Merap",
-    "Pamosu",
-    "Peere",
-    "Piscataway",
-    "Punan Tubu",
-    "Pampangan",
-    "Pei",
-    "Pitcairn-Norfolk",
-    "Punjabi, Eastern",
-    "Pana",
-    "Pekal",
-    "Piti",
-    "Punjabi, Western",
-    "Pana",
-    "Pela",
-    "Pitjantjatjara",
-    "Punthamara",
-    "Panamanian Sign Language",
-    "Pele-Ata",
-    "Pitta Pitta",
-    "Punu",
-    "Panar\u00e1",
-    "Pelende",
-    "Piu",
-    "Puoc",
-    "Panasuan",
-    "Pemon",
-    "Piya-Kwonci",
-    "Puragi",
-    "Panawa",
-    "P\u00e9mono",
-    "Plains Indian Sign Language",
-    "Purari",
-    "Pancana",
-    "Penan, Bah-Biau",
-    "Plautdietsch",
-    "Purepecha",
-    "Panchpargania",
-    "Penan, Eastern",
-    "Playero",
-    "Purepecha, Western Highland",
-    "Pande",
-    "Penan, Western",
-    "Pnar",
-    "Puri",
-    "Pangasinan",
-    "Penang Sign Language",
-    "Pogolo",
-    "Purik",
-    "Pangkhua",
-    "Penchal",
-    "Pohnpeian",
-    "Purisime\u00f1o",
-    "Pangseng",
-    "Pendau",
-    "Pokang\u00e1",
-    "Puroik",
-    "Pangu",
-    "Pengo",
-    "Poke",
-    "Purubor\u00e1",
-    "Pangwa",
-    "Penrhyn",
-    "P\u00f6koot",
-    "Purum",
-    "Pangwali",
-    "Perai",
-    "Pol",
-    "Pushto",
-    "Panim",
-    "Pero",
-    "Polari",
-    "Putai",
-    "Paniya",
-    "Persian",
-    "Polci",
-    "Putoh",
-    "Pankarar\u00e9",
-    "Persian Sign Language",
-    "Polish",
-    "Puyuma",
-    "Pankarar\u00fa",
-    "Persian, Iranian",
-    "Polish Sign Language",
-    "Pwaamei",
-    "Pannei",
-    "Peruvian Sign Language",
-    "Polonombauk",
-    "Pwapw\u00e2",
-    "Pano",
-    "Petats",
-    "Pom",
-    "Pyapun",
-    "Panobo",
-    "Petjo",
-    "Pomo, Central",
-    "Pyen",
-    "Pantar, Western",
-    "P\u00e9v\u00e9",
-    "Pomo, Eastern",
-    "Pyu",
-    "Panytyima",
-    "",
-    "Qabiao",
-    "Quechua, Ayacucho",
-    "Quechua, Lambayeque",
-    "Queyu",
-    "Q\u2019anjob\u2019al",
-    "Quechua, Cajamarca",
-    "Quechua, Margos-Yarowilca-Lauricocha",
-    "Quichua, Calder\u00f3n Highland",
-    "Qaqet",
-    "Quechua, Cajatambo North Lima",
-    "Quechua, North Bolivian",
-    "Quichua, Ca\u00f1ar Highland",
-    "Qau",
-    "Quechua, Chachapoyas",
-    "Quechua, North Jun\u00edn",
-    "Quichua, Chimborazo Highland",
-    "Qawasqar",
-    "Quechua, Chaupihuaranga",
-    "Quechua, Northern Conchucos Ancash",
-    "Quichua, Imbabura Highland",
-    "Q\u2019eqchi\u2019",
-    "Quechua, Chincha",
-    "Quechua, Pacaraos",
-    "Quichua, Loja Highland",
-    "Qiang, Northern",
-    "Quechua, Chiqui\u00e1n",
-    "Quechua, Panao",
-    "Quichua, Napo",
-    "Qiang, Southern",
-    "Quechua, Corongo Ancash",
-    "Quechua, Puno",
-    "Quichua, Northern Pastaza",
-    "Qimant",
-    "Quechua, Cusco",
-    "Quechua, San Mart\u00edn",
-    "Quichua, Salasaca Highland",
-    "Quapaw",
-    "Quechua, Eastern Apur\u00edmac",
-    "Quechua, Santa Ana de Tusi Pasco",
-    "Quichua, Santiago del Estero",
-    "Quebec Sign Language",
-    "Quechua, Huallaga",
-    "Quechua, Sihuas Ancash",
-    "Quichua, Tena Lowland",
-    "Quechan",
-    "Quechua, Huamal\u00edes-Dos de Mayo Hu\u00e1nuco",
-    "Quechua, South Bolivian",
-    "Quileute",
-    "Quechua",
-    "Quechua, Huaylas Ancash",
-    "Quechua, Southern Conchucos",
-    "Quinault",
-    "Quechua, Ambo-Pasco",
-    "Quechua, Huaylla Wanca",
-    "Quechua, Southern Pastaza",
-    "Quinqui",
-    "Quechua, Arequipa-La Uni\u00f3n",
-    "Quechua, Jauja Wanca",
-    "Quechua, Yauyos",
-    "",
-    "Rabha",
-    "Rawat",
-    "Rikbaktsa",
-    "Romblomanon",
-    "Rade",
-    "Rawo",
-    "Rikou",
-    "Rombo",
-    "Rahambuu",
-    "Razajerdi",
-    "Ripuarian",
-    "Romkun",
-    "Rajasthani",
-    "R\u0101zi\u1e25\u012b",
-    "Ririo",
-    "Ron",
-    "Rajbanshi",
-    "Reel",
-    "Ritarungo",
-    "Ronga",
-    "Raji",
-    "Rejang",
-    "Riung",
-    "Rongga",
-    "Rajong",
-    "Reli",
-    "Rmeet",
-    "Rongpo",
-    "Rakahanga-Manihiki",
-    "Rema",
-    "Roglai, Cacgia",
-    "Ronji",
-    "Rakhine",
-    "Rembarunga",
-    "Roglai, Northern",
-    "Roon",
-    "Ralte",
-    "Rembong",
-    "Roglai, Southern",
-    "Roria",
-    "Rama",
-    "Remo",
-    "Rogo",
-    "Rotokas",
-    "Ramoaaina",
-    "Rempi",
-    "Rohingya",
-    "Rotuman",
-    "Ramopa",
-    "Remun",
-    "Roma",
-    "Roviana",
-    "Rampi",
-    "Rendille",
-    "Romagnol",
-    "Rudbari",
-    "Rang",
-    "Rengao",
-    "Romam",
-    "Rufiji",
-    "Rangkas",
-    "Rennell-Bellona",
-    "Romani, Balkan",
-    "Ruga",
-    "Ranglong",
-    "Repanbitip",
-    "Romani, Baltic",
-    "Rukai",
-    "Rangpuri",
-    "Rer Bare",
-    "Romani, Carpathian",
-    "Ruma",
-    "Rao",
-    "Rerau",
-    "Romani, Kalo Finnish",
-    "Rumu",
-    "Rapa",
-    "Rerep",
-    "Romani, Sinte",
-    "Rundi",
-    "Rapa Nui",
-    "Reshe",
-    "Romani, Tavringer",
-    "Runga",
-    "Rapoisi",
-    "Res\u00edgaro",
-    "Romani, Vlax",
-    "Rungus",
-    "Rapting",
-    "Reta",
-    "Romani, Welsh",
-    "Rungwa",
-    "Rasawa",
-    "R\u00e9union Creole French",
-    "Romanian",
-    "Russian",
-    "Ratagnon",
-    "Reyesano",
-    "Romanian Sign Language",
-    "Russian Sign Language",
-    "Ratahan",
-    "Riang",
-    "Romanian, Istro",
-    "Rusyn",
-    "Rathawi",
-    "Riang Lai",
-    "Romanian, Megleno",
-    "Rutul",
-    "Raute",
-    "Riang Lang",
-    "Romano-Greek",
-    "Ruuli",
-    "Ravula",
-    "Riantana",
-    "Romano-Serbian",
-    "Ruund",
-    "Rawa",
-    "Ribun",
-    "Romansh",
-    "Rwa",
-    "Rawang",
-    "Rifao",
-    "Romany",
-    "",
-    "Sa",
-    "Sarli",
-    "Sharanahua",
-    "Sokoro",
-    "Sa\u2019a",
-    "Sarsi",
-    "Shark Bay",
-    "Soli",
-    "Saafi-Saafi",
-    "Sartang",
-    "Sharwa",
-    "Solomon Islands Sign Language",
-    "Saam",
-    "Sarua",
-    "Shasta",
-    "Solong",
-    "Saami, Akkala",
-    "Sarudu",
-    "Shatt",
-    "Solos",
-    "Saami, Inari",
-    "Saruga",
-    "Shau",
-    "Som",
-    "Saami, Kildin",
-    "Sasak",
-    "Shawi",
-    "Somali",
-    "Saami, Lule",
-    "Sasaru",
-    "Shawnee",
-    "Somba-Siawari",
-    "Saami, North",
-    "Satawalese",
-    "She",
-    "Somrai",
-    "Saami, Pite",
-    "Sater\u00e9-Maw\u00e9",
-    "Shehri",
-    "Somray",
-    "Saami, Skolt",
-    "Saterfriesisch",
-    "Shekhawati",
-    "Somyev",
-    "Saami, South",
-    "Saudi Arabian Sign Language",
-    "Shekkacho",
-    "Sonaga",
-    "Saami, Ter",
-    "Saurashtra",
-    "Sheko",
-    "Sonde",
-    "Saami, Ume",
-    "Sauri",
-    "Shelta",
-    "Songe",
-    "Saamia",
-    "Sauria Paharia",
-    "Shendu",
-    "Songhay, Humburi Senni",
-    "Saaroa",
-    "Sause",
-    "Sheni",
-    "Songhay, Koyra Chiini",
-    "Saba",
-    "Sausi",
-    "Sherbro",
-    "Songhay, Koyraboro Senni",
-    "Sa\u2019ban",
-    "Savi",
-    "Sherdukpen",
-    "Songo",
-    "Saban\u00ea",
-    "Savosavo",
-    "Sherpa",
-    "Songo",
-    "Sabaot",
-    "Sawai",
-    "Shi",
-    "Songomeno",
-    "Sab\u00fcm",
-    "Saweru",
-    "Shiki",
-    "Songoora",
-    "Sadri",
-    "Sawi",
-    "Shilluk",
-    "Sonha",
-    "Sadri, Oraon",
-    "Sawila",
-    "Shina",
-    "Sonia",
-    "Saek",
-    "Sawknah",
-    "Shina, Kohistani",
-    "Soninke",
-    "Saep",
-    "Saxon, East Frisian Low",
-    "Shipibo-Conibo",
-    "Sonsorolese",
-    "Safaliba",
-    "Saxon, Low",
-    "Shixing",
-    "Soo",
-    "Safeyoka",
-    "Saxon, Upper",
-    "Sholaga",
-    "Sop",
-    "Safwa",
-    "Saya",
-    "Shom Peng",
-    "Soqotri",
-    "Sagala",
-    "Scots",
-    "Shona",
-    "Sora",
-    "Sagalla",
-    "Scottish Gaelic",
-    "Shoo-Minda-Nye",
-    "Sorbian, Lower",
-    "Saho",
-    "Sea Island Creole English",
-    "Shor",
-    "Sorbian, Upper",
-    "Sahu",
-    "Seba",
-    "Shoshoni",
-    "Sori-Harengan",
-    "Saint Lucian Creole French",
-    "Sebat Bet Gurage",
-    "Shua",
-    "Sorkhei",
-    "Saisiyat",
-    "Seberuang",
-    "Shuadit",
-    "Sorsoganon, Northern",
-    "Sajau Basap",
-    "Sebop",
-    "Shuar",
-    "Sorsoganon, Southern",
-    "Sakachep",
-    "Sebuyau",
-    "Shubi",
-    "Sos Kundi",
-    "Sakao",
-    "Sechelt",
-    "Shughni",
-    "Sotho, Northern",
-    "Sakapulteko",
-    "Secoya",
-    "Shumashti",
-    "Sotho, Southern",
-    "Sakata",
-    "Sedang",
-    "Shumcho",
-    "Sou",
-    "Sake",
-    "Sedoa",
-    "Shuswap",
-    "Sou Nama",
-    "Sakirabi\u00e1",
-    "Seeku",
-    "Shuwa-Zamani",
-    "Sou Upaa",
-    "Sala",
-    "Segai",
-    "Shwai",
-    "South African Sign Language",
-    "Salampasu",
-    "Segeju",
-    "Sialum",
-    "Southern Lushootseed",
-    "Salar",
-    "Seget",
-    "Siamou",
-    "Sowa",
-    "Salas",
-    "Sehwi",
-    "Sian",
-    "Sowanda",
-    "Salchuq",
-    "Seimat",
-    "Siane",
-    "Sowari",
-    "Saleman",
-    "Seit-Kaitetu",
-    "Siang",
-    "Spanish",
-    "Saliba",
-    "Sekak",
-    "Siar-Lak",
-    "Spanish Sign Language",
-    "S\u00e1liba",
-    "Sekani",
-    "Siawi",
-    "Spanish, Charapa",
-    "Salinan",
-    "Sekapan",
-    "Sibe",
-    "Spiti Bhoti",
-    "Salish, Straits",
-    "Sekar",
-    "Sicilian",
-    "Spokane",
-    "Sallands",
-    "Seke",
-    "Sidamo",
-    "Squamish",
-    "Salt-Yui",
-    "Seke",
-    "Sie",
-    "Sranan",
-    "Saluan",
-    "Seki",
-    "Sierra Leone Sign Language",
-    "Sri Lankan Creole Malay",
-    "Salum\u00e1",
-    "Seko Padang",
-    "Sighu",
-    "Sri Lankan Sign Language",
-    "Salvadoran Sign Language",
-    "Seko Tengah",
-    "Sign Language of the Netherlands",
-    "Stellingwerfs",
-    "Sam",
-    "Sekpele",
-    "Sihan",
-    "Stieng, Budeh",
-    "Sama",
-    "Selangor Sign Language",
-    "Sika",
-    "Stieng, Bulo",
-    "Sama, Balangingih",
-    "Selaru",
-    "Sikaiana",
-    "Stod Bhoti",
-    "Sama, Central",
-    "Selayar",
-    "Sikaritai",
-    "sTodsde",
-    "Sama, Pangutaran",
-    "Selee",
-    "Sikiana",
-    "Stoney",
-    "Sama, Southern",
-    "Selepet",
-    "Sikkimese",
-    "Suabo",
-    "Samaritan",
-    "Selkup",
-    "Sikule",
-    "Suarmin",
-    "Samaritan Aramaic",
-    "Seluwasan",
-    "Sila",
-    "Suau",
-    "Samarokena",
-    "Semai",
-    "Silesian",
-    "Suba",
-    "Samatao",
-    "Semandang",
-    "Silesian, Lower",
-    "Suba-Simbiti",
-    "Samay",
-    "Semaq Beri",
-    "Silimo",
-    "Subanen, Central",
-    "Samba",
-    "Semelai",
-    "Siliput",
-    "Subanen, Eastern",
-    "Samba Daka",
-    "Semimi",
-    "Silopi",
-    "Subanen, Northern",
-    "Samba Leko",
-    "Semnam",
-    "Silt\u2019e",
-    "Subanen, Southern",
-    "Sambal",
-    "Semnani",
-    "Simaa",
-    "Subanon, Kolibugan",
-    "Sambal, Botolan",
-    "Sempan",
-    "Simba",
-    "Subanon, Western",
-    "Sambalpuri",
-    "Sena",
-    "Simbali",
-    "Subtiaba",
-    "Sambe",
-    "Sena, Malawi",
-    "Simbari",
-    "Sudest",
-    "Samberigi",
-    "Senaya",
-    "Simbo",
-    "Suena",
-    "Samburu",
-    "Sene",
-    "Simeku",
-    "Suga",
-    "Samei",
-    "Seneca",
-    "Simeulue",
-    "Suganga",
-    "Samo",
-    "Sened",
-    "Simte",
-    "Sugut Dusun",
-    "Samo, Matya",
-    "Sengele",
-    "Sinagen",
-    "Sui",
-    "Samo, Maya",
-    "Sengo",
-    "Sinasina",
-    "Suki",
-    "Samo, Southern",
-    "Sengseng",
-    "Sinaugoro",
-    "Suku",
-    "Samoan",
-    "Senhaja Berber",
-    "Sindhi",
-    "Sukuma",
-    "Samogitian",
-    "S\u00e9noufo, Cebaara",
-    "Sindhi Bhil",
-    "Sukur",
-    "Samosa",
-    "S\u00e9noufo, Djimini",
-    "Singa",
-    "Sukurum",
-    "Sampang",
-    "S\u00e9noufo, Mamara",
-    "Singapore Sign Language",
-    "Sula",
-    "Samre",
-    "S\u00e9noufo, Nanerig\u00e9",
-    "Singpho",
-    "Sulka",
-    "Samtao",
-    "S\u00e9noufo, Nyarafolo",
-    "Sinhala",
-    "Sulod",
-    "Samvedi",
-    "S\u00e9noufo, Palaka",
-    "Sinicized Miao",
-    "Suma",
-    "San Miguel Creole French",
-    "S\u00e9noufo, Senara",
-    "Sininkere",
-    "Sumariup",
-    "Sanapan\u00e1",
-    "S\u00e9noufo, Shempire",
-    "Sinsauru",
-    "Sumau",
-    "Sandawe",
-    "S\u00e9noufo, S\u00ecc\u00ect\u00e9",
-    "Sinyar",
-    "Sumbawa",
-    "Sanga",
-    "S\u00e9noufo, Supyire",
-    "Sio",
-    "Sumbwa",
-    "Sanga",
-    "S\u00e9noufo, Syenara",
-    "Siona",
-    "Sunam",
-    "Sanggau",
-    "S\u00e9noufo, Tagwana",
-    "Sipakapense",
-    "Sunda",
-    "Sangil",
-    "Sensi",
-    "Sira",
-    "Sunum",
-    "Sangir",
-    "Sentani",
-    "Siraya",
-    "Sunwar",
-    "Sangisari",
-    "Sentinel",
-    "Siri",
-    "Sur",
-    "Sangkong",
-    "Sepa",
-    "Siriano",
-    "Surbakhal",
-    "Sanglechi",
-    "Sepa",
-    "Sirion\u00f3",
-    "Surgujia",
-    "Sango",
-    "Sera",
-    "Sirmauri",
-    "Suri",
-    "Sango, Riverain",
-    "Serbian",
-    "Siroi",
-    "Surigaonon",
-    "Sangu",
-    "Serbo-Croatian",
-    "Sirva",
-    "Surjapuri",
-    "Sangu",
-    "Sere",
-    "Sisaala, Tumulung",
-    "Sursurunga",
-    "Sani",
-    "Serer-Sine",
-    "Sisaala, Western",
-    "Suruah\u00e1",
-    "Sanie",
-    "Seri",
-    "S\u00eesh\u00eb\u00eb",
-    "Surubu",
-    "Saniyo-Hiyewe",
-    "Serili",
-    "Sissala",
-    "Suru\u00ed",
-    "Sansi",
-    "Seroa",
-    "Sissano",
-    "Suru\u00ed do Par\u00e1",
-    "Sanskrit",
-    "Serrano",
-    "Siuslaw",
-    "Susu",
-    "Santhali",
-    "Seru",
-    "Sivandi",
-    "Susuami",
-    "Sanum\u00e1",
-    "Serua",
-    "Siwai",
-    "Suundi",
-    "S\u00e3otomense",
-    "Serui-Laut",
-    "Siwi",
-    "Su\u2019ung",
-    "Saparua",
-    "Seta",
-    "Siwu",
-    "Suwawa",
-    "Sap\u00e9",
-    "Setaman",
-    "Skagit",
-    "Suy\u00e1",
-    "Sapo",
-    "Seti",
-    "Skepi Creole Dutch",
-    "Svan",
-    "Saponi",
-    "Settla",
-    "Skou",
-    "Swabian",
-    "Saposa",
-    "Sewa Bay",
-    "Slave",
-    "Swahili",
-    "Sapuan",
-    "Seychelles Creole French",
-    "Slavey, North",
-    "Swahili",
-    "Sar",
-    "Sezo",
-    "Slavey, South",
-    "Swahili, Congo",
-    "Sara Kaba",
-    "Sha",
-    "Slavomolisano",
-    "Swati",
-    "Saraiki",
-    "Shabak",
-    "Slavonic, Church",
-    "Swedish",
-    "Saramaccan",
-    "Shabo",
-    "Slovak",
-    "Swedish Sign Language",
-    "Sarasira",
-    "Shahmirzadi",
-    "Slovakian Sign Language",
-    "Swiss-French Sign Language",
-    "Saraveca",
-    "Shahrudi",
-    "Slovene",
-    "Swiss-German Sign Language",
-    "Sardinian",
-    "Shall-Zwall",
-    "Snohomish",
-    "Swiss-Italian Sign Language",
-    "Sardinian, Campidanese",
-    "Shama-Sambuga",
-    "So",
-    "Swo",
-    "Sardinian, Gallurese",
-    "Shamang",
-    "So",
-    "Sylheti",
-    "Sardinian, Logudorese",
-    "Shambala",
-    "So\u2019a",
-    "Syriac",
-    "Sardinian, Sassarese",
-    "Shan",
-    "Sobei",
-    "Syriac",
-    "Sari",
-    "Shanenawa",
-    "Soga",
-    "Syuba",
-    "Sarikoli",
-    "Shanga",
-    "Soi",
-    "",
-    "Taabwa",
-    "Tarahumara, Southeastern",
-    "Tharu, Madhya Ksetriya",
-    "Totonac, Xicotepec de Ju\u00e1rez",
-    "Tabaru",
-    "Tarahumara, Southwestern",
-    "Tharu, Madhya-Purbiya",
-    "Totonac, Yecuatla",
-    "Tabasaran",
-    "Tarahumara, Western",
-    "Tharu, Rana",
-    "Totonaco del cerro Xinolat\u00e9petl",
-    "Tabla",
-    "Tarangan, East",
-    "Thawa",
-    "Totoro",
-    "Tabo",
-    "Tarangan, West",
-    "Thayore",
-    "Touo",
-    "Tabriak",
-    "Tareng",
-    "Thaypan",
-    "Toura",
-    "Tacana",
-    "Tariana",
-    "Themne",
-    "Toura",
-    "Tachawit",
-    "Tarifit",
-    "Thiin",
-    "Toussian, Northern",
-    "Tachelhit",
-    "Tarjumo",
-    "Tho",
-    "Toussian, Southern",
-    "Tadaksahak",
-    "Tarok",
-    "Thompson",
-    "Towei",
-    "Tado",
-    "Taroko",
-    "Thopho",
-    "Traveller Danish",
-    "Tadyawan",
-    "Taromi, Upper",
-    "Thu Lao",
-    "Traveller Scottish",
-    "Tae\u2019",
-    "Tarpia",
-    "Thudam",
-    "Tregami",
-    "Tafi",
-    "Taruma",
-    "Thulung",
-    "Trememb\u00e9",
-    "Tagabawa",
-    "Tasawaq",
-    "Thur",
-    "Trieng",
-    "Tagakaulo",
-    "Tasmate",
-    "Thurawal",
-    "Trimuris",
-    "Tagalaka",
-    "Tat, Muslim",
-    "Thuri",
-    "Tring",
-    "Tagalog",
-    "Tatana",
-    "Tiale",
-    "Trinidad and Tobago Sign Language",
-    "Tagargrent",
-    "Tatar",
-    "Tiang",
-    "Trinidadian Creole English",
-    "Tagbanwa",
-    "Tatar, Siberian",
-    "Tibea",
-    "Trinitario",
-    "Tagbanwa, Calamian",
-    "Tatuyo",
-    "Tibetan, Amdo",
-    "Tri\u00f3",
-    "Tagbanwa, Central",
-    "Tauade",
-    "Tibetan, Central",
-    "Triqui, Chicahuaxtla",
-    "Tagbu",
-    "Taulil",
-    "Tibetan, Khams",
-    "Triqui, Copala",
-    "Tagdal",
-    "Taungyo",
-    "Tichurong",
-    "Triqui, San Mart\u00edn Itunyoso",
-    "Tagin",
-    "Taupota",
-    "Ticuna",
-    "Truk\u00e1",
-    "Tagish",
-    "Tause",
-    "Tidore",
-    "Trumai",
-    "Tagoi",
-    "Taushiro",
-    "Tidung, Northern",
-    "Tsaangi",
-    "Tahitian",
-    "Tausug",
-    "Tidung, Southern",
-    "Tsakhur",
-    "Tahltan",
-    "Tauya",
-    "Ti\u00e9fo",
-    "Tsakonian",
-    "Tai",
-    "Taveta",
-    "Tiene",
-    "Tsamai",
-    "Tai Daeng",
-    "Tavoyan",
-    "Tifal",
-    "Tsat",
-    "Tai Dam",
-    "Tawala",
-    "Tigak",
-    "Tsaukambo",
-    "Tai D\u00f3n",
-    "Tawand\u00ea",
-    "Tigr\u00e9",
-    "Tseku",
-    "Tai Hongjin",
-    "Tawara",
-    "Tigrigna",
-    "Tshangla",
-    "Tai Khang",
-    "Tawbuid, Eastern",
-    "Tii",
-    "Tsikimba",
-    "Tai Laing",
-    "Tawbuid, Western",
-    "Tikar",
-    "Tsiman\u00e9",
-    "Tai Loi",
-    "Tawoyan",
-    "Tikopia",
-    "Tsimshian",
-    "Tai Long",
-    "T\u00e0y",
-    "Tillamook",
-    "Tsishingini",
-    "Tai N\u00fca",
-    "Tay Boi",
-    "Tilung",
-    "Tso",
-    "Tai Pao",
-    "T\u00e0y Sa Pa",
-    "Tima",
-    "Tsoa",
-    "Tai Thanh",
-    "T\u00e0y Tac",
-    "Timbe",
-    "Tsogo",
-    "Tai Ya",
-    "Tayo",
-    "Timbisha",
-    "Tsonga",
-    "Tai Yo",
-    "Taznatit",
-    "Tinani",
-    "Tsou",
-    "Taiap",
-    "Tboli",
-    "Tindi",
-    "Tsucuba",
-    "Taikat",
-    "Tchitchege",
-    "Tingui-Boto",
-    "Tsum",
-    "Tainae",
-    "Tchumbuli",
-    "Tinigua",
-    "Ts\u2019\u00fcn-Lao",
-    "Ta\u00edno",
-    "Teanu",
-    "Tinputz",
-    "Tsuvadi",
-    "Tairaha",
-    "Tebi",
-    "Tippera",
-    "Tsuvan",
-    "Tairora, North",
-    "Tebul Sign Language",
-    "Tira",
-    "Tswa",
-    "Tairora, South",
-    "Tedaga",
-    "Tirahi",
-    "Tswana",
-    "Tairuma",
-    "Tee",
-    "T\u00eer\u00ee",
-    "Tswapong",
-    "Taiwan Sign Language",
-    "T\u00e9\u00e9n",
-    "Tiruray",
-    "Tu",
-    "Taje",
-    "Tefaro",
-    "Tita",
-    "Tuamotuan",
-    "Tajiki",
-    "Tegali",
-    "Titan",
-    "Tubar",
-    "Tajio",
-    "Tehit",
-    "Tiv",
-    "T\u00fcbatulabal",
-    "Tajuasohn",
-    "Tehuelche",
-    "Tiwa",
-    "Tucano",
-    "Takestani",
-    "Teiwa",
-    "Tiwa, Northern",
-    "Tugen",
-    "Takia",
-    "Teke, Ibali",
-    "Tiwa, Southern",
-    "Tugun",
-    "Takua",
-    "Teke-Eboo",
-    "Tiwi",
-    "Tugutil",
-    "Takuu",
-    "Teke-Fuumu",
-    "Tjurruru",
-    "Tujia, Northern",
-    "Takwane",
-    "Teke-Kukuya",
-    "Tlingit",
-    "Tujia, Southern",
-    "Tal",
-    "Teke-Laali",
-    "To",
-    "Tukang Besi North",
-    "Tala",
-    "Teke-Nzikou",
-    "To\u2019abaita",
-    "Tukang Besi South",
-    "Talaud",
-    "Teke-Tege",
-    "Toaripi",
-    "Tuki",
-    "Taliabu",
-    "Teke-Tsaayi",
-    "Toba",
-    "Tukpa",
-    "Talieng",
-    "Teke-Tyee",
-    "Toba-Maskoy",
-    "Tukudede",
-    "Talinga-Bwisi",
-    "Tektiteko",
-    "Tobagonian Creole English",
-    "Tukumanf\u00e9d",
-    "Talise",
-    "Tela-Masbuar",
-    "Tobanga",
-    "Tula",
-    "Talodi",
-    "Telefol",
-    "Tobati",
-    "Tulehu",
-    "Taloki",
-    "Telugu",
-    "Tobelo",
-    "Tulishi",
-    "Talondo\u2019",
-    "Tem",
-    "Tobian",
-    "Tulu",
-    "Talu",
-    "Temb\u00e9",
-    "Tobilung",
-    "Tulu-Bohuai",
-    "Talysh",
-    "Tembo",
-    "Tobo",
-    "Tuma-Irumu",
-    "Tama",
-    "Tembo",
-    "Tocho",
-    "Tumak",
-    "Tama",
-    "Teme",
-    "Toda",
-    "Tumbuka",
-    "Tamagario",
-    "Temein",
-    "Todrah",
-    "Tumi",
-    "Tamahaq, Tahaggart",
-    "Temi",
-    "Tofanma",
-    "Tumleo",
-    "Tamajaq, Tawallammat",
-    "Temiar",
-    "Togoyo",
-    "Tumtum",
-    "Tamajeq, Tayart",
-    "Temoq",
-    "Tohono O\u2019odham",
-    "Tumzabt",
-    "Taman",
-    "Temuan",
-    "Tojolabal",
-    "Tunebo, Angosturas",
-    "Taman",
-    "T\u2019en",
-    "Tok Pisin",
-    "Tunebo, Barro Negro",
-    "Tamanaku",
-    "Ten\u2019edn",
-    "Tokano",
-    "Tunebo, Central",
-    "Tamang, Eastern",
-    "Tengger",
-    "Tokelauan",
-    "Tunebo, Western",
-    "Tamang, Eastern Gorkha",
-    "Tenharim",
-    "Toku-No-Shima",
-    "Tunen",
-    "Tamang, Northwestern",
-    "Tenino",
-    "Tol",
-    "Tungag",
-    "Tamang, Western",
-    "Tenis",
-    "Tolaki",
-    "Tunggare",
-    "Tamashek",
-    "Tennet",
-    "Tolomako",
-    "Tunia",
-    "Tamasheq",
-    "Teop",
-    "Tolowa",
-    "Tunica",
-    "Tamazight, Central Atlas",
-    "Teor",
-    "Toma",
-    "Tunisian Sign Language",
-    "Tamazight, Standard Moroccan",
-    "Tepecano",
-    "Tomadino",
-    "Tunjung",
-    "Tamazight, Temacine",
-    "Tepehua, Huehuetla",
-    "Tombelala",
-    "Tunni",
-    "Tamazight, Tidikelt",
-    "Tepehua, Pisaflores",
-    "Tombonuo",
-    "Tunzuii",
-    "Tambas",
-    "Tepehua, Tlachichilco",
-    "Tombulu",
-    "Tuotomb",
-    "Tambotalo",
-    "Tepehuan, Northern",
-    "Tomini",
-    "Tupar\u00ed",
-    "Tami",
-    "Tepehuan, Southeastern",
-    "Tomoip",
-    "Tupinikin",
-    "Tamil",
-    "Tepehuan, Southwestern",
-    "Tondano",
-    "Tupuri",
-    "Tamki",
-    "Tera",
-    "Tondi Songway Kiini",
-    "Turaka",
-    "Tampuan",
-    "Terebu",
-    "Tonga",
-    "Turi",
-    "Tampulma",
-    "Terei",
-    "Tonga",
-    "Turiw\u00e1ra",
-    "Tanacross",
-    "Ter\u00eana",
-    "Tonga",
-    "Turka",
-    "Tanahmerah",
-    "Teressa",
-    "Tongan",
-    "Turkana",
-    "Tanaina",
-    "Tereweng",
-    "Tongwe",
-    "Turkish",
-    "Tanana, Lower",
-    "Teribe",
-    "Tonjon",
-    "Turkish Sign Language",
-    "Tanana, Upper",
-    "Terik",
-    "Tonkawa",
-    "Turkmen",
-    "Tanapag",
-    "Termanu",
-    "Tonsawang",
-    "Turks and Caicos Creole English",
-    "Tandaganon",
-    "Ternate",
-    "Tonsea",
-    "Turoyo",
-    "Tandia",
-    "Ternate\u00f1o",
-    "Tontemboan",
-    "Turumsa",
-    "Tanema",
-    "Tese",
-    "Tooro",
-    "Turung",
-    "Tangale",
-    "Teso",
-    "Topoiyo",
-    "Tuscarora",
-    "Tangchangya",
-    "Tetela",
-    "Toposa",
-    "Tutchone, Northern",
-    "Tanggu",
-    "Tetete",
-    "Tor\u00e1",
-    "Tutchone, Southern",
-    "Tangko",
-    "Tetun",
-    "Toraja-Sa\u2019dan",
-    "Tutong",
-    "Tanglang",
-    "Tetun Dili",
-    "Toram",
-    "Tutuba",
-    "Tangoa",
-    "Te\u2019un",
-    "Torau",
-    "Tututni",
-    "Tanguat",
-    "Tewa",
-    "Toro",
-    "Tuva",
-    "Tanibili",
-    "Tewe",
-    "Toromono",
-    "Tuvaluan",
-    "Tanimuca-Retuar\u00e3",
-    "Tha",
-    "Torona",
-    "Tuwari",
-    "Tanjijili",
-    "Thachanadan",
-    "Torres Strait Creole",
-    "Tuwuli",
-    "Tanna, North",
-    "Thai",
-    "Torricelli",
-    "Tux\u00e1",
-    "Tanna, Southwest",
-    "Thai Sign Language",
-    "Torwali",
-    "Tuxin\u00e1wa",
-    "Tanzanian Sign Language",
-    "Thai Song",
-    "Totela",
-    "Tuyuca",
-    "Ta\u2019oih, Lower",
-    "Thai, Northeastern",
-    "Toto",
-    "Twana",
-    "Ta\u2019oih, Upper",
-    "Thai, Northern",
-    "Totoli",
-    "Twendi",
-    "Tapeba",
-    "Thai, Southern",
-    "Totonac, Coyutla",
-    "Twents",
-    "Tapei",
-    "Thakali",
-    "Totonac, Filomena Mata-Coahuitl\u00e1n",
-    "Tyap",
-    "Tapirap\u00e9",
-    "Thangmi",
-    "Totonac, Highland",
-    "Tyaraity",
-    "T\u2019apo",
-    "Thao",
-    "Totonac, Papantla",
-    "Tzeltal",
-    "Tarahumara, Central",
-    "Tharu, Dangaura",
-    "Totonac, Tecpatl\u00e1n",
-    "Tzotzil",
-    "Tarahumara, Northern",
-    "Tharu, Kathariya",
-    "Totonac, Upper Necaxa",
-    "Tz\u2019utujil",
-    "",
-    "U",
-    "Ukrainian Sign Language",
-    "Una",
-    "Uru-Eu-Wau-Wau",
-    "Uab Meto",
-    "Ukue",
-    "Unami",
-    "Uru-Pa-In",
-    "Uamu\u00e9",
-    "Ukuriguma",
-    "Uneapa",
-    "Uruangnirin",
-    "Uare",
-    "Ukwa",
-    "Uneme",
-    "Uruava",
-    "Ubaghara",
-    "Ukwuani-Aboh-Ndoni",
-    "Unggaranggu",
-    "Uruguayan Sign Language",
-    "Ubang",
-    "Ulau-Suain",
-    "Unggumi",
-    "Urum",
-    "Ubi",
-    "Ulch",
-    "\u2021Ungkue",
-    "Urumi",
-    "Ubir",
-    "Ulithian",
-    "Unserdeutsch",
-    "Usaghade",
-    "Ubykh",
-    "Ullatan",
-    "Unua",
-    "Usan",
-    "Uda",
-    "Ulukwumi",
-    "Unubahe",
-    "Usarufa",
-    "Udi",
-    "Ulumanda\u2019",
-    "Ura",
-    "Ushojo",
-    "Udihe",
-    "Ulwa",
-    "Ura",
-    "Usku",
-    "Udmurt",
-    "Uma",
-    "Uradhi",
-    "Usoi",
-    "Uduk",
-    "Uma\u2019 Lasan",
-    "Urak Lawoi\u2019",
-    "Uspanteko",
-    "Ufim",
-    "Uma\u2019 Lung",
-    "Urali",
-    "ut-Ma\u2019in",
-    "Ugandan Sign Language",
-    "Umanakaina",
-    "Urapmin",
-    "Utarmbung",
-    "Ughele",
-    "Umatilla",
-    "Urarina",
-    "Ute-Southern Paiute",
-    "Ugong",
-    "Umbindhamu",
-    "Urat",
-    "Utu",
-    "Uhami",
-    "Umbu-Ungu",
-    "Urdu",
-    "Utugwang-Irungene-Afrike",
-    "Uisai",
-    "Umbugarla",
-    "Urhobo",
-    "Uvbie",
-    "Ujir",
-    "Umbundu",
-    "Uri",
-    "Uya",
-    "Ukaan",
-    "Umbuygamu",
-    "Urigina",
-    "Uyajitaya",
-    "Ukhwejo",
-    "Umeda",
-    "Urim",
-    "Uyghur",
-    "Ukit",
-    "Umiida",
-    "Urimo",
-    "Uzbek",
-    "Ukpe-Bayobiri",
-    "Umon",
-    "Uripiv-Wala-Rano-Atchin",
-    "Uzbek, Northern",
-    "Ukpet-Ehom",
-    "Umot\u00edna",
-    "Urningangg",
-    "Uzbek, Southern",
-    "Ukrainian",
-    "Umpila",
-    "Uru",
-    "Uzekwe",
-    "",
-    "Vaagri Booli",
-    "Vangunu",
-    "Venezuelan Sign Language",
-    "Viti",
-    "Vaeakau-Taumako",
-    "Vanimo",
-    "Vengo",
-    "Vitou",
-    "Vafsi",
-    "Vanuma",
-    "Venture\u00f1o",
-    "Vitu",
-    "Vaghat-Ya-Bijim-Legeri",
-    "Vao",
-    "Veps",
-    "Vlaams",
-    "Vaghri",
-    "Varhadi-Nagpuri",
-    "Vera\u2019a",
-    "Vod",
-    "Vaghua",
-    "Varisi",
-    "Vidunda",
-    "Vono",
-    "Vagla",
-    "Varli",
-    "Viemo",
-    "Voro",
-    "Vai",
-    "Vasavi",
-    "Vietnamese",
-    "V\u00f5ro",
-    "Vaiphei",
-    "Veddah",
-    "Viid",
-    "Vumbu",
-    "Vale",
-    "Vehes",
-    "Vilela",
-    "Vunapu",
-    "Valencian Sign Language",
-    "Veluws",
-    "Vili",
-    "Vunjo",
-    "Valman",
-    "Vemgo-Mabas",
-    "Vincentian Creole English",
-    "Vur\u00ebs",
-    "Valpei",
-    "Venda",
-    "Vinza",
-    "Vute",
-    "Vamale",
-    "V\u2019\u00ebnen Taut",
-    "Virgin Islands Creole English",
-    "Vwanji",
-    "Vame",
-    "Venetian",
-    "Vishavan",
-    "",
-    "Wa, Parauk",
-    "Wambaya",
-    "Waropen",
-    "Wik-Iiyanh",
-    "Wa, Vo",
-    "Wambon",
-    "Warrgamay",
-    "Wik-Keyangan",
-    "Waama",
-    "Wambule",
-    "Warrwa",
-    "Wik-Me\u2019anha",
-    "Waamwang",
-    "Wamey",
-    "Waru",
-    "Wik-Mungkan",
-    "Waata",
-    "Wamin",
-    "Warumungu",
-    "Wik-Ngathana",
-    "Wab",
-    "Wampanoag",
-    "Waruna",
-    "Wikalkan",
-    "Wabo",
-    "Wampar",
-    "Warungu",
-    "Wikngenchera",
-    "Waboda",
-    "Wamp\u00eds",
-    "Warwar Feni",
-    "Wilawila",
-    "Wadaginam",
-    "Wampur",
-    "Wasa",
-    "Wintu",
-    "Waddar",
-    "Wan",
-    "Wasco-Wishram",
-    "Winy\u00e9",
-    "Wadi Wadi",
-    "Wanambre",
-    "Wasembo",
-    "Wipi",
-    "Wadikali",
-    "Wanap",
-    "Washo",
-    "Wiradhuri",
-    "Wadjabangayi",
-    "Wanda",
-    "Waskia",
-    "Wiraf\u00e9d",
-    "Wadjiginy",
-    "Wandala",
-    "Wasu",
-    "Wirangu",
-    "Wadjigu",
-    "Wandamen",
-    "Watakataui",
-    "Wiru",
-    "Wae Rana",
-    "Wandarang",
-    "Wathawurrung",
-    "Witoto, Muinani",
-    "Wa\u2019ema",
-    "Wandji",
-    "Watiwa",
-    "Wiyot",
-    "Waffa",
-    "Wan\u00e9",
-    "Watubela",
-    "Wogamusin",
-    "Wagawaga",
-    "Waneci",
-    "Watut, Middle",
-    "Wogeo",
-    "Wagaya",
-    "Wangaaybuwan-Ngiyambaa",
-    "Watut, North",
-    "Woi",
-    "Wagdi",
-    "Wanggamala",
-    "Watut, South",
-    "Woiwurrung",
-    "Wageman",
-    "Wangganguru",
-    "Waube",
-    "Wojenaka",
-    "Wagi",
-    "Wanggom",
-    "Waur\u00e1",
-    "Wolane",
-    "Wahgi",
-    "Wangkayutyuru",
-    "Wauyai",
-    "Wolani",
-    "Wahgi, North",
-    "Wangkumara",
-    "Wawa",
-    "Wolaytta",
-    "Waigali",
-    "Wanman",
-    "Wawonii",
-    "Woleaian",
-    "Wailaki",
-    "Wannu",
-    "Waxianghua",
-    "Wolio",
-    "Wailapa",
-    "Wano",
-    "Wayampi",
-    "Wolof",
-    "Waima",
-    "Wantoat",
-    "Wayana",
-    "Wolof, Gambian",
-    "Waima\u2019a",
-    "Wanukaka",
-    "Wayor\u00f3",
-    "Wom",
-    "Waimaha",
-    "Wanyi",
-    "Wayu",
-    "Wom",
-    "Waimiri-Atroar\u00ed",
-    "Waorani",
-    "Wayuu",
-    "Womo",
-    "Waioli",
-    "Wapan",
-    "W\u00e8 Northern",
-    "Wongo",
-    "Waiwai",
-    "W\u00e3pha",
-    "W\u00e8 Southern",
-    "Woria",
-    "Waja",
-    "Wapishana",
-    "W\u00e8 Western",
-    "Worimi",
-    "Wajarri",
-    "Wappo",
-    "Wedau",
-    "Worodougou",
-    "Wajiara",
-    "War-Jaintia",
-    "Weh",
-    "Worrorra",
-    "Wajuk",
-    "W\u00e1ra",
-    "Wejewa",
-    "Wotapuri-Katarqalai",
-    "Waka",
-    "Wara",
-    "Weliki",
-    "Wotjobaluk",
-    "Wakabunga",
-    "Warao",
-    "Welsh",
-    "Wotu",
-    "Wakawaka",
-    "Warapu",
-    "Wemale",
-    "Woun Meu",
-    "Wakhi",
-    "Waray",
-    "Wemba Wemba",
-    "Wudu",
-    "Wakon\u00e1",
-    "Waray-Waray",
-    "Wergaia",
-    "Wuliwuli",
-    "Wala",
-    "Wardaman",
-    "Weri",
-    "Wulna",
-    "Walak",
-    "Wardandi",
-    "Wersing",
-    "Wumboko",
-    "Walangama",
-    "Warduji",
-    "West Bengal Sign Language",
-    "Wumbvu",
-    "Wali",
-    "Warembori",
-    "Western Neo-Aramaic",
-    "Wunambal",
-    "Wali",
-    "Wares",
-    "Westphalien",
-    "Wunumara",
-    "Waling",
-    "Waris",
-    "Wewaw",
-    "Wurrugu",
-    "Walio",
-    "Waritai",
-    "Weyto",
-    "Wushi",
-    "Walla Walla",
-    "Wariyangga",
-    "Whitesands",
-    "Wusi",
-    "Wallisian",
-    "Warji",
-    "Wiarumus",
-    "Wutung",
-    "Walloon",
-    "Warkay-Bipim",
-    "Wich\u00ed Lhamt\u00e9s G\u00fcisnay",
-    "Wutunhua",
-    "Walmajarri",
-    "Warlmanpa",
-    "Wich\u00ed Lhamt\u00e9s Nocten",
-    "Wuvulu-Aua",
-    "Walser",
-    "Warlpiri",
-    "Wich\u00ed Lhamt\u00e9s Vejoz",
-    "Wuzlam",
-    "Walungge",
-    "Warluwara",
-    "Wichita",
-    "Wyandot",
-    "Wamas",
-    "Warnang",
-    "Wik-Epa",
-    "Wymysorys",
-    "",
-    "Xaasongaxango",
-    "X\u00e2r\u00e2gur\u00e8",
-    "Xhosa",
-    "Xiri\u00e2na",
-    "Xakriab\u00e1",
-    "Xav\u00e1nte",
-    "Xibe",
-    "Xokleng",
-    "|Xam",
-    "||Xegwi",
-    "Xinca",
-    "!X\u00f3\u00f5",
-    "Xamtanga",
-    "Xer\u00e9nte",
-    "Xipaya",
-    "Xukur\u00fa",
-    "X\u00e2r\u00e2c\u00f9\u00f9",
-    "Xet\u00e1",
-    "Xiri",
-    "",
-    "Yaaku",
-    "Yamphu",
-    "Yawuru",
-    "Yogad",
-    "Yaba\u00e2na",
-    "Yamphu, Southern",
-    "Yaygir",
-    "Yoidik",
-    "Yabarana",
-    "Yan-nhangu",
-    "Yazgulyam",
-    "Yoke",
-    "Yabem",
-    "Yan-nhangu Sign Language",
-    "Yei",
-    "Yokuts",
-    "Yaben",
-    "Yanda",
-    "Yekhee",
-    "Yolngu Sign Language",
-    "Yabong",
-    "Yandjibara",
-    "Yekora",
-    "Yom",
-    "Yabula Yabula",
-    "Yandruwandha",
-    "Yela",
-    "Yombe",
-    "Yace",
-    "Yanesha\u2019",
-    "Yele",
-    "Yonaguni",
-    "Yaeyama",
-    "Yangben",
-    "Yelmek",
-    "Yong",
-    "Yagara",
-    "Yangkam",
-    "Yelogu",
-    "Yongkom",
-    "Yagaria",
-    "Yangman",
-    "Yemba",
-    "Yopno",
-    "Yagnobi",
-    "Yango",
-    "Yemsa",
-    "Yora",
-    "Yagomi",
-    "Yangulam",
-    "Yendang",
-    "Yoron",
-    "Yagua",
-    "Yangum Dey",
-    "Yeni",
-    "Yorta Yorta",
-    "Yagwoia",
-    "Yangum Gel",
-    "Yeniche",
-    "Yoruba",
-    "Yahadian",
-    "Yangum Mon",
-    "Yerakai",
-    "Yotti",
-    "Yahang",
-    "Yankunytjatjara",
-    "Yeresiam",
-    "Yout Wam",
-    "Yahuna",
-    "Yanom\u00e1mi",
-    "Yeretuar",
-    "Yoy",
-    "Yaka",
-    "Yanomam\u00f6",
-    "Yerong",
-    "Yuanga",
-    "Yaka",
-    "Yansi",
-    "Yerukula",
-    "Yucatec Maya Sign Language",
-    "Yaka",
-    "Yanyuwa",
-    "Yessan-Mayo",
-    "Yuchi",
-    "Yakaikeke",
-    "Yao",
-    "Yetfa",
-    "Yucuna",
-    "Yakama",
-    "Yaour\u00e9",
-    "Yevanic",
-    "Yug",
-    "Yakan",
-    "Yapese",
-    "Yeyi",
-    "Yugambal",
-    "Yakkha",
-    "Yapunda",
-    "Yi, Wuding-Luquan",
-    "Yugoslavian Sign Language",
-    "Yakkha, Chhathare",
-    "Yaqay",
-    "Yiddish",
-    "Yugul",
-    "Yakoma",
-    "Yaqui",
-    "Yiddish, Eastern",
-    "Yugur, East",
-    "Yakut",
-    "Yarawata",
-    "Yiddish, Western",
-    "Yugur, West",
-    "Yala",
-    "Yardliyawarra",
-    "Yidgha",
-    "Yuhup",
-    "Yalahatan",
-    "Yareba",
-    "Yidiny",
-    "Yukaghir, Northern",
-    "Yalarnnga",
-    "Yarluyandi",
-    "Yil",
-    "Yukaghir, Southern",
-    "Yale",
-    "Yaroam\u00eb",
-    "Yimas",
-    "Yuki",
-    "Yale, Kosarek",
-    "Yarsun",
-    "Yinbaw",
-    "Yukpa",
-    "Yaleba",
-    "Yasa",
-    "Yindjibarndi",
-    "Yukuben",
-    "Yali, Angguruk",
-    "Yatay",
-    "Yindjilandji",
-    "Yulu",
-    "Yali, Ninia",
-    "Yau",
-    "Yine",
-    "Yupik, Central",
-    "Yali, Pass Valley",
-    "Yau",
-    "Yinggarda",
-    "Yupik, Central Siberian",
-    "Yalunka",
-    "Yaul",
-    "Yinhawangka",
-    "Yupik, Naukan",
-    "Y\u00e1mana",
-    "Yauma",
-    "Yiningayi",
-    "Yupik, Pacific Gulf",
-    "Yamap",
-    "Yaur",
-    "Yintale",
-    "Yupik, Sirenik",
-    "Yamba",
-    "Yavitero",
-    "Yinwum",
-    "Yuqui",
-    "Yambes",
-    "Yawa",
-    "Yipma",
-    "Yuracare",
-    "Yambeta",
-    "Yawalapit\u00ed",
-    "Yir-Yoront",
-    "Yurok",
-    "Yamdena",
-    "Yawanawa",
-    "Yirandali",
-    "Yuru",
-    "Yameo",
-    "Yawarawarga",
-    "Yirrk-Mel",
-    "Yuwana",
-    "Yami",
-    "Yaweyuha",
-    "Yis",
-    "Yuyu",
-    "Yaminahua",
-    "Yawijibaya",
-    "Yitha Yitha",
-    "Ywom",
-    "Yamongeri",
-    "Yawiyo",
-    "Yoba",
-    "",
-    "Zabana",
-    "Zapotec, Mixtepec",
-    "Zapotec, Yautepec",
-    "Zhuang, Liuqian",
-    "Zaghawa",
-    "Zapotec, Ocotl\u00e1n",
-    "Zapotec, Zaachila",
-    "Zhuang, Minz",
-    "Zaiwa",
-    "Zapotec, Ozolotepec",
-    "Zapotec, Zaniza",
-    "Zhuang, Nong",
-    "Zakhring",
-    "Zapotec, Petapa",
-    "Zapotec, Zoogocho",
-    "Zhuang, Qiubei",
-    "Zambian Sign Language",
-    "Zapotec, Quiavicuzas",
-    "Zaramo",
-    "Zhuang, Yang",
-    "Zan Gula",
-    "Zapotec, Quioquitani-Quier\u00ed",
-    "Zari",
-    "Zhuang, Yongbei",
-    "Zanaki",
-    "Zapotec, Rinc\u00f3n",
-    "Zarma",
-    "Zhuang, Yongnan",
-    "Zande",
-    "Zapotec, San Agust\u00edn Mixtepec",
-    "Zarphatic",
-    "Zhuang, Youjiang",
-    "Zangskari",
-    "Zapotec, San Baltazar Loxicha",
-    "Zauzou",
-    "Zhuang, Zuojiang",
-    "Zangwal",
-    "Zapotec, San Pedro Quiatoni",
-    "Zay",
-    "Zia",
-    "Z\u00e1paro",
-    "Zapotec, San Vicente Coatl\u00e1n",
-    "Zayein",
-    "Zialo",
-    "Zapotec",
-    "Zapotec, Santa Catarina Albarradas",
-    "Zaysete",
-    "Zigula",
-    "Zapotec, Alo\u00e1pam",
-    "Zapotec, Santa In\u00e9s Yatzechi",
-    "Zaza",
-    "Zimakani",
-    "Zapotec, Amatl\u00e1n",
-    "Zapotec, Santa Mar\u00eda Quiegolani",
-    "Zazaki, Northern",
-    "Zimba",
-    "Zapotec, Asunci\u00f3n Mixtepec",
-    "Zapotec, Santiago Xanica",
-    "Zazaki, Southern",
-    "Zimbabwe Sign Language",
-    "Zapotec, Ayoquesco",
-    "Zapotec, Santo Domingo Albarradas",
-    "Zazao",
-    "Zinza",
-    "Zapotec, Cajonos",
-    "Zapotec, Sierra de Ju\u00e1rez",
-    "Zeem",
-    "Ziriya",
-    "Zapotec, Chichicapan",
-    "Zapotec, Southeastern Ixtl\u00e1n",
-    "Zeeuws",
-    "Zizilivakan",
-    "Zapotec, Choapan",
-    "Zapotec, Southern Rincon",
-    "Zenag",
-    "Zo",
-    "Zapotec, Coatecas Altas",
-    "Zapotec, Tabaa",
-    "Zenaga",
-    "Zo\u2019\u00e9",
-    "Zapotec, Coatl\u00e1n",
-    "Zapotec, Tejalapan",
-    "Zerenkel",
-    "Zokhuo",
-    "Zapotec, El Alto",
-    "Zapotec, Texmelucan",
-    "Zhaba",
-    "Zoque, Chimalapa",
-    "Zapotec, Elotepec",
-    "Zapotec, Tilquiapan",
-    "Zhire",
-    "Zoque, Copainal\u00e1",
-    "Zapotec, Guevea de Humboldt",
-    "Zapotec, Tlacolulita",
-    "Zhoa",
-    "Zoque, Francisco Le\u00f3n",
-    "Zapotec, G\u00fcil\u00e1",
-    "Zapotec, Totomachapan",
-    "Zhuang",
-    "Zoque, Ray\u00f3n",
-    "Zapotec, Isthmus",
-    "Zapotec, Western Tlacolula Valley",
-    "Zhuang, Central Hongshuihe",
-    "Zoque, Tabasco",
-    "Zapotec, Lachiguiri",
-    "Zapotec, Xadani",
-    "Zhuang, Dai",
-    "Zorop",
-    "Zapotec, Lachix\u00edo",
-    "Zapotec, Xanagu\u00eda",
-    "Zhuang, Eastern Hongshuihe",
-    "Zulgo-Gemzek",
-    "Zapotec, Lapagu\u00eda-Guivini",
-    "Zapotec, Yal\u00e1lag",
-    "Zhuang, Guibei",
-    "Zulu",
-    "Zapotec, Loxicha",
-    "Zapotec, Yareni",
-    "Zhuang, Guibian",
-    "Zumaya",
-    "Zapotec, Mazaltepec",
-    "Zapotec, Yatee",
-    "Zhuang, Lianshan",
-    "Zumbun",
-    "Zapotec, Miahuatl\u00e1n",
-    "Zapotec, Yatzachi",
-    "Zhuang, Liujiang",
-    "Zuni",
-    "Zapotec, Mitla",
-    "Other"
-]
-
 
 def calculate_age_years(born):
     today = date.today()
     return today.year - born
 
 
-def get_country_iso(c_name):
-    _iso = ""
-    if c_name:
-        for iso, name in COUNTRIES.items():
-            if name.lower() == c_name.lower():
-                _iso = iso
-
-    return _iso
-
-
 def reorder_registration_form_fields(fields):
     required_order = {
         'first_name': 0,
@@ -7851,33 +77,43 @@ def get_str_match_ratio(str1, str2):
 
 
 def get_close_matching_orgs_with_suggestions(request, query):
-    """find list of organizations which are very close to a searched string"""
-    data = {}
+    """
+    find list of organizations which are very close to a searched string, ranked on their match ratio.
+
+    Organizations are searched in the in process organization search index, see `onboarding.org_search`
+    """
+    matches = []
+    org_search_ratio = configuration_helpers.get_value('org_search_ratio', 0)
+    query_match_label = get_match_label(query)
 
-    organizations = Organization.objects.filter(label__istartswith=query)
+    organizations = get_organization_search_index().search(query)
     if len(query) == ORG_SEARCH_TERM_LENGTH:
-        organizations = organizations.filter(label__length=ORG_SEARCH_TERM_LENGTH)
+        organizations = [organization for organization in organizations
+                         if len(organization['label']) == ORG_SEARCH_TERM_LENGTH]
     for organization in organizations:
-        match_ratio = get_str_match_ratio(query.lower(), organization.label.lower())
-        is_suggestion = True if re.match(query, organization.label, re.I) else False
-        is_matched = True if match_ratio >= configuration_helpers.get_value('org_search_ratio', 0) else False
+        match_ratio = SequenceMatcher(None, query_match_label, organization['match_label']).ratio()
+        is_suggestion = True if re.match(query, organization['label'], re.I) else False
+        is_matched = True if match_ratio >= org_search_ratio else False
 
         if is_suggestion or is_matched:
-            data[organization.label.lower()] = {
-                'id': organization.id,
-                'label': organization.label,
-                'is_admin_assigned': True if organization.admin else False,
-                'is_current_user_admin': True if organization.admin == request.user else False,
-                'admin_email': organization.admin.email if organization.admin else 'Administrator not assigned yet.',
-                'country': COUNTRIES.get(organization.country) if organization.country else '',
+            matches.append((match_ratio, organization['label'].lower(), {
+                'id': organization['id'],
+                'label': organization['label'],
+                'is_admin_assigned': True if organization['admin_id'] else False,
+                'is_current_user_admin': True if organization['admin_id'] and
+                organization['admin_id'] == request.user.id else False,
+                'admin_email': organization['admin_email'] if organization['admin_id'] else
+                'Administrator not assigned yet.',
+                'country': get_country_name(organization['country']) if organization['country'] else '',
                 'is_matched': is_matched,
                 'is_suggestion': is_suggestion,
-                'has_affiliated_partner': organization.has_affiliated_partner,
-                'total_employees': organization.total_employees,
-                'org_type': organization.org_type
-            }
+                'has_affiliated_partner': organization['has_affiliated_partner'],
+                'total_employees': organization['total_employees'],
+                'org_type': organization['org_type']
+            }))
 
-    return data
+    matches.sort(key=lambda match: (-match[0], match[1]))
+    return OrderedDict((label, data) for _, label, data in matches)
 
 
 def get_alquity_community_url():
@@ -8099,6 +335,9 @@ def update_user_email(user, old_email, new_email):
     :return: None
     """
 
+    from common.lib.mandrill_client.client import MandrillClient
+    from mailchimp_pipeline.signals.handlers import update_user_email_in_mailchimp
+    from nodebb.tasks import task_update_user_profile_on_nodebb
     from student.models import CourseEnrollmentAllowed, ManualEnrollmentAudit, UserProfile
 
     # update email in mailchimp
@@ -0,0 +1,88 @@
+"""
+Lookup tables of onboarding i.e. countries and languages.
+
+Tables are kept as json files in `data` directory and every table is loaded once, on its first access. This module
+has no import side effects so it can be imported by signal handlers, tasks and commands at no cost.
+"""
+import json
+import os
+import re
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+COUNTRIES_FILE_NAME = 'countries.json'
+LANGUAGES_FILE_NAME = 'languages.json'
+LEGACY_LANGUAGE_ESCAPE_PATTERN = re.compile(r'\\u([0-9a-f]{4})')
+
+_tables = {}
+
+
+def _get_table(name, loader):
+    """
+    Get a lookup table from memory, loading it with `loader` on first access
+    """
+    if name not in _tables:
+        _tables[name] = loader()
+    return _tables[name]
+
+
+def _load_json(file_name):
+    with open(os.path.join(DATA_DIR, file_name)) as data_file:
+        return json.load(data_file)
+
+
+def get_countries():
+    """
+    Returns:
+        dict: country names keyed on ISO country codes
+    """
+    return _get_table(COUNTRIES_FILE_NAME, lambda: _load_json(COUNTRIES_FILE_NAME))
+
+
+def get_country_name(country_code, default=None):
+    """
+    Get name of the country of an ISO country code, `default` if there is no such country
+    """
+    return get_countries().get(country_code, default)
+
+
+def get_country_iso(country_name):
+    """
+    Get ISO country code of a country name, case insensitively
+
+    Returns:
+        str: country code, empty string if there is no such country
+    """
+    if not country_name:
+        return ''
+
+    country_codes = _get_table('country_codes', lambda: {
+        name.lower(): code for code, name in get_countries().items()
+    })
+    return country_codes.get(country_name.lower(), '')
+
+
+def get_languages():
+    """
+    Returns:
+        list: language names, in the order in which these are suggested to users
+    """
+    return _get_table(LANGUAGES_FILE_NAME, lambda: _load_json(LANGUAGES_FILE_NAME))
+
+
+def normalize_language(language_name):
+    """
+    Decode `\\uXXXX` escapes of a language name. Languages used to be listed in a byte string literal which kept
+    these escapes as is, so profiles saved before carry the escaped spelling of non ascii names.
+    """
+    return LEGACY_LANGUAGE_ESCAPE_PATTERN.sub(lambda match: unichr(int(match.group(1), 16)), language_name)
+
+
+def is_language(language_name):
+    """
+    Check if a language name, in current or legacy escaped spelling, is one of the languages, with a set lookup
+    """
+    if not language_name:
+        return False
+
+    languages = _get_table('language_names', lambda: frozenset(get_languages()))
+    return normalize_language(language_name) in languages
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+from django.db import migrations
+
+LEGACY_LANGUAGE_ESCAPE_PATTERN = re.compile(r'\\u([0-9a-f]{4})')
+
+
+def normalize_legacy_language_names(apps, schema_editor):
+    """
+    Non ascii language names were saved with `\\uXXXX` escapes, save them with decoded characters instead
+    """
+    UserProfile = apps.get_model('student', 'UserProfile')
+    legacy_languages = UserProfile.objects.filter(
+        language__contains='\\u'
+    ).order_by().values_list('language', flat=True).distinct()
+
+    for legacy_language in list(legacy_languages):
+        UserProfile.objects.filter(language=legacy_language).update(
+            language=LEGACY_LANGUAGE_ESCAPE_PATTERN.sub(
+                lambda match: unichr(int(match.group(1), 16)), legacy_language
+            )
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onboarding', '0033_auto_20200720_0534'),
+        ('student', '0020_auto_20200618_0157'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_legacy_language_names, migrations.RunPython.noop),
+    ]
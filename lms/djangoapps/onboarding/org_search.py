@@ -0,0 +1,269 @@
+"""
+In process search index of organizations for the onboarding autocomplete.
+
+Organizations are kept sorted on their lower case label so that all organizations whose label starts with a search
+term are found with a binary search, instead of an `istartswith` query on every keystroke. Admin email is joined
+once, when the index is built.
+
+Every process holds its own index. Organization post_save and post_delete signals publish the change in the cache,
+keyed on a version which is incremented for every change. Every process, on its next search, replays the changes
+it has not applied yet, so a change costs no query in any process.
+
+The index is built in the request only by the first search of a process. Otherwise a full rebuild, when the index
+is older than ORG_SEARCH_INDEX_TIMEOUT seconds to pick up changes which are not signalled e.g. a change of admin
+email, or when changes to replay are missing from the cache, is done in a background thread while the current
+index keeps serving searches.
+"""
+import re
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.core.cache import cache
+from django.db import connection
+
+from lms.djangoapps.onboarding.constants import (
+    ORG_SEARCH_INDEX_CHANGE_KEY,
+    ORG_SEARCH_INDEX_MAX_REPLAY,
+    ORG_SEARCH_INDEX_TIMEOUT,
+    ORG_SEARCH_INDEX_VERSION_KEY
+)
+from lms.djangoapps.onboarding.models import Organization
+
+ORGANIZATION_FIELDS = (
+    'id', 'label', 'admin_id', 'admin__email', 'country', 'has_affiliated_partner', 'total_employees', 'org_type'
+)
+
+CHANGE_UPDATE = 'update'
+CHANGE_REMOVE = 'remove'
+
+_lock = threading.Lock()
+_index = None
+_rebuilding = False
+
+
+def get_match_label(label):
+    """
+    Lower case label without non alphanumeric characters, used to compute match ratio with a search term
+    """
+    return re.sub('[^A-Za-z0-9]+', '', label.lower())
+
+
+def get_index_entry(organization):
+    """
+    Entry of the index for an organization
+
+    Arguments:
+        organization (dict): organization with ORGANIZATION_FIELDS
+    """
+    entry = dict(organization)
+    entry['admin_email'] = entry.pop('admin__email')
+    entry['search_label'] = entry['label'].lower()
+    entry['match_label'] = get_match_label(entry['label'])
+    return entry
+
+
+class OrganizationSearchIndex(object):
+    """
+    Organizations sorted on lower case label, for prefix search
+    """
+
+    def __init__(self, organizations, version):
+        self.version = version
+        self.built_at = time.time()
+        self._organizations = {}
+        self._keys = []
+
+        for organization in organizations:
+            entry = get_index_entry(organization)
+            self._organizations[entry['id']] = entry
+            self._keys.append((entry['search_label'], entry['id']))
+
+        self._keys.sort()
+
+    def is_expired(self):
+        return time.time() - self.built_at > ORG_SEARCH_INDEX_TIMEOUT
+
+    def update(self, organization):
+        """
+        Add or replace an organization in the index
+        """
+        self.remove(organization['id'])
+        entry = get_index_entry(organization)
+        # lists are replaced instead of changed in place, so that a search running in another thread is not affected
+        keys = list(self._keys)
+        insort(keys, (entry['search_label'], entry['id']))
+        self._organizations[entry['id']] = entry
+        self._keys = keys
+
+    def remove(self, org_id):
+        """
+        Remove an organization from the index, if present
+        """
+        entry = self._organizations.pop(org_id, None)
+        if entry:
+            keys = list(self._keys)
+            del keys[bisect_left(keys, (entry['search_label'], org_id))]
+            self._keys = keys
+
+    def search(self, prefix):
+        """
+        Returns entries of all organizations whose label starts with `prefix`, case insensitive
+        """
+        prefix = prefix.lower()
+        keys = self._keys
+        entries = []
+
+        for index in xrange(bisect_left(keys, (prefix,)), len(keys)):
+            search_label, org_id = keys[index]
+            if not search_label.startswith(prefix):
+                break
+            entry = self._organizations.get(org_id)
+            if entry:
+                entries.append(entry)
+
+        return entries
+
+
+def _get_index_version():
+    cache.add(ORG_SEARCH_INDEX_VERSION_KEY, 0, None)
+    return cache.get(ORG_SEARCH_INDEX_VERSION_KEY, 0)
+
+
+def _increment_index_version():
+    """
+    Returns:
+        int: new version of the index
+    """
+    cache.add(ORG_SEARCH_INDEX_VERSION_KEY, 0, None)
+    try:
+        return cache.incr(ORG_SEARCH_INDEX_VERSION_KEY)
+    except ValueError:
+        # key was evicted between add and incr, every process rebuilds its index
+        cache.set(ORG_SEARCH_INDEX_VERSION_KEY, 1, None)
+        return 1
+
+
+def _build_index():
+    version = _get_index_version()
+    return OrganizationSearchIndex(Organization.objects.values(*ORGANIZATION_FIELDS), version)
+
+
+def _run_in_background(target):
+    """
+    Run `target` in a daemon thread, closing the database connection of the thread once it is done
+    """
+    def run():
+        try:
+            target()
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=run, name='organization-search-index')
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def _rebuild_index():
+    global _index, _rebuilding  # pylint: disable=global-statement
+
+    try:
+        index = _build_index()
+        with _lock:
+            _index = index
+    finally:
+        with _lock:
+            _rebuilding = False
+
+
+def _rebuild_index_in_background():
+    """
+    Rebuild the index of this process in a background thread, unless a rebuild is already running
+    """
+    global _rebuilding  # pylint: disable=global-statement
+
+    with _lock:
+        if _rebuilding:
+            return
+        _rebuilding = True
+
+    try:
+        _run_in_background(_rebuild_index)
+    except Exception:  # pylint: disable=broad-except
+        with _lock:
+            _rebuilding = False
+        raise
+
+
+def _replay_index_changes(index, version):
+    """
+    Apply changes published by all processes, after the version of the index and up to `version`, to the index.
+    Replay stops at the first change which is missing from the cache.
+    """
+    if version - index.version > ORG_SEARCH_INDEX_MAX_REPLAY:
+        return
+
+    keys = [(change_version, ORG_SEARCH_INDEX_CHANGE_KEY.format(version=change_version))
+            for change_version in range(index.version + 1, version + 1)]
+    changes = cache.get_many([key for _, key in keys])
+
+    for change_version, key in keys:
+        change = changes.get(key)
+        if change is None:
+            return
+
+        action, data = change
+        if action == CHANGE_UPDATE:
+            index.update(data)
+        else:
+            index.remove(data)
+        index.version = change_version
+
+
+def get_organization_search_index():
+    """
+    Returns the index of this process, brought up to date with the changes published by all processes
+    """
+    global _index  # pylint: disable=global-statement
+
+    index = _index
+    if index is None:
+        index = _build_index()
+        with _lock:
+            _index = _index or index
+        return index
+
+    version = _get_index_version()
+    if index.version < version:
+        with _lock:
+            _replay_index_changes(index, version)
+
+    if index.version != version or index.is_expired():
+        _rebuild_index_in_background()
+
+    return index
+
+
+def _publish_index_change(action, data):
+    """
+    Publish a change of the index to all processes, keyed on the version it brings the index to
+    """
+    version = _increment_index_version()
+    cache.set(ORG_SEARCH_INDEX_CHANGE_KEY.format(version=version), (action, data), ORG_SEARCH_INDEX_TIMEOUT)
+
+
+def update_organization_in_search_index(organization):
+    """
+    Add or update an organization in the search index
+    """
+    organization_data = {field: getattr(organization, field) for field in ORGANIZATION_FIELDS if '__' not in field}
+    organization_data['admin__email'] = organization.admin.email if organization.admin_id else None
+    _publish_index_change(CHANGE_UPDATE, organization_data)
+
+
+def remove_organization_from_search_index(org_id):
+    """
+    Remove an organization from the search index
+    """
+    _publish_index_change(CHANGE_REMOVE, org_id)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for lookup tables of onboarding
+"""
+from unittest import TestCase
+
+from mock import patch
+
+from lms.djangoapps.onboarding import lookups
+
+
+class LookupsTestCase(TestCase):
+    """
+    Tests for `onboarding.lookups`
+    """
+
+    def setUp(self):
+        super(LookupsTestCase, self).setUp()
+        lookups._tables.clear()  # pylint: disable=protected-access
+
+    def test_country_name_and_iso(self):
+        self.assertEqual(lookups.get_country_name('PK'), 'Pakistan')
+        self.assertEqual(lookups.get_country_name('XX', ''), '')
+        self.assertEqual(lookups.get_country_iso('united arab emirates'), 'AE')
+        self.assertEqual(lookups.get_country_iso('Atlantis'), '')
+        self.assertEqual(lookups.get_country_iso(None), '')
+
+    def test_languages(self):
+        languages = lookups.get_languages()
+
+        self.assertEqual(languages[-1], 'Other')
+        self.assertTrue(lookups.is_language(u'Angaité'))
+        self.assertFalse(lookups.is_language('Klingon'))
+        self.assertFalse(lookups.is_language(None))
+
+    def test_legacy_language_spelling(self):
+        """
+        Test language saved with escaped spelling, before languages were decoded, is still accepted
+        """
+        legacy_language = 'Angait\\u00e9'
+
+        self.assertTrue(lookups.is_language(legacy_language))
+        self.assertEqual(lookups.normalize_language(legacy_language), u'Angaité')
+        self.assertEqual(lookups.normalize_language(u'Angaité'), u'Angaité')
+
+    def test_tables_are_loaded_once(self):
+        load_json = lookups._load_json  # pylint: disable=protected-access
+        with patch.object(lookups, '_load_json', wraps=load_json) as mock_load_json:
+            lookups.get_country_name('PK')
+            lookups.get_country_iso('Pakistan')
+            lookups.get_countries()
+
+        mock_load_json.assert_called_once_with(lookups.COUNTRIES_FILE_NAME)
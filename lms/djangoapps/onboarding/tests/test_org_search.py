@@ -0,0 +1,110 @@
+"""
+Tests for organization search index
+"""
+from django.core.cache import cache
+from mock import Mock, patch
+
+from lms.djangoapps.onboarding import org_search
+from lms.djangoapps.onboarding.helpers import get_close_matching_orgs_with_suggestions
+from lms.djangoapps.onboarding.models import Organization
+from lms.djangoapps.onboarding.tests.factories import OrganizationFactory, UserFactory
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+
+
+class OrganizationSearchIndexTestCase(CacheIsolationTestCase):
+    """
+    Tests for `onboarding.org_search`
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(OrganizationSearchIndexTestCase, self).setUp()
+        org_search._index = None  # pylint: disable=protected-access
+        org_search._rebuilding = False  # pylint: disable=protected-access
+        self.admin = UserFactory(email='admin@example.com')
+        self.organization = OrganizationFactory(label='Philanthropy University', admin=self.admin, country='PK')
+        OrganizationFactory(label='Philanthropy Partners')
+        OrganizationFactory(label='Arbisoft')
+
+    def _search_labels(self, query):
+        return [organization['label'] for organization in org_search.get_organization_search_index().search(query)]
+
+    def test_prefix_search(self):
+        """
+        Test only organizations whose label starts with the term are found, case insensitive
+        """
+        self.assertEqual(self._search_labels('phil'), ['Philanthropy Partners', 'Philanthropy University'])
+        self.assertEqual(self._search_labels('ARB'), ['Arbisoft'])
+        self.assertEqual(self._search_labels('xyz'), [])
+
+    def test_index_updated_on_save_and_delete(self):
+        """
+        Test the index of the process is updated incrementally on organization save and delete
+        """
+        index = org_search.get_organization_search_index()
+
+        self.organization.label = 'Arbi Foundation'
+        self.organization.save()
+        OrganizationFactory(label='Arbitrary')
+
+        with self.assertNumQueries(0):
+            self.assertIs(org_search.get_organization_search_index(), index)
+        self.assertEqual(self._search_labels('arbi'), ['Arbi Foundation', 'Arbisoft', 'Arbitrary'])
+        self.assertEqual(self._search_labels('phil'), ['Philanthropy Partners'])
+
+        self.organization.delete()
+        self.assertEqual(self._search_labels('arbi'), ['Arbisoft', 'Arbitrary'])
+
+    def test_change_by_other_process_is_replayed(self):
+        """
+        Test a change published by another process is applied to the index without a query
+        """
+        index = org_search.get_organization_search_index()
+        organization = Organization.objects.values(*org_search.ORGANIZATION_FIELDS).get(label='Arbisoft')
+        organization['label'] = 'Arbi Foundation'
+        org_search._publish_index_change(org_search.CHANGE_UPDATE, organization)  # pylint: disable=protected-access
+
+        with self.assertNumQueries(0):
+            self.assertIs(org_search.get_organization_search_index(), index)
+        self.assertEqual(self._search_labels('arbi'), ['Arbi Foundation'])
+        self.assertEqual(index.version, cache.get(org_search.ORG_SEARCH_INDEX_VERSION_KEY))
+
+    @patch('lms.djangoapps.onboarding.org_search._run_in_background', side_effect=lambda target: target())
+    def test_index_rebuilt_in_background_on_missing_change(self, mock_run_in_background):
+        """
+        Test the index is rebuilt in background, and not in the request, when a change is missing from the cache
+        """
+        index = org_search.get_organization_search_index()
+        cache.incr(org_search.ORG_SEARCH_INDEX_VERSION_KEY)
+
+        self.assertIs(org_search.get_organization_search_index(), index)
+        self.assertEqual(mock_run_in_background.call_count, 1)
+        self.assertIsNot(org_search.get_organization_search_index(), index)
+
+    @patch('lms.djangoapps.onboarding.org_search._run_in_background')
+    def test_single_rebuild_of_expired_index(self, mock_run_in_background):
+        """
+        Test an expired index keeps serving searches while only one rebuild is started
+        """
+        index = org_search.get_organization_search_index()
+        index.built_at -= org_search.ORG_SEARCH_INDEX_TIMEOUT + 1
+
+        self.assertIs(org_search.get_organization_search_index(), index)
+        self.assertIs(org_search.get_organization_search_index(), index)
+        self.assertEqual(mock_run_in_background.call_count, 1)
+
+    @patch('lms.djangoapps.onboarding.helpers.configuration_helpers.get_value', return_value=0.5)
+    def test_close_matching_orgs_with_suggestions(self, mock_get_value):  # pylint: disable=unused-argument
+        """
+        Test matching organizations are ranked with admin info of the organization
+        """
+        request = Mock(user=self.admin)
+
+        with self.assertNumQueries(1):
+            data = get_close_matching_orgs_with_suggestions(request, 'Phil')
+
+        self.assertEqual(data.keys(), ['philanthropy partners', 'philanthropy university'])
+        self.assertEqual(data['philanthropy university']['admin_email'], 'admin@example.com')
+        self.assertTrue(data['philanthropy university']['is_current_user_admin'])
+        self.assertEqual(data['philanthropy university']['country'], 'Pakistan')
+        self.assertFalse(data['philanthropy partners']['is_admin_assigned'])
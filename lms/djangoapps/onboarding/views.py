@@ -22,7 +22,7 @@ from django.utils.translation import ugettext_noop
 from django.views.decorators.csrf import csrf_exempt
 
 from edxmako.shortcuts import render_to_response
-from lms.djangoapps.onboarding import forms
+from lms.djangoapps.onboarding import forms, lookups
 from lms.djangoapps.onboarding.decorators import can_save_org_data, can_save_org_details
 from lms.djangoapps.onboarding.email_utils import (
     send_admin_activation_email,
@@ -30,8 +30,6 @@ from lms.djangoapps.onboarding.email_utils import (
     send_admin_update_email
 )
 from lms.djangoapps.onboarding.helpers import (
-    COUNTRIES,
-    LANGUAGES,
     affiliated_unattended_surveys,
     calculate_age_years,
     get_alquity_community_url,
@@ -84,10 +82,11 @@ def user_info(request):
         'year_of_birth': userprofile.year_of_birth,
         'gender': userprofile.gender,
         'language': userprofile.language,
-        'country': COUNTRIES.get(userprofile.country) if not request.POST.get('country') else request.POST.get(
-            'country'),
-        'country_of_employment': COUNTRIES.get(user_extended_profile.country_of_employment, '') if not request.POST.get(
-            'country_of_employment') else request.POST.get('country_of_employment'),
+        'country': lookups.get_country_name(userprofile.country) if not request.POST.get(
+            'country') else request.POST.get('country'),
+        'country_of_employment': lookups.get_country_name(
+            user_extended_profile.country_of_employment, ''
+        ) if not request.POST.get('country_of_employment') else request.POST.get('country_of_employment'),
         'city': userprofile.city,
         'level_of_education': userprofile.level_of_education,
         'hours_per_week': user_extended_profile.hours_per_week if user_extended_profile.hours_per_week else '',
@@ -234,7 +233,7 @@ def organization(request):
         template = 'organization/update_organization.html'
 
     initial = {
-        'country': COUNTRIES.get(_organization.country),
+        'country': lookups.get_country_name(_organization.country),
         'is_org_url_exist': '1' if _organization.url else '0',
         'partner_networks': list(_organization.get_active_partners()),
     }
@@ -311,7 +310,7 @@ def get_country_names(request):
     """
     if request.is_ajax():
         q = request.GET.get('term', '')
-        all_countries = COUNTRIES.values()
+        all_countries = lookups.get_countries().values()
 
         filtered_countries = [country for country in all_countries if country.lower().startswith(q.lower())]
 
@@ -412,7 +411,9 @@ def get_languages(request):
     """
     if request.is_ajax():
         q = request.GET.get('term', '')
-        filtered_languages = [language for language in LANGUAGES if language.lower().startswith(q.lower())]
+        filtered_languages = [
+            language for language in lookups.get_languages() if language.lower().startswith(q.lower())
+        ]
         data = json.dumps(filtered_languages)
     else:
         data = 'fail'
@@ -126,41 +126,42 @@ def get_all_reruns_of_a_course(course):
     :param course:
     :return reruns:
     """
-    from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
-    from course_action_state.models import CourseRerunState
-    from openedx.features.course_card.helpers import get_course_open_date
-    courses = []
+    from openedx.features.course_card.helpers import get_course_family_runs, get_course_overviews
     current_time = datetime.utcnow().replace(tzinfo=utc)
-    course_rerun_states = [crs.course_key for crs in CourseRerunState.objects.filter(
-        source_course_key=course.id, action="rerun", state="succeeded")] + [course.id]
-    course_rerun_objects = CourseOverview.objects.select_related('image_set').filter(
-        id__in=course_rerun_states).order_by('start')
-    for course_run in course_rerun_objects:
-
-        course_open_date = get_course_open_date(course_run)
-        if course_run.start > current_time:
-            course_run.course_open_date = course_open_date
+    future_runs = [
+        run for run in get_course_family_runs([course.id]).get(course.id, []) if run.start > current_time
+    ]
+    course_rerun_objects = get_course_overviews(run.course_id for run in future_runs)
+
+    courses = []
+    for run in future_runs:
+        course_run = course_rerun_objects.get(run.course_id)
+        if course_run:
+            course_run.course_open_date = run.open_date
             courses.append(course_run)
 
     return courses
 
 
-def get_user_current_enrolled_class(request, course):
+def get_user_current_enrolled_class(request, course, course_runs=None):
     """
     Method to get an ongoing user enrolled course. A course that meets the following criteria
     => start date <= today
     => end date > today
     => user is enrolled
+
+    `course_runs` are the CourseFamilyRun of the course, these are read from the course family index if not given
     """
     from opaque_keys.edx.locations import SlashSeparatedCourseKey
     from lms.djangoapps.philu_overrides.courseware.views.views import get_course_related_keys
+    from openedx.features.course_card.helpers import get_course_family_runs
     from student.models import CourseEnrollment
-    from course_action_state.models import CourseRerunState
 
-    all_course_reruns = [crs.course_key for crs in CourseRerunState.objects.filter(
-        source_course_key=course.id, action="rerun", state="succeeded")] + [course.id]
+    if course_runs is None:
+        course_runs = get_course_family_runs([course.id]).get(course.id, [])
+
     current_time = datetime.utcnow().replace(tzinfo=utc)
-    current_class = get_course_current_class(all_course_reruns, current_time)
+    current_class = get_course_current_class(course_runs, current_time)
 
     current_enrolled_class = False
     if current_class:
@@ -180,30 +181,28 @@ def get_user_current_enrolled_class(request, course):
     return current_class, current_enrolled_class, current_enrolled_class_target
 
 
-def get_course_current_class(all_course_reruns, current_time):
+def get_course_current_class(course_runs, current_time):
     """
     Method to get ongoing course
 
     Arguments:
-        all_course_reruns (list): List of course reruns key
+        course_runs (list): CourseFamilyRun of the course and its reruns
         current_time (datetime): Current time
 
     Returns:
         CourseOverview object or None
     """
     from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
-    from openedx.features.course_card.helpers import get_course_open_date
-    course = CourseOverview.objects.select_related('image_set').filter(
-        id__in=all_course_reruns, start__lte=current_time, end__gte=current_time).order_by('-start').first()
+    from openedx.features.course_card.helpers import get_current_course_run
+    current_run = get_current_course_run(course_runs, current_time)
+    if not current_run:
+        return None
 
+    course = CourseOverview.objects.select_related('image_set').filter(id=current_run.course_id).first()
     if course:
-        course_open_date = get_course_open_date(course)
+        course.course_open_date = current_run.open_date
 
-        if course.start <= current_time:
-            course.course_open_date = course_open_date
-            return course
-        else:
-            return None
+    return course
 
 
 def is_user_enrolled_in_any_class(course_current_class, course_next_classes):
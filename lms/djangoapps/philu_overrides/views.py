@@ -28,7 +28,6 @@ from lms.djangoapps.courseware.views.views import add_tag_to_enrolled_courses
 from lms.djangoapps.onboarding.helpers import get_alquity_community_url
 from lms.djangoapps.philu_api.helpers import get_course_custom_settings, get_social_sharing_urls
 from lms.djangoapps.philu_overrides.constants import ENROLL_SHARE_DESC_FORMAT, ENROLL_SHARE_TITLE_FORMAT
-from lms.djangoapps.philu_overrides.courseware.views.views import get_course_related_keys
 from openedx.core.djangoapps.catalog.utils import get_programs_with_type  # pylint: disable=ungrouped-imports
 from openedx.core.djangoapps.external_auth.models import ExternalAuthMap
 from openedx.core.djangoapps.site_configuration import helpers as configuration_helpers
@@ -36,6 +35,11 @@ from openedx.core.djangoapps.theming.helpers import is_request_in_themed_site
 from openedx.core.djangoapps.user_authn.cookies import set_logged_in_cookies
 from openedx.core.djangoapps.user_authn.views.deprecated import register_user as old_register_view
 from openedx.core.djangoapps.user_authn.views.deprecated import signin_user as old_login_view
+from openedx.features.course_card.helpers import (
+    get_course_landing_target,
+    get_course_landing_targets,
+    get_last_accessed_positions
+)
 from philu_overrides.helpers import (
     get_course_next_classes,
     get_next_url_for_login_page_override,
@@ -167,8 +171,6 @@ def courses_custom(request):
     """
     Render "find courses" page.  The course selection work is done in courseware.courses.
     """
-    from lms.djangoapps.courseware.views.views import get_last_accessed_courseware
-
     courses_list = []
     programs_list = []
     course_discovery_meanings = getattr(settings, 'COURSE_DISCOVERY_MEANINGS', {})
@@ -193,28 +195,17 @@ def courses_custom(request):
     if request.user.is_authenticated():
         add_tag_to_enrolled_courses(request.user, courses_list)
 
+    course_ids = [course.id for course in courses_list]
+    landing_targets = get_course_landing_targets(course_ids)
+    last_accessed_positions = get_last_accessed_positions(request.user, course_ids)
+
     for course in courses_list:
-        course_key = SlashSeparatedCourseKey.from_deprecated_string(
-            course.id.to_deprecated_string())
-        with modulestore().bulk_operations(course_key):
-            if has_access(request.user, 'load', course):
-                access_link = get_last_accessed_courseware(
-                    get_course_by_id(course_key, 0),
-                    request,
-                    request.user
-                )
-
-                first_chapter_url, first_section = get_course_related_keys(
-                    request, get_course_by_id(course_key, 0))
-                first_target = reverse('courseware_section', args=[
-                    course.id.to_deprecated_string(),
-                    first_chapter_url,
-                    first_section
-                ])
-
-                course.course_target = access_link or first_target
-            else:
-                course.course_target = '/courses/' + course.id.to_deprecated_string()
+        if has_access(request.user, 'load', course):
+            course.course_target = get_course_landing_target(
+                course.id, landing_targets[course.id], last_accessed_positions.get(course.id)
+            )
+        else:
+            course.course_target = '/courses/' + course.id.to_deprecated_string()
 
     return render_to_response(
         "courseware/courses.html",
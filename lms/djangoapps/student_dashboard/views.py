@@ -6,10 +6,13 @@ from datetime import datetime
 import pytz
 
 from common.lib.nodebb_client.client import NodeBBClient
-from course_action_state.models import CourseRerunState
-from custom_settings.models import CustomSettings
-from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
-from openedx.features.course_card.helpers import get_course_cards_list, get_course_open_date, get_related_card
+from openedx.features.course_card.helpers import (
+    get_course_cards_list,
+    get_course_family_runs,
+    get_course_open_date,
+    get_next_open_course_run,
+    get_related_card
+)
 from student.models import CourseEnrollment
 from student.views.dashboard import get_course_enrollments
 from xmodule.modulestore.django import modulestore
@@ -62,21 +65,19 @@ def get_recommended_xmodule_courses(request, _from='onboarding'):
     user_enrolled_courses = [enrollment.course_overview.id for enrollment in
                              list(get_course_enrollments(user, None, []))]
 
-    for course in courses_list:
-
-        course_rerun_states = [crs.course_key for crs in CourseRerunState.objects.filter(
-            source_course_key=course.id, action="rerun", state="succeeded")] + [course.id]
+    course_families = get_course_family_runs([course.id for course in courses_list])
 
-        course_rerun_object = CourseOverview.objects.select_related('image_set').filter(
-            id__in=course_rerun_states, enrollment_start__lte=current_time, enrollment_end__gte=current_time
-        ).exclude(id__in=user_enrolled_courses).order_by('start').first()
+    for course in courses_list:
+        course_rerun_object = get_next_open_course_run(
+            course_families.get(course.id, []), current_time, exclude_course_ids=user_enrolled_courses
+        )
 
         if course_rerun_object:
             course_list_ids.append(course.id)
-            _settings = CustomSettings.objects.filter(id=course_rerun_object.id).first()
-            course.settings_attrs = _settings
-            course.course_open_date = get_course_open_date(course_rerun_object)
-            course.target_course_id = course_rerun_object.id
+            # course family run holds tags of the run, same as its CustomSettings
+            course.settings_attrs = course_rerun_object
+            course.course_open_date = course_rerun_object.open_date
+            course.target_course_id = course_rerun_object.course_id
             course.self_paced = course_rerun_object.self_paced
             all_courses.append(course)
 
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('third_party_surveys', '0002_thirdpartysurvey_gizmo_survey_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThirdPartySurveySyncState',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('survey_id', models.IntegerField(unique=True)),
+                ('last_request_date', models.DateTimeField()),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='thirdpartysurvey',
+            name='survey_id',
+            field=models.IntegerField(null=True, blank=True),
+        ),
+        migrations.AlterIndexTogether(
+            name='thirdpartysurvey',
+            index_together=set([('survey_id', 'gizmo_survey_id')]),
+        ),
+    ]
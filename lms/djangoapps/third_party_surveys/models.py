@@ -12,6 +12,23 @@ class ThirdPartySurvey(TimeStampedModel):
     request_date = models.DateTimeField()
     user = models.ForeignKey(User, related_name='survey_user')
     survey_type = models.CharField(max_length=20, null=True, blank=True)
+    survey_id = models.IntegerField(null=True, blank=True)
+
+    class Meta(object):
+        index_together = (('survey_id', 'gizmo_survey_id'),)
 
     def __unicode__(self):
         return "{} | {} | {}".format(self.gizmo_survey_id, self.user, self.request_date)
+
+
+class ThirdPartySurveySyncState(models.Model):
+    """
+    Model that stores the submission date of the latest synced response of a Survey Gizmo survey, responses submitted
+    after it are fetched in the next sync
+    """
+    survey_id = models.IntegerField(unique=True)
+    last_request_date = models.DateTimeField()
+    modified = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return "{} | {}".format(self.survey_id, self.last_request_date)
@@ -1,32 +1,69 @@
 import pytz
 from celery import task
 from datetime import datetime, timedelta
+from itertools import chain
 from logging import getLogger
-from django.db import IntegrityError
+from django.contrib.auth.models import User
 
 from common.lib.surveygizmo_client.client import SurveyGizmoClient
-from lms.djangoapps.third_party_surveys.models import ThirdPartySurvey
+from lms.djangoapps.third_party_surveys.models import ThirdPartySurvey, ThirdPartySurveySyncState
 
 log = getLogger(__name__)
 
+SURVEY_PAGE_WORKERS = 4
+SURVEY_RESPONSES_PER_PAGE = 500
+SURVEY_RESPONSES_CHUNK_SIZE = 500
+
 
 def get_third_party_surveys():
     """
     Periodic Task that will run on daily basis and will sync the response data
     of all surveys thorough Survey Gizmo APIs
     We are scheduling this task through Jenkins instead of celery beat.
+
+    Responses of every survey are fetched from the submission date of the latest synced response of that survey,
+    pages are streamed and saved in chunks so that a large backlog is synced in bounded memory.
+    """
+    survey_gizmo_client = SurveyGizmoClient()
+    sync_states = {state.survey_id: state for state in ThirdPartySurveySyncState.objects.all()}
+    # surveys synced before responses were tracked per survey continue from the latest response of all surveys
+    legacy_request_date = get_latest_request_date()
+
+    for survey in survey_gizmo_client.get_surveys()['data']:
+        survey_id = int(survey['id'])
+        sync_state = sync_states.get(survey_id)
+        last_request_date = sync_state.last_request_date if sync_state else legacy_request_date
+
+        filters = []
+        if last_request_date:
+            filters = [('datesubmitted', '>=', convert_utc_to_edt(last_request_date))]
+
+        try:
+            response_pages = survey_gizmo_client.iter_survey_response_pages(
+                survey_id, survey_filters=filters, results_per_page=SURVEY_RESPONSES_PER_PAGE,
+                workers=SURVEY_PAGE_WORKERS
+            )
+            latest_request_date = save_responses(survey_id, chain.from_iterable(response_pages))
+        except Exception as ex:  # pylint: disable=broad-except
+            log.exception('Sync of responses failed for survey %s: %s', survey_id, ex.args)
+            continue
+
+        # High-water mark moves only after all pages of the survey are saved, an interrupted sync fetches them again
+        if latest_request_date:
+            ThirdPartySurveySyncState.objects.update_or_create(
+                survey_id=survey_id, defaults={'last_request_date': latest_request_date}
+            )
+
+
+def get_latest_request_date():
+    """
+    Submission date of the latest synced response of all surveys
     """
-    filters = []
     try:
-        surveys_count = ThirdPartySurvey.objects.count()
-        if surveys_count:
-            last_survey = ThirdPartySurvey.objects.all().order_by('-request_date')[0]
-            edt_survey_time = convert_utc_to_edt(last_survey.request_date)
-            filters = [('datesubmitted', '>=', edt_survey_time)]
-    except Exception as ex:
+        last_survey = ThirdPartySurvey.objects.all().order_by('-request_date').first()
+        return last_survey.request_date if last_survey else None
+    except Exception as ex:  # pylint: disable=broad-except
         log.exception(ex.args)
-    survey_responses = SurveyGizmoClient().get_filtered_survey_responses(survey_filters=filters)
-    save_responses(survey_responses)
 
 
 def convert_utc_to_edt(utc_dt):
@@ -43,22 +80,69 @@ def get_third_party_surveys_task():
     get_third_party_surveys()
 
 
-def save_responses(survey_responses):
+def save_responses(survey_id, survey_responses):
+    """
+    Save responses of a survey in chunks, responses which are already saved are skipped
+
+    Arguments:
+        survey_id (int): Survey Gizmo id of the survey
+        survey_responses (iterable): responses of the survey, consumed lazily
+
+    Returns:
+        datetime: submission date of the latest response, None if there are no responses
+    """
+    latest_request_date = None
+    surveys = []
+
     for response in survey_responses:
+        date = datetime.strptime(response['datesubmitted'], "%Y-%m-%d %H:%M:%S")
+        latest_request_date = max(latest_request_date, date) if latest_request_date else date
 
         if response.get('[url("edx_uid")]') in ['', 'undefined', None] \
                 or response.get('[url("status")]') == 'Deleted':
 
             continue
-        date = datetime.strptime(response['datesubmitted'], "%Y-%m-%d %H:%M:%S")
+
         try:
-            ThirdPartySurvey.objects.create(
+            surveys.append(ThirdPartySurvey(
                 response=response,
-                gizmo_survey_id=response.get('id'),
-                user_id=response.get('[url("edx_uid")]'),
+                gizmo_survey_id=int(response.get('id')),
+                user_id=int(response.get('[url("edx_uid")]')),
                 request_date=date,
-                survey_type=response.get('[url("app")]', '')
-            )
-
-        except (IntegrityError, ValueError) as exc:
+                survey_type=response.get('[url("app")]', ''),
+                survey_id=survey_id
+            ))
+        except (TypeError, ValueError) as exc:
             log.error(exc)
+
+        if len(surveys) >= SURVEY_RESPONSES_CHUNK_SIZE:
+            create_surveys(survey_id, surveys)
+            surveys = []
+
+    if surveys:
+        create_surveys(survey_id, surveys)
+
+    return latest_request_date
+
+
+def create_surveys(survey_id, surveys):
+    """
+    Insert a chunk of responses of a survey with one query, leaving out responses which are already saved and
+    responses of users which don't exist
+    """
+    saved_response_ids = set(ThirdPartySurvey.objects.filter(
+        survey_id=survey_id, gizmo_survey_id__in=[survey.gizmo_survey_id for survey in surveys]
+    ).values_list('gizmo_survey_id', flat=True))
+    user_ids = set(User.objects.filter(
+        id__in=[survey.user_id for survey in surveys]
+    ).values_list('id', flat=True))
+
+    new_surveys = []
+    for survey in surveys:
+        if survey.user_id not in user_ids:
+            log.error('User %s of survey response %s does not exist', survey.user_id, survey.gizmo_survey_id)
+        elif survey.gizmo_survey_id not in saved_response_ids:
+            saved_response_ids.add(survey.gizmo_survey_id)
+            new_surveys.append(survey)
+
+    ThirdPartySurvey.objects.bulk_create(new_surveys)
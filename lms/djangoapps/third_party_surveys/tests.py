@@ -1,3 +1,75 @@
+"""
+Tests for syncing third party surveys
+"""
+import mock
 from django.test import TestCase
+from django.test.utils import override_settings
 
-# Create your tests here.
+from common.lib.surveygizmo_client.client import SurveyGizmoClient
+from lms.djangoapps.third_party_surveys.models import ThirdPartySurvey, ThirdPartySurveySyncState
+from lms.djangoapps.third_party_surveys.tasks import get_third_party_surveys
+from student.tests.factories import UserFactory
+
+SURVEY_ID = 10
+
+
+def get_response(response_id, user_id, date_submitted):
+    return {
+        'id': str(response_id),
+        'datesubmitted': date_submitted,
+        '[url("edx_uid")]': str(user_id),
+        '[url("app")]': 'mobile',
+    }
+
+
+@override_settings(SURVEY_GIZMO_TOKEN='token', SURVEY_GIZMO_TOKEN_SECRET='secret')
+@mock.patch('lms.djangoapps.third_party_surveys.tasks.SURVEY_RESPONSES_CHUNK_SIZE', 2)
+@mock.patch.object(SurveyGizmoClient, 'get_surveys', return_value={'data': [{'id': str(SURVEY_ID)}]})
+class GetThirdPartySurveysTestCase(TestCase):
+    """
+    Tests for streaming responses of surveys from Survey Gizmo into database
+    """
+
+    def setUp(self):
+        super(GetThirdPartySurveysTestCase, self).setUp()
+        self.user = UserFactory()
+        self.pages = {
+            1: [
+                get_response(1, self.user.id, '2020-07-01 10:00:00'),
+                get_response(2, self.user.id, '2020-07-01 11:00:00'),
+            ],
+            2: [
+                get_response(3, self.user.id, '2020-07-02 10:00:00'),
+                get_response(4, 0, '2020-07-02 11:00:00'),
+            ],
+            3: [get_response(5, 'undefined', '2020-07-03 10:00:00')],
+        }
+
+    def get_survey_responses(self, survey_id, survey_filters=None, page_no=1, results_per_page=500):
+        return {'data': self.pages[page_no], 'page': str(page_no), 'total_pages': str(len(self.pages))}
+
+    def test_responses_are_saved_and_sync_state_is_updated(self, mock_get_surveys):
+        with mock.patch.object(SurveyGizmoClient, 'get_survey_responses', side_effect=self.get_survey_responses):
+            get_third_party_surveys()
+
+        self.assertEqual(
+            sorted(ThirdPartySurvey.objects.values_list('gizmo_survey_id', flat=True)), [1, 2, 3]
+        )
+        self.assertTrue(ThirdPartySurvey.objects.filter(survey_id=SURVEY_ID, user=self.user).exists())
+        self.assertEqual(
+            ThirdPartySurveySyncState.objects.get(survey_id=SURVEY_ID).last_request_date.strftime('%Y-%m-%d'),
+            '2020-07-03'
+        )
+
+    def test_sync_continues_from_sync_state_and_skips_saved_responses(self, mock_get_surveys):
+        with mock.patch.object(SurveyGizmoClient, 'get_survey_responses', side_effect=self.get_survey_responses):
+            get_third_party_surveys()
+
+        with mock.patch.object(
+            SurveyGizmoClient, 'get_survey_responses', side_effect=self.get_survey_responses
+        ) as mock_get_survey_responses:
+            get_third_party_surveys()
+
+        survey_filters = mock_get_survey_responses.call_args[1]['survey_filters']
+        self.assertEqual(survey_filters[0][:2], ('datesubmitted', '>='))
+        self.assertEqual(ThirdPartySurvey.objects.count(), 3)
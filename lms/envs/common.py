@@ -2405,6 +2405,9 @@ INSTALLED_APPS = [
     # Application for custom fields
     'openedx.features.custom_fields',
 
+    # PhilU teams browser
+    'openedx.features.teams',
+
     'channels',
     'multiselectfield',
 
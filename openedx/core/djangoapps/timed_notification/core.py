@@ -2,11 +2,13 @@ import logging
 
 from lms.djangoapps.courseware.access import has_access
 from opaque_keys.edx.locations import SlashSeparatedCourseKey
-from student.models import CourseEnrollment
+from django.contrib.auth.models import User
 from django.core.urlresolvers import reverse
 from django.conf import settings
+from django.db.models import Count
 
-from collections import Counter
+from collections import Counter, defaultdict
+from datetime import date
 from boto.ses.exceptions import (
     SESAddressBlacklistedError,
     SESDomainEndsWithDotError,
@@ -14,11 +16,14 @@ from boto.ses.exceptions import (
     SESIllegalAddressError,
 )
 from common.lib.mandrill_client.client import MandrillClient
+from openedx.core.djangoapps.timed_notification.models import EmailDeliveryLedger
 from lms.djangoapps.courseware.courses import get_course_by_id
 from xmodule.modulestore.django import modulestore
 
 log = logging.getLogger('timed_notifications')
 
+NOTIFICATION_RECIPIENTS_BATCH_SIZE = 1000
+
 # Errors that an individual email is failing to be sent, and should just
 # be treated as a fail.
 SINGLE_EMAIL_FAILURE_ERRORS = (
@@ -34,6 +39,9 @@ def send_course_notification_email(course, template_name, context, to_list=None)
     """
     Sends an email to a list of recipients.
 
+    Recipients are read in batches of NOTIFICATION_RECIPIENTS_BATCH_SIZE and every batch is handed to a celery
+    subtask, so recipients of a course are never loaded all at once.
+
     Inputs are:
       * `course`: notification about this course.
       * `template_name`: slug of the Mandrill template which is to be used.
@@ -41,56 +49,181 @@ def send_course_notification_email(course, template_name, context, to_list=None)
       * `to_list`: list of recipients, if list is not provided then the email will be send to all enrolled students.
 
     """
+    # imported here because tasks of this app import this module
+    from openedx.core.djangoapps.timed_notification.tasks import task_send_course_notification_batch
 
     log.info("Sending email for course %s", course)
     if to_list is None:
-        to_list = CourseEnrollment.objects.users_enrolled_in(course.id)
-    log.info("Users list %s", to_list)
-    total_recipients = len(to_list)
-    recipient_num = 0
-    log.info("Setting up reference of user information")
-    recipients_info = Counter()
+        recipient_batches = get_course_recipient_batches(course.id)
+    else:
+        recipients = [(recipient.email, recipient.first_name, recipient.last_name) for recipient in to_list]
+        recipient_batches = (
+            recipients[batch_start:batch_start + NOTIFICATION_RECIPIENTS_BATCH_SIZE]
+            for batch_start in range(0, len(recipients), NOTIFICATION_RECIPIENTS_BATCH_SIZE)
+        )
 
-    log.info(
-        "TimedNotification ==> TotalRecipients: %s",
-        total_recipients
-    )
+    campaign = '{}:{}:{}'.format(template_name, course.id, date.today())
+    recipients_count = batches_count = 0
 
     try:
-        log.info("Before loop through to the user-list")
-        for current_recipient in to_list:
-            recipient_num += 1
-            log.info("Getting user email")
-            email = current_recipient.email
-            log.info("Adding full name in the context")
-            context["full_name"] = current_recipient.first_name + " " + current_recipient.last_name
-
-            log.info(
-                "TimedNotification ==> Recipient num: %s/%s, Recipient name: %s, Email address: %s",
-                recipient_num,
-                total_recipients,
-                current_recipient.username,
-                email
-            )
-            log.info("Just before sending email")
-            MandrillClient().send_mail(template_name, email, context)
-            log.info("After sending email")
-
-            recipients_info[email] += 1
-
-        duplicate_recipients = ["{0} ({1})".format(email, repetition)
-                                for email, repetition in recipients_info.most_common() if repetition > 1]
-        if duplicate_recipients:
-            log.info(
-                "TimedNotification ==> Total Duplicate Recipients [%s]: [%s]",
-                len(duplicate_recipients),
-                ', '.join(duplicate_recipients)
-            )
+        for recipients in recipient_batches:
+            task_send_course_notification_batch.delay(campaign, template_name, context, recipients)
+            recipients_count += len(recipients)
+            batches_count += 1
+
+        log.info("TimedNotification ==> TotalRecipients: %s, batches: %s", recipients_count, batches_count)
     except Exception as e:
         log.info(e.message)
         log.info('Email send failed!')
 
 
+def get_course_recipient_batches(course_id, batch_size=NOTIFICATION_RECIPIENTS_BATCH_SIZE):
+    """
+    Lazily yields batches of users enrolled in a course, keyset paginated on user id so that only one batch of rows
+    is held in memory.
+
+    Yields:
+        list: (email, first_name, last_name) tuples
+    """
+    last_user_id = 0
+
+    while True:
+        users = list(User.objects.filter(
+            courseenrollment__course_id=course_id,
+            courseenrollment__is_active=True,
+            id__gt=last_user_id,
+        ).order_by('id').values_list('id', 'email', 'first_name', 'last_name')[:batch_size])
+
+        if not users:
+            return
+
+        last_user_id = users[-1][0]
+        yield [(email, first_name, last_name) for _, email, first_name, last_name in users]
+
+
+def send_course_notification_batch(campaign, template_name, context, recipients):
+    """
+    Sends email of a campaign to a batch of recipients and logs the delivery status of the batch and the campaign
+
+    Arguments:
+        campaign (str): unique identifier of this email e.g. template, course and date
+        template_name (str): slug of the Mandrill template
+        context (dict): context for template, common for all recipients
+        recipients (list): (email, first_name, last_name) tuples
+
+    Returns:
+        Counter: number of recipients of the batch against each delivery status
+    """
+    recipients = [
+        {
+            'email': email,
+            'merge_vars': {'full_name': first_name + " " + last_name}
+        }
+        for email, first_name, last_name in recipients
+    ]
+
+    status_counts = send_bulk_email(campaign, template_name, recipients, context)
+    log.info(
+        "TimedNotification ==> BatchRecipients: %s, delivery status: %s, campaign %s delivery status: %s",
+        len(recipients),
+        dict(status_counts),
+        campaign,
+        dict(get_campaign_status_counts(campaign))
+    )
+    return status_counts
+
+
+def get_campaign_status_counts(campaign):
+    """
+    Returns:
+        Counter: number of recipients of the campaign against each delivery status recorded so far
+    """
+    return Counter(dict(
+        EmailDeliveryLedger.objects.filter(campaign=campaign).values('status').annotate(
+            count=Count('id')
+        ).values_list('status', 'count')
+    ))
+
+
+def send_bulk_email(campaign, template_name, recipients, context, subject=None):
+    """
+    Sends an email to many recipients in chunked Mandrill calls and records delivery status of every recipient.
+
+    Recipients to whom the email of the same campaign has already been delivered are skipped, so sending a campaign
+    again only goes to the recipients for whom it failed.
+
+    Arguments:
+        campaign (str): unique identifier of this email e.g. template, course and date
+        template_name (str): slug of the Mandrill template
+        recipients (list): dicts with `email` and optional per recipient `merge_vars` dict
+        context (dict): context for template, common for all recipients
+        subject (str): subject of the email
+
+    Returns:
+        Counter: number of recipients against each delivery status
+    """
+    delivered_emails = _get_delivered_emails(campaign, [recipient['email'] for recipient in recipients])
+
+    pending_recipients = []
+    pending_emails = set()
+    for recipient in recipients:
+        email = recipient['email']
+        if email in delivered_emails or email in pending_emails:
+            continue
+        pending_emails.add(email)
+        pending_recipients.append(recipient)
+
+    if not pending_recipients:
+        return Counter()
+
+    results = MandrillClient().send_bulk_mail(template_name, pending_recipients, context, subject=subject)
+    _record_email_deliveries(campaign, results)
+
+    return Counter(result.get('status') for result in results)
+
+
+def _get_delivered_emails(campaign, emails, batch_size=500):
+    """
+    Returns the emails, out of the given ones, to which email of the campaign has already been delivered
+    """
+    delivered_emails = set()
+
+    for batch_start in range(0, len(emails), batch_size):
+        delivered_emails.update(EmailDeliveryLedger.objects.filter(
+            campaign=campaign,
+            email__in=emails[batch_start:batch_start + batch_size],
+            status__in=EmailDeliveryLedger.DELIVERED_STATUSES
+        ).values_list('email', flat=True))
+
+    return delivered_emails
+
+
+def _record_email_deliveries(campaign, results, batch_size=500):
+    """
+    Create or update ledger rows of the campaign with the delivery results from Mandrill
+    """
+    statuses = {result['email']: result.get('status', EmailDeliveryLedger.ERROR) for result in results}
+    emails = statuses.keys()
+
+    for batch_start in range(0, len(emails), batch_size):
+        batch_emails = emails[batch_start:batch_start + batch_size]
+        existing_emails = set(EmailDeliveryLedger.objects.filter(
+            campaign=campaign, email__in=batch_emails
+        ).values_list('email', flat=True))
+
+        EmailDeliveryLedger.objects.bulk_create([
+            EmailDeliveryLedger(campaign=campaign, email=email, status=statuses[email])
+            for email in batch_emails if email not in existing_emails
+        ])
+
+        emails_by_status = defaultdict(list)
+        for email in existing_emails:
+            emails_by_status[statuses[email]].append(email)
+
+        for status, status_emails in emails_by_status.items():
+            EmailDeliveryLedger.objects.filter(campaign=campaign, email__in=status_emails).update(status=status)
+
+
 def get_course_link(course_id):
     course_link = reverse("about_course", args=[course_id])
     base_url = settings.LMS_ROOT_URL
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailDeliveryLedger',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('campaign', models.CharField(max_length=255)),
+                ('email', models.CharField(max_length=254)),
+                ('status', models.CharField(max_length=16)),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='emaildeliveryledger',
+            unique_together=set([('campaign', 'email')]),
+        ),
+    ]
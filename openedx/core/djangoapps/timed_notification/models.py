@@ -0,0 +1,29 @@
+"""
+Models for timed_notification app
+"""
+from django.db import models
+
+
+class EmailDeliveryLedger(models.Model):
+    """
+    Delivery status of every recipient of a bulk email, so that sending the same email again only goes to the
+    recipients for whom it failed
+    """
+    SENT = 'sent'
+    QUEUED = 'queued'
+    SCHEDULED = 'scheduled'
+    REJECTED = 'rejected'
+    INVALID = 'invalid'
+    ERROR = 'error'
+    DELIVERED_STATUSES = (SENT, QUEUED, SCHEDULED)
+
+    campaign = models.CharField(max_length=255)
+    email = models.CharField(max_length=254)
+    status = models.CharField(max_length=16)
+    modified = models.DateTimeField(auto_now=True)
+
+    class Meta(object):
+        unique_together = ('campaign', 'email')
+
+    def __unicode__(self):
+        return u'EmailDeliveryLedger: {}, {}: {}'.format(self.campaign, self.email, self.status)
@@ -1,7 +1,9 @@
 import logging
+from celery.task import task
 from datetime import datetime, timedelta, date
 from pytz import utc
 from openedx.core.djangoapps.timed_notification.core import \
+    send_course_notification_batch, \
     send_course_notification_email, \
     get_course_link, \
     get_course_first_chapter_link
@@ -80,3 +82,11 @@ def task_course_notifications():
             log.info("Finishing celery task")
 
     log.info("Emailing Task Completed")
+
+
+@task(routing_key=settings.BULK_EMAIL_ROUTING_KEY)
+def task_send_course_notification_batch(campaign, template_name, context, recipients):
+    """
+    Send course notification email of a campaign to a batch of (email, first_name, last_name) recipients
+    """
+    send_course_notification_batch(campaign, template_name, context, recipients)
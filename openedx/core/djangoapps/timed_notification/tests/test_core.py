@@ -0,0 +1,150 @@
+"""
+Tests for bulk email sending of timed_notification app
+"""
+import mandrill
+import requests
+from django.test import TestCase
+from mock import Mock, patch
+from opaque_keys.edx.keys import CourseKey
+
+from common.lib.mandrill_client.client import MandrillClient
+from openedx.core.djangoapps.timed_notification.core import (
+    get_course_recipient_batches,
+    send_bulk_email,
+    send_course_notification_batch,
+    send_course_notification_email
+)
+from openedx.core.djangoapps.timed_notification.models import EmailDeliveryLedger
+from student.tests.factories import CourseEnrollmentFactory, UserFactory
+
+
+class SendBulkMailTestCase(TestCase):
+    """
+    Tests for `MandrillClient.send_bulk_mail`
+    """
+
+    @patch('common.lib.mandrill_client.client.mandrill.Mandrill')
+    def test_recipients_are_sent_in_chunks(self, mocked_mandrill):
+        send_template = mocked_mandrill.return_value.messages.send_template
+        send_template.side_effect = lambda template_name, template_content, message: [
+            {'email': recipient['email'], 'status': 'sent'} for recipient in message['to']
+        ]
+        recipients = [{'email': 'user{}@example.com'.format(i), 'merge_vars': {'full_name': 'User'}} for i in range(5)]
+
+        results = MandrillClient().send_bulk_mail('test-template', recipients, {'course_name': 'test'}, chunk_size=2)
+
+        self.assertEqual(send_template.call_count, 3)
+        self.assertEqual([result['email'] for result in results], [recipient['email'] for recipient in recipients])
+
+        message = send_template.call_args_list[0][1]['message']
+        self.assertFalse(message['preserve_recipients'])
+        self.assertEqual(message['global_merge_vars'], [{'name': 'course_name', 'content': 'test'}])
+        self.assertEqual(
+            message['merge_vars'][0],
+            {'rcpt': 'user0@example.com', 'vars': [{'name': 'full_name', 'content': 'User'}]}
+        )
+
+    @patch('common.lib.mandrill_client.client.mandrill.Mandrill')
+    def test_failed_chunk_marks_recipients_as_error(self, mocked_mandrill):
+        mocked_mandrill.return_value.messages.send_template.side_effect = mandrill.Error('failed')
+
+        results = MandrillClient().send_bulk_mail('test-template', [{'email': 'user@example.com'}], {})
+
+        self.assertEqual(results[0]['status'], 'error')
+
+    @patch('common.lib.mandrill_client.client.mandrill.Mandrill')
+    def test_connection_error_fails_only_its_chunk(self, mocked_mandrill):
+        def send_template(template_name, template_content, message):  # pylint: disable=unused-argument
+            if message['to'][0]['email'] == 'user0@example.com':
+                raise requests.exceptions.ConnectionError('connection reset')
+            return [{'email': recipient['email'], 'status': 'sent'} for recipient in message['to']]
+
+        mocked_mandrill.return_value.messages.send_template.side_effect = send_template
+        recipients = [{'email': 'user{}@example.com'.format(i)} for i in range(4)]
+
+        results = MandrillClient().send_bulk_mail('test-template', recipients, {}, chunk_size=2)
+
+        self.assertEqual([result['status'] for result in results], ['error', 'error', 'sent', 'sent'])
+
+
+class SendBulkEmailTestCase(TestCase):
+    """
+    Tests for `send_bulk_email` and its delivery ledger
+    """
+
+    @patch('openedx.core.djangoapps.timed_notification.core.MandrillClient')
+    def test_only_failed_recipients_are_resent(self, mocked_client):
+        send_bulk_mail = mocked_client.return_value.send_bulk_mail
+        send_bulk_mail.return_value = [
+            {'email': 'sent@example.com', 'status': 'sent'},
+            {'email': 'failed@example.com', 'status': 'error'},
+        ]
+        recipients = [{'email': 'sent@example.com'}, {'email': 'failed@example.com'}, {'email': 'sent@example.com'}]
+
+        status_counts = send_bulk_email('campaign', 'test-template', recipients, {})
+
+        self.assertEqual(status_counts, {'sent': 1, 'error': 1})
+        send_bulk_mail.assert_called_once_with(
+            'test-template', [{'email': 'sent@example.com'}, {'email': 'failed@example.com'}], {}, subject=None
+        )
+
+        send_bulk_mail.return_value = [{'email': 'failed@example.com', 'status': 'sent'}]
+        send_bulk_email('campaign', 'test-template', recipients, {})
+
+        send_bulk_mail.assert_called_with('test-template', [{'email': 'failed@example.com'}], {}, subject=None)
+        self.assertEqual(
+            set(EmailDeliveryLedger.objects.filter(campaign='campaign').values_list('email', 'status')),
+            {('sent@example.com', 'sent'), ('failed@example.com', 'sent')}
+        )
+
+
+class SendCourseNotificationEmailTestCase(TestCase):
+    """
+    Tests for sending course notification emails in batches of recipients
+    """
+
+    def setUp(self):
+        super(SendCourseNotificationEmailTestCase, self).setUp()
+        self.course_id = CourseKey.from_string('course-v1:test+test+test')
+        self.users = [UserFactory(first_name='First', last_name=str(index)) for index in range(5)]
+        for user in self.users:
+            CourseEnrollmentFactory(user=user, course_id=unicode(self.course_id))
+
+        CourseEnrollmentFactory(user=UserFactory(), course_id=unicode(self.course_id), is_active=False)
+
+    def test_recipients_are_read_in_batches(self):
+        batches = list(get_course_recipient_batches(self.course_id, batch_size=2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(
+            [recipient for batch in batches for recipient in batch],
+            [(user.email, user.first_name, user.last_name) for user in self.users]
+        )
+
+    @patch('openedx.core.djangoapps.timed_notification.core.NOTIFICATION_RECIPIENTS_BATCH_SIZE', 2)
+    @patch('openedx.core.djangoapps.timed_notification.tasks.task_send_course_notification_batch.delay')
+    def test_every_batch_is_sent_by_a_subtask(self, mocked_delay):
+        course = Mock(id=self.course_id)
+
+        send_course_notification_email(course, 'test-template', {'course_name': 'test'}, to_list=self.users)
+
+        self.assertEqual(mocked_delay.call_count, 3)
+        campaign, template_name, context, recipients = mocked_delay.call_args_list[0][0]
+        self.assertTrue(campaign.startswith('test-template:{}:'.format(self.course_id)))
+        self.assertEqual((template_name, context), ('test-template', {'course_name': 'test'}))
+        self.assertEqual(recipients, [(user.email, user.first_name, user.last_name) for user in self.users[:2]])
+
+    @patch('openedx.core.djangoapps.timed_notification.core.MandrillClient')
+    def test_batch_is_sent_with_full_names(self, mocked_client):
+        send_bulk_mail = mocked_client.return_value.send_bulk_mail
+        send_bulk_mail.return_value = [{'email': 'user@example.com', 'status': 'sent'}]
+
+        status_counts = send_course_notification_batch(
+            'campaign', 'test-template', {}, [('user@example.com', 'First', 'Last')]
+        )
+
+        self.assertEqual(status_counts, {'sent': 1})
+        send_bulk_mail.assert_called_once_with(
+            'test-template', [{'email': 'user@example.com', 'merge_vars': {'full_name': 'First Last'}}], {},
+            subject=None
+        )
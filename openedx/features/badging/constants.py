@@ -37,3 +37,7 @@ UNKNOWN_COURSE_ERROR = 'Cannot assign badge {badge_id} for team {community_id} i
 EARNED_BADGE_NOTIFICATION_TYPE = 'philu.badging.user-badge-earned'
 
 JSON_NOTIFICATION_RENDERER = 'edx_notifications.renderers.basic.JsonRenderer'
+
+BADGES_VERSION_CACHE_KEY = 'badging.badges.version'
+TROPHYCASE_CACHE_KEY = 'badging.trophycase.{user_id}.{badges_version}'
+TROPHYCASE_CACHE_TIMEOUT = 24 * 60 * 60  # seconds
@@ -7,10 +7,12 @@ from edx_notifications.data import NotificationType
 from edx_notifications.lib.publisher import register_notification_type
 from edx_notifications.signals import perform_type_registrations
 
+from lms.djangoapps.teams.models import CourseTeamMembership
 from nodebb.models import TeamGroupChat
 from nodebb.tasks import task_delete_badge_info_from_nodebb, task_sync_badge_info_with_nodebb
 
 from .constants import EARNED_BADGE_NOTIFICATION_TYPE, JSON_NOTIFICATION_RENDERER
+from .helpers.badges import increment_badges_version, invalidate_trophycase
 from .models import Badge, UserBadge
 
 
@@ -36,6 +38,22 @@ def delete_badge_info_from_nodebb(sender, instance, **kwargs):  # pylint: disabl
     task_delete_badge_info_from_nodebb.delay(badge_data)
 
 
+@receiver(post_save, sender=Badge)
+@receiver(post_delete, sender=Badge)
+def invalidate_badges_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """On badge creation, update or deletion, mark cached badges and all trophy cases as outdated."""
+    increment_badges_version()
+
+
+@receiver(post_save, sender=UserBadge)
+@receiver(post_delete, sender=UserBadge)
+@receiver(post_save, sender=CourseTeamMembership)
+@receiver(post_delete, sender=CourseTeamMembership)
+def invalidate_user_trophycase(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """When user earns or loses a badge, or joins or leaves a team, remove cached trophy case of user."""
+    invalidate_trophycase(instance.user_id)
+
+
 @receiver(post_delete, sender=TeamGroupChat)
 def delete_user_badges(sender, instance, **kwargs):  # pylint: disable=unused-argument
     """
@@ -4,6 +4,7 @@ All helper methods related to badges
 import json
 from collections import OrderedDict
 
+from django.core.cache import cache
 from django.urls import reverse
 
 from lms.djangoapps.courseware.courses import get_course_by_id
@@ -14,6 +15,7 @@ from openedx.features.badging.constants import (
     BADGES_DATE_EARNED_KEY,
     BADGES_KEY,
     BADGES_PROGRESS_KEY,
+    BADGES_VERSION_CACHE_KEY,
     CONVERSATIONALIST,
     COURSES_KEY,
     DISCUSSION_COUNT_KEY,
@@ -25,6 +27,8 @@ from openedx.features.badging.constants import (
     TEAM_PLAYER,
     TEAM_ROOM_ID_KEY,
     THRESHOLD_LABEL_KEY,
+    TROPHYCASE_CACHE_KEY,
+    TROPHYCASE_CACHE_TIMEOUT,
     USERNAME_KEY
 )
 from openedx.features.badging.models import Badge
@@ -32,6 +36,105 @@ from openedx.features.badging.models import Badge
 BADGE_TYPE_TEAM = TEAM_PLAYER[TEAM_PLAYER_ENTRY_INDEX]
 BADGE_TYPE_CONVERSATIONALIST = CONVERSATIONALIST[CONVERSATIONALIST_ENTRY_INDEX]
 
+# (version, badges grouped by type) of this process
+_badges_by_type = None
+
+
+def get_badges_version():
+    """
+    Version of badge definitions, incremented whenever a badge is saved or deleted
+    """
+    cache.add(BADGES_VERSION_CACHE_KEY, 1, None)
+    return cache.get(BADGES_VERSION_CACHE_KEY, 1)
+
+
+def increment_badges_version():
+    """
+    Mark badge definitions cached in every process, and all trophy cases, as outdated
+    """
+    cache.add(BADGES_VERSION_CACHE_KEY, 1, None)
+    try:
+        cache.incr(BADGES_VERSION_CACHE_KEY)
+    except ValueError:
+        # key was evicted between add and incr, set a version no process can have cached
+        cache.set(BADGES_VERSION_CACHE_KEY, get_badges_version() + 1, None)
+
+
+def group_badges_by_type(badge_queryset):
+    """
+    Group badges by their type
+    :param badge_queryset: Badge queryset
+    :return: dictionary of badge type and list of badges, as dictionaries, of that type
+    """
+    badges_by_type = {badge_type: [] for badge_type, _ in Badge.BADGE_TYPES}
+
+    for badge in badge_queryset.values():
+        badges_by_type.setdefault(badge['type'], []).append(badge)
+
+    return badges_by_type
+
+
+def get_badges_by_type():
+    """
+    Badge definitions grouped by type and ordered by threshold, read from database once per version of badges
+    :return: dictionary of badge type and list of badges of that type
+    """
+    global _badges_by_type  # pylint: disable=global-statement
+
+    version = get_badges_version()
+    badges_by_type = _badges_by_type
+
+    if not badges_by_type or badges_by_type[0] != version:
+        badges_by_type = (version, group_badges_by_type(Badge.objects.all().order_by(THRESHOLD_LABEL_KEY)))
+        _badges_by_type = badges_by_type
+
+    return badges_by_type[1]
+
+
+def get_cached_trophycase(user, courses):
+    """
+    Get trophycase of user, populated by `populate_trophycase`, from cache
+    :param user: Current logged-in user
+    :param courses: Courses enrolled by user
+    :return: trophycase dictionary or None if it is not cached or has been cached for different courses
+    """
+    cached_trophycase = cache.get(_get_trophycase_cache_key(user.id))
+
+    if not cached_trophycase or cached_trophycase['courses'] != _get_courses_signature(courses):
+        return None
+
+    return cached_trophycase['trophycase']
+
+
+def cache_trophycase(user, courses, trophycase_dict):
+    """
+    Cache trophycase of user till a badge of user, a team membership of user or any badge changes
+    :param user: Current logged-in user
+    :param courses: Courses enrolled by user, for which trophycase is populated
+    :param trophycase_dict: trophycase populated by `populate_trophycase`
+    """
+    cache.set(
+        _get_trophycase_cache_key(user.id),
+        {'courses': _get_courses_signature(courses), 'trophycase': trophycase_dict},
+        TROPHYCASE_CACHE_TIMEOUT
+    )
+
+
+def invalidate_trophycase(user_id):
+    """
+    Remove cached trophycase of user
+    :param user_id: User id
+    """
+    cache.delete(_get_trophycase_cache_key(user_id))
+
+
+def _get_trophycase_cache_key(user_id):
+    return TROPHYCASE_CACHE_KEY.format(user_id=user_id, badges_version=get_badges_version())
+
+
+def _get_courses_signature(courses):
+    return [(unicode(course_key), display_name) for course_key, display_name in courses]
+
 
 def populate_trophycase(user, courses, earned_badges):
     """
@@ -43,10 +146,10 @@ def populate_trophycase(user, courses, earned_badges):
     :return: dictionary containing trophycase json
     """
     trophycase_dict = OrderedDict()
-    badge_queryset = Badge.objects.all().order_by(THRESHOLD_LABEL_KEY)
+    badges_by_type = get_badges_by_type()
 
     for course_key, display_name in courses:
-        course_badges = get_course_badges(user, course_key, earned_badges, badge_queryset)
+        course_badges = get_course_badges(user, course_key, earned_badges, badges_by_type=badges_by_type)
 
         course_id = unicode(course_key)
         trophycase_dict[course_id] = {
@@ -57,21 +160,25 @@ def populate_trophycase(user, courses, earned_badges):
     return trophycase_dict
 
 
-def get_course_badges(user, course_id, earned_badges, badge_queryset=None):
+def get_course_badges(user, course_id, earned_badges, badge_queryset=None, badges_by_type=None):
     """
     Get all badges of a course in a hierarchy, categorised by badge type
     :param user: Current logged-in user
     :param badge_queryset: Badge queryset
     :param course_id: Course identifier
     :param earned_badges: All badges earned in a course
+    :param badges_by_type: Badges grouped by type from `get_badges_by_type`, used instead of badge_queryset
     :return: List of badges in a course
     """
     badges = {
         BADGES_KEY: dict()
     }
 
-    if not badge_queryset:
-        badge_queryset = Badge.objects.all().order_by(THRESHOLD_LABEL_KEY)
+    if badges_by_type is None:
+        if not badge_queryset:
+            badge_queryset = Badge.objects.all().order_by(THRESHOLD_LABEL_KEY)
+
+        badges_by_type = group_badges_by_type(badge_queryset)
 
     for badge_type, _ in Badge.BADGE_TYPES:
 
@@ -89,9 +196,8 @@ def get_course_badges(user, course_id, earned_badges, badge_queryset=None):
                 badges[TEAM_ID_KEY] = course_team[TEAM_ID_KEY]
                 badges[TEAM_ROOM_ID_KEY] = course_team[TEAM_ROOM_ID_KEY]
 
-        badge_list = list(
-            badge_queryset.filter(type=badge_type).values()
-        )
+        # copy badges because earned date and progress is added to them
+        badge_list = [dict(badge) for badge in badges_by_type[badge_type]]
 
         add_badge_earned_date(course_id, badge_list, earned_badges)
 
@@ -109,11 +215,15 @@ def add_badge_earned_date(course_id, course_badges, earned_badges):
     :param course_badges: All badges of a course
     :param earned_badges: All badges earned in a course
     """
+    earned_dates = {
+        earned_badge.badge_id: earned_badge.date_earned
+        for earned_badge in earned_badges if course_id == earned_badge.course_id
+    }
+
     for badge in course_badges:
-        for earned_badge in earned_badges:
-            if badge['id'] == earned_badge.badge_id and course_id == earned_badge.course_id:
-                # earned date indicate badge is earned
-                badge[BADGES_DATE_EARNED_KEY] = earned_badge.date_earned
+        if badge['id'] in earned_dates:
+            # earned date indicate badge is earned
+            badge[BADGES_DATE_EARNED_KEY] = earned_dates[badge['id']]
 
 
 def filter_earned_badge_by_joined_team(user, course, earned_badges):
@@ -252,6 +252,41 @@ class BadgeHelperTestCases(ModuleStoreTestCase):
         self.assertIsNotNone(course_badges[0]['date_earned'])
         self.assertRaises(KeyError, lambda: course_badges[1]['date_earned'])
 
+    def test_get_badges_by_type_refreshed_on_badge_change(self):
+        """
+        Assert that badges are read from database only once, till any badge is changed
+        :return: None
+        """
+        BadgeFactory(type=self.type_conversationalist, threshold=5)
+        BadgeFactory(type=self.type_conversationalist, threshold=2)
+        badge_helpers.get_badges_by_type()
+
+        with self.assertNumQueries(0):
+            badges_by_type = badge_helpers.get_badges_by_type()
+
+        self.assertEqual([badge['threshold'] for badge in badges_by_type[self.type_conversationalist]], [2, 5])
+
+        BadgeFactory(type=self.type_conversationalist, threshold=3)
+        badges_by_type = badge_helpers.get_badges_by_type()
+        self.assertEqual([badge['threshold'] for badge in badges_by_type[self.type_conversationalist]], [2, 3, 5])
+
+    def test_cached_trophycase_invalidated_on_earned_badge(self):
+        """
+        Assert that cached trophycase is returned only for same courses and till user earns a badge
+        :return: None
+        """
+        badge = BadgeFactory(threshold=2)
+        courses = [(self.course1.id, self.course1.display_name)]
+        trophycase_dict = {unicode(self.course1.id): {'display_name': self.course1.display_name, 'badges': {}}}
+
+        badge_helpers.cache_trophycase(self.user, courses, trophycase_dict)
+
+        self.assertEqual(badge_helpers.get_cached_trophycase(self.user, courses), trophycase_dict)
+        self.assertIsNone(badge_helpers.get_cached_trophycase(self.user, list()))
+
+        UserBadgeFactory(user=self.user, course_id=self.course1.id, badge=badge)
+        self.assertIsNone(badge_helpers.get_cached_trophycase(self.user, courses))
+
     @factory.django.mute_signals(signals.pre_save, signals.post_save)
     def test_filter_earned_badge_by_joined_team(self):
         """
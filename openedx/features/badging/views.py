@@ -15,7 +15,9 @@ from student.models import CourseEnrollment
 from .constants import BADGES_KEY, COMMUNITY_URL_KEY, COURSE_ID_KEY, COURSE_NAME_KEY, COURSES_KEY
 from .helpers.badges import (
     add_posts_count_in_badges_list,
+    cache_trophycase,
     get_badge_progress_request_data,
+    get_cached_trophycase,
     get_course_badges,
     get_discussion_team_ids,
     populate_trophycase
@@ -37,14 +39,19 @@ def trophycase(request):
     """
     user = request.user
 
-    enrolled_courses_data = CourseEnrollment.enrollments_for_user(user).order_by(
-        COURSE_NAME_KEY).values_list(COURSE_ID_KEY, COURSE_NAME_KEY)
+    enrolled_courses_data = list(CourseEnrollment.enrollments_for_user(user).order_by(
+        COURSE_NAME_KEY).values_list(COURSE_ID_KEY, COURSE_NAME_KEY))
 
-    earned_user_badges = list(
-        UserBadge.objects.filter(user=user)
-    )
+    # trophycase is cached till user earns or loses a badge, joins or leaves a team, or badges are changed
+    trophycase_dict = get_cached_trophycase(user, enrolled_courses_data)
+
+    if trophycase_dict is None:
+        earned_user_badges = list(
+            UserBadge.objects.filter(user=user)
+        )
 
-    trophycase_dict = populate_trophycase(user, enrolled_courses_data, earned_user_badges)
+        trophycase_dict = populate_trophycase(user, enrolled_courses_data, earned_user_badges)
+        cache_trophycase(user, enrolled_courses_data, trophycase_dict)
 
     # Get list of dictionary keys in CourseKey Format
     course_key_list = [CourseKey.from_string(unicode(course_id)) for course_id in trophycase_dict.keys()]
@@ -0,0 +1 @@
+default_app_config = 'openedx.features.course_card.apps.CourseCardConfig'
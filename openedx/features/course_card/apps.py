@@ -6,3 +6,9 @@ from django.apps import AppConfig
 
 class CourseCardConfig(AppConfig):
     name = u'openedx.features.course_card'
+
+    def ready(self):
+        """
+        Connect signal handlers.
+        """
+        import openedx.features.course_card.handlers  # pylint: disable=unused-variable
@@ -0,0 +1,71 @@
+"""
+Signal handlers for course card app
+"""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from opaque_keys.edx.locator import LibraryLocator
+
+from course_action_state.models import CourseRerunState
+from custom_settings.models import CustomSettings
+from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
+from openedx.features.course_card.helpers import update_course_family_run
+from openedx.features.course_card.models import CourseLandingTarget
+from openedx.features.course_card.tasks import task_update_course_landing_target
+from openedx.features.specializations.cache import invalidate_program_cache
+from xmodule.modulestore.django import SignalHandler
+
+
+@receiver(post_save, sender=CourseOverview)
+@receiver(post_delete, sender=CourseOverview)
+def update_course_family_on_course_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    CourseOverview is saved whenever a course is published, keep dates of the course run in family index up to date
+    """
+    update_course_family_run(instance.id)
+
+
+@receiver(post_save, sender=CourseRerunState)
+def update_course_family_on_rerun_state_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    A rerun joins family of its source course once rerun has succeeded
+    """
+    update_course_family_run(instance.course_key)
+
+
+@receiver(post_save, sender=CustomSettings)
+def update_course_family_on_settings_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Keep open date and tags of the course run in family index up to date
+    """
+    update_course_family_run(instance.id)
+
+
+@receiver(SignalHandler.course_published)
+def update_landing_target_on_course_publish(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Precompute course outline so that catalog pages link to the courseware without loading the course. Course is
+    loaded in a task, after the same delay as block structures, so that publish is not slowed down.
+    """
+    if isinstance(course_key, LibraryLocator):
+        return
+
+    task_update_course_landing_target.apply_async(
+        kwargs=dict(course_id=unicode(course_key)),
+        countdown=settings.BLOCK_STRUCTURES_SETTINGS['COURSE_PUBLISH_TASK_DELAY'],
+    )
+
+
+@receiver(SignalHandler.course_deleted)
+def delete_landing_target_on_course_delete(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+    CourseLandingTarget.objects.filter(course_id=course_key).delete()
+
+
+@receiver(SignalHandler.course_published)
+@receiver(SignalHandler.course_deleted)
+def invalidate_program_cache_on_course_change(sender, course_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Course runs of specialization programs come from discovery, fetch programs again once a course run is published
+    or deleted. Registered here because courses are published in Studio, which does not load specializations app.
+    """
+    invalidate_program_cache()
@@ -1,18 +1,24 @@
 """
 Helper methods for Course Card application
 """
+import json
+from collections import defaultdict
 from datetime import datetime
 from logging import getLogger
 
 import pytz
+from django.core.urlresolvers import reverse
+from django.db.models import Q
 from opaque_keys.edx.keys import CourseKey
 
 from course_action_state.models import CourseRerunState
+from courseware.models import StudentModule
 from custom_settings.models import CustomSettings
 from openedx.core.djangoapps.catalog.utils import get_programs
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.theming.helpers import get_current_request
-from openedx.features.course_card.models import CourseCard
+from openedx.features.course_card.models import CourseCard, CourseFamilyRun, CourseLandingTarget
+from xmodule.modulestore.django import modulestore
 
 log = getLogger(__name__)
 
@@ -157,3 +163,303 @@ def is_course_in_programs(parent_course_key):
                 if rerun_parent_course_key == parent_course_key:
                     return True
     return False
+
+
+def get_course_parent_id(course_id):
+    """
+    Get parent course (course card) id of a course run
+
+    Arguments:
+        course_id (CourseKey): Course run id
+
+    Returns:
+        CourseKey: source course of the succeeded rerun, or the course id itself if course is not a rerun
+    """
+    course_rerun = CourseRerunState.objects.filter(course_key=course_id, action="rerun", state="succeeded").first()
+    if course_rerun:
+        return course_rerun.source_course_key
+
+    return course_id
+
+
+def _get_course_family_run_fields(course, parent_course_id, custom_settings):
+    return {
+        'parent_course_id': parent_course_id,
+        'start': course.start,
+        'end': course.end,
+        'open_date': custom_settings and custom_settings.course_open_date or course.start,
+        'enrollment_start': course.enrollment_start,
+        'enrollment_end': course.enrollment_end,
+        'self_paced': course.self_paced,
+        'tags': custom_settings.tags if custom_settings else None,
+    }
+
+
+def update_course_family_run(course_id):
+    """
+    Create, update or delete the course family index row of a course run from its CourseOverview, CourseRerunState
+    and CustomSettings
+
+    Arguments:
+        course_id (CourseKey): Course run id
+    """
+    course = CourseOverview.objects.filter(id=course_id).first()
+    if not course:
+        CourseFamilyRun.objects.filter(course_id=course_id).delete()
+        return
+
+    CourseFamilyRun.objects.update_or_create(
+        course_id=course_id,
+        defaults=_get_course_family_run_fields(
+            course, get_course_parent_id(course_id), CustomSettings.objects.filter(id=course_id).first()
+        )
+    )
+
+
+def index_course_families(parent_course_ids):
+    """
+    Build course family index rows of parent courses and all of their reruns, in bulk
+
+    Arguments:
+        parent_course_ids (list): Parent course ids
+    """
+    rerun_states = CourseRerunState.objects.filter(action="rerun", state="succeeded")
+    parent_ids = {parent_course_id: parent_course_id for parent_course_id in parent_course_ids}
+    # a course asked for as parent can itself be a rerun of another course
+    parent_ids.update(
+        rerun_states.filter(course_key__in=parent_course_ids).values_list('course_key', 'source_course_key')
+    )
+    parent_ids.update(
+        rerun_states.filter(source_course_key__in=parent_course_ids).values_list('course_key', 'source_course_key')
+    )
+
+    courses = CourseOverview.objects.filter(id__in=parent_ids.keys())
+    custom_settings = CustomSettings.objects.in_bulk(parent_ids.keys())
+
+    CourseFamilyRun.objects.filter(course_id__in=parent_ids.keys()).delete()
+    CourseFamilyRun.objects.bulk_create([
+        CourseFamilyRun(
+            course_id=course.id,
+            **_get_course_family_run_fields(course, parent_ids[course.id], custom_settings.get(course.id))
+        ) for course in courses
+    ])
+
+
+def get_course_family_runs(parent_course_ids):
+    """
+    Get all runs of many courses, including the courses themselves, with one query. Courses which are not indexed
+    yet are indexed first.
+
+    Arguments:
+        parent_course_ids (list): Course ids, usually course cards
+
+    Returns:
+        dict: course id -> list of CourseFamilyRun, of the course and its reruns, ordered by start date
+    """
+    parent_course_ids = set(parent_course_ids)
+    if not parent_course_ids:
+        return {}
+
+    families = _get_indexed_course_families(parent_course_ids)
+
+    # every course has a row for itself once it is indexed
+    unindexed_parent_ids = [
+        parent_course_id for parent_course_id in parent_course_ids
+        if parent_course_id not in {run.course_id for run in families.get(parent_course_id, [])}
+    ]
+    if unindexed_parent_ids:
+        index_course_families(unindexed_parent_ids)
+        families.update(_get_indexed_course_families(unindexed_parent_ids))
+
+    return families
+
+
+def _get_indexed_course_families(parent_course_ids):
+    families = defaultdict(list)
+    course_family_runs = CourseFamilyRun.objects.filter(
+        Q(parent_course_id__in=parent_course_ids) | Q(course_id__in=parent_course_ids)
+    ).order_by('start')
+
+    for run in course_family_runs:
+        if run.parent_course_id in parent_course_ids:
+            families[run.parent_course_id].append(run)
+        if run.course_id in parent_course_ids and run.course_id != run.parent_course_id:
+            families[run.course_id].append(run)
+
+    return dict(families)
+
+
+def get_current_course_run(course_runs, current_time):
+    """
+    Get the ongoing run, which started most recently, among runs of a course family
+
+    Arguments:
+        course_runs (list): CourseFamilyRun of a course family
+        current_time (datetime): Current time
+
+    Returns:
+        CourseFamilyRun: ongoing run or None
+    """
+    ongoing_runs = [
+        run for run in course_runs if run.start and run.end and run.start <= current_time <= run.end
+    ]
+    return max(ongoing_runs, key=lambda run: run.start) if ongoing_runs else None
+
+
+def get_next_open_course_run(course_runs, current_time, exclude_course_ids=()):
+    """
+    Get the run, which starts first, among runs of a course family whose enrollment is open
+
+    Arguments:
+        course_runs (list): CourseFamilyRun of a course family, ordered by start date
+        current_time (datetime): Current time
+        exclude_course_ids (iterable): Course runs to skip, e.g. runs user is already enrolled in
+
+    Returns:
+        CourseFamilyRun: run open for enrollment or None
+    """
+    for run in course_runs:
+        if run.course_id in exclude_course_ids:
+            continue
+        if run.enrollment_start and run.enrollment_end and run.enrollment_start <= current_time <= run.enrollment_end:
+            return run
+
+    return None
+
+
+def get_course_overviews(course_ids):
+    """
+    Get CourseOverview of many courses with one query
+
+    Arguments:
+        course_ids (iterable): Course ids
+
+    Returns:
+        dict: course id -> CourseOverview
+    """
+    course_ids = [course_id for course_id in course_ids if course_id]
+    if not course_ids:
+        return {}
+
+    return {course.id: course for course in CourseOverview.objects.select_related('image_set').filter(id__in=course_ids)}
+
+
+def get_course_outline_chapters(course_id):
+    """
+    Get chapters of a course and sections of each chapter, hidden from students, by url name
+
+    Arguments:
+        course_id (CourseKey): Course id
+
+    Returns:
+        list: [chapter url name, [section url names]] in course order or None if course does not exist
+    """
+    course = modulestore().get_course(course_id, depth=2)
+    if not course:
+        return None
+
+    return [
+        [chapter.url_name, [section.url_name for section in chapter.get_children() if not section.visible_to_staff_only]]
+        for chapter in course.get_children() if not chapter.visible_to_staff_only
+    ]
+
+
+def update_course_landing_target(course_id):
+    """
+    Precompute outline of a course, used to link catalog pages to the courseware. An empty outline is saved for a
+    course missing from modulestore, so that it is not loaded again on every page view.
+
+    Arguments:
+        course_id (CourseKey): Course id
+
+    Returns:
+        list: [chapter url name, [section url names]] in course order
+    """
+    chapters = get_course_outline_chapters(course_id) or []
+    CourseLandingTarget.objects.update_or_create(course_id=course_id, defaults={'chapters': chapters})
+    return chapters
+
+
+def get_course_landing_targets(course_ids):
+    """
+    Get precomputed outline of many courses with one query, courses published before outlines were precomputed
+    are loaded from modulestore once
+
+    Arguments:
+        course_ids (list): Course ids
+
+    Returns:
+        dict: course id -> [chapter url name, [section url names]]
+    """
+    landing_targets = {
+        target.course_id: target.chapters for target in CourseLandingTarget.objects.filter(course_id__in=course_ids)
+    }
+
+    for course_id in course_ids:
+        if course_id not in landing_targets:
+            landing_targets[course_id] = update_course_landing_target(course_id)
+
+    return landing_targets
+
+
+def get_last_accessed_positions(user, course_ids):
+    """
+    Get positions, user last accessed, in course and chapter blocks of many courses with one query
+
+    Arguments:
+        user (User): User whose positions are required
+        course_ids (list): Course ids
+
+    Returns:
+        dict: course id -> {'course': position in course, chapter url name: position in chapter}, positions are
+        1-indexed like the `position` field of course and chapter blocks
+    """
+    if not user.is_authenticated() or not course_ids:
+        return {}
+
+    student_modules = StudentModule.objects.filter(
+        student_id=user.id, course_id__in=course_ids, module_type__in=['course', 'chapter']
+    ).values_list('course_id', 'module_type', 'module_state_key', 'state')
+
+    positions = defaultdict(dict)
+    for course_id, module_type, module_state_key, state in student_modules:
+        try:
+            position = json.loads(state or '{}').get('position')
+        except ValueError:
+            continue
+
+        if position is not None:
+            key = 'course' if module_type == 'course' else module_state_key.block_id
+            positions[course_id][key] = position
+
+    return dict(positions)
+
+
+def get_course_landing_target(course_id, chapters, positions=None):
+    """
+    Get courseware url of the section user last accessed, or of the first section if user has not accessed course
+    yet. Same as the current child of course and chapter blocks, see `courseware.courses.get_current_child`.
+
+    Arguments:
+        course_id (CourseKey): Course id
+        chapters (list): [chapter url name, [section url names]] of the course
+        positions (dict): positions of user in course and chapter blocks, from `get_last_accessed_positions`
+
+    Returns:
+        str: courseware section url
+    """
+    def get_current_child(children, position):
+        if position is not None and 0 <= position - 1 < len(children):
+            return children[position - 1]
+        return children[0] if children else None
+
+    positions = positions or {}
+    chapter_url, sections = get_current_child(chapters, positions.get('course')) or ('', [])
+    section_url = get_current_child(sections, positions.get(chapter_url))
+
+    if section_url is None:
+        # same as target to the first chapter and its first section
+        chapter_url, sections = chapters[0] if chapters else ('', [])
+        section_url = sections[0] if sections else ''
+
+    return reverse('courseware_section', args=[course_id.to_deprecated_string(), chapter_url, section_url])
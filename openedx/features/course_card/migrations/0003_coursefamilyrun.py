@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import openedx.core.djangoapps.xmodule_django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_card', '0002_auto_20180711_0535'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseFamilyRun',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('course_id', openedx.core.djangoapps.xmodule_django.models.CourseKeyField(unique=True, max_length=255)),
+                ('parent_course_id', openedx.core.djangoapps.xmodule_django.models.CourseKeyField(max_length=255, db_index=True)),
+                ('start', models.DateTimeField(null=True)),
+                ('end', models.DateTimeField(null=True)),
+                ('open_date', models.DateTimeField(null=True)),
+                ('enrollment_start', models.DateTimeField(null=True)),
+                ('enrollment_end', models.DateTimeField(null=True)),
+                ('self_paced', models.BooleanField(default=False)),
+                ('tags', models.CharField(max_length=255, null=True, blank=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import jsonfield.fields
+import openedx.core.djangoapps.xmodule_django.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course_card', '0003_coursefamilyrun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseLandingTarget',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('course_id', openedx.core.djangoapps.xmodule_django.models.CourseKeyField(unique=True, max_length=255)),
+                ('chapters', jsonfield.fields.JSONField(default=[], blank=True)),
+                ('modified', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -2,6 +2,7 @@
 Models for Course Card
 """
 from django.db import models
+from jsonfield.fields import JSONField
 
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.xmodule_django.models import CourseKeyField
@@ -29,3 +30,47 @@ class CourseCard(models.Model):
         course_overview = CourseOverview.objects.get(id=self.course_id)
         self.course_name = course_overview.display_name
         super(CourseCard, self).save(*args, **kwargs)
+
+
+class CourseFamilyRun(models.Model):
+    """
+    Denormalized index of course runs by their parent course (course card), so that catalog pages find the
+    current or next open run of many parent courses with one query. A parent course has a row for itself too.
+
+    Rows are kept up to date by CourseOverview, CourseRerunState and CustomSettings signals.
+    """
+
+    class Meta:
+        app_label = 'course_card'
+
+    course_id = CourseKeyField(max_length=255, unique=True)
+    parent_course_id = CourseKeyField(max_length=255, db_index=True)
+    start = models.DateTimeField(null=True)
+    end = models.DateTimeField(null=True)
+    open_date = models.DateTimeField(null=True)
+    enrollment_start = models.DateTimeField(null=True)
+    enrollment_end = models.DateTimeField(null=True)
+    self_paced = models.BooleanField(default=False)
+    tags = models.CharField(max_length=255, blank=True, null=True)
+    modified = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return '{}--{}'.format(unicode(self.parent_course_id), unicode(self.course_id))
+
+
+class CourseLandingTarget(models.Model):
+    """
+    Course outline, chapters and their sections by url name, precomputed when course is published. Catalog pages
+    build the courseware link of a course from it, without loading the course from modulestore.
+    """
+
+    class Meta:
+        app_label = 'course_card'
+
+    course_id = CourseKeyField(max_length=255, unique=True)
+    # list of [chapter url name, [section url names]] in course order
+    chapters = JSONField(blank=True, default=[])
+    modified = models.DateTimeField(auto_now=True)
+
+    def __unicode__(self):
+        return unicode(self.course_id)
@@ -0,0 +1,15 @@
+"""
+Celery tasks for course card app
+"""
+from celery.task import task
+from opaque_keys.edx.keys import CourseKey
+
+from openedx.features.course_card.helpers import update_course_landing_target
+
+
+@task()
+def task_update_course_landing_target(course_id):
+    """
+    Precompute course outline of a published course, outside of the publish request
+    """
+    update_course_landing_target(CourseKey.from_string(course_id))
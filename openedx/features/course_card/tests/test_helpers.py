@@ -1,14 +1,32 @@
 """
 Unit tests for Course card helpers
 """
+from datetime import datetime
+
+import pytz
 from crum import set_current_request
+from django.core.urlresolvers import reverse
 from django.test.client import RequestFactory
+from mock import patch
+from opaque_keys.edx.keys import CourseKey
 
 from course_action_state.models import CourseRerunState
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.tests.factories import CourseFactory
 
-from ..helpers import get_course_cards_list, get_future_courses, get_related_card, get_related_card_id, is_course_rereun
+from ..helpers import (
+    get_course_cards_list,
+    get_course_family_runs,
+    get_course_landing_target,
+    get_course_landing_targets,
+    get_current_course_run,
+    get_future_courses,
+    get_next_open_course_run,
+    get_related_card,
+    get_related_card_id,
+    is_course_rereun
+)
+from ..models import CourseLandingTarget
 from .helpers import disable_course_card, set_course_dates
 from .test_views import CourseCardBaseClass
 
@@ -76,6 +94,38 @@ class CourseCardHelperBaseClass(CourseCardBaseClass):
 
         self.assertEqual(get_future_courses(self.rerun_parent_course.id), re_run_course_overview)
 
+    def test_get_course_family_runs(self):
+        CourseRerunState.objects.succeeded(course_key=self.re_run_course.id)
+
+        set_course_dates(self.rerun_parent_course, -90, -76, -75, 60)
+        set_course_dates(self.re_run_course, -5, 15, 16, 90)
+
+        parent_course_id = self.rerun_parent_course.id
+        other_course_id = self.courses[1].id
+        families = get_course_family_runs([parent_course_id, other_course_id])
+
+        # Runs of each family are ordered by start date
+        self.assertEqual(
+            [run.course_id for run in families[parent_course_id]], [parent_course_id, self.re_run_course.id]
+        )
+        self.assertEqual([run.course_id for run in families[other_course_id]], [other_course_id])
+
+        current_time = datetime.utcnow().replace(tzinfo=pytz.UTC)
+        self.assertEqual(get_current_course_run(families[parent_course_id], current_time).course_id, parent_course_id)
+        self.assertEqual(
+            get_next_open_course_run(families[parent_course_id], current_time).course_id, self.re_run_course.id
+        )
+        self.assertIsNone(
+            get_next_open_course_run(
+                families[parent_course_id], current_time, exclude_course_ids=[self.re_run_course.id]
+            )
+        )
+
+        # Index is kept up to date when course is published again
+        set_course_dates(self.re_run_course, 5, 15, 16, 90)
+        families = get_course_family_runs([parent_course_id])
+        self.assertIsNone(get_next_open_course_run(families[parent_course_id], current_time))
+
     def test_is_course_rereun(self):
         non_re_run_course_id = self.courses[1].id
         parent_course_id = self.rerun_parent_course.id
@@ -110,3 +160,42 @@ class CourseCardHelperBaseClass(CourseCardBaseClass):
         # For Staff User
         # Desired output is a list of all course overview objects
         self.assertEqual({c.id for c in get_course_cards_list()}, {course.id for course in self.courses})
+
+    def test_get_course_landing_target(self):
+        course_id = self.rerun_parent_course.id
+        chapters = [['chapter_1', ['section_1', 'section_2']], ['chapter_2', ['section_3']], ['chapter_3', []]]
+
+        def section_url(chapter, section):
+            return reverse('courseware_section', args=[course_id.to_deprecated_string(), chapter, section])
+
+        # User has not accessed course yet, first section of first chapter is the target
+        self.assertEqual(get_course_landing_target(course_id, chapters), section_url('chapter_1', 'section_1'))
+
+        # Section user last accessed is the target
+        positions = {'course': 2, 'chapter_2': 1}
+        self.assertEqual(
+            get_course_landing_target(course_id, chapters, positions), section_url('chapter_2', 'section_3')
+        )
+
+        # Positions out of bounds are ignored
+        positions = {'course': 5, 'chapter_1': 2}
+        self.assertEqual(
+            get_course_landing_target(course_id, chapters, positions), section_url('chapter_1', 'section_2')
+        )
+
+        # Chapter without sections falls back to the first section of first chapter
+        positions = {'course': 3}
+        self.assertEqual(
+            get_course_landing_target(course_id, chapters, positions), section_url('chapter_1', 'section_1')
+        )
+
+    def test_get_course_landing_targets_saves_empty_outline_of_missing_course(self):
+        course_id = CourseKey.from_string('course-v1:test+missing+run')
+
+        self.assertEqual(get_course_landing_targets([course_id]), {course_id: []})
+        self.assertEqual(CourseLandingTarget.objects.get(course_id=course_id).chapters, [])
+
+        # Outline is read from database, course is not loaded again
+        with patch('openedx.features.course_card.helpers.get_course_outline_chapters') as mocked_outline:
+            self.assertEqual(get_course_landing_targets([course_id]), {course_id: []})
+        self.assertFalse(mocked_outline.called)
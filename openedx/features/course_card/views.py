@@ -6,14 +6,13 @@ from datetime import datetime
 import pytz
 from django.views.decorators.csrf import csrf_exempt
 
-from course_action_state.models import CourseRerunState
 from edxmako.shortcuts import render_to_response
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.features.course_card.models import CourseCard
 from philu_overrides.helpers import get_user_current_enrolled_class
 from student.models import CourseEnrollment
 
-from .helpers import get_course_open_date
+from .helpers import get_course_family_runs, get_course_open_date, get_course_overviews
 
 utc = pytz.UTC
 
@@ -52,22 +51,37 @@ def get_course_cards(request):
     course_card_ids = [cc.course_id for cc in cards_query_set]
     courses_list = CourseOverview.objects.select_related('image_set').filter(id__in=course_card_ids)
     courses_list = sorted(courses_list, key=lambda _course: _course.number)
-    current_time = datetime.utcnow()
+    current_time = datetime.utcnow().replace(tzinfo=utc)
 
-    filtered_courses = []
+    courses_list = [
+        course for course in courses_list
+        if not course.invitation_only or CourseEnrollment.is_enrolled(request.user, course.id)
+    ]
+    course_families = get_course_family_runs([course.id for course in courses_list])
 
+    # next rerun, of every course card, whose enrollment has not ended
+    course_reruns = {}
     for course in courses_list:
+        reruns = [
+            run for run in course_families.get(course.id, [])
+            if run.course_id != course.id and run.enrollment_end and run.enrollment_end >= current_time
+        ]
+        if reruns:
+            course_reruns[course.id] = min(
+                reruns, key=lambda run: (run.enrollment_start is not None, run.enrollment_start)
+            )
 
-        if course.invitation_only and not CourseEnrollment.is_enrolled(request.user, course.id):
-            continue
+    rerun_overviews = get_course_overviews(run.course_id for run in course_reruns.values())
 
-        course_rerun_states = [crs.course_key for crs in CourseRerunState.objects.filter(
-            source_course_key=course.id, action="rerun", state="succeeded")]
+    filtered_courses = []
 
-        course_rerun_object = CourseOverview.objects.select_related('image_set').filter(
-            id__in=course_rerun_states, enrollment_end__gte=current_time).order_by('enrollment_start').first()
+    for course in courses_list:
+        course_rerun = course_reruns.get(course.id)
+        course_rerun_object = rerun_overviews.get(course_rerun.course_id) if course_rerun else None
 
-        course = get_course_with_link_and_start_date(course, course_rerun_object, request)
+        course = get_course_with_link_and_start_date(
+            course, course_rerun_object, request, course_families.get(course.id, [])
+        )
 
         filtered_courses.append(course)
 
@@ -79,24 +93,31 @@ def get_course_cards(request):
     )
 
 
-def get_course_with_link_and_start_date(course, course_rerun_object, request):
+def get_course_with_link_and_start_date(course, course_rerun_object, request, course_runs=None):
     """
     Arguments:
         course (CourseOverview): Contains the course details
         course_rerun_object (CourseRerunState): Course rerun details
         request (HTTPRequest): current user request object
+        course_runs (list): CourseFamilyRun of the course family, open dates are read from it if given
 
     Returns:
         CourseOverview: A course  with updated start date and current class link.
     """
     date_time_format = '%b %-d, %Y'
     current_time = datetime.utcnow().replace(tzinfo=utc)
+    open_dates = {run.course_id: run.open_date for run in course_runs or []}
+
+    def get_start_date(_course):
+        if _course and _course.id in open_dates:
+            return open_dates[_course.id] if _course.start else None
+        return get_course_start_date(_course)
 
     current_class, user_current_enrolled_class, current_enrolled_class_target = get_user_current_enrolled_class(
-        request, course)
+        request, course, course_runs)
 
     if current_class:
-        current_class_start_date = get_course_open_date(current_class)
+        current_class_start_date = current_class.course_open_date
 
     if user_current_enrolled_class:
         course.is_enrolled = True
@@ -105,8 +126,8 @@ def get_course_with_link_and_start_date(course, course_rerun_object, request):
         course.self_paced = current_class.self_paced
         return course
 
-    course_start_time = get_course_start_date(course)
-    rerun_start_time = get_course_start_date(course_rerun_object)
+    course_start_time = get_start_date(course)
+    rerun_start_time = get_start_date(course_rerun_object)
 
     if course.enrollment_end:
         _enrollment_end_date = course.enrollment_end.replace(tzinfo=utc)
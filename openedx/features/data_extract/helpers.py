@@ -1,19 +1,23 @@
-import requests
-import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
 
-from django.conf import settings
+from requests.exceptions import RequestException
 
 from certificates.models import GeneratedCertificate
+from common.lib.nodebb_client.client import NodeBBClient
 from courseware.models import StudentModule
 from lms.djangoapps.grades.models import PersistentCourseGrade, PersistentSubsectionGrade
 from lms.djangoapps.onboarding.models import Organization
 from lms.djangoapps.teams.models import CourseTeamMembership, CourseTeam
-from student.models import AnonymousUserId
-from lms.djangoapps.teams.models import CourseTeamMembership, CourseTeam
 from openassessment.fileupload import api as ora_file_upload_api
 from openedx.core.djangoapps.content.course_structures.models import CourseStructure
 from submissions.models import StudentItem, Submission, Score
 
+log = getLogger(__name__)
+
+NODEBB_WORKERS = 8
+
 
 def get_file_url(answer):
     """
@@ -67,21 +71,43 @@ def get_teams_data(course_key):
     return team_data
 
 
-def get_user_demographic_data(profile):
+def get_users_community_data(usernames, workers=NODEBB_WORKERS):
+    """
+    Returns the community profile data of users from NodeBB API, requested concurrently over pooled connections
+
+    Arguments:
+    usernames (list): usernames of the learners
+    workers (int): number of concurrent requests to NodeBB
+
+    Returns:
+    dict: username -> community profile data, empty if it could not be fetched
+    """
+    nodebb_client = NodeBBClient(pooled=True, pool_size=workers)
+
+    def get_community_data(username):
+        try:
+            status_code, response = nodebb_client.users.data(username)
+        except RequestException as error:
+            status_code, response = None, error
+
+        if status_code != 200:
+            log.error('Failed to get community data of %s from NodeBB: %s', username, response)
+            return {}
+
+        return response.get('payload', {})
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(usernames, executor.map(get_community_data, usernames)))
+
+
+def get_user_demographic_data(profile, user_community_data):
     """
     Returns the demographic data for a single user
 
     Arguments:
     profile (UserProfile): UserProfile object for the learner
+    user_community_data (dict): community profile data of the learner from `get_users_community_data`
     """
-    # get the user community profile data from NodeBB API
-    data_endpoint = settings.NODEBB_ENDPOINT + '/api/v2/users/data'
-    headers = {'Authorization': 'Bearer ' + settings.NODEBB_MASTER_TOKEN}
-    response = requests.post(data_endpoint,
-                             data={'_uid': 1, 'username': profile.user.username},
-                             headers=headers)
-
-    user_community_data = json.loads(response._content)['payload']
     reputation = user_community_data.get('reputation', 0)
     postcount = user_community_data.get('postcount', 0)
 
@@ -103,23 +129,46 @@ def get_user_demographic_data(profile):
     }
 
 
-def get_user_progress_data(course_key, profile, anonymous_user_id):
+def get_users_progress_data(course_key, anonymous_user_ids):
     """
-    Returns all the data regarding the progress the user has made in a course
+    Returns all the data regarding the progress a batch of users has made in a course, with one query per
+    kind of data for the whole batch
 
     Arguments:
     course_key (CourseKey): CourseKey object for specified course
-    profile (UserProfile): UserProfile object for the learner
+    anonymous_user_ids (dict): user id -> anonymous user id of the learners in the course
+
+    Returns:
+    dict: user id -> progress data of the learner
     """
+    user_ids = anonymous_user_ids.keys()
+    user_ids_by_anonymous_id = {anonymous_id: user_id for user_id, anonymous_id in anonymous_user_ids.items()}
+    course_id = course_key.to_deprecated_string()
 
-    return {
-        'team_memberships': [{
+    progress_data = {
+        user_id: {
+            'team_memberships': [],
+            'student_modules': [],
+            'persistent_course_grades': [],
+            'persistent_subsection_grades': [],
+            'generated_certificates': [],
+            'course_submission_data': {
+                'student_items': [],
+                'submissions': [],
+                'student_scores': [],
+            }
+        } for user_id in user_ids
+    }
+
+    for membership in CourseTeamMembership.objects.filter(user_id__in=user_ids):
+        progress_data[membership.user_id]['team_memberships'].append({
             'team_id': membership.team_id,
             'date_joined': membership.date_joined.__str__(),
             'last_activity_at': membership.last_activity_at.__str__(),
-        } for membership in CourseTeamMembership.objects.filter(user_id=profile.user.id)],
+        })
 
-        'student_modules': [{
+    for module in StudentModule.objects.filter(student_id__in=user_ids, course_id=course_key):
+        progress_data[module.student_id]['student_modules'].append({
             'module_type': module.module_type,
             'module_id': module.module_state_key.to_deprecated_string(),
             'course_id': module.course_id.to_deprecated_string(),
@@ -129,9 +178,10 @@ def get_user_progress_data(course_key, profile, anonymous_user_id):
             'done': module.done,
             'created': module.created.__str__(),
             'modified': module.modified.__str__(),
-        } for module in StudentModule.objects.filter(student_id=profile.user.id, course_id=course_key)],
+        })
 
-        'persistent_course_grades': [{
+    for course_grade in PersistentCourseGrade.objects.filter(user_id__in=user_ids, course_id=course_key):
+        progress_data[course_grade.user_id]['persistent_course_grades'].append({
             'created': course_grade.created.__str__(),
             'modified': course_grade.modified.__str__(),
             'course_id': course_grade.course_id.to_deprecated_string(),
@@ -141,9 +191,13 @@ def get_user_progress_data(course_key, profile, anonymous_user_id):
             'percent_grade': course_grade.percent_grade,
             'letter_grade': course_grade.letter_grade,
             'passed_timestamp': course_grade.passed_timestamp.__str__(),
-        } for course_grade in PersistentCourseGrade.objects.filter(user_id=profile.user.id, course_id=course_key)],
+        })
 
-        'persistent_subsection_grades': [{
+    for subsection_grade in PersistentSubsectionGrade.objects.select_related('visible_blocks').filter(
+        user_id__in=user_ids,
+        course_id=course_key
+    ):
+        progress_data[subsection_grade.user_id]['persistent_subsection_grades'].append({
             'created': subsection_grade.created.__str__(),
             'modified': subsection_grade.modified.__str__(),
             'course_id': subsection_grade.course_id.to_deprecated_string(),
@@ -156,12 +210,10 @@ def get_user_progress_data(course_key, profile, anonymous_user_id):
             'possible_graded': subsection_grade.possible_graded,
             'visible_blocks': subsection_grade.visible_blocks.blocks_json,
             'first_attempted': subsection_grade.first_attempted.__str__(),
-        } for subsection_grade in PersistentSubsectionGrade.objects.filter(
-            user_id=profile.user.id,
-            course_id=course_key
-        )],
+        })
 
-        'generated_certificates': [{
+    for certificate in GeneratedCertificate.objects.filter(user_id__in=user_ids, course_id=course_key):
+        progress_data[certificate.user_id]['generated_certificates'].append({
             'course_id': certificate.course_id.to_deprecated_string(),
             'verify_uuid': certificate.verify_uuid,
             'download_uuid': certificate.download_uuid,
@@ -175,46 +227,50 @@ def get_user_progress_data(course_key, profile, anonymous_user_id):
             'created_date': certificate.created_date.__str__(),
             'modified_date': certificate.modified_date.__str__(),
             'error_reason': certificate.error_reason,
-        } for certificate in GeneratedCertificate.objects.filter(user_id=profile.user.id, course_id=course_key)],
-
-        'course_submission_data': {
-            'student_items': [{
-                'id': item.id,
-                'student_id': item.student_id,
-                'course_id': item.course_id,
-                'item_id': item.item_id,
-                'item_type': item.item_type,
-            } for item in StudentItem.objects.filter(
-                student_id=anonymous_user_id,
-                course_id=course_key.to_deprecated_string()
-            )],
-
-            'submissions': [{
-                'id': submission.id,
-                'uuid': submission.uuid,
-                'attempt_number': submission.attempt_number,
-                'submitted_at': submission.submitted_at.__str__(),
-                'created_at': submission.created_at.__str__(),
-                'answer': submission.answer,
-                'answer_file_url': get_file_url(submission.answer),
-                'student_item_id': submission.student_item_id,
-                'status': submission.status,
-            } for submission in Submission.objects.filter(
-                student_item__student_id=anonymous_user_id,
-                student_item__course_id=course_key.to_deprecated_string()
-            )],
-
-            'student_scores': [{
-                'id': score.id,
-                'points_earned': score.points_earned,
-                'points_possible': score.points_possible,
-                'created_at': score.created_at.__str__(),
-                'reset': score.reset,
-                'student_item_id': score.student_item_id,
-                'submission_id': score.submission_id,
-            } for score in Score.objects.filter(
-                student_item__student_id=anonymous_user_id,
-                student_item__course_id=course_key.to_deprecated_string()
-            )],
-        }
-    }
+        })
+
+    submission_data = defaultdict(lambda: defaultdict(list))
+
+    for item in StudentItem.objects.filter(student_id__in=user_ids_by_anonymous_id.keys(), course_id=course_id):
+        submission_data[item.student_id]['student_items'].append({
+            'id': item.id,
+            'student_id': item.student_id,
+            'course_id': item.course_id,
+            'item_id': item.item_id,
+            'item_type': item.item_type,
+        })
+
+    for submission in Submission.objects.select_related('student_item').filter(
+        student_item__student_id__in=user_ids_by_anonymous_id.keys(),
+        student_item__course_id=course_id
+    ):
+        submission_data[submission.student_item.student_id]['submissions'].append({
+            'id': submission.id,
+            'uuid': submission.uuid,
+            'attempt_number': submission.attempt_number,
+            'submitted_at': submission.submitted_at.__str__(),
+            'created_at': submission.created_at.__str__(),
+            'answer': submission.answer,
+            'answer_file_url': get_file_url(submission.answer),
+            'student_item_id': submission.student_item_id,
+            'status': submission.status,
+        })
+
+    for score in Score.objects.select_related('student_item').filter(
+        student_item__student_id__in=user_ids_by_anonymous_id.keys(),
+        student_item__course_id=course_id
+    ):
+        submission_data[score.student_item.student_id]['student_scores'].append({
+            'id': score.id,
+            'points_earned': score.points_earned,
+            'points_possible': score.points_possible,
+            'created_at': score.created_at.__str__(),
+            'reset': score.reset,
+            'student_item_id': score.student_item_id,
+            'submission_id': score.submission_id,
+        })
+
+    for anonymous_id, user_submission_data in submission_data.items():
+        progress_data[user_ids_by_anonymous_id[anonymous_id]]['course_submission_data'].update(user_submission_data)
+
+    return progress_data
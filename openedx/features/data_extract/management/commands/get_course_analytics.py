@@ -10,7 +10,7 @@ from django.core.management.base import BaseCommand, CommandError
 
 from common.lib.mandrill_client.client import MandrillClient
 from lms.djangoapps.mailing.management.commands.mailchimp_sync_course import get_enrolled_students
-from lms.djangoapps.onboarding.helpers import get_country_iso
+from lms.djangoapps.onboarding.lookups import get_country_iso
 from opaque_keys.edx.keys import CourseKey
 from openedx.features.data_extract.models import CourseDataExtraction
 
@@ -18,10 +18,13 @@ from openedx.features.data_extract.helpers import (
     get_course_structure,
     get_teams_data,
     get_user_demographic_data,
-    get_user_progress_data,
+    get_users_community_data,
+    get_users_progress_data,
 )
 from student.models import AnonymousUserId
 
+USERS_BATCH_SIZE = 500
+
 
 class Command(BaseCommand):
     help = 'Generates the analytics data for each course_id in coursedataextraction table'
@@ -39,7 +42,6 @@ class Command(BaseCommand):
             course_data = {
                 'course_structure': get_course_structure(course_key),
                 'team_data': get_teams_data(course_key),
-                'user_data': []
             }
 
             eu_states = [
@@ -75,23 +77,21 @@ class Command(BaseCommand):
             # convert eu_states into corresponding country codes
             eu_states = list(map(lambda x: get_country_iso(x), eu_states))
 
-            user_profiles = get_enrolled_students(target_course.course_id)
+            user_profiles = get_enrolled_students(target_course.course_id).select_related(
+                'user', 'user__extended_profile', 'user__extended_profile__organization'
+            ).order_by('id')
             # filter users that are from eu_states
             # user_profiles = list(filter((lambda x: x.country not in eu_states), user_profiles))
-            # get dict of anonymous user ids
-            anon_user_ids = dict(list(map(lambda x: (x.user.username, x.anonymous_user_id,),
-                                          AnonymousUserId.objects.filter(course_id=course_key))))
-
-            for profile in user_profiles:
-                demographic_data = get_user_demographic_data(profile)
-                progress_data = get_user_progress_data(course_key, profile, anon_user_ids[profile.user.username])
-
-                course_data['user_data'].append({
-                    'demographic_data': demographic_data,
-                    'progress_data': progress_data,
-                })
+
+            # Course data is written as JSON lines, first line has course structure and team data followed by a
+            # line for every user, so that only one batch of users is in memory at a time
             with tempfile.NamedTemporaryFile() as tmp:
-                tmp.write(json.dumps(course_data))
+                tmp.write(json.dumps(course_data) + '\n')
+
+                for profiles in iterate_in_batches(user_profiles, USERS_BATCH_SIZE):
+                    for user_data in get_users_data(course_key, profiles):
+                        tmp.write(json.dumps(user_data) + '\n')
+
                 tmp.flush()
                 pyminizip.compress(tmp.name, '/tmp/data.zip', options['password'], 1)
                 for email in emails:
@@ -103,3 +103,34 @@ class Command(BaseCommand):
                     )
                     email_message.attach_file('/tmp/data.zip')
                     email_message.send()
+
+
+def iterate_in_batches(queryset, batch_size):
+    """
+    Yields lists of objects of a queryset ordered on id, keyset paginated so every batch is a separate query
+    """
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            return
+        last_id = batch[-1].id
+        yield batch
+
+
+def get_users_data(course_key, profiles):
+    """
+    Yields demographic and progress data of every user in a batch, fetched in bulk for the whole batch
+    """
+    user_ids = [profile.user_id for profile in profiles]
+    anon_user_ids = dict(AnonymousUserId.objects.filter(
+        course_id=course_key, user_id__in=user_ids
+    ).values_list('user_id', 'anonymous_user_id'))
+    community_data = get_users_community_data([profile.user.username for profile in profiles])
+    progress_data = get_users_progress_data(course_key, anon_user_ids)
+
+    for profile in profiles:
+        yield {
+            'demographic_data': get_user_demographic_data(profile, community_data[profile.user.username]),
+            'progress_data': progress_data[profile.user_id],
+        }
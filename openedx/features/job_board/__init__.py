@@ -0,0 +1,4 @@
+"""
+Job Board app to post and search jobs
+"""
+default_app_config = 'openedx.features.job_board.apps.JobBoardConfig'
@@ -6,3 +6,9 @@ from django.apps import AppConfig
 
 class JobBoardConfig(AppConfig):
     name = u'openedx.features.job_board'
+
+    def ready(self):
+        """
+        Connect signal handlers.
+        """
+        import openedx.features.job_board.handlers  # pylint: disable=unused-variable
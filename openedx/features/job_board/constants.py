@@ -35,6 +35,16 @@ JOB_HOURS_CHOICES = (
     (JOB_HOURS_FREELANCE_KEY, 'Freelance'),
 )
 
+JOB_SEARCH_FIELD_TITLE = 'title'
+JOB_SEARCH_FIELD_CITY = 'city'
+
+JOB_SEARCH_FIELD_CHOICES = (
+    (JOB_SEARCH_FIELD_TITLE, 'Title'),
+    (JOB_SEARCH_FIELD_CITY, 'City'),
+)
+
+JOB_SEARCH_TOKEN_MAX_LENGTH = 64
+
 DJANGO_COUNTRIES_KEY_INDEX = 0
 DJANGO_COUNTRIES_VALUE_INDEX = 1
 
@@ -0,0 +1,16 @@
+"""
+Signal handlers for Job Board app
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Job
+from .search import index_job
+
+
+@receiver(post_save, sender=Job)
+def index_job_on_save(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Keep search index of jobs up to date
+    """
+    index_job(instance)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+SEARCH_FIELDS = ('title', 'city')
+TOKEN_MAX_LENGTH = 64
+
+
+def index_jobs(apps, schema_editor):
+    """
+    Index words of titles and cities of existing jobs
+    """
+    Job = apps.get_model('job_board', 'Job')
+    JobSearchToken = apps.get_model('job_board', 'JobSearchToken')
+
+    for job in Job.objects.all().iterator():
+        tokens = set()
+        for field in SEARCH_FIELDS:
+            for word in re.findall(r'\w+', (getattr(job, field) or '').lower(), re.UNICODE):
+                tokens.add((field, word[:TOKEN_MAX_LENGTH]))
+
+        JobSearchToken.objects.bulk_create([
+            JobSearchToken(job_id=job.id, field=field, token=token) for field, token in tokens
+        ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job_board', '0006_job_user'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSearchToken',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('field', models.CharField(choices=[('title', 'Title'), ('city', 'City')], max_length=16)),
+                ('token', models.CharField(max_length=64)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='job_board.Job')),
+            ],
+        ),
+        migrations.AlterIndexTogether(
+            name='jobsearchtoken',
+            index_together=set([('field', 'token')]),
+        ),
+        migrations.RunPython(index_jobs, migrations.RunPython.noop),
+    ]
@@ -17,6 +17,8 @@ from util.philu_utils import UploadToPathAndRename
 from .constants import (
     JOB_COMPENSATION_CHOICES,
     JOB_HOURS_CHOICES,
+    JOB_SEARCH_FIELD_CHOICES,
+    JOB_SEARCH_TOKEN_MAX_LENGTH,
     JOB_TYPE_CHOICES,
     LOGO_ALLOWED_EXTENSION,
     LOGO_IMAGE_MAX_SIZE
@@ -89,3 +91,19 @@ class Job(TimeStampedModel):
 
     def __unicode__(self):
         return self.title
+
+
+class JobSearchToken(models.Model):
+    """
+    Inverted index of words in searchable fields of jobs, so that jobs are searched by word prefix with an index
+    instead of scanning every job.
+    """
+    job = models.ForeignKey(Job, related_name='search_tokens', on_delete=models.CASCADE)
+    field = models.CharField(max_length=16, choices=JOB_SEARCH_FIELD_CHOICES)
+    token = models.CharField(max_length=JOB_SEARCH_TOKEN_MAX_LENGTH)
+
+    class Meta(object):
+        index_together = (('field', 'token'),)
+
+    def __unicode__(self):
+        return '{field}: {token}'.format(field=self.field, token=self.token)
@@ -0,0 +1,80 @@
+"""
+Search index of Job Board
+
+Words of job titles and cities are kept in `JobSearchToken` rows and searched by prefix, country names are resolved
+to country codes through a map built once per language.
+"""
+import re
+
+from django.utils.translation import get_language
+from django_countries import countries
+
+from .constants import (
+    DJANGO_COUNTRIES_KEY_INDEX,
+    DJANGO_COUNTRIES_VALUE_INDEX,
+    JOB_SEARCH_FIELD_CHOICES,
+    JOB_SEARCH_TOKEN_MAX_LENGTH
+)
+from .models import JobSearchToken
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+_country_names = {}
+
+
+def tokenize(text):
+    """
+    Split text into lower case words, words are truncated to the length of an index token
+
+    Returns:
+        list: unique words in order of their appearance
+    """
+    tokens = []
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        token = word[:JOB_SEARCH_TOKEN_MAX_LENGTH]
+        if token not in tokens:
+            tokens.append(token)
+
+    return tokens
+
+
+def index_job(job):
+    """
+    Replace index tokens of a job with words of its searchable fields
+    """
+    JobSearchToken.objects.filter(job=job).delete()
+    JobSearchToken.objects.bulk_create([
+        JobSearchToken(job=job, field=field, token=token)
+        for field, _ in JOB_SEARCH_FIELD_CHOICES
+        for token in tokenize(getattr(job, field) or '')
+    ])
+
+
+def filter_jobs_by_words(queryset, field, text):
+    """
+    Filter jobs having words, in the field, which start with every word of the text
+    """
+    for token in tokenize(text):
+        queryset = queryset.filter(id__in=JobSearchToken.objects.filter(
+            field=field, token__startswith=token
+        ).values('job_id'))
+
+    return queryset
+
+
+def get_country_codes(country_name):
+    """
+    Get codes of countries whose name, in current language, contains the given name
+
+    Returns:
+        list: country codes
+    """
+    language = get_language()
+    if language not in _country_names:
+        _country_names[language] = [
+            (unicode(country[DJANGO_COUNTRIES_VALUE_INDEX]).lower(), country[DJANGO_COUNTRIES_KEY_INDEX])
+            for country in countries
+        ]
+
+    country_name = country_name.lower()
+    return [code for name, code in _country_names[language] if country_name in name]
@@ -216,3 +216,23 @@ class JobBoardViewTest(TestCase):
         self.assertTrue(response.context_data['filtered'], True)
         self.assertEqual(len(response.context_data['job_list']), 1)
         self.assertIn(job.title, response.context_data['job_list'][0].title)
+
+    @data(('data ana', 1), ('Senior', 1), ('nalyst', 0), ('analyst manager', 0))
+    @unpack
+    def test_job_list_view_searches_words_of_title(self, query, job_list_size):
+        JobFactory(title='Senior Data-Analyst')
+
+        response = self.client.get(add_or_replace_parameters(reverse('job_list'), {JOB_PARAM_QUERY_KEY: query}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.context_data['job_list']), job_list_size)
+
+    def test_job_search_index_updated_on_job_change(self):
+        job = JobFactory(title='Program Officer', city='Lahore')
+        job.title = 'Field Coordinator'
+        job.save()
+
+        self.assertEqual(
+            sorted(job.search_tokens.values_list('field', 'token')),
+            [('city', 'lahore'), ('title', 'coordinator'), ('title', 'field')]
+        )
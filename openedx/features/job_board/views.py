@@ -8,13 +8,10 @@ from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import CreateView
 from django.views.generic.list import ListView
-from django_countries import countries
 
 from openedx.features.teams.helpers import USER_ICON_COLORS
 
 from .constants import (
-    DJANGO_COUNTRIES_KEY_INDEX,
-    DJANGO_COUNTRIES_VALUE_INDEX,
     JOB_COMP_HOURLY_KEY,
     JOB_COMP_SALARIED_KEY,
     JOB_COMP_VOLUNTEER_KEY,
@@ -26,12 +23,15 @@ from .constants import (
     JOB_PARAM_CITY_KEY,
     JOB_PARAM_COUNTRY_KEY,
     JOB_PARAM_QUERY_KEY,
+    JOB_SEARCH_FIELD_CITY,
+    JOB_SEARCH_FIELD_TITLE,
     JOB_TYPE_CHOICES,
     JOB_TYPE_ONSITE_KEY,
     JOB_TYPE_REMOTE_KEY
 )
 from .forms import JobCreationForm
 from .models import Job
+from .search import filter_jobs_by_words, get_country_codes
 
 
 class JobListView(ListView):
@@ -76,13 +76,11 @@ class JobListView(ListView):
         if job_compensation_list:
             queryset = queryset.filter(compensation__in=job_compensation_list)
         if country:
-            country_codes = [django_country[DJANGO_COUNTRIES_KEY_INDEX] for django_country in countries if
-                             country.lower() in django_country[DJANGO_COUNTRIES_VALUE_INDEX].lower()]
-            queryset = queryset.filter(country__in=country_codes)
+            queryset = queryset.filter(country__in=get_country_codes(country))
         if city:
-            queryset = queryset.filter(city__icontains=city)
+            queryset = filter_jobs_by_words(queryset, JOB_SEARCH_FIELD_CITY, city)
         if query:
-            queryset = queryset.filter(title__icontains=query)
+            queryset = filter_jobs_by_words(queryset, JOB_SEARCH_FIELD_TITLE, query)
 
         return queryset
 
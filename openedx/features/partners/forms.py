@@ -13,7 +13,7 @@ from student import forms as student_forms
 from student.models import CourseEnrollmentAllowed, email_exists_or_retired
 from util.password_policy_validators import validate_password
 
-from lms.djangoapps.onboarding.helpers import COUNTRIES
+from lms.djangoapps.onboarding.lookups import get_countries
 
 
 def validate_name(name):
@@ -115,7 +115,7 @@ class PartnerAccountCreationForm(forms.Form):
 
     def clean_country(self):
         country_code = self.cleaned_data['country']
-        if country_code in COUNTRIES.keys():
+        if country_code in get_countries():
             return country_code
         else:
             raise ValidationError(_('The given country is invalid.') if country_code else _('Please select country.'))
@@ -4,12 +4,15 @@ from datetime import datetime
 from importlib import import_module
 from logging import getLogger
 
-from course_action_state.models import CourseRerunState
 from custom_settings.models import CustomSettings
 from nodebb.tasks import task_join_group_on_nodebb
-from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.models.course_details import CourseDetails
-from openedx.features.course_card.helpers import get_course_open_date, get_related_card_id
+from openedx.features.course_card.helpers import (
+    get_course_family_runs,
+    get_course_overviews,
+    get_next_open_course_run,
+    get_related_card_id
+)
 from openedx.features.course_card.models import CourseCard
 from student.models import CourseEnrollment
 
@@ -34,24 +37,30 @@ def get_partner_recommended_courses(partner_slug, user):
     # Make a set of card id's to remove duplication
     partner_course_card_ids = {get_related_card_id(crs_setting.id) for crs_setting in partner_course_settings}
 
+    course_families = get_course_family_runs(partner_course_card_ids)
+    course_card_ids = set(
+        CourseCard.objects.filter(course_id__in=partner_course_card_ids).values_list('course_id', flat=True)
+    )
+
+    open_runs = []
     for course_id in partner_course_card_ids:
-        course_reruns = [crs.course_key for crs in CourseRerunState.objects.filter(
-            source_course_key=course_id, action="rerun", state="succeeded")]
-        course_rerun_states = course_reruns + [course_id]
+        course_runs = course_families.get(course_id, [])
+        has_reruns = any(run.course_id != course_id for run in course_runs)
+
+        if not has_reruns and course_id not in course_card_ids:
+            # This is a parent course and it's card isn't added
+            continue
 
-        if not course_reruns:
-            try:
-                CourseCard.objects.get(course_id=course_id)
-            except CourseCard.DoesNotExist:
-                # This is a parent course and it's card isn't added
-                continue
+        open_run = get_next_open_course_run(course_runs, current_time)
+        if open_run:
+            open_runs.append(open_run)
 
-        course_rerun_object = CourseOverview.objects.select_related('image_set').filter(
-            id__in=course_rerun_states, enrollment_start__lte=current_time, enrollment_end__gte=current_time
-        ).order_by('start').first()
+    course_rerun_objects = get_course_overviews(run.course_id for run in open_runs)
 
+    for open_run in open_runs:
+        course_rerun_object = course_rerun_objects.get(open_run.course_id)
         if course_rerun_object:
-            course_rerun_object.start = get_course_open_date(course_rerun_object)
+            course_rerun_object.start = open_run.open_date
             course_rerun_object.description = get_course_description(course_rerun_object)
             course_rerun_object.enrolled = CourseEnrollment.is_enrolled(user, course_rerun_object.id)
             recommended_courses.append(course_rerun_object)
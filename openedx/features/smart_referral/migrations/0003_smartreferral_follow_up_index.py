@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('smart_referral', '0002_auto_20200707_0927'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='smartreferral',
+            index_together=set([('is_referral_step_complete', 'created')]),
+        ),
+    ]
@@ -24,6 +24,10 @@ class SmartReferral(TimeStampedModel):
         unique_together = (
             ('contact_email', 'user')
         )
+        # used to pick referrals pending follow-up email
+        index_together = (
+            ('is_referral_step_complete', 'created')
+        )
 
     def __unicode__(self):
         return '{user} referred {contact}'.format(user=self.user.username, contact=self.contact_email)
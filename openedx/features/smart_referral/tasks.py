@@ -5,28 +5,45 @@ from celery.task import task
 from django.conf import settings
 
 from common.lib.mandrill_client.client import MandrillClient
+from openedx.core.djangoapps.timed_notification.models import EmailDeliveryLedger
 from openedx.features.smart_referral.models import SmartReferral
 
+REFERRAL_EMAILS_BATCH_SIZE = 500
+
 
 @task(routing_key=settings.HIGH_PRIORITY_QUEUE)
 def task_send_referral_and_toolkit_emails(contact_emails, user_email):
     """Send initial referral email to all contact emails and send toolkit email to referrer."""
     mandrill_client = MandrillClient()
 
-    for email in contact_emails:
-        mandrill_client.send_mail(MandrillClient.REFERRAL_INITIAL_EMAIL, email, context={
+    mandrill_client.send_bulk_mail(
+        MandrillClient.REFERRAL_INITIAL_EMAIL, [{'email': email} for email in contact_emails], context={
             'root_url': settings.LMS_ROOT_URL,
-        })
+        }
+    )
 
     mandrill_client.send_mail(MandrillClient.REFERRAL_SOCIAL_IMPACT_TOOLKIT, user_email, context={})
 
 
 @task(routing_key=settings.HIGH_PRIORITY_QUEUE)
 def task_send_referral_follow_up_emails(contact_email_list):
-    """Send follow-up referral email to contact email."""
-    for contact_email in contact_email_list:
-        response = MandrillClient().send_mail(MandrillClient.REFERRAL_FOLLOW_UP_EMAIL, contact_email, context={
-            'root_url': settings.LMS_ROOT_URL,
-        })
-        if response[0]['status'] == 'sent':
-            SmartReferral.objects.filter(contact_email=response[0]['email']).update(is_referral_step_complete=True)
+    """
+    Send follow-up referral email to contact emails in batches, one multi-recipient email per batch. Referrals of the
+    contacts to which email is delivered, i.e. sent or queued by Mandrill, are marked complete with one update per
+    batch.
+    """
+    mandrill_client = MandrillClient()
+
+    for batch_start in range(0, len(contact_email_list), REFERRAL_EMAILS_BATCH_SIZE):
+        contact_emails = contact_email_list[batch_start:batch_start + REFERRAL_EMAILS_BATCH_SIZE]
+        results = mandrill_client.send_bulk_mail(
+            MandrillClient.REFERRAL_FOLLOW_UP_EMAIL, [{'email': email} for email in contact_emails], context={
+                'root_url': settings.LMS_ROOT_URL,
+            }, chunk_size=REFERRAL_EMAILS_BATCH_SIZE
+        )
+
+        delivered_emails = [
+            result['email'] for result in results if result['status'] in EmailDeliveryLedger.DELIVERED_STATUSES
+        ]
+        if delivered_emails:
+            SmartReferral.objects.filter(contact_email__in=delivered_emails).update(is_referral_step_complete=True)
@@ -20,8 +20,9 @@ class SmartReferralTasksTest(TestCase):
     Class contains tests for smart_referral app tasks
     """
 
+    @mock.patch('openedx.features.smart_referral.tasks.MandrillClient.send_bulk_mail')
     @mock.patch('openedx.features.smart_referral.tasks.MandrillClient.send_mail')
-    def test_task_send_referral_and_toolkit_emails_successfully(self, mock_send_mail):
+    def test_task_send_referral_and_toolkit_emails_successfully(self, mock_send_mail, mock_send_bulk_mail):
         """
         Test task to send smart referral toolkit email successfully
         """
@@ -35,43 +36,33 @@ class SmartReferralTasksTest(TestCase):
         context = {
             'root_url': settings.LMS_ROOT_URL,
         }
-        all_rerun_mock_calls = [
-            mock.call(MandrillClient.REFERRAL_INITIAL_EMAIL, test_email1, context=context),
-            mock.call(MandrillClient.REFERRAL_INITIAL_EMAIL, test_email2, context=context),
-            mock.call(MandrillClient.REFERRAL_SOCIAL_IMPACT_TOOLKIT, user_email, context={})
-        ]
 
-        self.assertEqual(mock_send_mail.call_count, 3)
-        mock_send_mail.assert_has_calls(all_rerun_mock_calls)
+        # Initial referral email is sent to all contacts with one API call
+        mock_send_bulk_mail.assert_called_once_with(
+            MandrillClient.REFERRAL_INITIAL_EMAIL, [{'email': test_email1}, {'email': test_email2}], context=context
+        )
+        mock_send_mail.assert_called_once_with(MandrillClient.REFERRAL_SOCIAL_IMPACT_TOOLKIT, user_email, context={})
 
-    @mock.patch('openedx.features.smart_referral.tasks.MandrillClient.send_mail')
-    def test_task_send_referral_follow_up_emails_successfully(self, mock_send_mail):
+    @mock.patch('openedx.features.smart_referral.tasks.REFERRAL_EMAILS_BATCH_SIZE', 2)
+    @mock.patch('openedx.features.smart_referral.tasks.MandrillClient.send_bulk_mail')
+    def test_task_send_referral_follow_up_emails_successfully(self, mock_send_bulk_mail):
         """
         Test task to send smart referral follow-up email successfully
         """
         test_email1 = 'test.referral1@example.com'
         test_email2 = 'test.referral2@example.com'
+        test_email3 = 'test.referral3@example.com'
 
         SmartReferralFactory(contact_email=test_email1, is_referral_step_complete=False)
         SmartReferralFactory(contact_email=test_email2, is_referral_step_complete=False)
+        SmartReferralFactory(contact_email=test_email3, is_referral_step_complete=False)
 
-        contact_emails = [test_email1, test_email2]
-
-        status_first_referral = [
-            {
-                'status': 'sent',
-                'email': test_email1
-            }
-        ]
-
-        status_second_referral = [
-            {
-                'status': 'sent',
-                'email': test_email2
-            }
-        ]
+        contact_emails = [test_email1, test_email2, test_email3]
 
-        mock_send_mail.side_effect = (status_first_referral, status_second_referral)
+        mock_send_bulk_mail.side_effect = (
+            [{'status': 'sent', 'email': test_email1}, {'status': 'rejected', 'email': test_email2}],
+            [{'status': 'sent', 'email': test_email3}],
+        )
         task_send_referral_follow_up_emails(contact_emails)
 
         context = {
@@ -79,15 +70,27 @@ class SmartReferralTasksTest(TestCase):
         }
 
         all_rerun_mock_calls = [
-            mock.call(MandrillClient.REFERRAL_FOLLOW_UP_EMAIL, test_email1, context=context),
-            mock.call(MandrillClient.REFERRAL_FOLLOW_UP_EMAIL, test_email2, context=context)
+            mock.call(MandrillClient.REFERRAL_FOLLOW_UP_EMAIL, [{'email': test_email1}, {'email': test_email2}],
+                      context=context, chunk_size=2),
+            mock.call(MandrillClient.REFERRAL_FOLLOW_UP_EMAIL, [{'email': test_email3}], context=context, chunk_size=2)
         ]
 
-        self.assertEqual(mock_send_mail.call_count, 2)
-        mock_send_mail.assert_has_calls(all_rerun_mock_calls)
+        self.assertEqual(mock_send_bulk_mail.call_count, 2)
+        mock_send_bulk_mail.assert_has_calls(all_rerun_mock_calls)
+
+        self.assertTrue(SmartReferral.objects.get(contact_email=test_email1).is_referral_step_complete)
+        self.assertFalse(SmartReferral.objects.get(contact_email=test_email2).is_referral_step_complete)
+        self.assertTrue(SmartReferral.objects.get(contact_email=test_email3).is_referral_step_complete)
+
+    @mock.patch('openedx.features.smart_referral.tasks.MandrillClient.send_bulk_mail')
+    def test_task_send_referral_follow_up_emails_queued(self, mock_send_bulk_mail):
+        """
+        Test referrals are marked complete when Mandrill queues the email instead of sending it right away
+        """
+        test_email = 'test.referral1@example.com'
+        SmartReferralFactory(contact_email=test_email, is_referral_step_complete=False)
+        mock_send_bulk_mail.return_value = [{'status': 'queued', 'email': test_email}]
 
-        first_referral = SmartReferral.objects.get(contact_email=test_email1)
-        second_referral = SmartReferral.objects.get(contact_email=test_email2)
+        task_send_referral_follow_up_emails([test_email])
 
-        self.assertTrue(first_referral.is_referral_step_complete)
-        self.assertTrue(second_referral.is_referral_step_complete)
+        self.assertTrue(SmartReferral.objects.get(contact_email=test_email).is_referral_step_complete)
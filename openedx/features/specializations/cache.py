@@ -0,0 +1,29 @@
+"""
+Cache of discovery programs, kept apart from helpers so that Studio can invalidate it on course publish without
+loading the LMS apps which helpers depend on
+"""
+from django.core.cache import cache
+
+PROGRAM_CACHE_KEY = 'specializations.program.{generation}.{uuid}'
+PROGRAM_CACHE_GENERATION_KEY = 'specializations.program.generation'
+PROGRAM_CACHE_TIMEOUT = 60 * 60
+
+
+def get_program_cache_generation():
+    """
+    Get generation of cached programs, programs cached in older generations are not read anymore
+    """
+    cache.add(PROGRAM_CACHE_GENERATION_KEY, 1, None)
+    return cache.get(PROGRAM_CACHE_GENERATION_KEY, 1)
+
+
+def invalidate_program_cache():
+    """
+    Move cached programs to next generation, so that every program is fetched from discovery again
+    """
+    cache.add(PROGRAM_CACHE_GENERATION_KEY, 1, None)
+    try:
+        cache.incr(PROGRAM_CACHE_GENERATION_KEY)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(PROGRAM_CACHE_GENERATION_KEY, 1, None)
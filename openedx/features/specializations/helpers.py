@@ -3,18 +3,27 @@ Helper functions for specializations app
 """
 from datetime import datetime, timedelta
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.urlresolvers import reverse
 from django.http import HttpResponseBadRequest
 from opaque_keys.edx.keys import CourseKey
 
 from common.lib.discovery_client.client import DiscoveryClient
-from lms.djangoapps.certificates.models import CertificateStatuses
+from lms.djangoapps.certificates.models import CertificateStatuses, GeneratedCertificate
+from lms.djangoapps.grades.config import should_persist_grades
 from lms.djangoapps.grades.course_grade_factory import CourseGradeFactory
+from lms.djangoapps.grades.models import PersistentCourseGrade
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
-from openedx.core.djangoapps.timed_notification.core import get_course_first_chapter_link
+from openedx.features.course_card.helpers import get_course_landing_targets
+from openedx.features.specializations.cache import (
+    PROGRAM_CACHE_KEY,
+    PROGRAM_CACHE_TIMEOUT,
+    get_program_cache_generation
+)
 from student.helpers import cert_info
 from student.models import CourseEnrollment
-from xmodule.modulestore.django import modulestore
 
 DISCOVERY_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
@@ -52,17 +61,26 @@ def get_program_courses(user, specialization_uuid, detail=False):
     if not user.is_authenticated:
         return context, courses
 
-    for course in [course for course in context.get('courses', []) if course.get('course_runs', [])]:
+    for course in [program_course for program_course in context.get('courses', [])
+                   if program_course.get('course_runs', [])]:
         course_rerun = get_open_course_rerun(course['course_runs'])
-        course_id = CourseKey.from_string(course_rerun['key'])
-        course_rerun['course_id'] = course_id
-        course_rerun['enrolled'] = CourseEnrollment.is_enrolled(user, course_id)
+        course_rerun['course_id'] = CourseKey.from_string(course_rerun['key'])
+        courses.append(course_rerun)
 
-        if detail:
-            course_rerun['first_chapter_link'] = get_first_chapter_link(course_id)
-            course_rerun['completed'], course_rerun['in_progress'] = is_course_completed_or_in_progress(course_id, user)
+    course_ids = [course['course_id'] for course in courses]
+    enrolled_course_ids = get_enrolled_course_ids(user, course_ids)
 
-        courses.append(course_rerun)
+    if detail:
+        first_chapter_links = get_first_chapter_links(course_ids)
+        completion_statuses = get_courses_completion_status(user, course_ids)
+
+    for course_rerun in courses:
+        course_id = course_rerun['course_id']
+        course_rerun['enrolled'] = course_id in enrolled_course_ids
+
+        if detail:
+            course_rerun['first_chapter_link'] = first_chapter_links[course_id]
+            course_rerun['completed'], course_rerun['in_progress'] = completion_statuses[course_id]
 
     context.update({'courses': courses})
     return context, courses
@@ -94,18 +112,85 @@ def get_open_course_rerun(course_runs):
     return course_rerun
 
 
-def get_first_chapter_link(course_id):
+def get_enrolled_course_ids(user, course_ids):
     """
-    Get first chapter link for a course run
+    Get courses, out of the given ones, in which user is enrolled with one query
 
     Args:
-        course_id (CourseKey): Course key object
+        user (object): User object
+        course_ids (list): Course key objects
+
+    Returns:
+        Set of course keys
+    """
+    if not course_ids:
+        return set()
+
+    return set(CourseEnrollment.objects.filter(
+        user=user, course_id__in=course_ids, is_active=True
+    ).values_list('course_id', flat=True))
+
+
+def get_first_chapter_links(course_ids):
+    """
+    Get first chapter link of many course runs from their precomputed outlines
+
+    Args:
+        course_ids (list): Course key objects
 
     Returns:
-        String, link
+        Dict of course key and link, chapter and section are empty in the link of a course without chapters
     """
-    current_course = modulestore().get_course(course_id)
-    return get_course_first_chapter_link(current_course) if current_course else ''
+    first_chapter_links = {}
+
+    for course_id, chapters in get_course_landing_targets(course_ids).items():
+        chapter_url, sections = chapters[0] if chapters else ('', [])
+        first_chapter_links[course_id] = settings.LMS_ROOT_URL + reverse('courseware_section', args=[
+            course_id.to_deprecated_string(), chapter_url, sections[0] if sections else ''
+        ])
+
+    return first_chapter_links
+
+
+def get_courses_completion_status(user, course_ids):
+    """
+    Check for many courses if course is completed or not, if not then is course started by learner or not yet
+    started. Certificates and persisted grades of all courses are read with one query each, courses whose grades are
+    not persisted are checked one by one.
+
+    Args:
+        user (object): Current user
+        course_ids (list): Course key objects
+
+    Returns:
+        Dict of course key and tuple of booleans (is_completed, is_in_progress)
+    """
+    if not course_ids:
+        return {}
+
+    certificate_statuses = dict(GeneratedCertificate.eligible_certificates.filter(
+        user=user, course_id__in=course_ids
+    ).values_list('course_id', 'status'))
+    course_grades = {
+        grade.course_id: grade
+        for grade in PersistentCourseGrade.objects.filter(user_id=user.id, course_id__in=course_ids)
+    }
+
+    completion_statuses = {}
+    for course_id in course_ids:
+        if not should_persist_grades(course_id):
+            completion_statuses[course_id] = is_course_completed_or_in_progress(course_id, user)
+            continue
+
+        course_grade = course_grades.get(course_id)
+        percent = course_grade.percent_grade if course_grade else 0.0
+        passed = bool(course_grade and course_grade.passed_timestamp)
+
+        is_completed = CertificateStatuses.is_passing_status(certificate_statuses.get(course_id)) or passed
+        is_in_progress = 0.0 < percent and not is_completed
+        completion_statuses[course_id] = (is_completed, is_in_progress)
+
+    return completion_statuses
 
 
 def is_course_completed_or_in_progress(course_id, user):
@@ -131,7 +216,8 @@ def is_course_completed_or_in_progress(course_id, user):
 
 def get_program_from_discovery(specialization_uuid):
     """
-    Get program from discovery client by uuid
+    Get program from discovery client by uuid, programs are cached for PROGRAM_CACHE_TIMEOUT or until a course is
+    published
 
     Args:
         specialization_uuid (str): uuid of specialization
@@ -139,9 +225,15 @@ def get_program_from_discovery(specialization_uuid):
     Returns:
         Programs detail from discovery
     """
-    try:
-        program_context = DiscoveryClient().get_program(specialization_uuid)
-    except ValidationError as exc:
-        raise HttpResponseBadRequest(exc.message)
+    cache_key = PROGRAM_CACHE_KEY.format(generation=get_program_cache_generation(), uuid=specialization_uuid)
+    program_context = cache.get(cache_key)
+
+    if program_context is None:
+        try:
+            program_context = DiscoveryClient().get_program(specialization_uuid)
+        except ValidationError as exc:
+            raise HttpResponseBadRequest(exc.message)
+
+        cache.set(cache_key, program_context, PROGRAM_CACHE_TIMEOUT)
 
     return program_context
@@ -5,10 +5,14 @@ import pytest
 from opaque_keys.edx.keys import CourseKey
 
 from lms.djangoapps.certificates.models import CertificateStatuses
+from lms.djangoapps.certificates.tests.factories import GeneratedCertificateFactory
+from lms.djangoapps.grades.models import PersistentCourseGrade
 from lms.djangoapps.onboarding.tests.factories import UserFactory
 from openedx.core.djangoapps.content.course_overviews.tests.factories import CourseOverviewFactory
 from openedx.features.specializations import helpers as specializations_helper
+from openedx.features.specializations.tests.mock_get_program_helpers import mock_get_program
 from student.tests.factories import CourseEnrollmentFactory
+from xmodule.modulestore.django import SignalHandler
 
 _specialization_uuid = 'eb228773-a9a5-48cf-bb0e-94725d5aa4f1'
 
@@ -132,3 +136,63 @@ def test_get_program_from_discovery_successfully(mocker):
     program_context = specializations_helper.get_program_from_discovery(None)
 
     assert program_context == 'test data'
+
+
+@pytest.mark.django_db
+def test_get_program_from_discovery_cached_until_course_published(mocker, settings):
+    """
+    Test program is fetched from discovery once and again after a course is published
+    """
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    mocker.patch('openedx.features.course_card.handlers.task_update_course_landing_target')
+    mocked_client = mocker.patch.object(specializations_helper, 'DiscoveryClient')
+    mocked_client().get_program.return_value = mock_get_program()
+
+    assert specializations_helper.get_program_from_discovery(_specialization_uuid) == mock_get_program()
+    assert specializations_helper.get_program_from_discovery(_specialization_uuid) == mock_get_program()
+    assert mocked_client().get_program.call_count == 1
+
+    SignalHandler.course_published.send(sender=None, course_key=CourseKey.from_string('course/key/123'))
+
+    specializations_helper.get_program_from_discovery(_specialization_uuid)
+    assert mocked_client().get_program.call_count == 2
+
+    SignalHandler.course_deleted.send(sender=None, course_key=CourseKey.from_string('course/key/123'))
+
+    specializations_helper.get_program_from_discovery(_specialization_uuid)
+    assert mocked_client().get_program.call_count == 3
+
+
+@pytest.mark.django_db
+def test_get_program_courses_detail_for_all_courses_at_once(mocker):
+    """
+    Test enrollment, completion and first chapter link of every course run in a program
+    """
+    user = UserFactory()
+    course_keys = ['course-v1:test+completed+run', 'course-v1:test+in_progress+run', 'course-v1:test+not_started+run']
+    completed_id, in_progress_id, not_started_id = [CourseKey.from_string(key) for key in course_keys]
+    program_context = mock_get_program(courses=[
+        {'course_runs': [{'key': key, 'enrollment_start': None, 'enrollment_end': None}]} for key in course_keys
+    ])
+
+    CourseEnrollmentFactory(user=user, course_id=course_keys[0])
+    CourseEnrollmentFactory(user=user, course_id=course_keys[1])
+    GeneratedCertificateFactory(user=user, course_id=completed_id, status=CertificateStatuses.downloadable)
+    PersistentCourseGrade.objects.create(
+        user_id=user.id, course_id=in_progress_id, percent_grade=0.4, letter_grade='', grading_policy_hash='',
+        course_version=''
+    )
+    mocker.patch.object(specializations_helper, 'get_program_from_discovery', return_value=program_context)
+    mocker.patch.object(specializations_helper, 'should_persist_grades', return_value=True)
+    mocker.patch.object(specializations_helper, 'get_course_landing_targets', return_value={
+        completed_id: [['chapter', ['section']]], in_progress_id: [['chapter', []]], not_started_id: []
+    })
+
+    _, courses = specializations_helper.get_program_courses(user, _specialization_uuid, detail=True)
+
+    assert [(course['enrolled'], course['completed'], course['in_progress']) for course in courses] == [
+        (True, True, False), (True, False, True), (False, False, False)
+    ]
+    assert courses[0]['first_chapter_link'].endswith('/courses/{}/courseware/chapter/section/'.format(completed_id))
+    assert courses[1]['first_chapter_link'].endswith('/courses/{}/courseware/chapter//'.format(in_progress_id))
+    assert courses[2]['first_chapter_link'].endswith('/courses/{}/courseware///'.format(not_started_id))
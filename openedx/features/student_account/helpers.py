@@ -10,7 +10,7 @@ from pytz import utc
 
 import third_party_auth
 from courseware.models import StudentModule
-from lms.djangoapps.onboarding.helpers import COUNTRIES
+from lms.djangoapps.onboarding.lookups import get_countries
 from lms.djangoapps.onboarding.models import EmailPreference, Organization, UserExtendedProfile
 from lms.djangoapps.philu_overrides.constants import ACTIVATION_ALERT_TYPE
 from mailchimp_pipeline.signals.handlers import task_send_account_activation_email
@@ -208,6 +208,6 @@ def check_and_add_third_party_params(request, params):
 
 def get_registration_countries():
     return {
-        'all_countries': sorted(COUNTRIES.items(), key=operator.itemgetter(1)),
+        'all_countries': sorted(get_countries().items(), key=operator.itemgetter(1)),
         'top_countries': TOP_REGISTRATION_COUNTRIES or []
     }
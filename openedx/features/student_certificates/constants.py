@@ -25,3 +25,10 @@ COMPLETION_DATE_FORMAT = '%b %d, %Y'
 CREDENTIALS_DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
 
 CERTIFICATE_PDF_NAME = 'PhilanthropyUniversity_{display_name}'
+
+# Certificate images are rendered in batches by a pool of concurrent wkhtmltoimage renderers
+CERTIFICATE_IMAGE_RENDER_WORKERS = 4
+CERTIFICATE_IMAGE_OPTIONS = {'format': 'jpg', 'quiet': ''}
+# an image requested again while it is already queued or rendering is skipped
+CERTIFICATE_IMAGE_LOCK_KEY = 'student_certificates.certificate_image.{verify_uuid}'
+CERTIFICATE_IMAGE_LOCK_TIMEOUT = 60 * 60
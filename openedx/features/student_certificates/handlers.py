@@ -8,6 +8,7 @@ from django.dispatch import receiver
 
 from common.lib.mandrill_client.client import MandrillClient
 from lms.djangoapps.certificates.models import GeneratedCertificate
+from openedx.features.student_certificates.image_renderer import claim_certificate_image
 from openedx.features.student_certificates.models import CertificateVerificationKey
 from openedx.features.student_certificates.signals import USER_CERTIFICATE_DOWNLOADABLE
 from openedx.features.student_certificates.tasks import task_create_certificate_img_and_upload_to_s3
@@ -17,7 +18,8 @@ log = logging.getLogger(__name__)
 
 @receiver(post_save, sender=GeneratedCertificate)
 def generate_certificate_img(instance, created, **_kwargs):
-    if not created:
+    # certificate is saved many times when it is generated, its image is rendered once for all these saves
+    if not created and claim_certificate_image(instance.verify_uuid):
         task_create_certificate_img_and_upload_to_s3.delay(instance.verify_uuid)
 
 
@@ -0,0 +1,172 @@
+"""
+Batch renderer of certificate images.
+
+Certificate pages are rendered to html in process, by the certificate web view, and converted to images by a pool
+of concurrent wkhtmltoimage renderers. Images are uploaded to S3 from memory over one connection per batch, nothing
+is written to local disk. A certificate already queued is not queued again, its claim is released as soon as the
+batch starts so that a certificate changed while it is being rendered is queued again.
+"""
+import resource
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from urlparse import urlparse
+
+import imgkit
+from boto import connect_s3
+from boto.s3.key import Key
+from crum import set_current_request
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test.client import RequestFactory
+from django.urls import reverse
+
+from openedx.features.student_certificates.constants import (
+    CERTIFICATE_IMAGE_LOCK_KEY,
+    CERTIFICATE_IMAGE_LOCK_TIMEOUT,
+    CERTIFICATE_IMAGE_OPTIONS,
+    CERTIFICATE_IMAGE_RENDER_WORKERS
+)
+from openedx.features.student_certificates.helpers import (
+    get_certificate_image_name,
+    get_certificate_img_key,
+    get_certificate_url
+)
+
+log = getLogger(__name__)
+
+
+def claim_certificate_image(verify_uuid):
+    """
+    Mark image of a certificate as queued for rendering
+
+    Returns:
+        bool: True if caller should queue the image, False if it is already queued
+    """
+    return cache.add(CERTIFICATE_IMAGE_LOCK_KEY.format(verify_uuid=verify_uuid), True, CERTIFICATE_IMAGE_LOCK_TIMEOUT)
+
+
+def release_certificate_images(verify_uuids):
+    """
+    Allow images of certificates to be queued again, once their rendering has started
+    """
+    cache.delete_many([CERTIFICATE_IMAGE_LOCK_KEY.format(verify_uuid=verify_uuid) for verify_uuid in verify_uuids])
+
+
+def render_certificate_html(verify_uuid):
+    """
+    Render the certificate page, without border, in process instead of fetching it over HTTP
+
+    Returns:
+        str: html of the certificate page with a base url so that wkhtmltoimage can load its static assets
+    """
+    # imported here to avoid loading the certificate views with the app signal handlers
+    from lms.djangoapps.certificates.views.webview import render_cert_by_uuid
+
+    lms_root_url = urlparse(settings.LMS_ROOT_URL)
+    request = RequestFactory(
+        SERVER_NAME=lms_root_url.hostname,
+        SERVER_PORT=lms_root_url.port or (443 if lms_root_url.scheme == 'https' else 80),
+    ).get(reverse('certificates:render_cert_by_uuid', args=[verify_uuid]), {'border': 'hide'})
+    request.user = AnonymousUser()
+    request.session = {}
+
+    set_current_request(request)
+    try:
+        response = render_cert_by_uuid(request, verify_uuid)
+    finally:
+        set_current_request(None)
+
+    if response.status_code != 200:
+        raise ValueError('Certificate page responded with status {}'.format(response.status_code))
+
+    html = response.content.decode('utf-8')
+    return html.replace('<head>', '<head><base href="{}/">'.format(settings.LMS_ROOT_URL), 1)
+
+
+def render_certificate_image(verify_uuid, html=None):
+    """
+    Convert certificate page to image in memory, the page is fetched over HTTP if its html is not given
+
+    Returns:
+        str: image content
+    """
+    if html is None:
+        return imgkit.from_url(get_certificate_url(verify_uuid), False, options=CERTIFICATE_IMAGE_OPTIONS)
+
+    return imgkit.from_string(html, False, options=CERTIFICATE_IMAGE_OPTIONS)
+
+
+def get_certificate_images_bucket():
+    """
+    Returns:
+        Bucket: S3 bucket of certificate images
+    """
+    conn = connect_s3(
+        aws_access_key_id=getattr(settings, 'AWS_ACCESS_KEY_ID', None),
+        aws_secret_access_key=getattr(settings, 'AWS_SECRET_ACCESS_KEY', None)
+    )
+    return conn.get_bucket(getattr(settings, 'FILE_UPLOAD_STORAGE_BUCKET_NAME', None))
+
+
+def create_certificate_images(verify_uuids, workers=CERTIFICATE_IMAGE_RENDER_WORKERS, bucket=None):
+    """
+    Render images of many certificates and upload them to S3
+
+    Html of the certificates is rendered on the calling thread, which owns the database connection, while images are
+    converted and uploaded by a pool of `workers` threads. Each thread waits on its own wkhtmltoimage process, so at
+    most `workers` renderers run at a time.
+
+    Arguments:
+        verify_uuids (list): verify uuids of certificates, repeated uuids are rendered once
+        workers (int): number of concurrent renderers
+        bucket (Bucket): S3 bucket to upload images to, bucket of certificate images if not given
+
+    Returns:
+        dict: number of `rendered` and `failed` images, `seconds` taken, `images_per_second` and
+            `peak_memory_kb` of the process
+    """
+    verify_uuids = list(OrderedDict.fromkeys(verify_uuids))
+    # released before anything can fail, so that a failed batch does not keep its certificates from being queued
+    release_certificate_images(verify_uuids)
+
+    bucket = bucket or get_certificate_images_bucket()
+    started_at = time.time()
+
+    def render_and_upload(verify_uuid, html):
+        try:
+            image = render_certificate_image(verify_uuid, html)
+            key = Key(bucket=bucket, name=get_certificate_img_key(get_certificate_image_name(verify_uuid)))
+            key.set_contents_from_string(image, headers={'Content-Type': 'image/jpeg'})
+            log.info('Certificate image uploaded to S3 for verify_uuid:%s', verify_uuid)
+            return True
+        except Exception as ex:  # pylint: disable=broad-except
+            log.error('Certificate image creation failed for verify_uuid:%s, Reason: %s', verify_uuid, ex)
+            return False
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = []
+        for verify_uuid in verify_uuids:
+            try:
+                html = render_certificate_html(verify_uuid)
+            except Exception as ex:  # pylint: disable=broad-except
+                log.warning('Rendering certificate page in process failed for verify_uuid:%s, Reason: %s', verify_uuid,
+                            ex)
+                html = None
+
+            futures.append(executor.submit(render_and_upload, verify_uuid, html))
+
+        rendered = sum(1 for future in futures if future.result())
+
+    seconds = time.time() - started_at
+    stats = {
+        'rendered': rendered,
+        'failed': len(verify_uuids) - rendered,
+        'seconds': seconds,
+        'images_per_second': rendered / max(seconds, 0.001),
+        'peak_memory_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+    log.info('Certificate images batch completed: %s', stats)
+    return stats
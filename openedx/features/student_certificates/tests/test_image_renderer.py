@@ -0,0 +1,79 @@
+"""
+This file contains the test cases for batch rendering of certificate images
+"""
+import mock
+from boto import connect_s3
+
+from common.test.utils import MockS3Mixin
+from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
+from openedx.features.student_certificates.image_renderer import (
+    claim_certificate_image,
+    create_certificate_images
+)
+
+TEST_BUCKET_NAME = 'test-certificate-images'
+
+
+@mock.patch('openedx.features.student_certificates.image_renderer.imgkit.from_string', return_value='image-content')
+@mock.patch('openedx.features.student_certificates.image_renderer.render_certificate_html',
+            return_value='<html><head></head><body></body></html>')
+class CertificateImageRendererTestCase(MockS3Mixin, CacheIsolationTestCase):
+    """
+    Tests for rendering certificate images in batches and uploading them to a local S3 stand-in
+    """
+    ENABLED_CACHES = ['default']
+
+    def setUp(self):
+        super(CertificateImageRendererTestCase, self).setUp()
+        self.bucket = connect_s3().create_bucket(TEST_BUCKET_NAME)
+
+    def test_create_certificate_images(self, mock_render_html, mock_from_string):
+        verify_uuids = ['{:032x}'.format(index) for index in range(20)]
+
+        stats = create_certificate_images(verify_uuids + verify_uuids[:5], workers=4, bucket=self.bucket)
+
+        # repeated uuids are rendered once
+        self.assertEqual(mock_render_html.call_count, 20)
+        self.assertEqual(mock_from_string.call_count, 20)
+        self.assertEqual((stats['rendered'], stats['failed']), (20, 0))
+        self.assertGreater(stats['images_per_second'], 0)
+        self.assertGreater(stats['peak_memory_kb'], 0)
+
+        uploaded_keys = sorted(key.name for key in self.bucket.list())
+        self.assertEqual(uploaded_keys, ['certificates_images/{}.jpg'.format(uuid) for uuid in verify_uuids])
+        self.assertEqual(self.bucket.get_key(uploaded_keys[0]).get_contents_as_string(), 'image-content')
+
+    def test_certificate_image_is_queued_once_until_rendering_starts(self, mock_render_html, mock_from_string):
+        verify_uuid = 'a' * 32
+
+        self.assertTrue(claim_certificate_image(verify_uuid))
+        self.assertFalse(claim_certificate_image(verify_uuid))
+
+        claims_during_render = []
+        mock_from_string.side_effect = lambda *args, **kwargs: (
+            claims_during_render.append(claim_certificate_image(verify_uuid)) or 'image-content'
+        )
+        create_certificate_images([verify_uuid], bucket=self.bucket)
+
+        # a certificate saved while its image is being rendered is queued again
+        self.assertEqual(claims_during_render, [True])
+
+    @mock.patch('openedx.features.student_certificates.image_renderer.get_certificate_images_bucket',
+                side_effect=Exception('S3 is down'))
+    def test_claims_released_when_batch_fails_early(self, mock_get_bucket, mock_render_html, mock_from_string):
+        verify_uuids = ['a' * 32, 'b' * 32]
+        for verify_uuid in verify_uuids:
+            claim_certificate_image(verify_uuid)
+
+        with self.assertRaises(Exception):
+            create_certificate_images(verify_uuids)
+
+        self.assertTrue(all(claim_certificate_image(verify_uuid) for verify_uuid in verify_uuids))
+
+    def test_failed_image_does_not_stop_batch(self, mock_render_html, mock_from_string):
+        mock_from_string.side_effect = [Exception('wkhtmltoimage failed'), 'image-content']
+
+        stats = create_certificate_images(['a' * 32, 'b' * 32], workers=1, bucket=self.bucket)
+
+        self.assertEqual((stats['rendered'], stats['failed']), (1, 1))
+        self.assertEqual([key.name for key in self.bucket.list()], ['certificates_images/{}.jpg'.format('b' * 32)])
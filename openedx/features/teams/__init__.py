@@ -0,0 +1,4 @@
+"""
+PhilU teams browser, built over the teams app of LMS
+"""
+default_app_config = 'openedx.features.teams.apps.PhiluTeamsConfig'
@@ -0,0 +1,16 @@
+"""
+Configurations for PhilU teams app
+"""
+from django.apps import AppConfig
+
+
+class PhiluTeamsConfig(AppConfig):
+    name = u'openedx.features.teams'
+    # `teams` label is taken by `lms.djangoapps.teams`
+    label = u'philu_teams'
+
+    def ready(self):
+        """
+        Connect signal handlers.
+        """
+        import openedx.features.teams.handlers  # pylint: disable=unused-variable
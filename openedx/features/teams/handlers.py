@@ -0,0 +1,28 @@
+"""
+Signal handlers for PhilU teams app
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from lms.djangoapps.teams.models import CourseTeam, CourseTeamMembership
+
+from .summaries import invalidate_course_teams, invalidate_team
+
+
+@receiver(post_save, sender=CourseTeam)
+@receiver(post_delete, sender=CourseTeam)
+def invalidate_teams_on_team_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Team counts and teams of every country of the course change once a team is created, updated or deleted
+    """
+    invalidate_course_teams(instance.course_id)
+    invalidate_team(instance.id)
+
+
+@receiver(post_save, sender=CourseTeamMembership)
+@receiver(post_delete, sender=CourseTeamMembership)
+def invalidate_team_on_membership_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Members of a team change once a user joins or leaves it, only that team is serialized again
+    """
+    invalidate_team(instance.team_id)
@@ -7,7 +7,6 @@ from django.conf import settings
 from opaque_keys.edx.keys import CourseKey
 
 from courseware.courses import get_course_with_access
-from lms.djangoapps.teams.models import CourseTeam
 
 USER_ICON_COLORS = [
     '#f44336', '#e91e63', '#9c27b0', '#673ab7', '#3f51b5',
@@ -81,22 +80,6 @@ def make_embed_url(team_group_chat, user, topic_url=None):
         )
 
 
-def get_user_recommended_team(course_key, user):
-    """
-    Get recommended teams for the user
-
-    :param CourseKey course_key: Course key object
-    :param User user: user object
-    :return: List of recommended teams
-    :rtype: list
-    """
-    user_country = user.profile.country
-    recommended_teams = CourseTeam.objects.filter(course_id=course_key,
-                                                  country=user_country).exclude(users__in=[user]).all()
-
-    return list(recommended_teams)
-
-
 def get_user_course_with_access(course_id, user):
     """
     Method that wraps the `courseware.courses.get_course_with_access` to use
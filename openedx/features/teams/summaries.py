@@ -0,0 +1,152 @@
+"""
+Cached summaries of teams of a course, shown on teams browser.
+
+Summaries are cached in small entries instead of one entry per course, so that a change only drops what it affects:
+topics with team counts of a course, ids of teams of every country of a course and every serialized team. Topics and
+team ids are cached in a generation of the course which moves on once a team is created, updated or deleted, topics
+are also keyed on the teams configuration of the course so that a changed configuration is picked up without a
+course publish signal. A membership change only drops the entry of its team.
+"""
+import json
+from hashlib import sha1
+
+from django.core.cache import cache
+
+from lms.djangoapps.teams.models import CourseTeam, CourseTeamMembership
+from lms.djangoapps.teams.serializers import BulkTeamCountTopicSerializer
+from lms.djangoapps.teams.views import get_alphabetical_topics
+
+from .helpers import serialize
+from .serializers import CustomCourseTeamSerializer
+
+TEAMS_TOPICS_CACHE_KEY = 'philu_teams.topics.{course_id}.{generation}.{topics_hash}'
+TEAMS_COUNTRY_CACHE_KEY = 'philu_teams.country_team_ids.{course_id}.{generation}.{country}'
+TEAMS_TEAM_CACHE_KEY = 'philu_teams.team.{team_pk}'
+TEAMS_GENERATION_KEY = 'philu_teams.generation.{course_id}'
+TEAMS_CACHE_TIMEOUT = 10 * 60
+
+
+def get_course_topics(course, request):
+    """
+    Get topics of the course with team count of every topic, cached until a team of the course or teams
+    configuration of the course changes
+
+    :param Course course: Course object
+    :param HttpRequest request: Http request, used only if topics are not cached
+    :return: Serialized topics
+    :rtype: list
+    """
+    cache_key = TEAMS_TOPICS_CACHE_KEY.format(
+        course_id=course.id,
+        generation=get_course_teams_generation(course.id),
+        topics_hash=sha1(json.dumps(course.teams_topics, sort_keys=True)).hexdigest(),
+    )
+    topics = cache.get(cache_key)
+
+    if topics is None:
+        topics = serialize(
+            get_alphabetical_topics(course), request, BulkTeamCountTopicSerializer, {'course_id': course.id}
+        )
+        cache.set(cache_key, topics, TEAMS_CACHE_TIMEOUT)
+
+    return topics
+
+
+def get_country_teams(course_key, country_code, request):
+    """
+    Get serialized teams of a country of the course. Ids of teams of the country are cached until a team of the course
+    changes and every team is cached until it or its membership changes, teams missing from cache are serialized
+    together.
+
+    :param CourseKey course_key: Course key object
+    :param str country_code: Country code of teams
+    :param HttpRequest request: Http request, used only if teams are not cached
+    :return: Serialized teams
+    :rtype: list
+    """
+    country_cache_key = TEAMS_COUNTRY_CACHE_KEY.format(
+        course_id=course_key, generation=get_course_teams_generation(course_key), country=country_code
+    )
+    team_pks = cache.get(country_cache_key)
+
+    if team_pks is None:
+        team_pks = list(CourseTeam.objects.filter(course_id=course_key, country=country_code).values_list(
+            'id', flat=True
+        ))
+        cache.set(country_cache_key, team_pks, TEAMS_CACHE_TIMEOUT)
+
+    team_cache_keys = {team_pk: TEAMS_TEAM_CACHE_KEY.format(team_pk=team_pk) for team_pk in team_pks}
+    cached_teams = cache.get_many(team_cache_keys.values())
+    teams = {team_pk: cached_teams[cache_key] for team_pk, cache_key in team_cache_keys.items()
+             if cache_key in cached_teams}
+
+    missing_team_pks = [team_pk for team_pk in team_pks if team_pk not in teams]
+    if missing_team_pks:
+        missing_teams = list(CourseTeam.objects.filter(id__in=missing_team_pks).prefetch_related('membership__user'))
+        serialized_teams = serialize(missing_teams, request, CustomCourseTeamSerializer, {'expand': ('user',)})
+        serialized_teams = {team.id: serialized_team for team, serialized_team in zip(missing_teams, serialized_teams)}
+
+        cache.set_many(
+            {team_cache_keys[team_pk]: serialized_team for team_pk, serialized_team in serialized_teams.items()},
+            TEAMS_CACHE_TIMEOUT
+        )
+        teams.update(serialized_teams)
+
+    # a team deleted after ids were cached is left out
+    return [teams[team_pk] for team_pk in team_pks if team_pk in teams]
+
+
+def get_user_team_ids(course_key, user):
+    """
+    Get ids of teams of the course, which the user has joined, with one query
+
+    :return: Team ids i.e. `team_id` of CourseTeam
+    :rtype: set
+    """
+    return set(CourseTeamMembership.objects.filter(
+        user=user, team__course_id=course_key
+    ).values_list('team__team_id', flat=True))
+
+
+def get_user_recommended_teams(course_key, user, user_team_ids, request):
+    """
+    Get teams of the country of the user which the user has not joined
+
+    :param CourseKey course_key: Course key object
+    :param User user: User object
+    :param set user_team_ids: Ids of teams of the course which the user has joined
+    :param HttpRequest request: Http request, used only if teams are not cached
+    :return: Serialized teams
+    :rtype: list
+    """
+    country_teams = get_country_teams(course_key, user.profile.country.code, request)
+    return [team for team in country_teams if team['id'] not in user_team_ids]
+
+
+def get_course_teams_generation(course_key):
+    """
+    Get generation of cached topics and team ids of a course, entries cached in older generations are not read anymore
+    """
+    generation_key = TEAMS_GENERATION_KEY.format(course_id=course_key)
+    cache.add(generation_key, 1, None)
+    return cache.get(generation_key, 1)
+
+
+def invalidate_course_teams(course_key):
+    """
+    Move cached topics and team ids of a course to next generation, so that these are computed again on next page view
+    """
+    generation_key = TEAMS_GENERATION_KEY.format(course_id=course_key)
+    cache.add(generation_key, 1, None)
+    try:
+        cache.incr(generation_key)
+    except ValueError:
+        # key was evicted between add and incr
+        cache.set(generation_key, 1, None)
+
+
+def invalidate_team(team_pk):
+    """
+    Drop a cached team, so that it is serialized again on next page view
+    """
+    cache.delete(TEAMS_TEAM_CACHE_KEY.format(team_pk=team_pk))
@@ -13,7 +13,6 @@ from openedx.features.teams.helpers import (
     generate_random_user_icon_color,
     get_team_topic,
     get_user_course_with_access,
-    get_user_recommended_team,
     make_embed_url,
     serialize
 )
@@ -158,15 +157,6 @@ class HelpersTestCase(ModuleStoreTestCase):
         expected_data = {key: str(data[key]) for key in serialized_data_keys}
         self.assertEqual(serialized_data, expected_data)
 
-    def test_get_user_recommended_teams(self):
-        """
-        Test that the helper method returns user recommended teams bases on
-        user country. Teams in which user is enrolled should not be returned.
-        """
-        expected_result = [self.team, ]
-        actual_result = get_user_recommended_team(self.course.id, self.user)
-        self.assertEqual(actual_result, expected_result)
-
     def test_get_user_course_with_access(self):
         """
         Test that user can access the course
@@ -0,0 +1,113 @@
+"""
+All unit test for cached summaries of teams in teams app
+"""
+import factory
+from django.db.models import signals
+from django.test.client import RequestFactory
+from mock import patch
+
+from lms.djangoapps.onboarding.tests.factories import UserFactory
+from lms.djangoapps.teams.tests.factories import CourseTeamMembershipFactory
+from openedx.features.teams.handlers import invalidate_team_on_membership_change, invalidate_teams_on_team_change
+from openedx.features.teams.helpers import serialize
+from openedx.features.teams.summaries import (
+    get_country_teams,
+    get_course_topics,
+    get_user_recommended_teams,
+    get_user_team_ids
+)
+from openedx.features.teams.tests.factories import CourseTeamFactory
+from xmodule.modulestore import ModuleStoreEnum
+from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
+from xmodule.modulestore.tests.factories import CourseFactory
+
+USER_COUNTRY = 'US'
+
+
+class TeamsSummaryTestCase(ModuleStoreTestCase):
+    """
+    Tests for cached topics and recommendations of teams browser
+    """
+
+    @factory.django.mute_signals(signals.pre_save, signals.post_save)
+    def setUp(self):
+        """
+        Setup a course with two teams of user country, user has joined one of them, and a team of other country
+        """
+        super(TeamsSummaryTestCase, self).setUp()
+        self.course = CourseFactory.create(
+            default_store=ModuleStoreEnum.Type.split,
+            teams_configuration={
+                'max_team_size': 10,
+                'topics': [{u'name': u'Topic', u'description': u'Best topic!', u'id': u'0'}]
+            }
+        )
+        self.user = UserFactory.create(profile__country=USER_COUNTRY)
+        self.request = RequestFactory().get('/')
+        self.request.user = self.user
+
+        self.joined_team = CourseTeamFactory.create(course_id=self.course.id, topic_id='0', country=USER_COUNTRY)
+        self.recommended_team = CourseTeamFactory.create(course_id=self.course.id, topic_id='0', country=USER_COUNTRY)
+        CourseTeamFactory.create(course_id=self.course.id, topic_id='0', country='PK')
+        self.membership = CourseTeamMembershipFactory.create(team=self.joined_team, user=self.user)
+
+    def test_topics_and_country_teams_are_cached(self):
+        topics = get_course_topics(self.course, self.request)
+        country_teams = get_country_teams(self.course.id, USER_COUNTRY, self.request)
+
+        self.assertEqual(topics[0]['team_count'], 3)
+        self.assertEqual(len(country_teams), 2)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_course_topics(self.course, self.request), topics)
+            self.assertEqual(get_country_teams(self.course.id, USER_COUNTRY, self.request), country_teams)
+
+    def test_team_change_invalidates_topics_and_country_teams(self):
+        get_course_topics(self.course, self.request)
+        get_country_teams(self.course.id, USER_COUNTRY, self.request)
+
+        with factory.django.mute_signals(signals.pre_save, signals.post_save):
+            team = CourseTeamFactory.create(course_id=self.course.id, topic_id='0', country=USER_COUNTRY)
+
+        invalidate_teams_on_team_change(sender=None, instance=team)
+
+        self.assertEqual(get_course_topics(self.course, self.request)[0]['team_count'], 4)
+        self.assertEqual(len(get_country_teams(self.course.id, USER_COUNTRY, self.request)), 3)
+
+    def test_membership_change_serializes_only_its_team(self):
+        get_country_teams(self.course.id, USER_COUNTRY, self.request)
+
+        with factory.django.mute_signals(signals.post_save, signals.post_delete):
+            self.membership.delete()
+
+        invalidate_team_on_membership_change(sender=None, instance=self.membership)
+
+        with patch('openedx.features.teams.summaries.serialize', wraps=serialize) as mock_serialize:
+            country_teams = get_country_teams(self.course.id, USER_COUNTRY, self.request)
+
+        memberships = {team['id']: team['membership'] for team in country_teams}
+        self.assertEqual(memberships[self.joined_team.team_id], [])
+        self.assertEqual(len(mock_serialize.call_args[0][0]), 1)
+
+    def test_topics_change_with_teams_configuration(self):
+        get_course_topics(self.course, self.request)
+
+        teams_configuration = dict(self.course.teams_configuration)
+        teams_configuration['topics'] = teams_configuration['topics'] + [
+            {u'name': u'Another topic', u'description': u'Second best topic!', u'id': u'1'}
+        ]
+        self.course.teams_configuration = teams_configuration
+
+        self.assertEqual(len(get_course_topics(self.course, self.request)), 2)
+
+    def test_user_recommended_teams(self):
+        """
+        Test that only teams of user country are recommended, except the ones user has joined
+        """
+        user_team_ids = get_user_team_ids(self.course.id, self.user)
+
+        self.assertEqual(user_team_ids, {self.joined_team.team_id})
+        self.assertEqual(
+            [team['id'] for team in get_user_recommended_teams(self.course.id, self.user, user_team_ids, self.request)],
+            [self.recommended_team.team_id]
+        )
@@ -13,8 +13,6 @@ from courseware.courses import has_access
 from django_comment_client.utils import has_discussion_privileges
 from lms.djangoapps.teams import is_feature_enabled
 from lms.djangoapps.teams.models import CourseTeam, CourseTeamMembership
-from lms.djangoapps.teams.serializers import BulkTeamCountTopicSerializer
-from lms.djangoapps.teams.views import get_alphabetical_topics
 from nodebb.constants import TEAM_PLAYER_ENTRY_INDEX
 from nodebb.models import TeamGroupChat
 from openedx.features.badging.constants import TEAM_PLAYER
@@ -22,8 +20,9 @@ from openedx.features.badging.models import Badge
 from student.models import CourseEnrollment
 
 from .decorators import can_view_teams
-from .helpers import get_team_topic, get_user_course_with_access, get_user_recommended_team, make_embed_url, serialize
+from .helpers import get_team_topic, get_user_course_with_access, make_embed_url, serialize
 from .serializers import CustomCourseTeamSerializer
+from .summaries import get_course_topics, get_user_recommended_teams, get_user_team_ids
 
 
 @login_required
@@ -49,33 +48,17 @@ def browse_teams(request, course_id):
             not has_access(user, 'staff', course, course.id):
         raise Http404
 
-    # Even though sorting is done outside of the serializer, sort_order needs to be passed
-    # to the serializer so that the paginated results indicate how they were sorted.
-    topics = get_alphabetical_topics(course)
-
-    topics_data = serialize(
-        topics,
-        request,
-        BulkTeamCountTopicSerializer,
-        {'course_id': course.id},
-    )
-
-    recommended_teams = serialize(
-        get_user_recommended_team(course.id, user),
-        request,
-        CustomCourseTeamSerializer,
-        {'expand': ('user',)}
-    )
-
-    is_member_of_any_team = CourseTeamMembership.user_in_team_for_course(user, course.id)
+    # Topics with team counts and teams of every country are cached for all users of the course, teams joined by the
+    # user are the only user specific part
+    user_team_ids = get_user_team_ids(course.id, user)
 
     course_has_ended = course.has_ended()
     context = {
         'course': course,
-        'topics': topics_data,
-        'recommended_teams': recommended_teams,
+        'topics': get_course_topics(course, request),
+        'recommended_teams': get_user_recommended_teams(course.id, user, user_team_ids, request),
         'user_country': user.profile.country.name.format(),
-        'show_create_card': not is_member_of_any_team,
+        'show_create_card': not user_team_ids,
         'course_has_ended': course_has_ended
     }
 